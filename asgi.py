@@ -0,0 +1,15 @@
+"""
+Context Engineering PRP Generator - ASGI Giriş Noktası
+=====================================================
+
+Async view'ları (PRP üretimi ve AI form doldurma) sunucunun event loop'unda
+doğrudan çalıştıran ASGI modu. Örnek:
+
+    uvicorn asgi:application --host 0.0.0.0 --port 5000
+"""
+
+from flask_app import app, start_background_services
+from src.web.asgi import FlaskASGIApp
+
+# Arka plan servisleri sunucunun loop'u benimsendikten sonra başlatılır
+application = FlaskASGIApp(app, on_startup=start_background_services)
@@ -0,0 +1,80 @@
+"""
+Context Engineering PRP Generator - Toplu Üretim CLI
+===================================================
+
+JSONL proje kayıtlarından toplu PRP üretir ve sonuçları tamamlandıkça çıktı JSONL'ine ekler.
+Aynı çıktı dosyasıyla yeniden çalıştırıldığında başarıyla tamamlanmış kayıtlar atlanır. Örnek:
+
+    python batch_generate.py projects.jsonl -o prps.jsonl -p openai -p anthropic -c 8
+"""
+
+import asyncio
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+
+from src.api.llm_factory import LLMProviderFactory
+from src.jobs.batch import STATUS_OK, completed_ids, parse_records, run_batch, to_jsonl
+from src.utils.config import load_config
+from src.utils.db import init_db, load_api_keys
+
+cli = typer.Typer(add_completion=False, help="JSONL kayıtlarından toplu PRP üretimi")
+
+
+@cli.command()
+def main(input_path: Path = typer.Argument(..., exists=True, dir_okay=False, help="Girdi JSONL dosyası"),
+         output_path: Path = typer.Option(Path("prps.jsonl"), "--output", "-o", help="Çıktı JSONL dosyası"),
+         providers: Optional[List[str]] = typer.Option(None, "--provider", "-p", help="Kullanılacak provider (tekrarlanabilir)"),
+         concurrency: int = typer.Option(4, "--concurrency", "-c", min=1, help="Aynı anda çalışan üretim sayısı"),
+         resume: bool = typer.Option(True, "--resume/--no-resume", help="Çıktıdaki tamamlanmış kayıtları atla")):
+    """Girdi dosyasındaki her kayıt için PRP üret"""
+
+    config = load_config()
+    init_db()
+    # Web arayüzünden kaydedilen anahtarlar ortam değişkenlerinin yerine geçer
+    for name, setting in load_api_keys().items():
+        if name in config.providers and setting.get('api_key'):
+            config.providers[name].api_key = setting['api_key']
+            if setting.get('model'):
+                config.providers[name].default_model = setting['model']
+
+    factory = LLMProviderFactory(config)
+    providers = providers or [config.default_provider]
+    for provider in providers:
+        if not factory.validate_provider(provider):
+            raise typer.BadParameter(f"Provider yapılandırılmamış: {provider}", param_hint="--provider")
+
+    with input_path.open(encoding="utf-8") as f:
+        try:
+            records = parse_records(f)
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint="INPUT_PATH")
+
+    skip_ids = set()
+    if resume and output_path.exists():
+        with output_path.open(encoding="utf-8") as f:
+            skip_ids = completed_ids(f)
+
+    create_client = factory.create_resilient_client if config.enable_failover else factory.create_client
+
+    async def _run() -> int:
+        failures = 0
+        processed = 0
+        with output_path.open("a", encoding="utf-8") as out:
+            async for result in run_batch(records, create_client, providers, concurrency, skip_ids):
+                out.write(to_jsonl(result))
+                out.flush()
+                processed += 1
+                if result['status'] != STATUS_OK:
+                    failures += 1
+                typer.echo(f"[{processed}] {result['id']}: {result['status']} ({result['provider']})")
+        return failures
+
+    failures = asyncio.run(_run())
+    typer.echo(f"Tamamlandı: {len(records)} kayıt, {len(skip_ids & {r['id'] for r in records})} atlandı, {failures} hata")
+    raise typer.Exit(code=1 if failures else 0)
+
+
+if __name__ == "__main__":
+    cli()
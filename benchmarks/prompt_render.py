@@ -0,0 +1,114 @@
+"""
+Prompt Render Karşılaştırması
+=============================
+
+Agent prompt şablonlarının derlenmiş kayıt defterinden render süresini, her çağrıda şablonu
+yeniden derlemenin maliyetiyle karşılaştırır ve şablon başına ortalama µs/render ile çıktı
+boyutunu raporlar. Örnek:
+
+    python benchmarks/prompt_render.py --iterations 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+os.environ.setdefault('TEST_MODE', 'true')
+
+from src.models.project_data import (
+    AnalysisResult, ArchitectureResult, ProjectData, ProjectRequirements, TestStrategy
+)
+from src.prompts.registry import PromptRegistry
+
+REQUIREMENTS = ProjectRequirements(
+    functional_requirements='\n'.join(f'- Gereksinim {i}' for i in range(30)),
+    frameworks='Flask, SQLAlchemy',
+    database='PostgreSQL',
+    security='OWASP Top 10',
+    ai_tools=['Cursor', 'GitHub Copilot']
+)
+PROJECT = ProjectData(
+    name='Benchmark',
+    type='Web Uygulaması',
+    language='Python',
+    description='x' * 2000,
+    platform=['iOS', 'Android'],
+    requirements=REQUIREMENTS
+)
+ANALYSIS = AnalysisResult(
+    complexity_score=7, risk_factors=['risk'] * 5, recommended_approach='Agile',
+    key_challenges=['zorluk'] * 5, success_criteria=['kriter'] * 5, estimated_effort='orta'
+)
+ARCHITECTURE = ArchitectureResult(
+    architecture_pattern='Layered', technology_stack={'backend': 'Flask', 'db': 'PostgreSQL'},
+    system_components=['API', 'Worker'], data_flow='İstemci → API → DB',
+    security_considerations=['TLS'], scalability_plan='Yatay ölçekleme'
+)
+TEST_STRATEGY = TestStrategy(
+    test_levels=['Unit', 'E2E'], test_frameworks=['pytest'], coverage_targets={'Unit': 80},
+    quality_gates=['CI'], performance_tests=['Load']
+)
+PROJECT_DICT = {'project_name': 'Benchmark', 'description': 'x' * 2000, 'tech_stack': ['Python'] * 10}
+
+CONTEXTS = {
+    'system_analyst/analysis': dict(project=PROJECT, req=REQUIREMENTS),
+    'software_architect/architecture': dict(project=PROJECT, analysis=ANALYSIS, req=REQUIREMENTS),
+    'test_specialist/test_strategy': dict(project=PROJECT, architecture=ARCHITECTURE, req=REQUIREMENTS),
+    'documentation_specialist/prp': dict(
+        project=PROJECT, analysis=ANALYSIS, architecture=ARCHITECTURE,
+        test_strategy=TEST_STRATEGY, req=REQUIREMENTS, references=''
+    ),
+    'prp_generator/system': dict(detail_level='comprehensive', include_examples=True),
+    'prp_generator/user': dict(project_data=PROJECT_DICT, requirements={'a': 'b'}, detail_level='detailed', references=''),
+    'form_filler/fill': dict(description='x' * 2000),
+}
+
+
+def time_per_call(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def run(iterations: int) -> list:
+    registry = PromptRegistry()
+    rows = []
+    for name in registry.names():
+        context = CONTEXTS.get(name, {})
+        source = registry.env.loader.get_source(registry.env, name + '.j2')[0]
+        text = registry.render(name, **context)
+
+        if name == 'prp_generator/system':
+            render = lambda: registry.render_cached(name, **context)
+        else:
+            render = lambda: registry.render(name, **context)
+        compile_each = lambda: registry.env.from_string(source).render(**context)
+
+        rows.append({
+            'template': name,
+            'static': registry.is_static(name),
+            'render_us': time_per_call(render, iterations),
+            'compile_us': time_per_call(compile_each, max(iterations // 10, 1)),
+            'chars': len(text),
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'şablon':<36}{'statik':>8}{'µs/render':>12}{'µs/derle+render':>18}{'karakter':>10}")
+    for row in run(args.iterations):
+        print(f"{row['template']:<36}{'evet' if row['static'] else '':>8}{row['render_us']:>12.2f}"
+              f"{row['compile_us']:>18.2f}{row['chars']:>10}")
+
+
+if __name__ == '__main__':
+    main()
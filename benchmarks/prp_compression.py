@@ -0,0 +1,120 @@
+"""
+PRP Sıkıştırma Karşılaştırması
+==============================
+
+`examples/sample_prp.md` iskeletinden türetilmiş sentetik bir PRP geçmişini (proje başına
+birden çok sürüm) geçici bir veritabanına kaydeder ve saklanan boyutu sıkıştırmasız,
+sözlüksüz ve yalnızca sözlüklü kodlamayla karşılaştırır. Sürüm çözme hızı her okumada
+önbellek boşken (delta zinciri dahil) ve sürümler sırayla LRU önbellek açıkken okunurken
+ölçülür. Örnek:
+
+    python benchmarks/prp_compression.py --projects 40 --versions 5
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.storage import prp_codec
+from src.storage.history_store import HistoryStore
+from src.utils.dal import Database
+from src.utils.db import MIGRATIONS
+
+WORDS = ('kullanıcı', 'ödeme', 'rapor', 'bildirim', 'yetki', 'arama', 'önbellek', 'kuyruk',
+         'panel', 'entegrasyon', 'denetim', 'fatura', 'mesaj', 'takvim', 'dosya', 'profil')
+
+
+def synthetic_history(projects: int, versions: int, seed: int = 7) -> list:
+    """(proje_adı, [sürüm metinleri]) listesi; sürümler bir öncekinden küçük farklarla türetilir"""
+
+    rng = random.Random(seed)
+    skeleton = prp_codec.seed_corpus()[0].splitlines()
+    history = []
+    for index in range(projects):
+        name = f"Proje {index} {rng.choice(WORDS).title()}"
+        lines = [line.replace('Research Agent', name) for line in skeleton]
+        lines[1:1] = [f"- {rng.choice(WORDS)} {rng.choice(WORDS)} gereksinimi {i}" for i in range(rng.randint(10, 40))]
+        texts = []
+        for _ in range(versions):
+            for _ in range(rng.randint(3, 12)):
+                position = rng.randrange(len(lines))
+                lines.insert(position, f"- {rng.choice(WORDS)} için {rng.choice(WORDS)} adımı")
+            texts.append('\n'.join(lines))
+        history.append((name, texts))
+    return history
+
+
+def run(projects: int, versions: int, rounds: int) -> dict:
+    history = synthetic_history(projects, versions)
+    texts = [text for _, items in history for text in items]
+    raw = sum(len(text.encode('utf-8')) for text in texts)
+    plain = sum(prp_codec.plain_size(text) for text in texts)
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = HistoryStore(Database(Path(directory) / 'app.db', MIGRATIONS))
+        for name, items in history:
+            for text in items:
+                store.record({'project_name': name}, {}, text)
+        store.retrain()
+
+        dictionary = store._dictionary(store.dict_id)
+        dict_only = sum(len(prp_codec.compress(text, store.codec, prp_codec.MODE_DICT, dictionary)) for text in texts)
+        stats = store.compression_stats()
+
+        version_ids = [row[0] for row in store.db.fetchall("SELECT id FROM prp_versions")]
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for version_id in version_ids:
+                store._texts.clear()
+                store._text(version_id)
+        cold = time.perf_counter() - started
+
+        store._texts.clear()
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for version_id in version_ids:
+                store._text(version_id)
+        warm = time.perf_counter() - started
+
+    decoded = raw * rounds / 1e6
+    return {
+        'codec': stats['codec'],
+        'versions': len(texts),
+        'raw': raw,
+        'sizes': {
+            'sıkıştırmasız': raw,
+            f"{stats['codec']} (sözlüksüz)": plain,
+            f"{stats['codec']} + sözlük": dict_only,
+            f"{stats['codec']} + sözlük + delta": stats['stored_bytes'],
+        },
+        'encodings': stats['encodings'],
+        'cold_mb_s': decoded / cold,
+        'warm_mb_s': decoded / warm,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--projects', type=int, default=40)
+    parser.add_argument('--versions', type=int, default=5)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    result = run(args.projects, args.versions, args.rounds)
+    print(f"{result['versions']} sürüm, {result['raw'] / 1e6:.2f} MB ham metin")
+    print(f"{'kodlama':<28}{'bayt':>12}{'oran':>8}")
+    for label, size in result['sizes'].items():
+        print(f"{label:<28}{size:>12}{result['raw'] / size:>8.1f}")
+    print("sürüm kodlamaları: " + ', '.join(f"{name}={item['versions']}" for name, item in sorted(result['encodings'].items())))
+    print(f"çözme (soğuk, delta zinciri dahil): {result['cold_mb_s']:.1f} MB/s")
+    print(f"çözme (sıralı, LRU önbellek açık): {result['warm_mb_s']:.1f} MB/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Session G/Ç Karşılaştırması
+===========================
+
+Flask-Session dosya sistemi backend'i ile SQLite session deposunu, sihirbazın tipik trafiğiyle
+(sayfa GET'lerinde `session['current_step']` ataması, ara sıra veri kaydı) karşılaştırır ve
+istek başına ortalama süreyi ve depolama yazımlarını raporlar. Örnek:
+
+    python benchmarks/session_io.py --requests 2000
+"""
+
+import argparse
+import pickle
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from flask import Flask, session
+from flask_session import Session
+
+from src.web.session_store import IndexedSessionInterface, SQLiteSessionStore
+
+PROJECT_DATA = {
+    'project_name': 'Benchmark',
+    'description': 'x' * 2000,
+    'tech_stack': ['Python', 'Flask', 'SQLite'],
+    'main_goals': ['hız'] * 20,
+}
+
+
+def build_app(backend: str, workdir: Path) -> Flask:
+    app = Flask(__name__)
+    app.secret_key = 'benchmark'
+    app.config['SESSION_PERMANENT'] = False
+    app.config['PERMANENT_SESSION_LIFETIME'] = 3600
+
+    if backend == 'filesystem':
+        app.config['SESSION_TYPE'] = 'filesystem'
+        app.config['SESSION_FILE_DIR'] = str(workdir / 'sessions')
+        Session(app)
+    else:
+        app.session_interface = IndexedSessionInterface(
+            SQLiteSessionStore(db_path=workdir / 'sessions.db'), lifetime_seconds=3600
+        )
+
+    @app.route('/page/<step>')
+    def page(step):
+        session['current_step'] = step
+        return 'ok'
+
+    @app.route('/save', methods=['POST'])
+    def save():
+        session['project_data'] = dict(PROJECT_DATA, saved_at=time.time())
+        return 'ok'
+
+    return app
+
+
+def count_writes(app: Flask, backend: str) -> dict:
+    """Depolama yazımlarını saymak için backend'i sar"""
+
+    counter = {'writes': 0, 'bytes': 0}
+    if backend == 'filesystem':
+        cache = app.session_interface.cache
+        original = cache.set
+
+        def counting_set(key, value, timeout=None, mgmt_element=False):
+            counter['writes'] += 1
+            counter['bytes'] += len(value) if isinstance(value, (bytes, bytearray)) else len(pickle.dumps(value))
+            return original(key, value, timeout, mgmt_element)
+
+        cache.set = counting_set
+    else:
+        store = app.session_interface.store
+        original_write = store.write
+        original_touch = store.touch
+
+        def counting_write(sid, upserts, deletes, expires_at):
+            counter['writes'] += 1
+            counter['bytes'] += sum(len(v) for v in upserts.values())
+            return original_write(sid, upserts, deletes, expires_at)
+
+        def counting_touch(sid, expires_at):
+            counter['writes'] += 1
+            return original_touch(sid, expires_at)
+
+        store.write = counting_write
+        store.touch = counting_touch
+    return counter
+
+
+def run(backend: str, requests: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        app = build_app(backend, Path(tmp))
+        counter = count_writes(app, backend)
+        client = app.test_client()
+        client.post('/save')
+
+        steps = ['project_setup', 'requirements', 'generation', 'results']
+        started = time.perf_counter()
+        for i in range(requests):
+            if i % 50 == 0:
+                client.post('/save')
+            else:
+                # Kullanıcı aynı sayfayı yeniler: değer değişmez
+                client.get(f'/page/{steps[(i // 10) % len(steps)]}')
+        elapsed = time.perf_counter() - started
+
+        return {
+            'backend': backend,
+            'avg_ms': elapsed / requests * 1000,
+            'writes_per_request': counter['writes'] / requests,
+            'bytes_per_request': counter['bytes'] / requests,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'backend':<12}{'ort. ms/istek':>16}{'yazım/istek':>14}{'bayt/istek':>14}")
+    for backend in ('filesystem', 'sqlite'):
+        result = run(backend, args.requests)
+        print(f"{result['backend']:<12}{result['avg_ms']:>16.3f}"
+              f"{result['writes_per_request']:>14.3f}{result['bytes_per_request']:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
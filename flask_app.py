@@ -15,14 +15,17 @@ uygun PRP (Product Requirements Prompt) dosyaları oluşturur.
 import asyncio
 import json
 from pathlib import Path
+import re
+import secrets
 import sys
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime
 
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for, send_file, make_response
+from flask import render_template, request, jsonify, session, redirect, url_for, Response, g
 from flask_session import Session
 from werkzeug.utils import secure_filename
 import os
-import tempfile
 from flask_cors import CORS
 
 # Proje dizinini Python path'ine ekle
@@ -30,40 +33,48 @@ sys.path.append(str(Path(__file__).parent))
 
 from src.utils.config import load_config, get_available_providers, get_provider_info
 from src.utils.logger import setup_logger
-from src.agents.form_filler_agent import FormFillerAgent
+from src.agents.form_filler_agent import FormFillerAgent, get_form_fill_memo
 from src.agents.prp_generator_agent import PRPGeneratorAgent
 from src.agents.team_manager import SoftwareEngineeringTeam
 from src.api.llm_factory import LLMProviderFactory
+from src.api.prompt_cache import get_token_usage
+from src.api.rate_limiter import rate_limit_key
+from src.api.resilience import get_circuit_breakers
+from src.jobs import completed_ids, get_job_queue, parse_records, run_batch
+from src.jobs.batch import to_jsonl
+from src.retrieval import get_context_retriever
+from src.storage import Artifact, content_hash, get_artifact_store, get_history_store
+from src.prompts import get_prompt_registry
 from src.models.project_data import ProjectData, ProjectRequirements, ProjectType, ProgrammingLanguage, Platform, TeamSize, Timeline
 from src.ui.project_templates import ProjectTemplates
-from src.utils.db import init_db, save_api_keys as db_save_keys, load_api_keys
+from src.utils.db import (
+    init_db, save_api_keys as db_save_keys, load_api_keys, get_api_key, get_key_vault, encrypt_secret, decrypt_secret
+)
+from src.web.asgi import AsyncFlask
+from src.web.session_store import IndexedSessionInterface, MemorySessionStore, SQLiteSessionStore
+from src.web.export import AGENT_OUTPUTS_RENDITION, ExportContext, available_formats, get_writer
+from src.web.http_cache import conditional_response, conditional_stream, make_etag
+from src.web.rendering import HTML_RENDITION, representation
+from src.utils.async_runner import iterate_async
 
 # Geçici dosyalar için dizin
 TEMP_DIR = os.path.join(os.path.dirname(__file__), 'temp')
 if not os.path.exists(TEMP_DIR):
     os.makedirs(TEMP_DIR)
 
-# Flask uygulamasını oluştur
-app = Flask(__name__)
+# Flask uygulamasını oluştur - async view'lar kalıcı event loop'ta (WSGI) veya
+# doğrudan sunucu loop'unda (ASGI, bkz. asgi.py) çalışır
+app = AsyncFlask(__name__)
 app.secret_key = 'context-engineering-prp-generator-secret-key'  # Güvenlik için değiştirilmeli
 
 # Session konfigürasyonu - sunucu tarafında sakla
-app.config['SESSION_TYPE'] = 'filesystem'
 app.config['SESSION_PERMANENT'] = False
 app.config['SESSION_USE_SIGNER'] = True
-app.config['SESSION_KEY_PREFIX'] = 'prp_'
-app.config['SESSION_FILE_DIR'] = os.path.join(TEMP_DIR, 'sessions')
 app.config['SESSION_COOKIE_SECURE'] = False  # HTTPS için True yapın
 app.config['SESSION_COOKIE_HTTPONLY'] = True
 app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
 app.config['PERMANENT_SESSION_LIFETIME'] = 3600  # 1 saat
 
-# Session dizinini oluştur
-os.makedirs(app.config['SESSION_FILE_DIR'], exist_ok=True)
-
-# Session'ı başlat
-Session(app)
-
 # Konfigürasyon ve logger'ı yükle
 try:
     config = load_config()
@@ -73,6 +84,23 @@ except Exception as e:
     print(f"Konfigürasyon yüklenirken hata oluştu: {str(e)}")
     sys.exit(1)
 
+# Session deposunu başlat: varsayılan SQLite (WAL) + LRU, yalnızca değişen anahtarlar yazılır
+if config.session_store == 'filesystem':
+    app.config['SESSION_TYPE'] = 'filesystem'
+    app.config['SESSION_KEY_PREFIX'] = 'prp_'
+    app.config['SESSION_FILE_DIR'] = os.path.join(TEMP_DIR, 'sessions')
+    os.makedirs(app.config['SESSION_FILE_DIR'], exist_ok=True)
+    Session(app)
+else:
+    session_store = MemorySessionStore() if config.session_store == 'memory' else SQLiteSessionStore(
+        cache_size=config.session_cache_size
+    )
+    app.session_interface = IndexedSessionInterface(
+        session_store,
+        lifetime_seconds=app.config['PERMANENT_SESSION_LIFETIME'],
+        use_signer=app.config['SESSION_USE_SIGNER']
+    )
+
 # Template'leri yükle
 templates = ProjectTemplates.get_templates()
 
@@ -95,51 +123,205 @@ def _sync_config_api_keys():
 # Uygulama başlatılırken bir kez çalıştır
 _sync_config_api_keys()
 
-def save_to_temp_file(data, prefix='data'):
-    """Büyük veriyi geçici dosyaya kaydet"""
+# Process genelinde tek factory - client'lar paylaşılan havuzdan gelir
+llm_factory = LLMProviderFactory(config)
+
+def _get_llm_client(provider_name):
+    """Session API anahtarını uygula ve havuzdaki LLM client'ı döndür"""
+    _apply_session_api_key(provider_name)
+    # Rate limit kuyruğunda session'lar arası adil sıralama için anahtar
+    rate_limit_key.set(getattr(session, 'sid', None) or request.remote_addr)
+    return _create_llm_client(provider_name)
+
+def _create_llm_client(provider_name, provider_configs=None):
+    """Konfigürasyona göre (failover'lı veya tekil) LLM client oluştur"""
+    if config.enable_failover:
+        return llm_factory.create_resilient_client(provider_name, provider_configs)
+    return llm_factory.create_client(provider_name, provider_configs)
+
+async def _await_ai(coro):
+    """AI coroutine'ini konfigüre edilen zaman aşımı ile bekle"""
+    return await asyncio.wait_for(coro, timeout=config.request_timeout_seconds)
+
+# Agent prompt şablonları ilk istekten önce derlenir
+prompt_registry = get_prompt_registry()
+
+# Form ve gereksinim adımları aynı açıklama için tek bir analiz paylaşır
+form_fill_memo = get_form_fill_memo(config.form_fill_memo_seconds)
+
+def _form_fill_scope(provider_name):
+    """Form doldurma sonucunun paylaşıldığı kapsam: session ve provider"""
+    return (getattr(session, 'sid', None) or request.remote_addr, provider_name)
+
+# /api/get-generated-content için istenebilecek gösterimler
+CONTENT_FORMATS = ('markdown', 'html', 'both')
+
+# Depo kullanılamadığında session'daki içerikten oluşturulan artifact'ların kimliği
+SESSION_ARTIFACT_ID = 'session'
+
+# Üretilen PRP'ler içerik hash'i ile adreslenen artifact deposunda tutulur
+artifact_store = get_artifact_store(
+    ttl_seconds=config.artifact_ttl_hours * 3600,
+    compression=config.artifact_compression
+)
+
+def _artifact_metadata(settings=None):
+    """Aktif session için artifact metadata'sı"""
+    project_data = session.get('project_data') or {}
+    return {
+        'session_id': getattr(session, 'sid', None),
+        'project_name': project_data.get('project_name') or project_data.get('name'),
+        'settings': settings
+    }
+
+# Üretilen PRP'ler ayrıca süresiz proje geçmişine yazılır (listeleme, arama, yeniden açma)
+history_store = get_history_store(
+    retention_seconds=config.history_retention_days * 24 * 3600
+) if config.history_enabled else None
+
+# Geçmişin sahibi session değil, kalıcı çalışma alanı anahtarıdır (çerez veya API başlığı);
+# anahtarı paylaşan tarayıcılar/istemciler aynı geçmişi görür
+WORKSPACE_COOKIE = 'prp_workspace'
+WORKSPACE_HEADER = 'X-Workspace-Token'
+WORKSPACE_MAX_AGE = (config.history_retention_days or 10 * 365) * 24 * 3600
+_WORKSPACE_TOKEN = re.compile(r'[A-Za-z0-9_-]{22,128}')
+
+# Agent'lar prompt'a örneklerden ve geçmiş PRP'lerden yalnızca ilgili bölümleri ekler
+context_retriever = get_context_retriever(
+    history=history_store,
+    token_budget=config.retrieval_token_budget,
+    top_k=config.retrieval_top_k
+)
+
+def _history_inputs():
+    """Geçmiş kaydı için session'daki ham üretim girdileri (yeniden açınca session'a geri yüklenir)"""
+    return {
+        'project_data': session.get('project_data') or {},
+        'requirements': session.get('project_requirements') or {},
+        'provider': session.get('selected_provider', config.default_provider),
+        'owner': content_hash(_workspace_token())
+    }
+
+def _request_workspace_token():
+    """İstekle gelen çalışma alanı anahtarı (başlık çerezden önceliklidir); yoksa veya geçersizse None"""
+    token = request.headers.get(WORKSPACE_HEADER) or request.cookies.get(WORKSPACE_COOKIE)
+    return token if token and _WORKSPACE_TOKEN.fullmatch(token) else None
+
+def _workspace_token():
+    """Geçmiş kaydı için çalışma alanı anahtarı; istekte yoksa yenisi üretilir, çerez süresi yenilenir"""
+    if 'workspace_token' not in g:
+        g.workspace_token = _request_workspace_token() or secrets.token_urlsafe(32)
+    g.refresh_workspace_cookie = True
+    return g.workspace_token
+
+@app.after_request
+def _set_workspace_cookie(response):
+    """Anahtarı olmayan tarayıcıya çalışma alanı çerezi ver; geçmişe kayıt süresini uzatır"""
+    if config.history_enabled and (g.get('refresh_workspace_cookie') or _request_workspace_token() is None):
+        response.set_cookie(
+            WORKSPACE_COOKIE,
+            g.get('workspace_token') or secrets.token_urlsafe(32),
+            max_age=WORKSPACE_MAX_AGE,
+            httponly=True,
+            secure=app.config['SESSION_COOKIE_SECURE'],
+            samesite='Lax'
+        )
+    return response
+
+def record_history(content, settings=None, inputs=None):
+    """PRP'yi proje geçmişine ekle; hata üretimi bozmaz"""
+    if history_store is None or not content:
+        return None
+    inputs = inputs or _history_inputs()
     try:
-        # Geçici dosya oluştur
-        with tempfile.NamedTemporaryFile(
-            mode='w', 
-            suffix='.json', 
-            prefix=f'{prefix}_',
-            dir=TEMP_DIR,
-            delete=False,
-            encoding='utf-8'
-        ) as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-            return f.name
+        return history_store.record(
+            inputs['project_data'], inputs['requirements'], content,
+            settings=settings, provider=inputs['provider'], owner=inputs['owner']
+        )
     except Exception as e:
-        logger.error(f"Geçici dosya kaydetme hatası: {str(e)}")
+        logger.error(f"PRP geçmişi kaydetme hatası: {str(e)}")
         return None
 
-def load_from_temp_file(filepath):
-    """Geçici dosyadan veri yükle"""
+def reserve_generated_prp(settings=None):
+    """İçeriği daha sonra yazılacak PRP için artifact ayır ve session'a bağla"""
+    artifact_id = artifact_store.reserve(**_artifact_metadata(settings))
+    session['generated_prp_artifact'] = artifact_id
+    session.pop('generated_prp', None)
+    return artifact_id
+
+def store_generated_prp(content, settings=None):
+    """Üretilen PRP'yi artifact deposuna yaz ve session'a bağla"""
     try:
-        if filepath and os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return None
+        artifact_id = artifact_store.put(content, **_artifact_metadata(settings))
     except Exception as e:
-        logger.error(f"Geçici dosya okuma hatası: {str(e)}")
+        # Depo yazılamazsa session'da tut (son çare)
+        logger.error(f"Artifact kaydetme hatası: {str(e)}")
+        session.pop('generated_prp_artifact', None)
+        session['generated_prp'] = content
+        session['generated_prp_at'] = time.time()
         return None
+    
+    session['generated_prp_artifact'] = artifact_id
+    session.pop('generated_prp', None)
+    return artifact_id
 
-def cleanup_temp_files():
-    """24 saatten eski geçici dosyaları temizle"""
-    try:
-        if not os.path.exists(TEMP_DIR):
-            return
-            
-        current_time = datetime.now()
-        for filename in os.listdir(TEMP_DIR):
-            filepath = os.path.join(TEMP_DIR, filename)
-            if os.path.isfile(filepath):
-                file_time = datetime.fromtimestamp(os.path.getmtime(filepath))
-                if current_time - file_time > timedelta(hours=24):
-                    os.remove(filepath)
-                    logger.info(f"Eski geçici dosya silindi: {filename}")
-    except Exception as e:
-        logger.error(f"Geçici dosya temizleme hatası: {str(e)}")
+def load_generated_prp():
+    """Session'a bağlı PRP içeriğini döndür (önce artifact deposu, sonra session)"""
+    artifact_id = session.get('generated_prp_artifact')
+    if artifact_id:
+        content = artifact_store.get_content(artifact_id)
+        if content:
+            return content
+    return session.get('generated_prp')
+
+def load_generated_artifact():
+    """Session'a bağlı PRP'yi Artifact olarak döndür; depoda yoksa session içeriğinden oluştur"""
+    artifact_id = session.get('generated_prp_artifact')
+    artifact = artifact_store.get(artifact_id) if artifact_id else None
+    if artifact:
+        return artifact
+    content = session.get('generated_prp')
+    if not content:
+        return None
+    project_data = session.get('project_data') or {}
+    return Artifact(SESSION_ARTIFACT_ID, content_hash(content), content,
+                    project_name=project_data.get('project_name') or project_data.get('name'),
+                    created_at=session.get('generated_prp_at') or 0.0)
+
+def store_agent_outputs(outputs):
+    """Ekip workflow'unun ara çıktılarını session'daki PRP'nin yanına kaydet (ZIP export için)"""
+    digest = generated_prp_hash()
+    if digest and outputs and session.get('generated_prp_artifact'):
+        artifact_store.put_rendition(digest, AGENT_OUTPUTS_RENDITION, json.dumps(outputs, ensure_ascii=False))
+
+def _export_context(created_at=None):
+    """Session'daki PRP ve proje verisinden export girdilerini hazırla"""
+    artifact = load_generated_artifact()
+    store = artifact_store if artifact.id != SESSION_ARTIFACT_ID else None
+    agent_outputs = store.get_rendition(artifact.hash, AGENT_OUTPUTS_RENDITION) if store else None
+    return ExportContext(
+        artifact,
+        store=store,
+        project_data=session.get('project_data', {}),
+        requirements=session.get('project_requirements', {}),
+        agent_outputs=json.loads(agent_outputs) if agent_outputs else None,
+        created_at=created_at
+    )
+
+def generated_prp_hash():
+    """Session'a bağlı PRP'nin içerik hash'i; içerik okunmadan ETag üretmek için"""
+    artifact_id = session.get('generated_prp_artifact')
+    digest = artifact_store.get_hash(artifact_id) if artifact_id else None
+    if digest:
+        return digest
+    content = session.get('generated_prp')
+    return content_hash(content) if content else None
+
+def generated_prp_created_at():
+    """Session'a bağlı PRP'nin oluşturulma zamanı; içerik okunmadan ETag üretmek için"""
+    artifact_id = session.get('generated_prp_artifact')
+    created_at = artifact_store.get_created_at(artifact_id) if artifact_id else None
+    return created_at or session.get('generated_prp_at')
 
 @app.route('/')
 def index():
@@ -267,12 +449,8 @@ def results():
     """Sonuçlar sayfası"""
     session['current_step'] = 'results'
     
-    # PRP'yi kontrol et - önce geçici dosyadan, sonra session'dan
-    generated_prp = None
-    if 'generated_prp_file' in session:
-        generated_prp = load_from_temp_file(session['generated_prp_file'])
-    elif 'generated_prp' in session:
-        generated_prp = session['generated_prp']
+    # PRP'yi kontrol et - önce artifact deposundan, sonra session'dan
+    generated_prp = load_generated_prp()
     
     if not generated_prp:
         return redirect(url_for('generation'))
@@ -282,7 +460,7 @@ def results():
                          project_data=session['project_data'])
 
 @app.route('/api/ai-fill-form', methods=['POST'])
-def ai_fill_form():
+async def ai_fill_form():
     data = request.get_json()
     description = data.get('description')
     if not description:
@@ -290,13 +468,13 @@ def ai_fill_form():
 
     expanded_desc = session.get('expanded_description', description)
     provider_name = session.get('selected_provider', config.default_provider)
-    _apply_session_api_key(provider_name)
-    factory = LLMProviderFactory(config)
-    llm_client = factory.create_client(provider_name)
+    llm_client = _get_llm_client(provider_name)
     
     try:
         agent = FormFillerAgent(llm_client, logger)
-        filled_data = asyncio.run(agent.analyze_and_fill_form(expanded_desc))
+        filled_data = await _await_ai(
+            agent.analyze_and_fill_form(expanded_desc, memo_scope=_form_fill_scope(provider_name))
+        )
         project_fields = {
             'project_name': filled_data.get('project_name'),
             'project_type': filled_data.get('project_type'),
@@ -315,7 +493,7 @@ def ai_fill_form():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/ai-fill-requirements', methods=['POST'])
-def ai_fill_requirements():
+async def ai_fill_requirements():
     data = request.get_json(silent=True) or {}
     description = data.get('description')
     
@@ -328,13 +506,13 @@ def ai_fill_requirements():
         return jsonify({'success': False, 'error': 'Project description is required'}), 400
     
     provider_name = session.get('selected_provider', config.default_provider)
-    _apply_session_api_key(provider_name)
-    factory = LLMProviderFactory(config)
-    llm_client = factory.create_client(provider_name)
+    llm_client = _get_llm_client(provider_name)
     
     try:
         agent = FormFillerAgent(llm_client, logger)
-        filled_data = asyncio.run(agent.analyze_and_fill_form(expanded_desc))
+        filled_data = await _await_ai(
+            agent.analyze_and_fill_form(expanded_desc, memo_scope=_form_fill_scope(provider_name))
+        )
         requirements_fields = {
             'functional_requirements': '\n'.join(filled_data.get('functional_requirements', [])),
             'non_functional_requirements': '\n'.join(filled_data.get('non_functional_requirements', [])),
@@ -454,92 +632,93 @@ def save_requirements():
         logger.error(f"Gereksinim kaydetme hatası: {str(e)}")
         return jsonify({'error': f'Gereksinim kaydetme hatası: {str(e)}'}), 500
 
+def _build_generation_inputs(session_project_data, session_requirements, ai_requirements, data):
+    """Session verilerini PRP Generator'ın beklediği (project_data, requirements) formatına çevir"""
+    
+    detail_level = data.get('detail_level', 'detailed')
+    include_examples = data.get('include_examples', True)
+    
+    # Proje verilerini PRP Generator için uygun formata çevir
+    # Hem eski hem yeni format için uyumluluk sağla
+    project_data = {
+        'project_name': session_project_data.get('project_name') or session_project_data.get('name'),
+        'project_type': session_project_data.get('project_type') or session_project_data.get('type'),
+        'description': session_project_data.get('description'),
+        'tech_stack': session_project_data.get('tech_stack', []),
+        'target_platform': session_project_data.get('deployment_target'),
+        'timeline': session_project_data.get('timeline'),
+        'main_goals': session_project_data.get('main_goals'),
+        'target_audience': session_project_data.get('target_audience'),
+        'budget_range': session_project_data.get('budget_range'),
+        'detail_level': detail_level,
+        'include_examples': include_examples
+    }
+    
+    # Requirements'ı da uygun formata çevir
+    # Önce manuel girilenleri, yoksa AI ile doldurulmuş verileri kullan
+    requirements = {
+        key: session_requirements.get(key) or ai_requirements.get(key, '')
+        for key in (
+            'functional_requirements', 'non_functional_requirements', 'technical_constraints',
+            'acceptance_criteria', 'user_stories', 'dependencies', 'risks'
+        )
+    }
+    
+    # Detay seviyesine göre proje verilerini zenginleştir
+    if detail_level == 'comprehensive':
+        # Kapsamlı detaylar ekle
+        project_data['include_architecture'] = True
+        project_data['include_testing'] = True
+        project_data['include_deployment'] = True
+    elif detail_level == 'basic':
+        # Temel bilgiler yeterli
+        project_data['simplified'] = True
+    
+    return project_data, requirements
+
+def _session_generation_inputs(data):
+    """Aktif session'dan üretim girdilerini ve ayarlarını hazırla"""
+    project_data, requirements = _build_generation_inputs(
+        session['project_data'],
+        session['project_requirements'],
+        session.get('ai_filled_requirements', {}),
+        data
+    )
+    settings = {
+        'detail_level': project_data['detail_level'],
+        'include_examples': project_data['include_examples'],
+        'generated_at': datetime.now().isoformat()
+    }
+    return project_data, requirements, settings
+
 @app.route('/api/generate-prp', methods=['POST'])
-def generate_prp():
+async def generate_prp():
     """PRP üretme API'si - Sample PRP formatında eksiksiz"""
     try:
         # Gerekli verileri kontrol et
         if 'project_data' not in session or 'project_requirements' not in session:
             return jsonify({'error': 'Proje verileri eksik'}), 400
         
-        # Proje verilerini al
-        session_project_data = session['project_data']
-        session_requirements = session['project_requirements']
-        
         # Üretim ayarlarını al
         data = request.get_json() or {}
-        detail_level = data.get('detail_level', 'detailed')
-        include_examples = data.get('include_examples', True)
+        project_data, requirements, settings = _session_generation_inputs(data)
         
         # LLM client oluştur
         selected_provider = session.get('selected_provider', config.default_provider)
-        _apply_session_api_key(selected_provider)
-        llm_factory = LLMProviderFactory(config)
-        llm_client = llm_factory.create_client(selected_provider)
+        llm_client = _get_llm_client(selected_provider)
         
         # PRP Generator agent'ı oluştur
         prp_generator = PRPGeneratorAgent(llm_client, logger)
         
-        # Proje verilerini PRP Generator için uygun formata çevir
-        # Hem eski hem yeni format için uyumluluk sağla
-        project_data = {
-            'project_name': session_project_data.get('project_name') or session_project_data.get('name'),
-            'project_type': session_project_data.get('project_type') or session_project_data.get('type'),
-            'description': session_project_data.get('description'),
-            'tech_stack': session_project_data.get('tech_stack', []),
-            'target_platform': session_project_data.get('deployment_target'),
-            'timeline': session_project_data.get('timeline'),
-            'main_goals': session_project_data.get('main_goals'),
-            'target_audience': session_project_data.get('target_audience'),
-            'budget_range': session_project_data.get('budget_range'),
-            'detail_level': detail_level,
-            'include_examples': include_examples
-        }
-        
-        # Requirements'ı da uygun formata çevir
-        # Önce AI ile doldurulmuş verileri kontrol et, sonra manuel girilenleri
-        ai_requirements = session.get('ai_filled_requirements', {})
-        
-        requirements = {
-            'functional_requirements': session_requirements.get('functional_requirements') or ai_requirements.get('functional_requirements', ''),
-            'non_functional_requirements': session_requirements.get('non_functional_requirements') or ai_requirements.get('non_functional_requirements', ''),
-            'technical_constraints': session_requirements.get('technical_constraints') or ai_requirements.get('technical_constraints', ''),
-            'acceptance_criteria': session_requirements.get('acceptance_criteria') or ai_requirements.get('acceptance_criteria', ''),
-            'user_stories': session_requirements.get('user_stories') or ai_requirements.get('user_stories', ''),
-            'dependencies': session_requirements.get('dependencies') or ai_requirements.get('dependencies', ''),
-            'risks': session_requirements.get('risks') or ai_requirements.get('risks', '')
-        }
-        
-        # Detay seviyesine göre proje verilerini zenginleştir
-        if detail_level == 'comprehensive':
-            # Kapsamlı detaylar ekle
-            project_data['include_architecture'] = True
-            project_data['include_testing'] = True
-            project_data['include_deployment'] = True
-        elif detail_level == 'basic':
-            # Temel bilgiler yeterli
-            project_data['simplified'] = True
-        
-        # Async fonksiyonu çalıştır
-        prp_content = asyncio.run(
+        # Agent'ı doğrudan await et
+        prp_content = await _await_ai(
             prp_generator.generate_comprehensive_prp(project_data, requirements)
         )
         
-        # Büyük veriyi geçici dosyaya kaydet
-        prp_file = save_to_temp_file(prp_content, 'prp')
-        if prp_file:
-            session['generated_prp_file'] = prp_file
-            # Session'dan büyük veriyi kaldır
-            session.pop('generated_prp', None)
-        else:
-            # Geçici dosya kaydedilemezse session'da tut (son çare)
-            session['generated_prp'] = prp_content
-        
-        session['generation_settings'] = {
-            'detail_level': detail_level,
-            'include_examples': include_examples,
-            'generated_at': datetime.now().isoformat()
-        }
+        # Büyük veriyi session yerine artifact deposunda tut
+        store_generated_prp(prp_content, settings)
+        session['generation_settings'] = settings
+        record_history(prp_content, settings)
         
         return jsonify({
             'success': True,
@@ -552,23 +731,491 @@ def generate_prp():
         logger.error(f"PRP üretme hatası: {str(e)}")
         return jsonify({'error': f'PRP üretme hatası: {str(e)}'}), 500
 
+def _sse_event(event, payload):
+    """Server-Sent Events formatında tek bir olay üret"""
+    return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+@app.route('/api/generate-prp/stream', methods=['POST'])
+def generate_prp_stream():
+    """PRP'yi Server-Sent Events ile token token üreten API"""
+    if 'project_data' not in session or 'project_requirements' not in session:
+        return jsonify({'error': 'Proje verileri eksik'}), 400
+    
+    data = request.get_json(silent=True) or {}
+    project_data, requirements, settings = _session_generation_inputs(data)
+    
+    selected_provider = session.get('selected_provider', config.default_provider)
+    try:
+        llm_client = _get_llm_client(selected_provider)
+    except Exception as e:
+        logger.error(f"PRP streaming hatası: {str(e)}")
+        return jsonify({'error': f'PRP üretme hatası: {str(e)}'}), 500
+    
+    prp_generator = PRPGeneratorAgent(llm_client, logger)
+    
+    # Session yanıt gövdesi stream edilmeden önce kaydedilir; bu yüzden sonuç artifact'ı
+    # şimdiden ayrılır ve üretim tamamlanınca içerik bu kimliğe yazılır
+    artifact_id = reserve_generated_prp(settings)
+    session['generation_settings'] = settings
+    history_inputs = _history_inputs()
+    
+    def generate():
+        yield _sse_event('start', {'settings': settings})
+        try:
+            events = iterate_async(
+                prp_generator.stream_comprehensive_prp(project_data, requirements),
+                timeout=config.request_timeout_seconds
+            )
+            for event in events:
+                if event['type'] == 'token':
+                    yield _sse_event('token', {'text': event['text']})
+                elif event['type'] == 'complete':
+                    content = event['content']
+                    artifact_store.put(content, artifact_id=artifact_id)
+                    record_history(content, settings, history_inputs)
+                    payload = {'success': True, 'length': len(content), 'settings': settings}
+                    if event['replaced']:
+                        payload['content'] = content
+                    yield _sse_event('complete', payload)
+        except Exception as e:
+            logger.error(f"PRP streaming hatası: {str(e)}")
+            yield _sse_event('error', {'error': f'PRP üretme hatası: {str(e)}'})
+    
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+# Arka plan işlerinde ilerleme, token akışı sırasında en fazla bu aralıkla kaydedilir
+JOB_PROGRESS_INTERVAL_SECONDS = 0.5
+# Token sayısından ilerleme tahmini için tipik PRP uzunluğu (karakter)
+EXPECTED_PRP_CHARS = 20000
+
+def _team_project_data(project_data, requirements):
+    """Üretim girdilerini ekip workflow'unun beklediği ProjectData modeline çevir"""
+    
+    def _match(enum_cls, value, default):
+        for member in enum_cls:
+            if value and str(value).strip().lower() in (member.value.lower(), member.name.lower()):
+                return member
+        return default
+    
+    tech_stack = project_data.get('tech_stack') or []
+    language = next(
+        (lang for lang in (_match(ProgrammingLanguage, tech, None) for tech in tech_stack) if lang),
+        ProgrammingLanguage.OTHER
+    )
+    
+    functional = (requirements.get('functional_requirements') or '').strip()
+    
+    return ProjectData(
+        name=project_data.get('project_name') or 'Proje',
+        type=_match(ProjectType, project_data.get('project_type'), ProjectType.OTHER),
+        description=project_data.get('description') or '',
+        language=language,
+        requirements=ProjectRequirements(
+            functional_requirements=functional,
+            user_stories=requirements.get('user_stories') or None,
+            constraints=requirements.get('technical_constraints') or None
+        ) if len(functional) >= 10 else None
+    )
+
+def _job_credentials():
+    """İşi kuyruğa alan session'ın provider anahtarlarını iş kaydı için şifreli olarak çöz"""
+    credentials = {}
+    for name in config.providers:
+        key, model = _session_api_setting(name)
+        if key:
+            credentials[name] = {'api_key': encrypt_secret(key), 'model': model}
+    return credentials
+
+def _job_provider_configs(payload):
+    """
+    İş kaydındaki anahtarlarla provider config kopyaları oluştur
+    
+    İş, process genelindeki (başka session'ın anahtarı uygulanmış olabilecek) config'i değil
+    yalnızca kuyruğa alındığı anda çözülen anahtarları kullanır; anahtarı olmayan
+    provider'lar kullanılamaz.
+    """
+    credentials = payload.get('credentials') or {}
+    configs = {}
+    for name, provider_cfg in config.providers.items():
+        setting = credentials.get(name) or {}
+        update = {'api_key': decrypt_secret(setting['api_key']) if setting.get('api_key') else None}
+        if setting.get('model'):
+            update['default_model'] = setting['model']
+        configs[name] = provider_cfg.model_copy(update=update)
+    return configs
+
+async def _run_prp_job(ctx):
+    """Arka plan işi: PRP Generator ile PRP üret"""
+    payload = ctx.payload
+    rate_limit_key.set(payload.get('owner'))
+    # Provider hatası fallback PRP ile 'completed' sayılmasın; iş 'failed' olur
+    prp_generator = PRPGeneratorAgent(
+        _create_llm_client(payload['provider'], _job_provider_configs(payload)), logger, strict=True
+    )
+    
+    ctx.report(0.02, 'PRP üretimi başladı')
+    received = 0
+    last_report = time.monotonic()
+    content = None
+    
+    async def _consume():
+        nonlocal received, last_report, content
+        async for event in prp_generator.stream_comprehensive_prp(payload['project_data'], payload['requirements']):
+            if event['type'] == 'token':
+                received += len(event['text'])
+                if time.monotonic() - last_report >= JOB_PROGRESS_INTERVAL_SECONDS:
+                    last_report = time.monotonic()
+                    ctx.report(min(0.95, received / EXPECTED_PRP_CHARS), f'{received} karakter üretildi')
+            elif event['type'] == 'complete':
+                content = event['content']
+    
+    await asyncio.wait_for(_consume(), timeout=config.job_timeout_seconds)
+    return {'content': content, 'settings': payload['settings']}
+
+async def _run_team_job(ctx):
+    """Arka plan işi: yazılım mühendisliği ekibi workflow'u ile PRP üret"""
+    payload = ctx.payload
+    rate_limit_key.set(payload.get('owner'))
+    team = SoftwareEngineeringTeam(
+        _create_llm_client(payload['provider'], _job_provider_configs(payload)), logger, strict=True
+    )
+    project_data = _team_project_data(payload['project_data'], payload['requirements'])
+    
+    ctx.report(0.02, 'Ekip analizi başladı')
+    results = await asyncio.wait_for(
+        team.full_analysis_workflow(
+            project_data,
+            on_stage_complete=lambda name, done, total: ctx.report(done / total, f'{name} aşaması tamamlandı')
+        ),
+        timeout=config.job_timeout_seconds
+    )
+    return {
+        'content': results['prp_content'],
+        'metadata': results['metadata'],
+        'settings': payload['settings'],
+        # ZIP export'u için ara çıktılar
+        'agent_outputs': {
+            'analysis': results['analysis_result'].model_dump(mode='json'),
+            'architecture': results['architecture_result'].model_dump(mode='json'),
+            'test_strategy': results['test_strategy'].model_dump(mode='json'),
+            'metadata': results['metadata']
+        }
+    }
+
+JOB_HANDLERS = {
+    'prp': _run_prp_job,
+    'team': _run_team_job
+}
+
+job_queue = get_job_queue(config.job_workers)
+for _kind, _handler in JOB_HANDLERS.items():
+    job_queue.register(_kind, _handler)
+job_queue.retention_seconds = config.job_retention_hours * 3600
+
+_background_started = False
+_background_lock = threading.Lock()
+
+def start_background_services():
+    """
+    İş kuyruğunu ve bağlam indeksi kurulumunu başlat (process başına bir kez)
+    
+    Import sırasında değil, sunucunun event loop'u belli olduktan sonra çağrılır: ASGI
+    modunda lifespan başlangıcında (loop benimsendikten sonra), WSGI modunda ilk istekte.
+    Böylece işler, SSE ve native async view'lar aynı loop'u ve bağlantı havuzlarını paylaşır.
+    """
+    global _background_started
+    with _background_lock:
+        if _background_started:
+            return
+        _background_started = True
+    job_queue.start()
+    if context_retriever.enabled:
+        # İlk üretim isteği indeks kurulumunu beklemesin
+        context_retriever.schedule_refresh()
+
+@app.before_request
+def _ensure_background_services():
+    start_background_services()
+
+def _public_job(job):
+    """İş kaydının istemciye gösterilecek alanları"""
+    return {
+        'job_id': job['id'],
+        'kind': job['kind'],
+        'status': job['status'],
+        'progress': round(job['progress'], 3),
+        'message': job['message'],
+        'error': job['error'],
+        'created_at': job['created_at'],
+        'started_at': job['started_at'],
+        'finished_at': job['finished_at']
+    }
+
+def _get_owned_job(job_id):
+    """İşi yalnızca kendisini oluşturan session'a döndür"""
+    job = job_queue.get(job_id)
+    if job is None or job['owner'] != getattr(session, 'sid', None):
+        return None
+    return job
+
+@app.route('/api/jobs', methods=['POST'])
+def enqueue_generation_job():
+    """PRP üretimini arka plan işi olarak kuyruğa al"""
+    if 'project_data' not in session or 'project_requirements' not in session:
+        return jsonify({'error': 'Proje verileri eksik'}), 400
+    
+    data = request.get_json(silent=True) or {}
+    kind = data.get('kind', 'prp')
+    if kind not in JOB_HANDLERS:
+        return jsonify({'error': f'Bilinmeyen iş türü: {kind}'}), 400
+    
+    project_data, requirements, settings = _session_generation_inputs(data)
+    selected_provider = session.get('selected_provider', config.default_provider)
+    
+    try:
+        # Anahtarlar şimdi çözülür; iş çalışırken global config'teki anahtar kullanılmaz
+        owner = getattr(session, 'sid', None)
+        payload = {'provider': selected_provider, 'credentials': _job_credentials()}
+        # Provider'ın bu anahtarlarla kullanılabilir olduğunu doğrula
+        _create_llm_client(selected_provider, _job_provider_configs(payload))
+        job_id = job_queue.enqueue(kind, {
+            **payload,
+            'owner': owner,
+            'project_data': project_data,
+            'requirements': requirements,
+            'settings': settings
+        }, owner=owner)
+    except Exception as e:
+        logger.error(f"İş kuyruğa alınamadı: {str(e)}")
+        return jsonify({'error': f'PRP üretme hatası: {str(e)}'}), 500
+    
+    session['generation_job_id'] = job_id
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status_url': url_for('get_generation_job', job_id=job_id),
+        'result_url': url_for('get_generation_job_result', job_id=job_id)
+    }), 202
+
+@app.route('/api/jobs/<job_id>')
+def get_generation_job(job_id):
+    """Arka plan işinin durumunu ve ilerlemesini döndür"""
+    job = _get_owned_job(job_id)
+    if job is None:
+        return jsonify({'error': 'İş bulunamadı'}), 404
+    return jsonify(_public_job(job))
+
+@app.route('/api/jobs/<job_id>/result')
+def get_generation_job_result(job_id):
+    """Tamamlanan işin PRP içeriğini döndür ve session'a bağla"""
+    job = _get_owned_job(job_id)
+    if job is None:
+        return jsonify({'error': 'İş bulunamadı'}), 404
+    if job['status'] != 'completed':
+        return jsonify({**_public_job(job), 'error': job['error'] or 'İş henüz tamamlanmadı'}), 409
+    
+    result = job['result']
+    if session.get('generation_job_id') == job_id and session.get('generation_job_saved') != job_id:
+        # Sonuç sayfası ve indirme uçları aynı artifact'tan okusun
+        store_generated_prp(result['content'], result.get('settings'))
+        session['generation_settings'] = result.get('settings')
+        store_agent_outputs(result.get('agent_outputs'))
+        record_history(result['content'], result.get('settings'))
+        session['generation_job_saved'] = job_id
+    
+    return jsonify({'success': True, **_public_job(job), **result})
+
+@app.route('/api/batch-generate', methods=['POST'])
+def batch_generate():
+    """
+    JSONL proje kayıtlarından toplu PRP üret; sonuçlar tamamlandıkça JSONL olarak stream edilir
+    
+    Girdi ham JSONL gövdesi ya da multipart `input` dosyası olabilir. Multipart `previous`
+    dosyası (önceki çıktı) verilirse orada başarıyla tamamlanmış kayıtlar atlanır.
+    Sorgu parametreleri: `providers` (virgülle ayrılmış), `concurrency`.
+    """
+    
+    if 'input' in request.files:
+        lines = request.files['input'].read().decode('utf-8').splitlines()
+    else:
+        lines = request.get_data(as_text=True).splitlines()
+    previous = request.files.get('previous')
+    skip_ids = completed_ids(previous.read().decode('utf-8').splitlines()) if previous else set()
+    
+    try:
+        records = parse_records(lines)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if not records:
+        return jsonify({'error': 'Girdi kaydı yok'}), 400
+    
+    providers = [
+        name.strip() for name in request.args.get('providers', '').split(',') if name.strip()
+    ] or [session.get('selected_provider', config.default_provider)]
+    concurrency = min(max(request.args.get('concurrency', 4, type=int), 1), config.batch_max_concurrency)
+    
+    try:
+        # Session anahtarlarını uygula ve client'ları istek bağlamında hazırla
+        clients = {name: _get_llm_client(name) for name in providers}
+        for record in records:
+            if record.get('provider') and record['provider'] not in clients:
+                clients[record['provider']] = _get_llm_client(record['provider'])
+    except Exception as e:
+        logger.error(f"Batch başlatılamadı: {str(e)}")
+        return jsonify({'error': f'Provider hatası: {str(e)}'}), 400
+    
+    def generate():
+        results = iterate_async(
+            run_batch(records, clients.__getitem__, providers, concurrency, skip_ids),
+            timeout=config.job_timeout_seconds
+        )
+        for result in results:
+            yield to_jsonl(result)
+    
+    return Response(
+        generate(),
+        mimetype='application/x-ndjson',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+def _history_unavailable():
+    return jsonify({'error': 'PRP geçmişi devre dışı'}), 503
+
+def _history_owner():
+    """Geçmiş yalnızca kaydeden çalışma alanına açıktır; anahtarsız istekler geçmişe erişemez"""
+    token = _request_workspace_token()
+    return content_hash(token) if token else None
+
+def _history_forbidden():
+    return jsonify({'error': f'PRP geçmişi için çalışma alanı anahtarı gerekli ({WORKSPACE_HEADER})'}), 403
+
+@app.route('/api/history')
+def list_history():
+    """Çalışma alanının geçmişteki projelerini son sürüm bilgisiyle listele (`limit`, `offset`)"""
+    if history_store is None:
+        return _history_unavailable()
+    owner = _history_owner()
+    if owner is None:
+        return _history_forbidden()
+    limit = min(max(request.args.get('limit', 50, type=int), 1), 200)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    try:
+        return jsonify({'success': True, 'projects': history_store.list_projects(limit, offset, owner=owner)})
+    except Exception as e:
+        logger.error(f"PRP geçmişi listeleme hatası: {str(e)}")
+        return jsonify({'error': f'PRP geçmişi hatası: {str(e)}'}), 500
+
+@app.route('/api/history/search')
+def search_history():
+    """PRP metinlerinde tam metin arama (`q`, `limit`)"""
+    if history_store is None:
+        return _history_unavailable()
+    owner = _history_owner()
+    if owner is None:
+        return _history_forbidden()
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'error': 'Arama sorgusu gerekli'}), 400
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    try:
+        return jsonify({'success': True, 'query': query, 'results': history_store.search(query, limit, owner=owner)})
+    except Exception as e:
+        logger.error(f"PRP geçmişi arama hatası: {str(e)}")
+        return jsonify({'error': f'PRP geçmişi hatası: {str(e)}'}), 500
+
+@app.route('/api/history/projects/<int:project_id>')
+def get_history_project(project_id):
+    """Projenin kayıtlı PRP sürümlerini listele"""
+    if history_store is None:
+        return _history_unavailable()
+    owner = _history_owner()
+    if owner is None:
+        return _history_forbidden()
+    versions = history_store.versions(project_id, owner=owner)
+    if not versions:
+        return jsonify({'error': 'Proje bulunamadı'}), 404
+    return jsonify({'success': True, 'project_id': project_id, 'versions': versions})
+
+@app.route('/api/history/projects/<int:project_id>', methods=['DELETE'])
+def delete_history_project(project_id):
+    """Projeyi tüm PRP sürümleriyle geçmişten sil"""
+    if history_store is None:
+        return _history_unavailable()
+    owner = _history_owner()
+    if owner is None:
+        return _history_forbidden()
+    if not history_store.delete_project(project_id, owner=owner):
+        return jsonify({'error': 'Proje bulunamadı'}), 404
+    return jsonify({'success': True})
+
+@app.route('/api/history/versions/<int:version_id>')
+def get_history_version(version_id):
+    """Kayıtlı PRP sürümünü içeriği ve üretim girdileriyle döndür (ETag ile koşullu)"""
+    if history_store is None:
+        return _history_unavailable()
+    owner = _history_owner()
+    if owner is None:
+        return _history_forbidden()
+    version = history_store.get_version(version_id, owner=owner)
+    if version is None:
+        return jsonify({'error': 'PRP sürümü bulunamadı'}), 404
+    return conditional_response(
+        make_etag(version['content_hash'], 'history', version_id),
+        lambda: json.dumps({'success': True, **version}, ensure_ascii=False).encode('utf-8'),
+        'application/json'
+    )
+
+@app.route('/api/history/versions/<int:version_id>/open', methods=['POST'])
+def open_history_version(version_id):
+    """Kayıtlı PRP'yi yeniden üretmeden session'a bağla ve sonuç sayfasına yönlendir"""
+    if history_store is None:
+        return _history_unavailable()
+    owner = _history_owner()
+    if owner is None:
+        return _history_forbidden()
+    version = history_store.get_version(version_id, owner=owner)
+    if version is None:
+        return jsonify({'error': 'PRP sürümü bulunamadı'}), 404
+    
+    if version['project_data']:
+        session['project_data'] = version['project_data']
+    if version['requirements']:
+        session['project_requirements'] = version['requirements']
+    settings = version['settings'] or None
+    store_generated_prp(version['content'], settings)
+    session['generation_settings'] = settings
+    session['current_step'] = 'results'
+    
+    return jsonify({
+        'success': True,
+        'version_id': version_id,
+        'project_id': version['project_id'],
+        'version': version['version'],
+        'redirect': url_for('results')
+    })
+
 @app.route('/api/download-prp')
 def download_prp():
-    """PRP dosyasını indirme API'si"""
+    """PRP dosyasını indirme API'si (diske yazmadan, ETag ile koşullu)"""
     try:
-        if 'generated_prp' not in session:
+        digest = generated_prp_hash()
+        if not digest:
             return jsonify({'error': 'PRP bulunamadı'}), 404
         
-        # Geçici dosya oluştur
-        filename = f"{session['project_data']['name'].replace(' ', '_')}_PRP.md"
-        filepath = Path(f"output/{filename}")
-        filepath.parent.mkdir(exist_ok=True)
+        project_data = session.get('project_data') or {}
+        project_name = project_data.get('project_name') or project_data.get('name') or 'Proje'
+        filename = secure_filename(f"{project_name.replace(' ', '_')}_PRP.md") or 'PRP.md'
         
-        # PRP'yi dosyaya yaz
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(session['generated_prp'])
-        
-        return send_file(filepath, as_attachment=True, download_name=filename)
+        return conditional_response(
+            make_etag(digest, 'prp'),
+            lambda: load_generated_artifact().content.encode('utf-8'),
+            'text/markdown',
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
+        )
         
     except Exception as e:
         logger.error(f"PRP indirme hatası: {str(e)}")
@@ -619,68 +1266,79 @@ def select_template():
 
 @app.route('/api/get-generated-content')
 def get_generated_content():
-    """Üretilen içeriği alma API'si"""
+    """
+    Üretilen içeriği alma API'si
+    
+    `format` parametresi ile yalnızca gereken gösterim istenebilir: `markdown`, `html` veya
+    `both` (varsayılan). HTML her içerik için bir kez render edilip saklanır; yanıtlar içerik
+    hash'inden türetilen ETag ile koşulludur ve sıkıştırılır.
+    """
     try:
-        # Önce geçici dosyadan, sonra session'dan dene
-        content = None
-        if 'generated_prp_file' in session:
-            content = load_from_temp_file(session['generated_prp_file'])
-        elif 'generated_prp' in session:
-            content = session['generated_prp']
-        
-        if not content:
+        fmt = request.args.get('format', 'both')
+        if fmt not in CONTENT_FORMATS:
+            return jsonify({'error': f"Geçersiz format: {fmt}"}), 400
+        
+        digest = generated_prp_hash()
+        if not digest:
             return jsonify({'error': 'Üretilen içerik bulunamadı'}), 404
         
-        # Markdown'ı HTML'e çevir (basit)
-        html_content = content.replace('\n', '<br>')
+        def build_body():
+            artifact = load_generated_artifact()
+            # Session'dan oluşturulan içerik için render sonucu depoya yazılmaz
+            store = artifact_store if artifact.id != SESSION_ARTIFACT_ID else None
+            return json.dumps(representation(store, artifact, fmt), ensure_ascii=False).encode('utf-8')
         
-        return jsonify({
-            'success': True,
-            'content': content,
-            'html': html_content
-        })
+        return conditional_response(make_etag(digest, fmt, HTML_RENDITION), build_body, 'application/json')
         
     except Exception as e:
         logger.error(f"İçerik alma hatası: {str(e)}")
         return jsonify({'error': f'İçerik alma hatası: {str(e)}'}), 500
 
-@app.route('/api/download-file', methods=['POST'])
+@app.route('/api/download-file', methods=['GET', 'POST'])
 def download_file():
-    """Dosya indirme API'si"""
+    """
+    Dosya indirme API'si
+    
+    Format GET isteğinde `?format=`, POST isteğinde JSON gövdesiyle verilir. Çıktı kayıtlı
+    export yazıcısı tarafından parça parça üretilip doğrudan yanıta aktarılır. GET yanıtları
+    ETag ile koşulludur; aynı içerik tekrar indirildiğinde 304 döner.
+    """
     try:
-        data = request.get_json()
-        format_type = data.get('format', 'markdown')
+        if request.method == 'POST':
+            data = request.get_json(silent=True) or {}
+            format_type = data.get('format', 'markdown')
+        else:
+            format_type = request.args.get('format', 'markdown')
         
-        # Önce geçici dosyadan, sonra session'dan dene
-        content = None
-        if 'generated_prp_file' in session:
-            content = load_from_temp_file(session['generated_prp_file'])
-        elif 'generated_prp' in session:
-            content = session['generated_prp']
+        writer = get_writer(format_type)
+        if writer is None:
+            return jsonify({'error': f"Geçersiz format: {format_type}", 'formats': available_formats()}), 400
         
-        if not content:
+        digest = generated_prp_hash()
+        if not digest:
             return jsonify({'error': 'İndirilecek içerik bulunamadı'}), 404
         
-        # Format'a göre dosya hazırla
-        if format_type == 'txt':
-            # Markdown işaretlerini kaldır
-            import re
-            content = re.sub(r'[#*`]', '', content)
-        elif format_type == 'json':
-            import json
-            content = json.dumps({
+        etag_parts = [digest, writer.name, HTML_RENDITION]
+        if writer.uses_session_data:
+            # Çıktı session verisini de içerdiği için ETag'e onun hash'i eklenir
+            etag_parts.append(content_hash(json.dumps({
                 'project_data': session.get('project_data', {}),
-                'requirements': session.get('project_requirements', {}),
-                'generated_content': content,
-                'generated_at': datetime.now().isoformat()
-            }, indent=2, ensure_ascii=False)
+                'requirements': session.get('project_requirements', {})
+            }, sort_keys=True, ensure_ascii=False, default=str))[:16])
+        # Aynı içerik farklı zamanlarda kaydedilmiş olabilir; zaman damgası ETag'e eklenir
+        created_at = generated_prp_created_at() or time.time()
+        if writer.uses_created_at:
+            etag_parts.append(int(created_at * 1_000_000))
         
-        # Dosya olarak döndür
-        response = make_response(content)
-        response.headers['Content-Type'] = 'application/octet-stream'
-        response.headers['Content-Disposition'] = f'attachment; filename=prp_{int(datetime.now().timestamp())}.{format_type}'
-        
-        return response
+        return conditional_stream(
+            make_etag(*etag_parts),
+            lambda: writer.write(_export_context(created_at)),
+            writer.mimetype,
+            headers={
+                'Content-Disposition': f'attachment; filename=prp_{int(datetime.now().timestamp())}.{writer.extension}'
+            },
+            compressible=writer.compressible
+        )
         
     except Exception as e:
         logger.error(f"Dosya indirme hatası: {str(e)}")
@@ -726,11 +1384,9 @@ def submit_feedback():
 def clear_session():
     """Session temizleme API'si"""
     try:
-        # Geçici dosyaları temizle
-        if 'generated_prp_file' in session:
-            prp_file = session['generated_prp_file']
-            if os.path.exists(prp_file):
-                os.remove(prp_file)
+        # Session'a bağlı artifact'ı sil (aynı içeriği paylaşan başka kayıt yoksa blob da silinir)
+        if 'generated_prp_artifact' in session:
+            artifact_store.delete(session['generated_prp_artifact'])
         
         # Session'ı temizle
         session.clear()
@@ -759,26 +1415,41 @@ def clear_template():
         return jsonify({'error': f'Template temizleme hatası: {str(e)}'}), 500
 
 @app.route('/api/expand-description', methods=['POST'])
-def expand_description():
+async def expand_description():
     data = request.get_json()
     description = data.get('description')
     if not description:
         return jsonify({'success': False, 'error': 'Description is required'}), 400
 
     provider_name = session.get('selected_provider', config.default_provider)
-    _apply_session_api_key(provider_name)
     
     try:
-        factory = LLMProviderFactory(config)
-        llm_client = factory.create_client(provider_name)
+        llm_client = _get_llm_client(provider_name)
         prompt = f"Expand this short project description into a more detailed version, including key features, goals, and technical aspects: {description}"
-        expanded = asyncio.run(llm_client.generate_response(prompt))
+        expanded = await _await_ai(llm_client.generate_response(prompt))
         session['expanded_description'] = expanded
         return jsonify({'success': True, 'expanded_description': expanded})
     except Exception as e:
         logger.error(f"Description expansion error: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/llm-stats')
+def llm_stats():
+    """LLM katmanı ve depolama metrikleri"""
+    return jsonify({
+        'client_pool': llm_factory.client_pool.stats(),
+        'response_cache': llm_factory.response_cache.stats() if llm_factory.response_cache else None,
+        'rate_limiters': llm_factory.rate_limiters.stats() if llm_factory.rate_limiters else None,
+        'single_flight': llm_factory.single_flight.stats() if llm_factory.single_flight else None,
+        'token_usage': get_token_usage().stats(),
+        'circuit_breakers': get_circuit_breakers().stats(),
+        'form_fill_memo': form_fill_memo.stats(),
+        'prompt_templates': prompt_registry.stats(),
+        'key_vault': get_key_vault().stats(),
+        'prp_history': history_store.compression_stats() if history_store else None,
+        'retrieval': context_retriever.stats()
+    })
+
 # Context processor for template variables
 @app.context_processor
 def inject_template_vars():
@@ -806,17 +1477,16 @@ def get_progress_percentage():
     return (current_step_index / 5) * 100
 
 # Yeni yardımcı: oturum API key'lerini config'e enjekte et
+def _session_api_setting(provider_name):
+    """Session için geçerli (API anahtarı, model) çiftini döndür"""
+    # öncelik oturum, sonra db (çözülmüş anahtarlar bellekte tutulur, yalnızca bu provider okunur)
+    setting = get_api_key(provider_name) or {}
+    key = (session.get('api_keys') or {}).get(provider_name) or setting.get('api_key')
+    return key, setting.get('model') or None
+
 def _apply_session_api_key(provider_name):
     """Session'daki API anahtarını ilgili provider config'ine uygula"""
-    # öncelik oturum, sonra db
-    api_keys = session.get('api_keys') or load_api_keys()
-    key = None
-    model = None
-    if api_keys and provider_name in api_keys:
-        setting = api_keys[provider_name]
-        key = setting.get('api_key', '')
-        if isinstance(setting, dict):
-            model = setting.get('model') if setting.get('model') else None
+    key, model = _session_api_setting(provider_name)
     if key:
         try:
             config.providers[provider_name].api_key = key
@@ -855,6 +1525,8 @@ def save_api_keys():
         db_save_keys(merged)
         # Kaydetme sonrası config'i güncelle
         _sync_config_api_keys()
+        # Döndürülen anahtarlara ait eski client'ları havuzdan çıkar
+        llm_factory.invalidate_clients()
         return jsonify({'success': True, 'message': 'API anahtarları kaydedildi'})
     except Exception as e:
         logger.error(f"API anahtarları kaydetme hatası: {str(e)}")
@@ -866,8 +1538,8 @@ if __name__ == '__main__':
     os.makedirs('static', exist_ok=True)
     os.makedirs('output', exist_ok=True)
     
-    # Eski geçici dosyaları temizle
-    cleanup_temp_files()
+    # Süresi dolan artifact'ları temizle
+    artifact_store.purge_expired()
     
     # Uygulamayı başlat
     app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+Context Engineering PRP Generator - PRP Geçmişi CLI
+==================================================
+
+`data/app.db` içindeki PRP geçmişinin sıkıştırmasını ve saklama süresini yönetir. Saklanan PRP'lerle yeni bir
+sıkıştırma sözlüğü eğitip tüm sürümleri yeniden kodlamak ve durumu görmek için:
+
+    python prp_history.py retrain --samples 500
+    python prp_history.py stats
+
+Saklama süresi dolan çalışma alanlarının geçmişini hemen silmek için:
+
+    python prp_history.py purge --days 365
+"""
+
+import typer
+
+from src.storage.history_store import RETRAIN_SAMPLES, get_history_store
+from src.utils.config import load_config
+from src.utils.db import init_db
+
+cli = typer.Typer(add_completion=False, help="PRP geçmişi sıkıştırma ve saklama yönetimi")
+
+
+def _print_stats(stats: dict) -> None:
+    typer.echo(f"Codec: {stats['codec']}  sözlük: #{stats['dict_id']}")
+    for encoding, item in sorted(stats['encodings'].items()):
+        typer.echo(f"  {encoding:<12}{item['versions']:>8} sürüm{item['raw_bytes']:>14} B{item['stored_bytes']:>12} B")
+    typer.echo(f"Toplam: {stats['raw_bytes']} B -> {stats['stored_bytes']} B (oran: {stats['ratio'] or '-'})")
+
+
+@cli.command()
+def retrain(samples: int = typer.Option(RETRAIN_SAMPLES, "--samples", "-n", min=0, help="Eğitimde kullanılacak son PRP sayısı"),
+            recompress: bool = typer.Option(True, "--recompress/--no-recompress", help="Tüm sürümleri yeni sözlükle yeniden kodla")):
+    """Örnek ve saklanan PRP'lerle yeni sıkıştırma sözlüğü eğit"""
+
+    init_db()
+    store = get_history_store()
+    result = store.retrain(samples=samples, recompress=recompress)
+    typer.echo(f"Sözlük #{result['dict_id']}: {result['dict_size']} B, {result['samples']} örnek, "
+               f"{result['recompressed']} sürüm yeniden kodlandı")
+    _print_stats(store.compression_stats())
+
+
+@cli.command()
+def purge(days: int = typer.Option(None, "--days", "-d", min=1, help="Saklama süresi (varsayılan: HISTORY_RETENTION_DAYS)")):
+    """Son kaydı saklama süresinden eski çalışma alanlarının geçmişini sil"""
+
+    init_db()
+    days = days or load_config().history_retention_days
+    if not days:
+        typer.echo("Saklama süresi sınırsız; silinecek geçmiş yok")
+        return
+    store = get_history_store(retention_seconds=days * 24 * 3600)
+    typer.echo(f"{store.purge_inactive()} proje silindi")
+
+
+@cli.command()
+def stats():
+    """Kodlama başına sürüm sayısı ve sıkıştırma oranı"""
+
+    init_db()
+    _print_stats(get_history_store().compression_stats())
+
+
+if __name__ == "__main__":
+    cli()
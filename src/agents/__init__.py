@@ -6,7 +6,7 @@ from .software_architect import SoftwareArchitectAgent
 from .test_specialist import TestSpecialistAgent
 from .documentation_specialist import DocumentationSpecialistAgent
 from .form_filler_agent import FormFillerAgent
-from .prp_generator_agent import PRPGeneratorAgent
+from .prp_generator_agent import PRPGenerationError, PRPGeneratorAgent
 
 __all__ = [
     'SoftwareEngineeringTeam',
@@ -15,5 +15,6 @@ __all__ = [
     'TestSpecialistAgent',
     'DocumentationSpecialistAgent',
     'FormFillerAgent',
-    'PRPGeneratorAgent'
+    'PRPGeneratorAgent',
+    'PRPGenerationError'
 ] 
\ No newline at end of file
@@ -12,168 +12,23 @@ from ..models.project_data import (
     TestStrategy, PRPContent
 )
 from ..api.llm_factory import LLMClient
+from ..prompts import get_prompt_registry
+from ..retrieval import get_context_retriever
 from ..utils.logger import LoggerMixin, log_async_function_call
 
 class DocumentationSpecialistAgent(LoggerMixin):
     """Dokümantasyon Uzmanı AI Ajanı"""
     
-    def __init__(self, llm_client: LLMClient, logger=None):
+    def __init__(self, llm_client: LLMClient, logger=None, strict: bool = False):
         super().__init__()
         self.llm_client = llm_client
         self.logger = logger
+        # True ise LLM hatasında fallback sonuç yerine hata fırlatılır
+        self.strict = strict
         
-        self.system_prompt = """
-Sen deneyimli bir Dokümantasyon Uzmanı'sın ve Context Engineering konusunda uzmansın. 
-
-Görevin, yazılım projelerinin analiz sonuçlarını kullanarak EXAMPLE_multi_agent_prp.md formatında Context Engineering standartlarına uygun PRP (Product Requirements Prompt) dökümanları oluşturmak.
-
-ZORUNLU FORMAT (EXAMPLE_multi_agent_prp.md'den):
-
-```
-name: "[Proje Adı]: [Kısa Açıklama]"
-description: |
-
-## Purpose
-[Projenin amacını açıkla - neden bu proje gerekli]
-
-## Core Principles
-1. **Context is King**: Include ALL necessary documentation, examples, and caveats
-2. **Validation Loops**: Provide executable tests/lints the AI can run and fix
-3. **Information Dense**: Use keywords and patterns from the codebase
-4. **Progressive Success**: Start simple, validate, then enhance
-
----
-
-## Goal
-[Spesifik, ölçülebilir hedefleri tanımla]
-
-## Why
-- **Business value**: [İş değeri]
-- **Integration**: [Entegrasyon faydaları]  
-- **Problems solved**: [Çözülen problemler]
-
-## What
-[Detaylı proje açıklaması]
-
-### Success Criteria
-- [ ] [Spesifik başarı kriteri 1]
-- [ ] [Spesifik başarı kriteri 2]
-- [ ] [Spesifik başarı kriteri 3]
-
-## All Needed Context
-
-### Documentation & References
-```yaml
-# MUST READ - Include these in your context window
-- url: [relevant_documentation_url]
-  why: [neden bu dokümantasyon gerekli]
-  
-- file: [relevant_file_path]
-  why: [neden bu dosya gerekli]
-```
-
-### Current Codebase tree
-```bash
-[Mevcut proje yapısı]
-```
-
-### Desired Codebase tree with files to be added
-```bash
-[Hedeflenen proje yapısı - eklenecek dosyalar]
-```
-
-### Known Gotchas & Library Quirks
-```python
-# CRITICAL: [Kritik dikkat edilmesi gerekenler]
-# GOTCHA: [Yaygın hatalar ve çözümleri]
-```
-
-## Implementation Blueprint
-
-### Data models and structure
-```python
-[Pydantic models ve veri yapıları]
-```
-
-### List of tasks to be completed
-```yaml
-Task 1: [Görev başlığı]
-CREATE/UPDATE [dosya_yolu]:
-  - PATTERN: [Hangi pattern'i takip et]
-  - [Spesifik gereksinimler]
-
-Task 2: [Görev başlığı]
-[...]
-```
-
-### Per task pseudocode
-```python
-# Task X: [Görev açıklaması]
-def example_function():
-    # PATTERN: [Hangi pattern'i kullan]
-    # GOTCHA: [Dikkat edilecek noktalar]
-    pass
-```
-
-### Integration Points
-```yaml
-ENVIRONMENT:
-  - add to: .env
-  - vars: |
-      [Environment variables]
-      
-CONFIG:
-  - [Konfigürasyon detayları]
-  
-DEPENDENCIES:
-  - Update requirements.txt with:
-    - [Yeni bağımlılıklar]
-```
-
-## Validation Loop
-
-### Level 1: Syntax & Style
-```bash
-# Run these FIRST - fix any errors before proceeding
-[Syntax ve style kontrol komutları]
-```
-
-### Level 2: Unit Tests
-```python
-# [Test dosyası adı]
-async def test_[feature]():
-    \"\"\"[Test açıklaması]\"\"\"
-    [Test kodu]
-```
-
-### Level 3: Integration Test
-```bash
-# Test CLI interaction
-[Integration test adımları]
-```
-
-## Final Validation Checklist
-- [ ] [Kontrol listesi 1]
-- [ ] [Kontrol listesi 2]
-- [ ] [Kontrol listesi 3]
-
-## Anti-Patterns to Avoid
-- ❌ [Kaçınılması gereken pattern 1]
-- ❌ [Kaçınılması gereken pattern 2]
-
-## Confidence Score: X/10
-[Güven skoru açıklaması]
-```
-
-ÖNEMLI KURALLAR:
-- CLAUDE.md ve INITIAL.md dosyalarındaki talimatları takip et
-- Context Engineering prensiplerini tam olarak uygula
-- Tüm AI kod geliştirme araçları ile uyumlu olmalı
-- Executable code examples ekle
-- YAML, Python, Bash kod blokları kullan
-- Comprehensive validation loops oluştur
-- Türkçe açıklamalar ama teknik terimler İngilizce
-"""
+        self.prompts = get_prompt_registry()
+        self.system_prompt = self.prompts.render('documentation_specialist/system')
+        self.retriever = get_context_retriever()
     
     @log_async_function_call
     async def generate_prp(self, 
@@ -215,6 +70,8 @@ async def test_[feature]():
             
         except Exception as e:
             self.log_error(f"PRP oluşturma hatası: {str(e)}")
+            if self.strict:
+                raise
             return self._create_fallback_prp(project_data, analysis_result, architecture_result, test_strategy)
     
     def _create_prp_prompt(self, 
@@ -224,107 +81,15 @@ async def test_[feature]():
                           test_strategy: TestStrategy) -> str:
         """PRP oluşturma prompt'unu hazırla"""
         
-        prompt = f"""
-Context Engineering standartlarına uygun bir PRP (Product Requirements Prompt) oluştur:
-
-# Proje Bilgileri
-- **Proje Adı**: {project_data.name}
-- **Proje Türü**: {project_data.type}
-- **Programlama Dili**: {project_data.language}
-- **Hedef Platformlar**: {', '.join(project_data.platform) if project_data.platform else 'Belirtilmemiş'}
-- **Ekip Büyüklüğü**: {project_data.team_size or 'Belirtilmemiş'}
-- **Hedef Süre**: {project_data.timeline or 'Belirtilmemiş'}
-
-## Proje Açıklaması
-{project_data.description}
-
-# Sistem Analizi Sonuçları
-- **Karmaşıklık Skoru**: {analysis_result.complexity_score}/10
-- **Risk Faktörleri**: {', '.join(analysis_result.risk_factors)}
-- **Önerilen Yaklaşım**: {analysis_result.recommended_approach}
-- **Ana Zorluklar**: {', '.join(analysis_result.key_challenges)}
-- **Başarı Kriterleri**: {', '.join(analysis_result.success_criteria)}
-- **Tahmini Efor**: {analysis_result.estimated_effort}
-
-# Mimari Tasarım
-- **Mimari Pattern**: {architecture_result.architecture_pattern}
-- **Teknoloji Stack**: {', '.join(f"{k}: {v}" for k, v in architecture_result.technology_stack.items())}
-- **Sistem Bileşenleri**: {', '.join(architecture_result.system_components)}
-- **Veri Akışı**: {architecture_result.data_flow}
-- **Güvenlik Değerlendirmeleri**: {', '.join(architecture_result.security_considerations)}
-- **Ölçeklenebilirlik Planı**: {architecture_result.scalability_plan}
-
-# Test Stratejisi
-- **Test Seviyeleri**: {', '.join(test_strategy.test_levels)}
-- **Test Framework'leri**: {', '.join(test_strategy.test_frameworks)}
-- **Kapsam Hedefleri**: {', '.join(f"{k}: %{v}" for k, v in test_strategy.coverage_targets.items())}
-- **Kalite Kontrol Noktaları**: {', '.join(test_strategy.quality_gates)}
-- **Performans Testleri**: {', '.join(test_strategy.performance_tests)}
-"""
-        
-        # Gereksinimler varsa ekle
-        if project_data.requirements:
-            req = project_data.requirements
-            prompt += f"""
-# Detaylı Gereksinimler
-## Fonksiyonel Gereksinimler
-{req.functional_requirements}
-
-## Teknik Gereksinimler
-- **Framework/Kütüphaneler**: {req.frameworks or 'Belirtilmemiş'}
-- **Veritabanı**: {req.database or 'Belirtilmemiş'}
-- **Kimlik Doğrulama**: {req.authentication or 'Belirtilmemiş'}
-- **Deployment**: {req.deployment or 'Belirtilmemiş'}
-- **Performans**: {req.performance or 'Belirtilmemiş'}
-- **Güvenlik**: {req.security or 'Belirtilmemiş'}
-
-## Kullanıcı Hikayeleri
-{req.user_stories or 'Belirtilmemiş'}
-
-## Kısıtlamalar
-{req.constraints or 'Belirtilmemiş'}
-
-## Özel Gereksinimler
-{req.special_requirements or 'Belirtilmemiş'}
-
-## AI Araç Uyumluluğu
-Hedef AI Araçları: {', '.join(req.ai_tools)}
-Context Tercihleri: {req.context_preferences or 'Belirtilmemiş'}
-"""
-        
-        prompt += """
-# PRP Oluşturma Görevin
-
-Yukarıdaki tüm bilgileri kullanarak Context Engineering standartlarına uygun bir PRP oluştur. 
-
-PRP şu bölümleri içermeli:
-
-1. **Purpose**: Bu PRP'nin amacı ve hedefi
-2. **Core Principles**: Context Engineering prensipleri
-3. **Goal**: Spesifik proje hedefleri
-4. **Implementation Blueprint**: 
-   - Data Models (kod örnekleri ile)
-   - Task List (öncelik sırasına göre)
-   - Architecture Overview
-   - Technology Stack Details
-5. **Validation Loop**: 
-   - Syntax & Style checks
-   - Testing requirements
-   - Performance benchmarks
-   - Security validations
-6. **Confidence Score**: Bu PRP'nin güven skoru (1-10)
-
-## Önemli Notlar:
-- Tüm AI kod geliştirme araçları (Claude, Cursor, GitHub Copilot, etc.) ile uyumlu olmalı
-- Kod örnekleri dahil et
-- Spesifik ve actionable olmalı
-- Context Engineering yaklaşımını tam olarak uygula
-- Markdown formatında çıktı ver
-
-Lütfen kapsamlı ve detaylı bir PRP oluştur.
-"""
-        
-        return prompt
+        return self.prompts.render(
+            'documentation_specialist/prp',
+            project=project_data,
+            analysis=analysis_result,
+            architecture=architecture_result,
+            test_strategy=test_strategy,
+            req=project_data.requirements,
+            references=self.retriever.context_for(project_data)
+        )
     
     def _create_fallback_prp(self, 
                             project_data: ProjectData,
@@ -3,11 +3,25 @@ Form Doldurma Uzmanı
 ===================
 
 Bu modül, proje açıklamasına göre form alanlarını otomatik dolduran AI agent'ı içerir.
+
+Sihirbazın form ve gereksinim adımları aynı açıklama için aynı analizi kullanır;
+`FormFillMemo` sonucu kapsam (session/provider) ve açıklama hash'i başına saklar ve
+devam eden analizi ikinci isteğe paylaştırır.
 """
 
-import json
-from typing import Dict, Any, List, Optional
+import asyncio
+import concurrent.futures
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Any, Hashable, List, Optional, Tuple
+from pydantic import ValidationError
 from ..api.llm_factory import LLMClient
+from ..api.resilience import is_transient_error
+from ..models.project_data import FormFillResult
+from ..prompts import get_prompt_registry
+from ..utils.json_extract import extract_json_object
 from ..utils.logger import LoggerMixin, log_async_function_call
 
 class FormFillerAgent(LoggerMixin):
@@ -17,100 +31,127 @@ class FormFillerAgent(LoggerMixin):
         super().__init__()
         self.llm_client = llm_client
         self.logger = logger
+        self.prompts = get_prompt_registry()
         
         self.log_info("Form Doldurma Uzmanı başlatıldı")
     
-    async def analyze_and_fill_form(self, project_description: str) -> Dict[str, Any]:
+    async def analyze_and_fill_form(self,
+                                    project_description: str,
+                                    memo_scope: Optional[Hashable] = None) -> Dict[str, Any]:
         """
         Proje açıklamasını analiz ederek form alanlarını otomatik doldur
         
         Args:
             project_description: Proje açıklaması
+            memo_scope: Verilirse (ör. session ve provider) aynı kapsam ve açıklama için sonuç
+                paylaşılır; devam eden analiz varsa yeni LLM çağrısı yapılmadan beklenir
             
         Returns:
             Form alanları için önerilen değerler
         """
         
+        try:
+            if memo_scope is None:
+                form_data = await self.fill_form(project_description)
+            else:
+                form_data = await get_form_fill_memo().get_or_fill(
+                    memo_scope, project_description, lambda: self.fill_form(project_description)
+                )
+        except Exception as e:
+            self.log_error(f"Form doldurma hatası: {str(e)}")
+            form_data = None
+        
+        return form_data if form_data is not None else self._get_fallback_response()
+    
+    async def fill_form(self, project_description: str) -> Optional[Dict[str, Any]]:
+        """
+        Form alanlarını LLM ile çıkar (varsayılan yanıta düşmeden)
+        
+        Returns:
+            Form alanları; LLM yanıtından alan ayıklanamadıysa None
+        """
+        
         self.log_info(
             "Proje açıklaması analiz ediliyor",
             description_length=len(project_description)
         )
         
+        # Sistem prompt'u
+        system_prompt = self._get_system_prompt()
+        
+        # User prompt'u
+        user_prompt = self.prompts.render('form_filler/fill', description=project_description)
+        
+        # Önce typed output (tool calling), desteklenmiyorsa serbest metinden JSON ayıkla
+        form_data = await self._fill_structured(system_prompt, user_prompt)
+        if form_data is None:
+            form_data = await self._fill_from_text(system_prompt, user_prompt)
+        
+        if form_data is None:
+            self.log_error("LLM yanıtından form alanları ayıklanamadı")
+            return None
+        
+        self.log_info(
+            "Form alanları başarıyla dolduruldu",
+            filled_fields=len(form_data)
+        )
+        
+        return form_data
+    
+    async def _fill_structured(self, system_prompt: str, user_prompt: str) -> Optional[Dict[str, Any]]:
+        """
+        Form alanlarını pydantic_ai typed output ile al
+        
+        Returns:
+            Form alanları; provider yapılandırılmış çıktı üretemediyse None
+        """
+        
+        agent = self.llm_client.create_agent(
+            system_prompt=system_prompt,
+            output_type=FormFillResult
+        )
+        
         try:
-            # Sistem prompt'u
-            system_prompt = self._get_system_prompt()
-            
-            # User prompt'u
-            user_prompt = f"""
-            Lütfen aşağıdaki proje açıklamasını analiz ederek form alanlarını otomatik doldur:
-
-            PROJE AÇIKLAMASI:
-            {project_description}
-
-            Lütfen yanıtını sadece JSON formatında ver, başka hiçbir açıklama ekleme.
-            """
-            
-            # LLM'den yanıt al
-            # Sistem ve kullanıcı prompt'larını birleştir
-            full_prompt = f"{system_prompt}\n\n{user_prompt}"
-            response = await self.llm_client.generate_response(full_prompt)
-            
-            # JSON'u parse et
-            try:
-                form_data = json.loads(response)
-                
-                self.log_info(
-                    "Form alanları başarıyla dolduruldu",
-                    filled_fields=len(form_data)
-                )
-                
-                return form_data
-                
-            except json.JSONDecodeError as e:
-                self.log_error(f"JSON parse hatası: {str(e)}")
-                return self._get_fallback_response()
-                
+            result = await agent.run(user_prompt)
         except Exception as e:
-            self.log_error(f"Form doldurma hatası: {str(e)}")
-            return self._get_fallback_response()
+            # Geçici hatalar metin modunda da tekrarlanır; doğrudan yukarı ilet
+            if is_transient_error(e):
+                raise
+            self.log_warning(f"Yapılandırılmış çıktı alınamadı, metin moduna geçiliyor: {str(e)}")
+            return None
+        
+        output = result.output
+        if isinstance(output, FormFillResult):
+            return output.model_dump(exclude_none=True)
+        if isinstance(output, str):
+            # Tool calling desteklemeyen agent'lar metin döndürebilir
+            return self._parse_form_json(output)
+        return None
+    
+    async def _fill_from_text(self, system_prompt: str, user_prompt: str) -> Optional[Dict[str, Any]]:
+        """Form alanlarını serbest metin yanıtından ayıkla"""
+        
+        # Sistem prompt'u ayrı mesaj olarak gider (provider prompt cache)
+        response = await self.llm_client.generate_response(user_prompt, system_prompt=system_prompt)
+        return self._parse_form_json(response)
+    
+    def _parse_form_json(self, text: str) -> Optional[Dict[str, Any]]:
+        """Metindeki JSON nesnesini ayıkla ve form modeline göre doğrula"""
+        
+        data = extract_json_object(text)
+        if data is None:
+            return None
+        
+        try:
+            return FormFillResult.model_validate(data).model_dump(exclude_none=True)
+        except ValidationError as e:
+            self.log_warning(f"Form JSON doğrulama hatası: {str(e)}")
+            return None
     
     def _get_system_prompt(self) -> str:
         """Sistem prompt'unu döndür"""
         
-        return """
-        Sen bir Form Doldurma Uzmanısın. Verilen proje açıklamasını analiz ederek 
-        proje kurulum formundaki alanları otomatik olarak doldurman gerekiyor.
-
-        Görevin:
-        1. Proje açıklamasını dikkatlice analiz et
-        2. Proje türünü, hedef kitleyi, teknoloji stack'ini ve diğer detayları çıkar
-        3. Form alanlarını mantıklı şekilde doldur
-        4. Sadece JSON formatında yanıt ver
-
-        FORM ALANLARI:
-        - project_name: Proje adı (açıklamadan çıkar)
-        - project_type: Proje türü (Web Application, Mobile App, Desktop Application, API/Backend Service, Static Website, E-commerce Platform, Dashboard/Analytics, Marketing Website, Portfolio Website, Blog/CMS, Other)
-        - description: Proje açıklaması (verilen açıklamayı düzenleyip iyileştir)
-        - target_audience: Hedef kitle
-        - timeline: Zaman çizelgesi (1-2 hafta, 2-3 hafta, 1-2 ay, 2-3 ay, 3-6 ay, 6+ ay)
-        - deployment_target: Deployment hedefi (Vercel, Netlify, AWS, Google Cloud, Azure, Heroku, DigitalOcean, Self-hosted, Other)
-        - budget_range: Bütçe aralığı (Kişisel proje, Küçük bütçe (< $1K), Orta bütçe ($1K - $10K), Büyük bütçe ($10K+), Kurumsal proje)
-        - main_goals: Ana hedefler (liste olarak)
-        - tech_stack: Teknoloji stack (liste olarak)
-        - additional_requirements: Ek gereksinimler (liste olarak)
-        - functional_requirements: Fonksiyonel gereksinimler (liste olarak)
-        - non_functional_requirements: Fonksiyonel olmayan gereksinimler (liste olarak)
-        - technical_requirements: Teknik gereksinimler (liste olarak)
-        - constraints: Kısıtlamalar (liste olarak)
-
-        KURALLARI:
-        1. Sadece JSON formatında yanıt ver
-        2. Tüm alanları doldur
-        3. Proje türü mutlaka verilen seçeneklerden biri olmalı
-        4. Teknoloji stack'i popüler teknolojilerden seç
-        5. Hedef kitle ve ana hedefleri açıklamadan çıkar
-        6. Zaman çizelgesi ve bütçeyi proje karmaşıklığına göre belirle
-        """
+        return self.prompts.render('form_filler/system')
     
     def _get_fallback_response(self) -> Dict[str, Any]:
         """Hata durumunda varsayılan yanıt"""
@@ -156,4 +197,98 @@ class FormFillerAgent(LoggerMixin):
                 "Sınırlı bütçe",
                 "Hızlı geliştirme süreci"
             ]
-        } 
\ No newline at end of file
+        }
+
+
+class FormFillMemo:
+    """
+    Form doldurma sonuçları için süreli, single-flight önbellek
+    
+    Aynı anahtar için ilk çağrı analizi başlatır; sonraki çağrılar (hangi event loop'ta
+    olursa olsun) aynı concurrent Future'ı bekler. Yalnızca başarılı sonuçlar saklanır.
+    """
+    
+    def __init__(self, ttl_seconds: float = 900, max_entries: int = 512):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Tuple[float, concurrent.futures.Future]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _key(scope: Hashable, description: str) -> Tuple:
+        return (scope, hashlib.sha256(description.encode('utf-8')).hexdigest())
+    
+    async def get_or_fill(self,
+                          scope: Hashable,
+                          description: str,
+                          fill: Callable[[], Awaitable[Optional[Dict[str, Any]]]]) -> Optional[Dict[str, Any]]:
+        """Saklanan veya devam eden sonucu döndür; yoksa `fill` ile üret"""
+        
+        key = self._key(scope, description)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                future, owner = entry[1], False
+            else:
+                future = concurrent.futures.Future()
+                self._entries[key] = (now + self.ttl_seconds, future)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                self.misses += 1
+                owner = True
+        
+        if not owner:
+            try:
+                # Bekleyenin iptali paylaşılan analizi iptal etmesin
+                result = await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    # Analizi başlatan istek zaman aşımına uğradı
+                    return None
+                raise
+            return dict(result) if result is not None else None
+        
+        try:
+            result = await fill()
+        except BaseException as e:
+            self._discard(key, future)
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+            raise
+        
+        if result is None:
+            self._discard(key, future)
+        future.set_result(result)
+        return result
+    
+    def _discard(self, key: Tuple, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is future:
+                del self._entries[key]
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+_memo: Optional[FormFillMemo] = None
+_memo_lock = threading.Lock()
+
+
+def get_form_fill_memo(ttl_seconds: Optional[float] = None) -> FormFillMemo:
+    """Process genelindeki form doldurma önbelleğini döndür"""
+    global _memo
+    with _memo_lock:
+        if _memo is None:
+            _memo = FormFillMemo() if ttl_seconds is None else FormFillMemo(ttl_seconds)
+        elif ttl_seconds is not None:
+            _memo.ttl_seconds = ttl_seconds
+        return _memo
@@ -5,19 +5,37 @@ PRP Generator Agent
 Bu modül, sample_prp.md formatında eksiksiz Product Requirements Prompt üreten AI agent'ı içerir.
 """
 
-import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional
 from datetime import datetime
 from ..api.llm_factory import LLMClient
+from ..prompts import get_prompt_registry
+from ..retrieval import get_context_retriever
 from ..utils.logger import LoggerMixin
 
+# Bundan kısa LLM çıktıları geçersiz sayılır ve fallback PRP ile değiştirilir
+MIN_OUTPUT_CHARS = 100
+
+class PRPGenerationError(RuntimeError):
+    """Strict modda PRP üretilemediğinde (fallback yerine) fırlatılır"""
+
 class PRPGeneratorAgent(LoggerMixin):
     """Sample PRP formatında eksiksiz PRP üreten agent"""
     
-    def __init__(self, llm_client: LLMClient, logger=None):
+    def __init__(self, llm_client: LLMClient, logger=None, strict: bool = False):
+        """
+        Args:
+            llm_client: PRP'yi üretecek LLM client
+            logger: Opsiyonel logger
+            strict: True ise giriş hatası, provider hatası veya geçersiz çıktıda fallback/hata
+                PRP'si döndürmek yerine hata fırlatılır (batch ve arka plan işleri sonucu
+                başarısız olarak kaydedebilsin diye)
+        """
         super().__init__()
         self.llm_client = llm_client
         self.logger = logger
+        self.strict = strict
+        self.prompts = get_prompt_registry()
+        self.retriever = get_context_retriever()
         
         self.log_info("PRP Generator Agent başlatıldı")
     
@@ -33,6 +51,9 @@ class PRPGeneratorAgent(LoggerMixin):
             
         Returns:
             Sample PRP formatında eksiksiz PRP metni
+            
+        Raises:
+            PRPGenerationError: Strict modda giriş geçersizse veya çıktı kullanılamıyorsa
         """
         
         # Detay seviyesi kontrolü
@@ -45,6 +66,8 @@ class PRPGeneratorAgent(LoggerMixin):
         validation_result = self._validate_inputs(project_data, requirements, detail_level)
         if not validation_result['valid']:
             self.log_error(f"Giriş validasyon hatası: {validation_result['error']}")
+            if self.strict:
+                raise PRPGenerationError(f"Giriş validasyon hatası: {validation_result['error']}")
             return self._get_error_prp(validation_result['error'], project_data)
         
         try:
@@ -54,9 +77,9 @@ class PRPGeneratorAgent(LoggerMixin):
             # Detay seviyesine göre user prompt'u
             user_prompt = self._create_user_prompt(project_data, requirements, detail_level)
             
-            # LLM'den yanıt al
-            full_prompt = f"{system_prompt}\n\n{user_prompt}"
-            response = await self.llm_client.generate_response(full_prompt)
+            # LLM'den yanıt al; statik sistem prompt'u ayrı mesaj olarak gider (provider prompt cache)
+            response = await self.llm_client.generate_response(user_prompt, system_prompt=system_prompt)
+            self._check_output(response)
             
             # Çıktı validasyonu
             validated_response = self._validate_output(response, detail_level)
@@ -66,8 +89,69 @@ class PRPGeneratorAgent(LoggerMixin):
                 
         except Exception as e:
             self.log_error(f"PRP üretme hatası: {str(e)}")
+            if self.strict:
+                raise
             return self._get_fallback_prp(project_data, requirements, detail_level)
     
+    async def stream_comprehensive_prp(self,
+                                       project_data: Dict[str, Any],
+                                       requirements: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Eksiksiz PRP'yi provider'ın streaming API'si ile parça parça üret
+        
+        Args:
+            project_data: Proje temel bilgileri
+            requirements: Proje gereksinimleri
+            
+        Yields:
+            {'type': 'token', 'text': ...} olayları ve en sonda validate edilmiş metni içeren
+            {'type': 'complete', 'content': ..., 'replaced': bool} olayı. `replaced` True ise
+            son içerik stream edilen metinden farklıdır (hata/fallback PRP).
+            
+        Raises:
+            PRPGenerationError: Strict modda giriş geçersizse veya çıktı kullanılamıyorsa
+        """
+        
+        detail_level = project_data.get('detail_level', 'detailed')
+        include_examples = project_data.get('include_examples', True)
+        
+        self.log_info(f"PRP streaming üretimi başlatılıyor - Detay seviyesi: {detail_level}")
+        
+        validation_result = self._validate_inputs(project_data, requirements, detail_level)
+        if not validation_result['valid']:
+            self.log_error(f"Giriş validasyon hatası: {validation_result['error']}")
+            if self.strict:
+                raise PRPGenerationError(f"Giriş validasyon hatası: {validation_result['error']}")
+            yield {
+                'type': 'complete',
+                'content': self._get_error_prp(validation_result['error'], project_data),
+                'replaced': True
+            }
+            return
+        
+        chunks: List[str] = []
+        try:
+            system_prompt = self._get_system_prompt(detail_level, include_examples)
+            user_prompt = self._create_user_prompt(project_data, requirements, detail_level)
+            
+            async for delta in self.llm_client.stream_response(user_prompt, system_prompt=system_prompt):
+                chunks.append(delta)
+                yield {'type': 'token', 'text': delta}
+            
+            streamed = ''.join(chunks)
+            self._check_output(streamed)
+            content = self._validate_output(streamed, detail_level)
+            self.log_info(f"PRP streaming ile üretildi - Uzunluk: {len(content)} karakter")
+            
+        except Exception as e:
+            self.log_error(f"PRP streaming hatası: {str(e)}")
+            if self.strict:
+                raise
+            streamed = ''.join(chunks)
+            content = self._get_fallback_prp(project_data, requirements, detail_level)
+        
+        yield {'type': 'complete', 'content': content, 'replaced': content != streamed}
+    
     def _validate_inputs(self, project_data: Dict[str, Any], requirements: Dict[str, Any], detail_level: str) -> Dict[str, Any]:
         """Giriş verilerini validate et"""
         
@@ -111,55 +195,26 @@ class PRPGeneratorAgent(LoggerMixin):
         }
     
     def _create_user_prompt(self, project_data: Dict[str, Any], requirements: Dict[str, Any], detail_level: str) -> str:
-        """Detay seviyesine göre user prompt oluştur"""
-        
-        base_prompt = f"""
-        Lütfen aşağıdaki proje bilgilerini kullanarak sample_prp.md formatında bir Product Requirements Prompt oluştur:
-
-        PROJE BİLGİLERİ:
-        {json.dumps(project_data, indent=2, ensure_ascii=False)}
-
-        GEREKSİNİMLER:
-        {json.dumps(requirements, indent=2, ensure_ascii=False)}
-        """
+        """Detay seviyesine göre user prompt oluştur (projeye en yakın örnek bölümleriyle)"""
+        
+        return self.prompts.render(
+            'prp_generator/user',
+            project_data=project_data,
+            requirements=requirements,
+            detail_level=detail_level,
+            references=self.retriever.context_for(project_data, requirements)
+        )
+    
+    def _check_output(self, response: str) -> None:
+        """Strict modda kullanılamayacak (fallback ile değiştirilecek) çıktıyı reddet"""
         
-        # Detay seviyesine göre özel talimatlar
-        if detail_level == 'basic':
-            base_prompt += """
-            
-            DETAY SEVİYESİ: TEMEL
-            - Temel bölümleri içeren kısa ve öz bir PRP oluştur
-            - Purpose, Goal, Implementation Blueprint ve Validation Loop bölümlerini dahil et
-            - Kod örnekleri basit ve anlaşılır olsun
-            - Maksimum 2000 kelime ile sınırla
-            """
-        elif detail_level == 'detailed':
-            base_prompt += """
-            
-            DETAY SEVİYESİ: DETAYLI
-            - Standart PRP formatında tüm ana bölümleri dahil et
-            - Kod örnekleri ve pseudocode ekle
-            - Test stratejileri ve validation adımları detaylandır
-            - Orta seviye karmaşıklıkta içerik üret
-            """
-        elif detail_level == 'comprehensive':
-            base_prompt += """
-            
-            DETAY SEVİYESİ: KAPSAMLI
-            - Sample_prp.md formatında TÜM bölümleri eksiksiz dahil et
-            - Detaylı kod örnekleri, pseudocode ve implementasyon adımları
-            - Kapsamlı test stratejileri ve validation döngüleri
-            - Architecture patterns ve best practices dahil et
-            - Integration points ve deployment stratejileri ekle
-            - Anti-patterns ve gotchas bölümlerini detaylandır
-            """
-        
-        return base_prompt
+        if self.strict and (not response or len(response.strip()) < MIN_OUTPUT_CHARS):
+            raise PRPGenerationError("PRP çıktısı çok kısa veya boş")
     
     def _validate_output(self, response: str, detail_level: str) -> str:
         """Çıktıyı validate et ve gerekirse düzelt"""
         
-        if not response or len(response.strip()) < 100:
+        if not response or len(response.strip()) < MIN_OUTPUT_CHARS:
             self.log_error("PRP çıktısı çok kısa veya boş")
             return self._get_fallback_prp({}, {}, detail_level)
         
@@ -232,186 +287,12 @@ Lütfen eksik bilgileri tamamlayıp tekrar deneyin.
     def _get_system_prompt(self, detail_level: str = 'detailed', include_examples: bool = True) -> str:
         """Detay seviyesine göre sistem prompt'unu döndür"""
         
-        base_prompt = """
-        Sen bir Product Requirements Prompt (PRP) uzmanısın. Görevin, verilen proje bilgilerini kullanarak 
-        sample_prp.md formatında profesyonel bir PRP oluşturmak.
-
-        PRP FORMATI (sample_prp.md'deki gibi):
-
-        ```
-        name: "Proje Adı"
-        description: |
-        
-        ## Purpose
-        [Projenin amacı ve neden önemli olduğu]
-        
-        ## Core Principles
-        1. **Context is King**: Include ALL necessary documentation, examples, and caveats
-        2. **Validation Loops**: Provide executable tests/lints the AI can run and fix
-        3. **Information Dense**: Use keywords and patterns from the codebase
-        4. **Progressive Success**: Start simple, validate, then enhance
-        
-        ---
-        
-        ## Goal
-        [Net ve ölçülebilir hedef]
-        
-        ## Why
-        - **Business value**: [İş değeri]
-        - **Integration**: [Entegrasyon faydaları]
-        - **Problems solved**: [Çözülen problemler]
-        
-        ## What
-        [Detaylı proje açıklaması ve özellikler]
-        
-        ### Success Criteria
-        - [ ] [Başarı kriteri 1]
-        - [ ] [Başarı kriteri 2]
-        - [ ] [Başarı kriteri 3]
-        
-        ## All Needed Context
-        
-        ### Documentation & References
-        ```yaml
-        # MUST READ - Include these in your context window
-        - url: [İlgili dokümantasyon URL'leri]
-          why: [Neden önemli]
-        
-        - file: [İlgili dosyalar]
-          why: [Neden önemli]
-        ```
-        
-        ### Current Codebase tree
-        ```bash
-        [Mevcut proje yapısı]
-        ```
-        
-        ### Desired Codebase tree with files to be added
-        ```bash
-        [Hedeflenen proje yapısı]
-        ```
-        
-        ### Known Gotchas & Library Quirks
-        ```python
-        # CRITICAL: [Önemli uyarılar ve kütüphane özellikleri]
-        ```
-        
-        ## Implementation Blueprint
-        
-        ### Data models and structure
-        ```python
-        [Veri modelleri ve yapıları]
-        ```
-        
-        ### List of tasks to be completed
-        ```yaml
-        Task 1: [Görev adı]
-        CREATE [dosya]:
-          - PATTERN: [Kullanılacak pattern]
-          - [Detaylı açıklama]
-        
-        Task 2: [Görev adı]
-        [Devamı...]
-        ```
-        
-        ### Per task pseudocode
-        ```python
-        # Task 1: [Görev adı]
-        [Pseudocode örneği]
-        ```
-        
-        ### Integration Points
-        ```yaml
-        ENVIRONMENT:
-          - add to: .env
-          - vars: |
-              [Environment variables]
-              
-        CONFIG:
-          - [Konfigürasyon detayları]
-          
-        DEPENDENCIES:
-          - [Bağımlılıklar]
-        ```
-        
-        ## Validation Loop
-        
-        ### Level 1: Syntax & Style
-        ```bash
-        [Syntax ve style kontrolleri]
-        ```
-        
-        ### Level 2: Unit Tests
-        ```python
-        [Unit test örnekleri]
-        ```
-        
-        ### Level 3: Integration Test
-        ```bash
-        [Entegrasyon testleri]
-        ```
-        
-        ## Final Validation Checklist
-        - [ ] [Kontrol listesi öğeleri]
-        
-        ---
-        
-        ## Anti-Patterns to Avoid
-        - ❌ [Kaçınılması gereken pattern'lar]
-        
-        ## Confidence Score: X/10
-        [Güven skoru ve açıklaması]
-        ```
-
-        KURALLARI:
-        1. Tüm bölümleri sample_prp.md formatında eksiksiz doldur
-        2. Proje türüne uygun teknoloji stack ve pattern'lar öner
-        3. Gerçekçi görevler ve zaman çizelgesi oluştur
-        4. Executable kod örnekleri ve testler ekle
-        5. Proje karmaşıklığına uygun detay seviyesi kullan
-        6. Markdown formatını tam olarak koru
-        """
-        
-        # Detay seviyesine göre özel talimatlar
-        if detail_level == 'basic':
-            base_prompt += """
-            
-            DETAY SEVİYESİ: TEMEL
-            - Sadece temel bölümleri dahil et (Purpose, Goal, Implementation Blueprint, Validation Loop)
-            - Kısa ve öz açıklamalar yap
-            - Basit kod örnekleri kullan
-            - Maksimum 2000 kelime ile sınırla
-            """
-        elif detail_level == 'detailed':
-            base_prompt += """
-            
-            DETAY SEVİYESİ: DETAYLI
-            - Standart PRP formatında tüm ana bölümleri dahil et
-            - Orta seviye detayda açıklamalar yap
-            - Kod örnekleri ve pseudocode ekle
-            - Test stratejileri dahil et
-            """
-        elif detail_level == 'comprehensive':
-            base_prompt += """
-            
-            DETAY SEVİYESİ: KAPSAMLI
-            - Sample_prp.md formatında TÜM bölümleri eksiksiz dahil et
-            - Maksimum detay seviyesinde açıklamalar yap
-            - Kapsamlı kod örnekleri, pseudocode ve implementasyon adımları
-            - Detaylı test stratejileri ve validation döngüleri
-            - Architecture patterns ve best practices
-            - Integration points ve deployment stratejileri
-            - Anti-patterns ve gotchas bölümleri
-            - Confidence score ile birlikte
-            """
-        
-        if not include_examples:
-            base_prompt += """
-            
-            NOT: Kod örneklerini minimum seviyede tut, sadece gerekli yerlerde kullan.
-            """
-        
-        return base_prompt
+        # Parametre kombinasyonu sınırlı: her kombinasyon bir kez render edilir
+        return self.prompts.render_cached(
+            'prp_generator/system',
+            detail_level=detail_level,
+            include_examples=bool(include_examples)
+        )
     
     def _get_fallback_prp(self, project_data: Dict[str, Any], requirements: Dict[str, Any], detail_level: str = 'detailed') -> str:
         """Hata durumunda fallback PRP"""
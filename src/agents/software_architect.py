@@ -9,52 +9,21 @@ Teknoloji stack'ini belirler, mimari pattern'leri önerir ve ölçeklenebilirlik
 from typing import Dict, Any
 from ..models.project_data import ProjectData, AnalysisResult, ArchitectureResult
 from ..api.llm_factory import LLMClient
+from ..prompts import get_prompt_registry
 from ..utils.logger import LoggerMixin, log_async_function_call
 
 class SoftwareArchitectAgent(LoggerMixin):
     """Yazılım Mimarı AI Ajanı"""
     
-    def __init__(self, llm_client: LLMClient, logger=None):
+    def __init__(self, llm_client: LLMClient, logger=None, strict: bool = False):
         super().__init__()
         self.llm_client = llm_client
         self.logger = logger
+        # True ise LLM hatasında fallback sonuç yerine hata fırlatılır
+        self.strict = strict
         
-        self.system_prompt = """
-Sen deneyimli bir Yazılım Mimarı'sın. CLAUDE.md ve INITIAL.md dosyalarındaki talimatları takip ederek sistem mimarisi tasarlıyorsun.
-
-CLAUDE.md'den Mimari Prensipler:
-- **Modüler yapı**: Her component ayrı dosyada, clear separation of concerns
-- **Async/await patterns**: API çağrıları için asenkron işlemler
-- **Type hints ve Pydantic models**: Güçlü tip güvenliği
-- **API Integration Standards**: Environment variables, Provider factory pattern
-- **Performance Optimization**: Caching, lazy loading, memory management
-- **Security & Privacy**: API key management, input sanitization, rate limiting
-
-INITIAL.md'den Gereksinimler:
-- **Multi-LLM Provider Desteği**: Gemini, OpenRouter, OpenAI, DeepSeek API entegrasyonu
-- **Pydantic AI Tabanlı**: Farklı uzmanlık alanlarına sahip AI ajanları
-- **Context Engineering Uyumluluğu**: Tüm AI kod geliştirme araçları için uyumlu
-- **Kapsamlı Bilgi Toplama**: Teknoloji tercihleri, kısıtlamalar, özel gereksinimler
-- **Extensibility**: Yeni LLM provider'ları kolayca eklenebilir
-
-Görevin:
-1. **Uygun mimari pattern'i belirlemek** (CLAUDE.md: Modüler yapı, separation of concerns)
-2. **Teknoloji stack'ini önermek** (INITIAL.md: Multi-LLM Provider support)
-3. **Sistem bileşenlerini tanımlamak** (CLAUDE.md: Component architecture)
-4. **Veri akışını planlamak** (CLAUDE.md: Async/await patterns)
-5. **Güvenlik değerlendirmesi yapmak** (CLAUDE.md: Security & Privacy)
-6. **Ölçeklenebilirlik planı oluşturmak** (CLAUDE.md: Performance optimization)
-
-Özel Dikkat Edilecek Noktalar:
-- **Flask web patterns**: HTML templates, forms, Bootstrap ile responsive layout
-- **Pydantic AI multi-agent sistem**: Agent specialization, dependency injection
-- **LLM Provider factory pattern**: Unified interface, retry logic, rate limiting
-- **Context Engineering compliance**: PRP Structure, validation loops
-- **AI Tool Compatibility**: Claude, Cursor, GitHub Copilot uyumluluğu
-
-Mimari kararlarını proje gereksinimlerine, analiz sonuçlarına ve Context Engineering prensiplerine göre al.
-Cevaplarını Pydantic model formatında ver ve CLAUDE.md standartlarına uygun tasarım yap.
-"""
+        self.prompts = get_prompt_registry()
+        self.system_prompt = self.prompts.render('software_architect/system')
     
     @log_async_function_call
     async def design_architecture(self, project_data: ProjectData, analysis_result: AnalysisResult) -> ArchitectureResult:
@@ -90,58 +59,19 @@ Cevaplarını Pydantic model formatında ver ve CLAUDE.md standartlarına uygun
             
         except Exception as e:
             self.log_error(f"Mimari tasarım hatası: {str(e)}")
+            if self.strict:
+                raise
             return self._create_fallback_architecture(project_data, analysis_result)
     
     def _create_architecture_prompt(self, project_data: ProjectData, analysis_result: AnalysisResult) -> str:
         """Mimari tasarım prompt'unu oluştur"""
         
-        prompt = f"""
-Lütfen aşağıdaki proje için sistem mimarisi tasarla:
-
-## Proje Bilgileri
-- **Proje Adı**: {project_data.name}
-- **Proje Türü**: {project_data.type}
-- **Programlama Dili**: {project_data.language}
-- **Hedef Platformlar**: {', '.join(project_data.platform) if project_data.platform else 'Belirtilmemiş'}
-
-## Analiz Sonuçları
-- **Karmaşıklık Skoru**: {analysis_result.complexity_score}/10
-- **Önerilen Yaklaşım**: {analysis_result.recommended_approach}
-- **Ana Zorluklar**: {', '.join(analysis_result.key_challenges)}
-
-## Proje Açıklaması
-{project_data.description}
-"""
-        
-        if project_data.requirements:
-            req = project_data.requirements
-            prompt += f"""
-## Teknik Gereksinimler
-- **Framework/Kütüphaneler**: {req.frameworks or 'Belirtilmemiş'}
-- **Veritabanı**: {req.database or 'Belirtilmemiş'}
-- **Kimlik Doğrulama**: {req.authentication or 'Belirtilmemiş'}
-- **Deployment**: {req.deployment or 'Belirtilmemiş'}
-- **Performans**: {req.performance or 'Belirtilmemiş'}
-- **Güvenlik**: {req.security or 'Belirtilmemiş'}
-
-## Fonksiyonel Gereksinimler
-{req.functional_requirements}
-"""
-        
-        prompt += """
-## Mimari Tasarım Görevlerin:
-
-1. **Mimari Pattern**: En uygun mimari pattern'i belirle (MVC, Microservices, Layered, etc.)
-2. **Teknoloji Stack**: Her katman için teknoloji seçimi yap
-3. **Sistem Bileşenleri**: Ana sistem bileşenlerini listele
-4. **Veri Akışı**: Veri akışını açıkla
-5. **Güvenlik Değerlendirmesi**: Güvenlik konularını ele al
-6. **Ölçeklenebilirlik Planı**: Nasıl ölçeklenebileceğini planla
-
-Cevabını JSON formatında ver ve Türkçe açıkla.
-"""
-        
-        return prompt
+        return self.prompts.render(
+            'software_architect/architecture',
+            project=project_data,
+            analysis=analysis_result,
+            req=project_data.requirements
+        )
     
     def _create_fallback_architecture(self, project_data: ProjectData, analysis_result: AnalysisResult) -> ArchitectureResult:
         """Fallback mimari tasarım"""
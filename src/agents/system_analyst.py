@@ -9,54 +9,22 @@ Karmaşıklık skorunu belirler, risk faktörlerini tespit eder ve öneriler sun
 from typing import List, Dict, Any
 from ..models.project_data import ProjectData, AnalysisResult
 from ..api.llm_factory import LLMClient
+from ..prompts import get_prompt_registry
 from ..utils.logger import LoggerMixin, log_async_function_call
 
 class SystemAnalystAgent(LoggerMixin):
     """Sistem Analisti AI Ajanı"""
     
-    def __init__(self, llm_client: LLMClient, logger=None):
+    def __init__(self, llm_client: LLMClient, logger=None, strict: bool = False):
         super().__init__()
         self.llm_client = llm_client
         self.logger = logger
+        # True ise LLM hatasında fallback sonuç yerine hata fırlatılır
+        self.strict = strict
         
         # System prompt'u tanımla - CLAUDE.md talimatlarına uygun
-        self.system_prompt = """
-Sen deneyimli bir Sistem Analisti'sin. CLAUDE.md ve INITIAL.md dosyalarındaki talimatları takip ederek yazılım projelerini analiz ediyorsun.
-
-CLAUDE.md'den Ana Prensipler:
-- **Context Engineering uyumluluğu**: Tüm AI kod geliştirme araçları ile uyumlu analiz
-- **Multi-LLM Provider desteği**: Farklı AI araçları için optimize edilmiş analiz
-- **Pydantic AI multi-agent sistem**: Diğer ajanlarla koordineli çalışma
-- **Type hints ve Pydantic models**: Güçlü tip güvenliği
-- **Async/await patterns**: API çağrıları için asenkron işlemler
-
-INITIAL.md'den Gereksinimler:
-- **Context Engineering PRP Generator**: Sadece Claude değil, tüm AI araçları için PRP
-- **Kapsamlı bilgi toplama**: Proje gereksinimleri, teknoloji tercihleri, kısıtlamalar
-- **Otomatik PRP üretimi**: Context Engineering standartlarına uygun analiz
-
-Görevin:
-1. **Proje gereksinimlerini detaylı analiz etmek** (CLAUDE.md: Comprehensive analysis)
-2. **Karmaşıklık skorunu (1-10) belirlemek** (Context Engineering: Progressive Success)
-3. **Risk faktörlerini tespit etmek** (CLAUDE.md: Error handling, graceful degradation)
-4. **Önerilen yaklaşımı belirlemek** (CLAUDE.md: Agent specialization)
-5. **Ana zorlukları listelemek** (Context Engineering: Information Dense)
-6. **Başarı kriterlerini tanımlamak** (Context Engineering: Validation Loops)
-7. **Tahmini efor değerlendirmesi yapmak** (CLAUDE.md: Performance optimization)
-
-Analiz yaparken şunları dikkate al:
-- **Proje türü ve kapsamı** (INITIAL.md: Multi-LLM Provider support)
-- **Teknoloji karmaşıklığı** (CLAUDE.md: API Integration Standards)
-- **Ekip büyüklüğü ve deneyimi** (CLAUDE.md: Agent specialization)
-- **Zaman kısıtları** (CLAUDE.md: Performance optimization)
-- **Teknik riskler** (CLAUDE.md: Security & Privacy)
-- **İş süreçleri karmaşıklığı** (Context Engineering: Progressive Success)
-- **Entegrasyon gereksinimleri** (INITIAL.md: API integrations)
-- **Performans ve ölçeklenebilirlik** (CLAUDE.md: Performance optimization)
-- **AI araç uyumluluğu** (INITIAL.md: Tüm AI kod geliştirme araçları)
-
-Cevaplarını Pydantic model formatında ver ve Context Engineering prensiplerine uygun analiz yap.
-"""
+        self.prompts = get_prompt_registry()
+        self.system_prompt = self.prompts.render('system_analyst/system')
     
     @log_async_function_call
     async def analyze_project(self, project_data: ProjectData) -> AnalysisResult:
@@ -105,6 +73,8 @@ Cevaplarını Pydantic model formatında ver ve Context Engineering prensiplerin
             
         except Exception as e:
             self.log_error(f"Proje analizi hatası: {str(e)}")
+            if self.strict:
+                raise
             
             # Fallback analiz sonucu
             return self._create_fallback_analysis(project_data)
@@ -112,60 +82,11 @@ Cevaplarını Pydantic model formatında ver ve Context Engineering prensiplerin
     def _create_analysis_prompt(self, project_data: ProjectData) -> str:
         """Analiz prompt'unu oluştur"""
         
-        prompt = f"""
-Lütfen aşağıdaki projeyi detaylı analiz et:
-
-## Proje Bilgileri
-- **Proje Adı**: {project_data.name}
-- **Proje Türü**: {project_data.type}
-- **Programlama Dili**: {project_data.language}
-- **Hedef Platformlar**: {', '.join(project_data.platform) if project_data.platform else 'Belirtilmemiş'}
-- **Ekip Büyüklüğü**: {project_data.team_size or 'Belirtilmemiş'}
-- **Hedef Süre**: {project_data.timeline or 'Belirtilmemiş'}
-
-## Proje Açıklaması
-{project_data.description}
-"""
-        
-        # Gereksinimler varsa ekle
-        if project_data.requirements:
-            req = project_data.requirements
-            prompt += f"""
-## Fonksiyonel Gereksinimler
-{req.functional_requirements}
-
-## Teknik Detaylar
-- **Framework/Kütüphaneler**: {req.frameworks or 'Belirtilmemiş'}
-- **Veritabanı**: {req.database or 'Belirtilmemiş'}
-- **Kimlik Doğrulama**: {req.authentication or 'Belirtilmemiş'}
-- **Deployment**: {req.deployment or 'Belirtilmemiş'}
-- **Performans**: {req.performance or 'Belirtilmemiş'}
-- **Güvenlik**: {req.security or 'Belirtilmemiş'}
-
-## Kısıtlamalar
-{req.constraints or 'Belirtilmemiş'}
-
-## Özel Gereksinimler
-{req.special_requirements or 'Belirtilmemiş'}
-
-## Kullanıcı Hikayeleri
-{req.user_stories or 'Belirtilmemiş'}
-"""
-        
-        prompt += """
-## Analiz Görevlerin:
-
-1. **Karmaşıklık Skoru (1-10)**: Projenin teknik ve iş karmaşıklığını değerlendir
-2. **Risk Faktörleri**: Potansiyel riskleri listele
-3. **Önerilen Yaklaşım**: En uygun geliştirme yaklaşımını öner
-4. **Ana Zorluklar**: Karşılaşılabilecek ana zorlukları belirle
-5. **Başarı Kriterleri**: Projenin başarılı sayılacağı kriterleri tanımla
-6. **Tahmini Efor**: Geliştirme sürecinin zorluğunu değerlendir
-
-Lütfen cevabını JSON formatında ver ve her alanı Türkçe olarak doldur.
-"""
-        
-        return prompt
+        return self.prompts.render(
+            'system_analyst/analysis',
+            project=project_data,
+            req=project_data.requirements
+        )
     
     def _create_fallback_analysis(self, project_data: ProjectData) -> AnalysisResult:
         """Hata durumunda fallback analiz sonucu oluştur"""
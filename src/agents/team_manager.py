@@ -7,7 +7,7 @@ Farklı uzmanlık alanlarındaki ajanları koordine eder ve PRP üretimini orche
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from datetime import datetime
 
 from ..models.project_data import (
@@ -20,14 +20,22 @@ from .system_analyst import SystemAnalystAgent
 from .software_architect import SoftwareArchitectAgent
 from .test_specialist import TestSpecialistAgent
 from .documentation_specialist import DocumentationSpecialistAgent
+from .workflow import WorkflowStage, run_stage_graph
 
 class SoftwareEngineeringTeam(LoggerMixin):
     """Yazılım mühendisliği ekibi yöneticisi"""
     
-    def __init__(self, llm_client: LLMClient, logger=None):
+    def __init__(self, llm_client: LLMClient, logger=None, strict: bool = False):
+        """
+        Args:
+            llm_client: Ekip üyelerinin kullanacağı LLM client
+            logger: Opsiyonel logger
+            strict: True ise üyeler LLM hatasında fallback sonuç yerine hata fırlatır
+        """
         super().__init__()
         self.llm_client = llm_client
         self.logger = logger
+        self.strict = strict
         
         # Ekip üyelerini oluştur
         self._initialize_team()
@@ -38,10 +46,10 @@ class SoftwareEngineeringTeam(LoggerMixin):
         self.log_info("Yazılım mühendisliği ekibi oluşturuluyor...")
         
         try:
-            self.system_analyst = SystemAnalystAgent(self.llm_client, self.logger)
-            self.software_architect = SoftwareArchitectAgent(self.llm_client, self.logger)
-            self.test_specialist = TestSpecialistAgent(self.llm_client, self.logger)
-            self.documentation_specialist = DocumentationSpecialistAgent(self.llm_client, self.logger)
+            self.system_analyst = SystemAnalystAgent(self.llm_client, self.logger, strict=self.strict)
+            self.software_architect = SoftwareArchitectAgent(self.llm_client, self.logger, strict=self.strict)
+            self.test_specialist = TestSpecialistAgent(self.llm_client, self.logger, strict=self.strict)
+            self.documentation_specialist = DocumentationSpecialistAgent(self.llm_client, self.logger, strict=self.strict)
             
             self.log_info("Tüm ekip üyeleri başarıyla oluşturuldu")
             
@@ -122,13 +130,14 @@ class SoftwareEngineeringTeam(LoggerMixin):
     @log_async_function_call
     async def create_test_strategy(self, 
                                   project_data: ProjectData, 
-                                  architecture_result: ArchitectureResult) -> TestStrategy:
+                                  architecture_result: Optional[ArchitectureResult] = None) -> TestStrategy:
         """
         Test stratejisi oluştur
         
         Args:
             project_data: Proje verileri
-            architecture_result: Mimari tasarım sonucu
+            architecture_result: Opsiyonel mimari tasarım sonucu; verilmezse strateji proje
+                verisi ve gereksinimlerden (dil, tür, performans/güvenlik) çıkarılır
             
         Returns:
             Test stratejisi
@@ -136,7 +145,7 @@ class SoftwareEngineeringTeam(LoggerMixin):
         
         self.log_info(
             f"Test stratejisi oluşturuluyor: {project_data.name}",
-            architecture_pattern=architecture_result.architecture_pattern
+            architecture_pattern=architecture_result.architecture_pattern if architecture_result else None
         )
         
         try:
@@ -206,12 +215,31 @@ class SoftwareEngineeringTeam(LoggerMixin):
             raise
     
     @log_async_function_call
-    async def full_analysis_workflow(self, project_data: ProjectData) -> Dict[str, Any]:
+    async def full_analysis_workflow(self,
+                                     project_data: ProjectData,
+                                     speculative: bool = False,
+                                     complexity_tolerance: int = 1,
+                                     on_stage_complete: Optional[Callable[[str, int, int], None]] = None) -> Dict[str, Any]:
         """
-        Tam analiz workflow'unu çalıştır
+        Tam analiz workflow'unu bağımlılık grafiği üzerinden çalıştır
+        
+        Test stratejisi yalnızca proje verisi ve gereksinimlere (dil, proje türü, performans ve
+        güvenlik gereksinimleri) dayanır; bu yüzden sistem analiziyle aynı anda başlayan bir kök
+        aşamadır. Mimari ile test stratejisi PRP aşamasında birleştirilir. Varsayılan kritik yol
+        analiz -> mimari -> PRP'dir (dört yerine üç ardışık LLM çağrısı).
+        
+        `speculative` ile mimari de, sistem analizi sürerken heuristik (LLM'siz) bir analiz
+        taslağı üzerinden başlatılır; gerçek analiz taslakla uyumluysa (karmaşıklık farkı
+        `complexity_tolerance` içinde) taslak mimari kabul edilir, değilse gerçek analizle
+        yeniden tasarlanır. Bu bir hız/kalite ödünleşimidir: taslak analizin önerilen yaklaşım
+        ve zorluk alanları sabit metindir, kabul edilen mimari gerçek analizin bulgularını
+        görmez ve reddedilen taslak bir LLM çağrısı israf eder.
         
         Args:
             project_data: Proje verileri
+            speculative: Spekülatif mimari taslağını etkinleştir (varsayılan kapalı)
+            complexity_tolerance: Taslağın kabulü için izin verilen karmaşıklık farkı
+            on_stage_complete: İlerleme bildirimi için aşama tamamlanma callback'i
             
         Returns:
             Tüm analiz sonuçları
@@ -220,51 +248,86 @@ class SoftwareEngineeringTeam(LoggerMixin):
         self.log_info(
             f"Tam analiz workflow'u başlatılıyor: {project_data.name}",
             project_type=project_data.type,
-            language=project_data.language
+            language=project_data.language,
+            speculative=speculative
         )
         
         start_time = datetime.now()
+        stage_timings: Dict[str, Dict[str, Any]] = {}
+        speculation = {'enabled': speculative, 'architecture': None}
         
-        try:
-            # 1. Sistem analizi
-            self.log_info("1/4 - Sistem analizi başlatılıyor...")
-            analysis_result = await self.analyze_project(project_data)
-            
-            # 2. Mimari tasarım
-            self.log_info("2/4 - Mimari tasarım başlatılıyor...")
-            architecture_result = await self.design_architecture(project_data, analysis_result)
-            
-            # 3. Test stratejisi
-            self.log_info("3/4 - Test stratejisi oluşturuluyor...")
-            test_strategy = await self.create_test_strategy(project_data, architecture_result)
-            
-            # 4. PRP oluşturma
-            self.log_info("4/4 - PRP oluşturuluyor...")
-            prp_content = await self.generate_prp(
-                project_data, analysis_result, architecture_result, test_strategy
+        async def analysis(results):
+            return await self.analyze_project(project_data)
+        
+        async def architecture_draft(results):
+            draft_analysis = self.system_analyst._create_fallback_analysis(project_data)
+            architecture = await self.design_architecture(project_data, draft_analysis)
+            return draft_analysis, architecture
+        
+        async def architecture(results):
+            analysis_result = results['analysis']
+            if speculative:
+                draft_analysis, draft_architecture = results['architecture_draft']
+                drift = abs(analysis_result.complexity_score - draft_analysis.complexity_score)
+                if drift <= complexity_tolerance:
+                    speculation['architecture'] = 'accepted'
+                    return draft_architecture
+                speculation['architecture'] = 'rejected'
+                self.log_info("Spekülatif mimari reddedildi, yeniden tasarlanıyor", complexity_drift=drift)
+            return await self.design_architecture(project_data, analysis_result)
+        
+        async def test_strategy(results):
+            return await self.create_test_strategy(project_data)
+        
+        async def prp(results):
+            return await self.generate_prp(
+                project_data, results['analysis'], results['architecture'], results['test_strategy']
             )
+        
+        stages = [
+            WorkflowStage('analysis', analysis),
+            WorkflowStage('test_strategy', test_strategy),
+            WorkflowStage('prp', prp, depends_on=['analysis', 'architecture', 'test_strategy']),
+        ]
+        if speculative:
+            stages += [
+                WorkflowStage('architecture_draft', architecture_draft),
+                WorkflowStage('architecture', architecture, depends_on=['analysis', 'architecture_draft']),
+            ]
+        else:
+            stages.append(WorkflowStage('architecture', architecture, depends_on=['analysis']))
+        
+        try:
+            stage_results = await run_stage_graph(stages, stage_timings, on_stage_complete)
             
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
+            prp_content = stage_results['prp']
             
             results = {
                 'project_data': project_data,
-                'analysis_result': analysis_result,
-                'architecture_result': architecture_result,
-                'test_strategy': test_strategy,
+                'analysis_result': stage_results['analysis'],
+                'architecture_result': stage_results['architecture'],
+                'test_strategy': stage_results['test_strategy'],
                 'prp_content': prp_content,
                 'metadata': {
                     'start_time': start_time.isoformat(),
                     'end_time': end_time.isoformat(),
                     'duration_seconds': duration,
-                    'team_members': ['system_analyst', 'software_architect', 'test_specialist', 'documentation_specialist']
+                    'team_members': ['system_analyst', 'software_architect', 'test_specialist', 'documentation_specialist'],
+                    'stage_timings': stage_timings,
+                    'sequential_duration_seconds': round(sum(
+                        timing.get('duration_seconds', 0) for timing in stage_timings.values()
+                    ), 4),
+                    'speculation': speculation
                 }
             }
             
             self.log_info(
                 f"Tam analiz workflow'u tamamlandı",
                 duration_seconds=duration,
-                prp_length=len(prp_content)
+                prp_length=len(prp_content),
+                speculation=speculation['architecture']
             )
             
             return results
@@ -366,7 +429,7 @@ class SoftwareEngineeringTeam(LoggerMixin):
             'workflow': [
                 '1. Sistem Analizi - Proje karmaşıklığı ve riskleri değerlendirilir',
                 '2. Mimari Tasarım - Sistem mimarisi ve teknoloji stack\'i belirlenir',
-                '3. Test Stratejisi - Kalite kontrol ve test planı oluşturulur',
+                '3. Test Stratejisi - Analizle eşzamanlı olarak kalite kontrol ve test planı oluşturulur',
                 '4. PRP Üretimi - Context Engineering standartlarında dokümantasyon hazırlanır'
             ],
             'llm_provider': self.llm_client.config.name if hasattr(self.llm_client, 'config') else 'Unknown'
@@ -6,66 +6,34 @@ Bu modül, test stratejisi oluşturan AI ajanını içerir.
 Test seviyelerini belirler, framework önerileri yapar ve kalite kontrol planı oluşturur.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from ..models.project_data import ProjectData, ArchitectureResult, TestStrategy
 from ..api.llm_factory import LLMClient
+from ..prompts import get_prompt_registry
 from ..utils.logger import LoggerMixin, log_async_function_call
 
 class TestSpecialistAgent(LoggerMixin):
     """Test Uzmanı AI Ajanı"""
     
-    def __init__(self, llm_client: LLMClient, logger=None):
+    def __init__(self, llm_client: LLMClient, logger=None, strict: bool = False):
         super().__init__()
         self.llm_client = llm_client
         self.logger = logger
+        # True ise LLM hatasında fallback sonuç yerine hata fırlatılır
+        self.strict = strict
         
-        self.system_prompt = """
-Sen deneyimli bir Test Uzmanı'sın. CLAUDE.md ve INITIAL.md dosyalarındaki talimatları takip ederek test stratejisi oluşturuyorsun.
-
-CLAUDE.md'den Test ve Kalite Standartları:
-- **Testing & Quality**: pytest ile comprehensive test coverage
-- **Integration tests**: API endpoints ve agent interactions
-- **PRP validation**: Generated PRP files için quality checks
-- **Performance tests**: Response time ve memory usage
-- **User acceptance tests**: Real-world scenarios
-- **Validation Loops**: Executable tests/lints the AI can run and fix
-- **Progressive Success**: Start simple, validate, then enhance
-
-INITIAL.md'den Gereksinimler:
-- **Context Engineering PRP Generator**: Validation sistemleri gerekli
-- **Multi-LLM Provider Desteği**: Farklı API'lar için test stratejisi
-- **Pydantic AI Tabanlı**: Agent interactions için test coverage
-- **Robust hata yakalama**: API çağrılarında hata yönetimi testleri
-- **Performans**: Async işlemler ve progress bar testleri
-- **Validation**: Üretilen PRP dosyalarının kalite kontrolü
-
-Görevin:
-1. **Test seviyelerini belirlemek** (CLAUDE.md: Unit, Integration, User acceptance)
-2. **Uygun test framework'lerini önermek** (CLAUDE.md: pytest comprehensive coverage)
-3. **Kapsam hedeflerini belirlemek** (CLAUDE.md: 80%+ coverage)
-4. **Kalite kontrol noktalarını tanımlamak** (Context Engineering: Validation Loops)
-5. **Performans test senaryolarını oluşturmak** (CLAUDE.md: Response time, memory usage)
-
-Özel Test Alanları:
-- **PRP Quality Validation**: Context Engineering standartlarına uygunluk
-- **Multi-LLM Provider Testing**: API entegrasyonu ve fallback mekanizmaları
-- **Agent Interaction Testing**: Pydantic AI multi-agent koordinasyonu
-- **Flask web Testing**: HTTP endpoints, template rendering, form validation
-- **Context Engineering Compliance**: PRP formatı ve içerik kalitesi
-- **API Rate Limiting Tests**: Provider limits ve retry logic
-- **Security Testing**: API key management ve input sanitization
-
-Test stratejisini proje mimarisine, gereksinimlerine ve Context Engineering prensiplerine göre planla.
-Cevaplarını Pydantic model formatında ver ve CLAUDE.md standartlarına uygun test planı oluştur.
-"""
+        self.prompts = get_prompt_registry()
+        self.system_prompt = self.prompts.render('test_specialist/system')
     
     @log_async_function_call
-    async def create_test_strategy(self, project_data: ProjectData, architecture_result: ArchitectureResult) -> TestStrategy:
-        """Test stratejisi oluştur"""
+    async def create_test_strategy(self,
+                                   project_data: ProjectData,
+                                   architecture_result: Optional[ArchitectureResult] = None) -> TestStrategy:
+        """Test stratejisi oluştur (mimari verilmezse yalnızca proje verisi ve gereksinimlerden)"""
         
         self.log_info(
             f"Test stratejisi oluşturuluyor: {project_data.name}",
-            architecture_pattern=architecture_result.architecture_pattern
+            architecture_pattern=architecture_result.architecture_pattern if architecture_result else None
         )
         
         test_prompt = self._create_test_prompt(project_data, architecture_result)
@@ -93,56 +61,21 @@ Cevaplarını Pydantic model formatında ver ve CLAUDE.md standartlarına uygun
             
         except Exception as e:
             self.log_error(f"Test stratejisi hatası: {str(e)}")
+            if self.strict:
+                raise
             return self._create_fallback_test_strategy(project_data, architecture_result)
     
-    def _create_test_prompt(self, project_data: ProjectData, architecture_result: ArchitectureResult) -> str:
+    def _create_test_prompt(self, project_data: ProjectData, architecture_result: Optional[ArchitectureResult]) -> str:
         """Test stratejisi prompt'unu oluştur"""
         
-        prompt = f"""
-Lütfen aşağıdaki proje için test stratejisi oluştur:
-
-## Proje Bilgileri
-- **Proje Adı**: {project_data.name}
-- **Proje Türü**: {project_data.type}
-- **Programlama Dili**: {project_data.language}
-
-## Mimari Bilgileri
-- **Mimari Pattern**: {architecture_result.architecture_pattern}
-- **Sistem Bileşenleri**: {', '.join(architecture_result.system_components)}
-- **Teknoloji Stack**: {', '.join(f"{k}: {v}" for k, v in architecture_result.technology_stack.items())}
-
-## Proje Açıklaması
-{project_data.description}
-"""
-        
-        if project_data.requirements:
-            req = project_data.requirements
-            prompt += f"""
-## Fonksiyonel Gereksinimler
-{req.functional_requirements}
-
-## Performans Gereksinimleri
-{req.performance or 'Belirtilmemiş'}
-
-## Güvenlik Gereksinimleri
-{req.security or 'Belirtilmemiş'}
-"""
-        
-        prompt += """
-## Test Stratejisi Görevlerin:
-
-1. **Test Seviyeleri**: Hangi test seviyelerinin gerekli olduğunu belirle
-2. **Test Framework'leri**: Her test seviyesi için uygun framework'leri öner
-3. **Kapsam Hedefleri**: Her test seviyesi için kapsam hedeflerini belirle
-4. **Kalite Kontrol Noktaları**: Kalite kontrol noktalarını tanımla
-5. **Performans Testleri**: Performans test senaryolarını oluştur
-
-Cevabını JSON formatında ver ve Türkçe açıkla.
-"""
-        
-        return prompt
+        return self.prompts.render(
+            'test_specialist/test_strategy',
+            project=project_data,
+            architecture=architecture_result,
+            req=project_data.requirements
+        )
     
-    def _create_fallback_test_strategy(self, project_data: ProjectData, architecture_result: ArchitectureResult) -> TestStrategy:
+    def _create_fallback_test_strategy(self, project_data: ProjectData, architecture_result: Optional[ArchitectureResult]) -> TestStrategy:
         """Fallback test stratejisi"""
         
         # Temel test stratejisi
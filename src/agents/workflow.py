@@ -0,0 +1,126 @@
+"""
+İş Akışı Zamanlayıcısı
+======================
+
+Bu modül, ekip ajanlarının çalışmalarını bağımlılık grafiği olarak zamanlar.
+Her aşama yalnızca bağımlı olduğu aşamalar tamamlanınca başlar; birbirinden bağımsız
+aşamalar eşzamanlı çalışır ve her aşamanın süresi kaydedilir.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from ..utils.logger import get_logger
+
+StageFunc = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class WorkflowStage:
+    """İş akışında tek bir aşama"""
+
+    def __init__(self, name: str, run: StageFunc, depends_on: Iterable[str] = ()):
+        """
+        Args:
+            name: Aşama adı (sonuç sözlüğündeki anahtar)
+            run: Önceki aşamaların sonuç sözlüğünü alan coroutine fonksiyonu
+            depends_on: Bu aşamadan önce tamamlanması gereken aşama adları
+        """
+        self.name = name
+        self.run = run
+        self.depends_on = tuple(depends_on)
+
+    def __repr__(self) -> str:
+        return f"WorkflowStage({self.name!r}, depends_on={self.depends_on!r})"
+
+
+def _topological_order(stages: List[WorkflowStage]) -> List[WorkflowStage]:
+    """Aşamaları bağımlılık sırasına diz; eksik bağımlılık ve döngüleri reddet"""
+
+    by_name = {stage.name: stage for stage in stages}
+    if len(by_name) != len(stages):
+        raise ValueError("Aşama adları benzersiz olmalı")
+
+    for stage in stages:
+        missing = [dep for dep in stage.depends_on if dep not in by_name]
+        if missing:
+            raise ValueError(f"'{stage.name}' aşaması bilinmeyen aşamalara bağlı: {missing}")
+
+    ordered: List[WorkflowStage] = []
+    state: Dict[str, str] = {}
+
+    def visit(stage: WorkflowStage) -> None:
+        if state.get(stage.name) == "done":
+            return
+        if state.get(stage.name) == "visiting":
+            raise ValueError(f"İş akışında döngüsel bağımlılık: {stage.name}")
+        state[stage.name] = "visiting"
+        for dep in stage.depends_on:
+            visit(by_name[dep])
+        state[stage.name] = "done"
+        ordered.append(stage)
+
+    for stage in stages:
+        visit(stage)
+    return ordered
+
+
+async def run_stage_graph(stages: List[WorkflowStage],
+                          timings: Optional[Dict[str, Dict[str, Any]]] = None,
+                          on_stage_complete: Optional[Callable[[str, int, int], None]] = None) -> Dict[str, Any]:
+    """
+    Aşama grafiğini çalıştır
+
+    Args:
+        stages: Çalıştırılacak aşamalar
+        timings: Verilirse her aşama için başlangıç ofseti, süre ve durum buraya yazılır
+        on_stage_complete: Her aşama bitince (aşama adı, tamamlanan sayısı, toplam) ile çağrılır
+
+    Returns:
+        Aşama adı -> aşama sonucu sözlüğü
+    """
+
+    logger = get_logger(__name__)
+    ordered = _topological_order(stages)
+    timings = timings if timings is not None else {}
+    results: Dict[str, Any] = {}
+    tasks: Dict[str, "asyncio.Task[Any]"] = {}
+    origin = time.perf_counter()
+
+    async def _run(stage: WorkflowStage) -> Any:
+        if stage.depends_on:
+            await asyncio.gather(*(tasks[dep] for dep in stage.depends_on))
+
+        started = time.perf_counter()
+        timings[stage.name] = {"start_offset_seconds": round(started - origin, 4), "status": "running"}
+        try:
+            result = await stage.run(results)
+        except BaseException:
+            timings[stage.name].update(
+                status="failed",
+                duration_seconds=round(time.perf_counter() - started, 4)
+            )
+            raise
+
+        timings[stage.name].update(
+            status="completed",
+            duration_seconds=round(time.perf_counter() - started, 4)
+        )
+        results[stage.name] = result
+        logger.debug(f"Aşama tamamlandı: {stage.name} ({timings[stage.name]['duration_seconds']}s)")
+        if on_stage_complete is not None:
+            on_stage_complete(stage.name, len(results), len(ordered))
+        return result
+
+    for stage in ordered:
+        tasks[stage.name] = asyncio.ensure_future(_run(stage))
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+    return results
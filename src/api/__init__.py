@@ -1,5 +1,6 @@
 """API package - LLM Provider integrations"""
 
 from .llm_factory import LLMProviderFactory, LLMClient
+from .client_pool import LLMClientPool, get_client_pool
 
-__all__ = ['LLMProviderFactory', 'LLMClient'] 
\ No newline at end of file
+__all__ = ['LLMProviderFactory', 'LLMClient', 'LLMClientPool', 'get_client_pool']
@@ -0,0 +1,163 @@
+"""
+LLM Client Havuzu
+=================
+
+Bu modül, process genelinde paylaşılan ve thread-safe bir LLM client kayıt defteri sağlar.
+Client'lar (provider, API anahtarı parmak izi, model) üçlüsü ve bağlı oldukları katmanlar
+(yanıt önbelleği, single-flight, rate limiter) ile anahtarlanır; böylece pydantic_ai model'leri
+ve alttaki httpx bağlantı havuzları istekler arasında yeniden kullanılır. Havuzdaki client'lar
+oluşturulduktan sonra değiştirilmez; farklı katman isteyen çağrı ayrı bir client alır.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
+
+from ..utils.config import LLMProviderConfig
+from ..utils.logger import LoggerMixin
+
+if TYPE_CHECKING:
+    from .llm_factory import LLMClient
+
+ClientKey = Tuple[str, str, str, Tuple[Tuple[str, Any], ...]]
+
+
+def fingerprint_api_key(api_key: Optional[str]) -> str:
+    """API anahtarının geri döndürülemez kısa parmak izini üret"""
+    if not api_key:
+        return "no-key"
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def make_client_key(provider_name: str,
+                    provider_config: LLMProviderConfig,
+                    hooks: Optional[Dict[str, Any]] = None) -> ClientKey:
+    """Havuz anahtarını oluştur: (provider, api key parmak izi, model, katmanlar)"""
+    return (
+        provider_name,
+        fingerprint_api_key(provider_config.api_key),
+        provider_config.default_model,
+        # Katman nesneleri kimlikleriyle karşılaştırılır
+        tuple(sorted((hooks or {}).items(), key=lambda item: item[0])),
+    )
+
+
+class LLMClientPool(LoggerMixin):
+    """Process genelinde paylaşılan LLM client havuzu"""
+
+    def __init__(self, max_size: int = 32):
+        super().__init__()
+        self.max_size = max_size
+        self._clients: "OrderedDict[ClientKey, LLMClient]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_create(self,
+                      provider_name: str,
+                      provider_config: LLMProviderConfig,
+                      client_class: Type["LLMClient"],
+                      logger=None,
+                      hooks: Optional[Dict[str, Any]] = None) -> "LLMClient":
+        """
+        Havuzdaki client'ı döndür, yoksa oluşturup havuza ekle
+
+        Args:
+            provider_name: Provider adı (ör. "openai")
+            provider_config: Provider konfigürasyonu
+            client_class: Oluşturulacak LLMClient sınıfı
+            logger: Client'a iletilecek logger
+            hooks: Client oluşturulurken bir kez atanan öznitelikler
+                (ör. response_cache, single_flight, rate_limiter); anahtarın parçasıdır
+
+        Returns:
+            Paylaşılan LLMClient instance'ı
+        """
+
+        key = make_client_key(provider_name, provider_config, hooks)
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                self._hits += 1
+                return client
+
+            # Config paylaşılan bir nesne ve request'ler arasında değiştirilebiliyor;
+            # client'ın anahtarı ile havuz anahtarının tutarlı kalması için kopyasını ver
+            client = client_class(provider_config.model_copy(), logger)
+            for name, value in (hooks or {}).items():
+                setattr(client, name, value)
+            self._clients[key] = client
+            self._misses += 1
+
+            while len(self._clients) > self.max_size:
+                evicted_key, _ = self._clients.popitem(last=False)
+                self.log_debug(f"LLM client havuzdan çıkarıldı (LRU): {evicted_key[0]}")
+
+            return client
+
+    def evict(self, provider_name: Optional[str] = None) -> int:
+        """Bir provider'ın (veya tüm provider'ların) client'larını havuzdan çıkar"""
+
+        with self._lock:
+            keys = [
+                key for key in self._clients
+                if provider_name is None or key[0] == provider_name
+            ]
+            for key in keys:
+                del self._clients[key]
+
+        if keys:
+            self.log_info(f"{len(keys)} LLM client havuzdan çıkarıldı", provider=provider_name or "all")
+        return len(keys)
+
+    def evict_stale(self, providers: Dict[str, LLMProviderConfig]) -> int:
+        """
+        Güncel konfigürasyonla eşleşmeyen client'ları havuzdan çıkar
+
+        API anahtarları döndürüldüğünde (rotation) eski anahtarla oluşturulmuş client'lar
+        ve bağlantı havuzları burada serbest bırakılır.
+        """
+
+        current = {
+            make_client_key(name, provider_config)[:3]
+            for name, provider_config in providers.items()
+        }
+
+        with self._lock:
+            stale = [
+                key for key in self._clients
+                if key[0] in providers and key[:3] not in current
+            ]
+            for key in stale:
+                del self._clients[key]
+
+        if stale:
+            self.log_info(f"{len(stale)} eski LLM client havuzdan çıkarıldı")
+        return len(stale)
+
+    def clear(self) -> None:
+        """Havuzu tamamen boşalt"""
+        with self._lock:
+            self._clients.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Havuz istatistiklerini döndür"""
+        with self._lock:
+            return {
+                "size": len(self._clients),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "providers": sorted({key[0] for key in self._clients}),
+            }
+
+
+_client_pool = LLMClientPool()
+
+
+def get_client_pool() -> LLMClientPool:
+    """Process genelindeki paylaşılan client havuzunu döndür"""
+    return _client_pool
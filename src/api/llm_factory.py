@@ -4,11 +4,10 @@ LLM Provider Factory for Context Engineering PRP Generator
 
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIModel
-from pydantic_ai.models.anthropic import AnthropicModel
 from pydantic_ai.models.gemini import GeminiModel
 from pydantic_ai.providers.openai import OpenAIProvider
 from pydantic_ai.providers.anthropic import AnthropicProvider
@@ -17,6 +16,18 @@ from pydantic_ai.providers.deepseek import DeepSeekProvider
 
 from ..utils.config import ApplicationConfig, LLMProviderConfig
 from ..utils.logger import LoggerMixin, log_function_call
+from .client_pool import LLMClientPool, fingerprint_api_key, get_client_pool
+from .response_cache import CachedAgent, ResponseCache, get_response_cache
+from .rate_limiter import AsyncTokenBucket, RateLimitedAgent, get_rate_limiter_registry
+from .single_flight import SingleFlight, SingleFlightAgent, get_single_flight
+from .prompt_cache import (
+    PromptCachingAnthropicModel, UsageTrackingAgent, get_token_usage, openai_prompt_cache_settings
+)
+from .resilience import CircuitBreakerRegistry, ResilientAgent, RetryPolicy, get_circuit_breakers
+
+
+# Ayrı sistem prompt'u verilmeyen çağrılar için varsayılan
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant."
 
 
 class LLMClient(ABC):
@@ -26,6 +37,9 @@ class LLMClient(ABC):
         self.config = config
         self.logger = logger
         self.model = None
+        self.response_cache: Optional[ResponseCache] = None
+        self.rate_limiter: Optional[AsyncTokenBucket] = None
+        self.single_flight: Optional[SingleFlight] = None
     
     @abstractmethod
     def create_agent(self, 
@@ -36,9 +50,53 @@ class LLMClient(ABC):
         pass
     
     @abstractmethod
-    async def generate_response(self, prompt: str, **kwargs) -> str:
-        """Generate a response from the LLM"""
+    async def generate_response(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
+        """Generate a response; a static system_prompt is sent as a real (cacheable) system message"""
         pass
+    
+    def _wrap_agent(self, agent: Agent, system_prompt: str, output_type: Any, tools: Optional[list]) -> Agent:
+        """Wrap the agent with the rate limiter, single-flight and the response cache when enabled"""
+        
+        # En içte: yalnızca provider'a giden çağrıların token kullanımı (ve prompt cache isabetleri) sayılır
+        agent = UsageTrackingAgent(agent, get_token_usage(), self.config.name)
+        
+        # Önbellek dış katmanda: cache hit'leri rate limit token'ı harcamaz
+        if self.rate_limiter is not None:
+            agent = RateLimitedAgent(agent, self.rate_limiter)
+        
+        # Tool'lu agent'lar yan etkili olabilir; birleştirilmez ve önbelleğe alınmaz
+        if tools:
+            return agent
+        
+        # Farklı API anahtarlarının istekleri (ve kota/faturaları) birbirine karışmaz
+        key_parts = {
+            'provider': self.config.name,
+            'api_key': fingerprint_api_key(self.config.api_key),
+            'model': self.config.default_model,
+            'system_prompt': system_prompt,
+            'output_type': output_type
+        }
+        
+        # Önbellekte olmayan özdeş eşzamanlı istekler tek provider çağrısında birleşir
+        if self.single_flight is not None:
+            agent = SingleFlightAgent(agent, self.single_flight, key_parts)
+        
+        if self.response_cache is None:
+            return agent
+        
+        return CachedAgent(agent, self.response_cache, key_parts)
+    
+    async def stream_response(self,
+                              prompt: str,
+                              system_prompt: str = DEFAULT_SYSTEM_PROMPT,
+                              **kwargs) -> AsyncIterator[str]:
+        """Stream a text response from the LLM as incremental deltas"""
+        
+        agent = self.create_agent(system_prompt)
+        async with agent.run_stream(prompt) as result:
+            async for delta in result.stream_text(delta=True):
+                if delta:
+                    yield delta
 
 
 class OpenAIClient(LLMClient):
@@ -63,17 +121,20 @@ class OpenAIClient(LLMClient):
                     tools: Optional[list] = None) -> Agent:
         """OpenAI agent oluştur"""
         
-        return Agent(
+        agent = Agent(
             model=self.model,
             system_prompt=system_prompt,
             output_type=output_type,
-            tools=tools or []
+            tools=tools or [],
+            # Aynı sistem prompt'lu istekler aynı prefix önbelleğine yönlenir
+            model_settings=openai_prompt_cache_settings(system_prompt)
         )
+        return self._wrap_agent(agent, system_prompt, output_type, tools)
     
-    async def generate_response(self, prompt: str, **kwargs) -> str:
+    async def generate_response(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
         """OpenAI response üret"""
         
-        agent = self.create_agent("You are a helpful assistant.")
+        agent = self.create_agent(system_prompt or DEFAULT_SYSTEM_PROMPT)
         result = await agent.run(prompt)
         return result.output
 
@@ -88,7 +149,8 @@ class AnthropicClient(LLMClient):
         
         # Anthropic model'i provider ile oluştur
         provider = AnthropicProvider(api_key=config.api_key)
-        self.model = AnthropicModel(
+        # Uzun sistem prompt'ları cache_control ile işaretlenir
+        self.model = PromptCachingAnthropicModel(
             model_name=config.default_model,
             provider=provider
         )
@@ -99,17 +161,18 @@ class AnthropicClient(LLMClient):
                     tools: Optional[list] = None) -> Agent:
         """Anthropic agent oluştur"""
         
-        return Agent(
+        agent = Agent(
             model=self.model,
             system_prompt=system_prompt,
             output_type=output_type,
             tools=tools or []
         )
+        return self._wrap_agent(agent, system_prompt, output_type, tools)
     
-    async def generate_response(self, prompt: str, **kwargs) -> str:
+    async def generate_response(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
         """Anthropic response üret"""
         
-        agent = self.create_agent("You are a helpful assistant.")
+        agent = self.create_agent(system_prompt or DEFAULT_SYSTEM_PROMPT)
         result = await agent.run(prompt)
         return result.output
 
@@ -137,17 +200,18 @@ class GeminiClient(LLMClient):
                     tools: Optional[list] = None) -> Agent:
         """Gemini agent oluştur"""
         
-        return Agent(
+        agent = Agent(
             model=self.model,
             system_prompt=system_prompt,
             output_type=output_type,
             tools=tools or []
         )
+        return self._wrap_agent(agent, system_prompt, output_type, tools)
     
-    async def generate_response(self, prompt: str, **kwargs) -> str:
+    async def generate_response(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
         """Gemini response üret"""
         
-        agent = self.create_agent("You are a helpful assistant.")
+        agent = self.create_agent(system_prompt or DEFAULT_SYSTEM_PROMPT)
         result = await agent.run(prompt)
         return result.output
 
@@ -173,17 +237,18 @@ class OpenRouterClient(LLMClient):
                     tools: Optional[list] = None) -> Agent:
         """OpenRouter agent oluştur"""
         
-        return Agent(
+        agent = Agent(
             model=self.model,
             system_prompt=system_prompt,
             output_type=output_type,
             tools=tools or []
         )
+        return self._wrap_agent(agent, system_prompt, output_type, tools)
     
-    async def generate_response(self, prompt: str, **kwargs) -> str:
+    async def generate_response(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
         """OpenRouter response üret"""
         
-        agent = self.create_agent("You are a helpful assistant.")
+        agent = self.create_agent(system_prompt or DEFAULT_SYSTEM_PROMPT)
         result = await agent.run(prompt)
         return result.output
 
@@ -209,17 +274,18 @@ class DeepSeekClient(LLMClient):
                     tools: Optional[list] = None) -> Agent:
         """DeepSeek agent oluştur"""
         
-        return Agent(
+        agent = Agent(
             model=self.model,
             system_prompt=system_prompt,
             output_type=output_type,
             tools=tools or []
         )
+        return self._wrap_agent(agent, system_prompt, output_type, tools)
     
-    async def generate_response(self, prompt: str, **kwargs) -> str:
+    async def generate_response(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
         """DeepSeek response üret"""
         
-        agent = self.create_agent("You are a helpful assistant.")
+        agent = self.create_agent(system_prompt or DEFAULT_SYSTEM_PROMPT)
         result = await agent.run(prompt)
         return result.output
 
@@ -250,9 +316,59 @@ class MockClient(LLMClient):
         
         return MockAgent(system_prompt, output_type)
     
-    async def generate_response(self, prompt: str, **kwargs) -> str:
+    async def generate_response(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
         """Mock response üret"""
         return f"Mock response for: {prompt}"
+    
+    async def stream_response(self, prompt: str, system_prompt: str = "", **kwargs) -> AsyncIterator[str]:
+        """Mock response'u parça parça üret"""
+        
+        response = f"Mock response for: {prompt}"
+        chunk_size = 64
+        for i in range(0, len(response), chunk_size):
+            yield response[i:i + chunk_size]
+
+class ResilientLLMClient(LLMClient):
+    """Client that retries transient errors and fails over across providers"""
+    
+    def __init__(self,
+                 candidates: List[Tuple[str, LLMClient]],
+                 policy: RetryPolicy,
+                 breakers: Optional[CircuitBreakerRegistry] = None,
+                 logger=None):
+        if not candidates:
+            raise ValueError("At least one provider client is required")
+        
+        primary = candidates[0][1]
+        super().__init__(primary.config, logger)
+        self.model = primary.model
+        self.candidates = candidates
+        self.policy = policy
+        self.breakers = breakers or get_circuit_breakers()
+    
+    @property
+    def provider_names(self) -> List[str]:
+        return [name for name, _ in self.candidates]
+    
+    def create_agent(self, 
+                    system_prompt: str,
+                    output_type: Any = str,
+                    tools: Optional[list] = None) -> Agent:
+        """Failover zinciri üzerinde çalışan agent oluştur"""
+        
+        return ResilientAgent(
+            self.candidates,
+            {'system_prompt': system_prompt, 'output_type': output_type, 'tools': tools},
+            self.policy,
+            self.breakers
+        )
+    
+    async def generate_response(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
+        """Retry + failover ile response üret"""
+        
+        agent = self.create_agent(system_prompt or DEFAULT_SYSTEM_PROMPT)
+        result = await agent.run(prompt)
+        return result.output
 
 class LLMProviderFactory(LoggerMixin):
     """LLM Provider Factory"""
@@ -267,44 +383,109 @@ class LLMProviderFactory(LoggerMixin):
         "mock": MockClient
     }
     
-    def __init__(self, config: ApplicationConfig):
+    def __init__(self, config: ApplicationConfig, client_pool: Optional[LLMClientPool] = None):
         super().__init__()
         self.config = config
-        self._clients = {}
+        # Client'lar process genelindeki havuzda tutulur; factory instance'ları ucuzdur
+        self.client_pool = client_pool or get_client_pool()
+        self.response_cache = get_response_cache(config)
+        self.single_flight = get_single_flight() if config.enable_single_flight else None
+        self.rate_limiters = (
+            get_rate_limiter_registry(config.rate_limit_per_api_key)
+            if config.enable_rate_limiting else None
+        )
     
     @log_function_call
-    def create_client(self, provider_name: str) -> LLMClient:
-        """Create LLM client for given provider"""
+    def create_client(self,
+                      provider_name: str,
+                      provider_configs: Optional[Dict[str, LLMProviderConfig]] = None) -> LLMClient:
+        """
+        Create (or reuse a pooled) LLM client for given provider
+        
+        `provider_configs` overrides the shared application config per provider
+        (e.g. keys resolved for one session when a background job was enqueued)
+        """
         
         try:
-            # Cache kontrolü
-            if provider_name in self._clients:
-                return self._clients[provider_name]
-            
             # Provider validation
             if provider_name not in self.PROVIDERS:
                 available = ", ".join(self.PROVIDERS.keys())
                 raise ValueError(f"Unknown provider: {provider_name}. Available: {available}")
             
             # Provider config al
-            provider_config = self._get_provider_config(provider_name)
+            provider_config = self._get_provider_config(provider_name, provider_configs)
             
-            # Client oluştur
+            # Havuzdaki client'lar paylaşılır ve değiştirilmez; bu factory'nin katmanları
+            # havuz anahtarına girer ve yalnızca client oluşturulurken atanır
+            hooks = {
+                'response_cache': self.response_cache,
+                'single_flight': self.single_flight,
+                'rate_limiter': (
+                    self.rate_limiters.get_bucket(provider_name, provider_config)
+                    if self.rate_limiters is not None else None
+                )
+            }
             client_class = self.PROVIDERS[provider_name]
-            client = client_class(provider_config, self.logger)
-            
-            # Cache'e ekle
-            self._clients[provider_name] = client
+            client = self.client_pool.get_or_create(
+                provider_name, provider_config, client_class, self.logger, hooks
+            )
             
-            self.logger.info(f"Created {provider_name} client successfully")
+            self.logger.debug(f"Using pooled {provider_name} client")
             return client
             
         except Exception as e:
             self.logger.error(f"Failed to create {provider_name} client: {e}")
             raise
     
-    def _get_provider_config(self, provider_name: str) -> LLMProviderConfig:
-        """Get provider configuration"""
+    def create_resilient_client(self,
+                                provider_name: str,
+                                provider_configs: Optional[Dict[str, LLMProviderConfig]] = None) -> LLMClient:
+        """
+        Create a client that retries transient errors and fails over to the
+        other configured providers (in PROVIDERS order) when the primary fails
+        
+        `provider_configs` overrides are applied to every provider in the chain
+        """
+        
+        if provider_name not in self.PROVIDERS:
+            available = ", ".join(self.PROVIDERS.keys())
+            raise ValueError(f"Unknown provider: {provider_name}. Available: {available}")
+        
+        # Mock provider'ın yedeğe ihtiyacı yok; gerçek provider'lar da mock'a düşmez
+        if provider_name == "mock":
+            return self.create_client(provider_name, provider_configs)
+        
+        names = [provider_name] + [
+            name for name in self.PROVIDERS
+            if name not in (provider_name, "mock") and self.validate_provider(name, provider_configs)
+        ]
+        
+        candidates: List[Tuple[str, LLMClient]] = []
+        for name in names:
+            try:
+                candidates.append((name, self.create_client(name, provider_configs)))
+            except Exception as e:
+                self.logger.warning(f"Skipping {name} in failover chain: {e}")
+        
+        if not candidates:
+            raise ValueError(f"No usable provider for failover chain starting at {provider_name}")
+        
+        policy = RetryPolicy(
+            max_retries=self.config.llm_max_retries,
+            base_delay=self.config.llm_retry_base_delay,
+            max_delay=self.config.llm_retry_max_delay,
+            failure_threshold=self.config.circuit_breaker_threshold,
+            reset_timeout=self.config.circuit_breaker_reset_seconds
+        )
+        return ResilientLLMClient(candidates, policy, logger=self.logger)
+    
+    def _get_provider_config(self,
+                             provider_name: str,
+                             provider_configs: Optional[Dict[str, LLMProviderConfig]] = None) -> LLMProviderConfig:
+        """Get provider configuration (an override wins over the application config)"""
+        
+        if provider_configs and provider_name in provider_configs:
+            return provider_configs[provider_name]
         
         # Mock provider için özel config
         if provider_name == "mock":
@@ -338,11 +519,20 @@ class LLMProviderFactory(LoggerMixin):
         
         return providers
     
-    def validate_provider(self, provider_name: str) -> bool:
+    def validate_provider(self,
+                          provider_name: str,
+                          provider_configs: Optional[Dict[str, LLMProviderConfig]] = None) -> bool:
         """Validate if provider is properly configured"""
         
         try:
-            config = self._get_provider_config(provider_name)
+            config = self._get_provider_config(provider_name, provider_configs)
             return config is not None and bool(config.api_key)
         except Exception:
-            return False 
\ No newline at end of file
+            return False
+    
+    def invalidate_clients(self, provider_name: Optional[str] = None) -> int:
+        """Drop pooled clients whose key/model no longer match the config"""
+        
+        if provider_name is not None:
+            return self.client_pool.evict(provider_name)
+        return self.client_pool.evict_stale(self.config.providers)
@@ -0,0 +1,120 @@
+"""
+Provider Tarafı Prompt Önbelleği
+================================
+
+Bu modül, agent'ların uzun ve statik sistem prompt'larının provider tarafında önbelleğe
+alınmasını sağlar ve önbellekten okunan token sayılarını raporlar:
+
+- Anthropic: sistem prompt'u `cache_control: ephemeral` işaretli bir metin bloğu olarak
+  gönderilir; tool tanımları ve sistem prompt'u sonraki isteklerde önbellekten okunur.
+- OpenAI: 1024 token üzerindeki prefix'ler otomatik önbelleklenir; aynı sistem prompt'u
+  taşıyan isteklerin aynı önbelleğe yönlenmesi için `prompt_cache_key` gönderilir.
+- Diğer provider'lar (Gemini, DeepSeek) örtük önbellek kullanır; yalnızca raporlama yapılır.
+
+Token kullanımı `UsageTrackingAgent` ile provider bazında toplanır.
+"""
+
+import hashlib
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from pydantic_ai.models.anthropic import AnthropicModel
+
+# Bundan kısa sistem prompt'ları işaretlenmez (provider'ların asgari önbellek boyutu ~1024 token)
+MIN_CACHEABLE_SYSTEM_CHARS = 3000
+
+
+class PromptCachingAnthropicModel(AnthropicModel):
+    """Sistem prompt'unu önbellek işaretli blok olarak gönderen Anthropic modeli"""
+
+    async def _map_message(self, messages):
+        system_prompt, anthropic_messages = await super()._map_message(messages)
+        if isinstance(system_prompt, str) and len(system_prompt) >= MIN_CACHEABLE_SYSTEM_CHARS:
+            system_prompt = [{
+                'type': 'text',
+                'text': system_prompt,
+                'cache_control': {'type': 'ephemeral'}
+            }]
+        return system_prompt, anthropic_messages
+
+
+def openai_prompt_cache_settings(system_prompt: str) -> Optional[Dict[str, Any]]:
+    """Uzun sistem prompt'ları için OpenAI `prompt_cache_key` model ayarı"""
+
+    if not system_prompt or len(system_prompt) < MIN_CACHEABLE_SYSTEM_CHARS:
+        return None
+    key = hashlib.sha256(system_prompt.encode('utf-8')).hexdigest()[:32]
+    return {'extra_body': {'prompt_cache_key': key}}
+
+
+class TokenUsageRegistry:
+    """Provider bazında token kullanımı ve prompt önbelleği isabet sayaçları"""
+
+    FIELDS = ('requests', 'input_tokens', 'output_tokens', 'cache_read_tokens', 'cache_write_tokens')
+
+    def __init__(self):
+        self._providers: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, usage: Any) -> None:
+        """pydantic_ai `RunUsage` nesnesini provider sayaçlarına ekle"""
+        if usage is None:
+            return
+        with self._lock:
+            counters = self._providers.setdefault(provider, dict.fromkeys(self.FIELDS, 0))
+            for field in self.FIELDS:
+                counters[field] += getattr(usage, field, 0) or 0
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            result = {}
+            for provider, counters in self._providers.items():
+                input_tokens = counters['input_tokens']
+                result[provider] = {
+                    **counters,
+                    'cache_hit_ratio': round(counters['cache_read_tokens'] / input_tokens, 4) if input_tokens else 0.0
+                }
+            return result
+
+
+class UsageTrackingAgent:
+    """Agent çalıştırmalarının token kullanımını kayıt defterine yazan proxy"""
+
+    def __init__(self, agent: Any, registry: TokenUsageRegistry, provider: str):
+        self._agent = agent
+        self._registry = registry
+        self._provider = provider
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._agent, name)
+
+    def _record(self, result: Any) -> None:
+        usage = getattr(result, 'usage', None)
+        if callable(usage):
+            self._registry.record(self._provider, usage())
+
+    async def run(self, *args, **kwargs) -> Any:
+        result = await self._agent.run(*args, **kwargs)
+        self._record(result)
+        return result
+
+    @asynccontextmanager
+    async def run_stream(self, *args, **kwargs) -> AsyncIterator[Any]:
+        async with self._agent.run_stream(*args, **kwargs) as result:
+            yield result
+        self._record(result)
+
+
+_usage_registry: Optional[TokenUsageRegistry] = None
+_usage_registry_lock = threading.Lock()
+
+
+def get_token_usage() -> TokenUsageRegistry:
+    """Process genelindeki token kullanım kayıt defterini döndür"""
+
+    global _usage_registry
+    with _usage_registry_lock:
+        if _usage_registry is None:
+            _usage_registry = TokenUsageRegistry()
+        return _usage_registry
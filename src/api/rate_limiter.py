@@ -0,0 +1,220 @@
+"""
+Rate Limiter
+============
+
+Bu modül, `LLMProviderConfig.rpm_limit` değerini uygulayan async token-bucket rate limiter'ı içerir.
+Her provider (isteğe bağlı olarak her API anahtarı) için process genelinde tek bir bucket tutulur.
+Token bekleyen çağrılar session bazında kuyruklanır ve session'lar arasında round-robin ile
+sırayla servis edilir; böylece tek bir session'ın çok sayıda isteği diğerlerini aç bırakmaz.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+
+from ..utils.config import LLMProviderConfig
+from ..utils.logger import LoggerMixin
+from .client_pool import fingerprint_api_key
+
+# Aktif isteğin adil kuyruklama anahtarı (ör. Flask session id)
+rate_limit_key: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "rate_limit_key", default=None
+)
+
+_DEFAULT_KEY = "default"
+
+
+class AsyncTokenBucket(LoggerMixin):
+    """Session'lar arası adil kuyruklamalı async token bucket"""
+
+    def __init__(self, name: str, rate_per_minute: int, capacity: Optional[int] = None):
+        super().__init__()
+        self.name = name
+        self.rate_per_second = max(rate_per_minute, 1) / 60.0
+        self.capacity = float(capacity or max(rate_per_minute, 1))
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._waiters: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        # Tek bekleyen dağıtım zamanlayıcısı ve bağlı olduğu loop
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+        self._acquired = 0
+        self._waited = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    async def acquire(self, key: Optional[str] = None) -> float:
+        """
+        Bir token al; gerekirse kuyrukta bekle
+
+        Args:
+            key: Adil kuyruklama anahtarı (None ise aktif isteğin anahtarı kullanılır)
+
+        Returns:
+            Beklenen süre (saniye)
+        """
+
+        key = key or rate_limit_key.get() or _DEFAULT_KEY
+        started = time.monotonic()
+
+        with self._lock:
+            self._refill()
+            if not self._waiters and self._tokens >= 1:
+                self._tokens -= 1
+                self._acquired += 1
+                return 0.0
+
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.setdefault(key, deque()).append(future)
+
+        self._dispatch()
+        await future
+
+        waited = time.monotonic() - started
+        with self._lock:
+            self._acquired += 1
+            self._waited += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+
+        if waited >= 1.0:
+            self.log_info(f"Rate limit beklemesi: {self.name}", wait_seconds=round(waited, 2), key=key)
+        return waited
+
+    def _dispatch(self) -> None:
+        """Mevcut token'ları bekleyen session'lara round-robin dağıt"""
+
+        with self._lock:
+            self._refill()
+
+            while self._tokens >= 1 and self._waiters:
+                key, queue = next(iter(self._waiters.items()))
+                future = queue.popleft()
+                if queue:
+                    # Session'ı sıranın sonuna taşı (round-robin)
+                    self._waiters.move_to_end(key)
+                else:
+                    del self._waiters[key]
+
+                if future.done():
+                    continue
+                self._tokens -= 1
+                future.get_loop().call_soon_threadsafe(self._wake, future)
+
+            if not self._waiters:
+                return
+            if self._timer is not None and self._timer_loop.is_running():
+                # Her bekleyen için ayrı zamanlayıcı kurulmaz; bekleyen zamanlayıcı dağıtımı sürdürür
+                return
+            if self._timer is not None:
+                # Loop'u durmuş bekleyenin zamanlayıcısı hiç çalışmayacak
+                self._timer.cancel()
+            delay = max((1 - self._tokens) / self.rate_per_second, 0.001)
+            loop = next(iter(self._waiters.values()))[0].get_loop()
+            self._timer = loop.call_later(delay, self._on_timer)
+            self._timer_loop = loop
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._timer_loop = None
+        self._dispatch()
+
+    def _wake(self, future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(None)
+            return
+
+        # Bekleyen iptal edilmiş; token'ı geri ver
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+        self._dispatch()
+
+    def stats(self) -> Dict[str, Any]:
+        """Bekleme metriklerini döndür"""
+        with self._lock:
+            self._refill()
+            return {
+                "rate_per_minute": round(self.rate_per_second * 60),
+                "available_tokens": round(self._tokens, 2),
+                "queued": sum(len(q) for q in self._waiters.values()),
+                "queued_sessions": len(self._waiters),
+                "acquired": self._acquired,
+                "waited": self._waited,
+                "total_wait_seconds": round(self._total_wait, 3),
+                "avg_wait_seconds": round(self._total_wait / self._waited, 3) if self._waited else 0.0,
+                "max_wait_seconds": round(self._max_wait, 3),
+            }
+
+
+class RateLimiterRegistry:
+    """Provider (ve isteğe bağlı API anahtarı) başına paylaşılan bucket kayıt defteri"""
+
+    def __init__(self, per_api_key: bool = False):
+        self.per_api_key = per_api_key
+        self._buckets: Dict[Tuple[str, str, int], AsyncTokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def get_bucket(self, provider_name: str, provider_config: LLMProviderConfig) -> AsyncTokenBucket:
+        """Provider konfigürasyonu için bucket'ı döndür, yoksa oluştur"""
+
+        key_part = fingerprint_api_key(provider_config.api_key) if self.per_api_key else "*"
+        key = (provider_name, key_part, provider_config.rpm_limit)
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = AsyncTokenBucket(f"{provider_name}:{key_part}", provider_config.rpm_limit)
+                self._buckets[key] = bucket
+            return bucket
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {bucket.name: bucket.stats() for bucket in self._buckets.values()}
+
+
+class RateLimitedAgent:
+    """pydantic_ai Agent çağrılarını token bucket'tan geçiren proxy"""
+
+    def __init__(self, agent: Any, bucket: AsyncTokenBucket):
+        self._agent = agent
+        self._bucket = bucket
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._agent, name)
+
+    async def run(self, *args, **kwargs) -> Any:
+        await self._bucket.acquire()
+        return await self._agent.run(*args, **kwargs)
+
+    @asynccontextmanager
+    async def run_stream(self, *args, **kwargs) -> AsyncIterator[Any]:
+        await self._bucket.acquire()
+        async with self._agent.run_stream(*args, **kwargs) as result:
+            yield result
+
+
+_registry: Optional[RateLimiterRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter_registry(per_api_key: bool = False) -> RateLimiterRegistry:
+    """Process genelindeki rate limiter kayıt defterini döndür"""
+
+    global _registry
+    with _registry_lock:
+        if _registry is None or _registry.per_api_key != per_api_key:
+            _registry = RateLimiterRegistry(per_api_key=per_api_key)
+        return _registry
@@ -0,0 +1,274 @@
+"""
+Dayanıklı LLM Client
+====================
+
+Bu modül, LLM çağrıları için yeniden deneme (jitter'lı üstel geri çekilme), provider
+failover ve provider başına circuit breaker sağlar. Geçici hatalar aynı provider'da
+yeniden denenir; denemeler tükenince API anahtarı tanımlı bir sonraki provider'a geçilir.
+Art arda hata veren provider'ların devresi açılır ve bir süre hiç denenmez.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+
+from ..utils.logger import get_logger
+
+# Yeniden denemeye değer HTTP durum kodları (529: Anthropic overloaded)
+TRANSIENT_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+
+class LLMUnavailableError(RuntimeError):
+    """Hiçbir provider isteği karşılayamadığında fırlatılır"""
+
+    def __init__(self, message: str, errors: Optional[Dict[str, BaseException]] = None):
+        super().__init__(message)
+        self.errors = errors or {}
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Hatanın yeniden denemeye değer (geçici) olup olmadığını belirle"""
+
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError, ConnectionError, httpx.TransportError)):
+        return True
+
+    # pydantic_ai ModelHTTPError ve provider SDK hataları status_code taşır
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status_code, int):
+        return status_code in TRANSIENT_STATUS_CODES
+
+    # OpenAI/Anthropic SDK bağlantı ve zaman aşımı hataları
+    return type(error).__name__ in {"APIConnectionError", "APITimeoutError", "RateLimitError", "InternalServerError"}
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Full-jitter üstel geri çekilme süresi"""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """Provider başına basit circuit breaker (closed -> open -> half-open)"""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Bu provider'a istek gönderilebilir mi?"""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._half_open_in_flight:
+                # Devre yarı açık: tek bir deneme isteğine izin ver
+                self._half_open_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._half_open_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._half_open_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Provider'ın sağlığı hakkında bilgi vermeyen sonucu kaydet (ör. 400/401)"""
+        with self._lock:
+            self._half_open_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"state": self._state(), "consecutive_failures": self._failures}
+
+
+class CircuitBreakerRegistry:
+    """Process genelinde provider başına circuit breaker'lar"""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider_name: str, failure_threshold: int = 5, reset_timeout: float = 60.0) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(provider_name)
+            if breaker is None:
+                breaker = CircuitBreaker(provider_name, failure_threshold, reset_timeout)
+                self._breakers[provider_name] = breaker
+            return breaker
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {name: breaker.stats() for name, breaker in self._breakers.items()}
+
+
+_breakers = CircuitBreakerRegistry()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Process genelindeki circuit breaker kayıt defterini döndür"""
+    return _breakers
+
+
+class RetryPolicy:
+    """Yeniden deneme ve circuit breaker ayarları"""
+
+    def __init__(self,
+                 max_retries: int = 2,
+                 base_delay: float = 0.5,
+                 max_delay: float = 8.0,
+                 failure_threshold: int = 5,
+                 reset_timeout: float = 60.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+
+class ResilientAgent:
+    """Provider zinciri üzerinde retry + failover uygulayan agent proxy'si"""
+
+    def __init__(self,
+                 candidates: List[Tuple[str, Any]],
+                 agent_kwargs: Dict[str, Any],
+                 policy: RetryPolicy,
+                 breakers: CircuitBreakerRegistry):
+        self._candidates = candidates
+        self._agent_kwargs = agent_kwargs
+        self._policy = policy
+        self._breakers = breakers
+        self._agents: Dict[str, Any] = {}
+        self.logger = get_logger(self.__class__.__name__)
+
+    def __getattr__(self, name: str) -> Any:
+        # Agent özniteliklerini birincil provider'ın agent'ından oku
+        return getattr(self._agent_for(*self._candidates[0]), name)
+
+    def _agent_for(self, provider_name: str, client: Any) -> Any:
+        agent = self._agents.get(provider_name)
+        if agent is None:
+            agent = client.create_agent(**self._agent_kwargs)
+            self._agents[provider_name] = agent
+        return agent
+
+    async def _attempts(self) -> AsyncIterator[Tuple[str, Any, int]]:
+        """Denenecek (provider, agent, deneme no) üçlülerini sırayla üret"""
+        for provider_name, client in self._candidates:
+            breaker = self._breakers.get(
+                provider_name, self._policy.failure_threshold, self._policy.reset_timeout
+            )
+            if not breaker.allow():
+                self.logger.warning(f"Circuit açık, provider atlanıyor: {provider_name}")
+                continue
+            agent = self._agent_for(provider_name, client)
+            for attempt in range(self._policy.max_retries + 1):
+                yield provider_name, agent, attempt
+
+    async def _handle_failure(self, provider_name: str, attempt: int, error: Exception) -> bool:
+        """
+        Hatayı kaydet ve aynı provider'da yeniden denenip denenmeyeceğini döndür
+        """
+        breaker = self._breakers.get(provider_name)
+        transient = is_transient_error(error)
+
+        if transient and attempt < self._policy.max_retries:
+            delay = backoff_delay(attempt, self._policy.base_delay, self._policy.max_delay)
+            self.logger.warning(
+                f"{provider_name} geçici hata, {delay:.2f}s sonra yeniden denenecek "
+                f"({attempt + 1}/{self._policy.max_retries}): {error}"
+            )
+            await asyncio.sleep(delay)
+            return True
+
+        # Yalnızca geçici hatalar provider'ın sağlığını gösterir; 400/401 gibi
+        # istek/anahtar hataları devreyi açıp diğer kullanıcıları etkilememeli
+        if transient:
+            breaker.record_failure()
+        else:
+            breaker.release()
+        self.logger.error(f"{provider_name} başarısız, sonraki provider'a geçiliyor: {error}")
+        return False
+
+    async def run(self, *args, **kwargs) -> Any:
+        errors: Dict[str, BaseException] = {}
+        skip_provider: Optional[str] = None
+
+        async for provider_name, agent, attempt in self._attempts():
+            if provider_name == skip_provider:
+                continue
+            try:
+                result = await agent.run(*args, **kwargs)
+            except Exception as e:
+                errors[provider_name] = e
+                if not await self._handle_failure(provider_name, attempt, e):
+                    skip_provider = provider_name
+                continue
+
+            self._breakers.get(provider_name).record_success()
+            if provider_name != self._candidates[0][0]:
+                self.logger.info(f"İstek failover ile karşılandı: {provider_name}")
+            return result
+
+        raise LLMUnavailableError("Hiçbir LLM provider isteği karşılayamadı", errors)
+
+    @asynccontextmanager
+    async def run_stream(self, *args, **kwargs) -> AsyncIterator[Any]:
+        """Stream'i aç; yalnızca ilk yanıt gelmeden önceki hatalar yeniden denenir"""
+
+        errors: Dict[str, BaseException] = {}
+        skip_provider: Optional[str] = None
+
+        async for provider_name, agent, attempt in self._attempts():
+            if provider_name == skip_provider:
+                continue
+            stream_cm = agent.run_stream(*args, **kwargs)
+            try:
+                result = await stream_cm.__aenter__()
+            except Exception as e:
+                errors[provider_name] = e
+                if not await self._handle_failure(provider_name, attempt, e):
+                    skip_provider = provider_name
+                continue
+
+            self._breakers.get(provider_name).record_success()
+            try:
+                yield result
+            except BaseException as e:
+                if not await stream_cm.__aexit__(type(e), e, e.__traceback__):
+                    raise
+            else:
+                await stream_cm.__aexit__(None, None, None)
+            return
+
+        raise LLMUnavailableError("Hiçbir LLM provider stream açamadı", errors)
@@ -0,0 +1,262 @@
+"""
+LLM Yanıt Önbelleği
+===================
+
+Bu modül, LLM çağrıları için içerik adresli (content-addressed) bir yanıt önbelleği sağlar.
+Anahtar; provider, model, sistem prompt'u, kullanıcı prompt'u ve çıktı tipinin hash'idir.
+Bellek içi LRU katmanı ve `data/` altındaki SQLite disk katmanından oluşur; her iki katman da
+`cache_ttl_seconds` ile süre sonu (TTL) uygular.
+"""
+
+import functools
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from ..utils.config import ApplicationConfig
+from ..utils.db import DATA_DIR
+from ..utils.logger import LoggerMixin
+
+CACHE_DB_PATH = DATA_DIR / 'llm_cache.db'
+
+
+def _type_name(output_type: Any) -> str:
+    """Çıktı tipinin kararlı adını döndür (anahtar için)"""
+    module = getattr(output_type, "__module__", "")
+    name = getattr(output_type, "__qualname__", None) or repr(output_type)
+    return f"{module}.{name}" if module else name
+
+
+@functools.lru_cache(maxsize=64)
+def _adapter(output_type: Any) -> TypeAdapter:
+    """Çıktı tipi için (önbelleklenmiş) pydantic TypeAdapter"""
+    return TypeAdapter(output_type)
+
+
+def make_cache_key(provider: str,
+                   model: str,
+                   system_prompt: str,
+                   user_prompt: str,
+                   output_type: Any = str,
+                   api_key: str = "") -> str:
+    """Yanıt önbelleği için içerik adresli anahtar üret (api_key: anahtarın parmak izi)"""
+
+    digest = hashlib.sha256()
+    for part in (provider, model, system_prompt or "", user_prompt or "", _type_name(output_type)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    if api_key:
+        digest.update(api_key.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class ResponseCache(LoggerMixin):
+    """Bellek içi LRU + SQLite disk katmanlı yanıt önbelleği"""
+
+    def __init__(self,
+                 ttl_seconds: int = 3600,
+                 max_entries: int = 512,
+                 db_path: Optional[Path] = CACHE_DB_PATH,
+                 max_disk_entries: int = 5000):
+        super().__init__()
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.db_path = db_path
+
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0}
+
+        if db_path is not None:
+            self._init_disk()
+
+    def _init_disk(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_response_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_response_cache_expires ON llm_response_cache(expires_at)"
+        )
+        self._conn = conn
+
+    def get(self, key: str, output_type: Any = str) -> Tuple[bool, Any]:
+        """
+        Önbellekten değer oku
+
+        Returns:
+            (bulundu_mu, değer) ikilisi
+        """
+
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return True, value
+                del self._memory[key]
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM llm_response_cache WHERE key = ? AND expires_at > ?",
+                    (key, now)
+                ).fetchone()
+                if row is not None:
+                    try:
+                        value = _adapter(output_type).validate_json(row[0])
+                    except Exception as e:
+                        self.log_warning(f"Önbellek kaydı çözümlenemedi, atlanıyor: {str(e)}")
+                    else:
+                        self._conn.execute(
+                            "UPDATE llm_response_cache SET last_access = ? WHERE key = ?", (now, key)
+                        )
+                        self._remember(key, row[1], value)
+                        self._stats["disk_hits"] += 1
+                        return True, value
+
+            self._stats["misses"] += 1
+            return False, None
+
+    def set(self, key: str, value: Any, output_type: Any = str) -> None:
+        """Değeri her iki katmana yaz"""
+
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+
+        with self._lock:
+            self._remember(key, expires_at, value)
+            self._stats["writes"] += 1
+
+            if self._conn is not None:
+                try:
+                    payload = _adapter(output_type).dump_json(value).decode("utf-8")
+                except Exception as e:
+                    self.log_warning(f"Önbellek değeri serileştirilemedi, disk katmanı atlanıyor: {str(e)}")
+                    return
+                self._conn.execute(
+                    """
+                    INSERT INTO llm_response_cache(key, value, expires_at, last_access)
+                    VALUES(?, ?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET value=excluded.value,
+                        expires_at=excluded.expires_at, last_access=excluded.last_access
+                    """,
+                    (key, payload, expires_at, now)
+                )
+                if self._stats["writes"] % 100 == 0:
+                    self._evict_disk(now)
+
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self, now: float) -> None:
+        """Süresi dolmuş ve LRU sınırını aşan disk kayıtlarını sil"""
+        self._conn.execute("DELETE FROM llm_response_cache WHERE expires_at <= ?", (now,))
+        self._conn.execute(
+            """
+            DELETE FROM llm_response_cache WHERE key IN (
+                SELECT key FROM llm_response_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_disk_entries,)
+        )
+
+    def clear(self) -> None:
+        """Önbelleği tamamen temizle"""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM llm_response_cache")
+
+    def stats(self) -> Dict[str, Any]:
+        """Önbellek istatistiklerini döndür"""
+        with self._lock:
+            return {**self._stats, "memory_size": len(self._memory), "ttl_seconds": self.ttl_seconds}
+
+
+class CachedAgent:
+    """
+    pydantic_ai Agent'ı saran ve `run()` sonuçlarını önbelleğe alan proxy
+
+    Yalnızca saf prompt çağrıları (ek run argümanı ve tool olmadan) önbelleğe alınır;
+    diğer tüm öznitelikler alttaki agent'a devredilir.
+    """
+
+    def __init__(self, agent: Any, cache: ResponseCache, key_parts: Dict[str, Any]):
+        self._agent = agent
+        self._cache = cache
+        self._key_parts = key_parts
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._agent, name)
+
+    async def run(self, user_prompt: Any = None, **kwargs) -> Any:
+        if kwargs or not isinstance(user_prompt, str):
+            return await self._agent.run(user_prompt, **kwargs)
+
+        output_type = self._key_parts["output_type"]
+        key = make_cache_key(user_prompt=user_prompt, **self._key_parts)
+
+        found, value = self._cache.get(key, output_type)
+        if found:
+            return CachedRunResult(value)
+
+        result = await self._agent.run(user_prompt)
+        self._cache.set(key, result.output, output_type)
+        return result
+
+
+class CachedRunResult:
+    """Önbellekten dönen `AgentRunResult` benzeri sonuç"""
+
+    cached = True
+
+    def __init__(self, output: Any):
+        self.output = output
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache(config: ApplicationConfig) -> Optional[ResponseCache]:
+    """Process genelindeki yanıt önbelleğini döndür (caching kapalıysa None)"""
+
+    global _response_cache
+
+    if not config.enable_caching:
+        return None
+
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(
+                ttl_seconds=config.cache_ttl_seconds,
+                max_entries=config.cache_max_entries,
+                db_path=CACHE_DB_PATH if config.cache_disk_enabled else None
+            )
+        return _response_cache
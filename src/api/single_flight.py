@@ -0,0 +1,139 @@
+"""
+Single-Flight İstek Birleştirme
+===============================
+
+Bu modül, aynı anda gönderilen özdeş LLM isteklerini tek bir provider çağrısında birleştirir.
+Anahtar, yanıt önbelleğiyle aynı şekilde (provider, model, sistem prompt'u, kullanıcı prompt'u
+ve çıktı tipi) üretilir. İlk çağıran (lider) isteği gönderir; o sürerken gelen özdeş çağrılar
+liderin sonucunu bekler. Önbellekten farklı olarak sonuç saklanmaz: istek tamamlandığında
+anahtar serbest kalır.
+
+Bekleyenler concurrent Future üzerinden bağlanır; böylece farklı thread veya event loop'lardan
+gelen çağrılar da birleştirilebilir.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ..utils.logger import LoggerMixin
+from .response_cache import make_cache_key
+
+
+class SingleFlight(LoggerMixin):
+    """Anahtar başına tek bir devam eden çağrıya izin veren grup"""
+
+    def __init__(self):
+        super().__init__()
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "leaders": 0, "coalesced": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        `fn`'i anahtar için bir kez çalıştır; eşzamanlı çağrılar aynı sonucu alır
+
+        Lider iptal edilirse bekleyenlerden biri yeni lider olarak çağrıyı tekrarlar.
+        """
+
+        while True:
+            with self._lock:
+                self._stats["calls"] += 1
+                future = self._inflight.get(key)
+                leader = future is None
+                if leader:
+                    future = concurrent.futures.Future()
+                    self._inflight[key] = future
+                    self._stats["leaders"] += 1
+                else:
+                    self._stats["coalesced"] += 1
+
+            if leader:
+                return await self._lead(key, future, fn)
+
+            try:
+                # Bekleyenin iptali liderin çağrısını iptal etmesin
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+    async def _lead(self, key: str, future: concurrent.futures.Future, fn: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            result = await fn()
+        except BaseException as e:
+            self._release(key, future)
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+            raise
+        self._release(key, future)
+        future.set_result(result)
+        return result
+
+    def _release(self, key: str, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "inflight": len(self._inflight)}
+
+
+class SingleFlightAgent:
+    """
+    pydantic_ai Agent'ı saran ve özdeş eşzamanlı `run()` çağrılarını birleştiren proxy
+
+    Yalnızca saf prompt çağrıları (ek run argümanı olmadan) birleştirilir; bekleyenler
+    liderin çıktısını `CoalescedRunResult` olarak alır.
+    """
+
+    def __init__(self, agent: Any, group: SingleFlight, key_parts: Dict[str, Any]):
+        self._agent = agent
+        self._group = group
+        self._key_parts = key_parts
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._agent, name)
+
+    async def run(self, user_prompt: Any = None, **kwargs) -> Any:
+        if kwargs or not isinstance(user_prompt, str):
+            return await self._agent.run(user_prompt, **kwargs)
+
+        key = make_cache_key(user_prompt=user_prompt, **self._key_parts)
+        leader_result = None
+
+        async def _call():
+            nonlocal leader_result
+            leader_result = await self._agent.run(user_prompt)
+            return leader_result.output
+
+        output = await self._group.do(key, _call)
+        # Lider kendi sonucunu (mesaj geçmişi vb. ile) alır, bekleyenler yalnızca çıktıyı
+        return leader_result if leader_result is not None else CoalescedRunResult(output)
+
+
+class CoalescedRunResult:
+    """Başka bir çağrının sonucundan dönen `AgentRunResult` benzeri sonuç"""
+
+    coalesced = True
+
+    def __init__(self, output: Any):
+        self.output = output
+
+
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Process genelindeki single-flight grubunu döndür"""
+
+    global _single_flight
+    with _single_flight_lock:
+        if _single_flight is None:
+            _single_flight = SingleFlight()
+        return _single_flight
@@ -0,0 +1,9 @@
+"""Jobs package - Arka plan iş kuyruğu ve toplu üretim"""
+
+from .job_queue import JobContext, JobQueue, JobStore, get_job_queue
+from .batch import completed_ids, parse_records, run_batch
+
+__all__ = [
+    'JobContext', 'JobQueue', 'JobStore', 'get_job_queue',
+    'completed_ids', 'parse_records', 'run_batch'
+]
@@ -0,0 +1,155 @@
+"""
+Toplu PRP Üretimi
+=================
+
+Bu modül, JSONL formatındaki proje kayıtlarından toplu PRP üretir. Her satır bir kayıttır:
+
+    {"id": "proje-1", "project_data": {...}, "requirements": {...}, "provider": "openai"}
+
+`id` verilmezse kaydın içeriğinden kararlı bir kimlik türetilir; `provider` verilmezse kayıtlar
+seçilen provider'lar arasında sırayla dağıtılır. Sonuçlar tamamlandıkça JSONL satırı olarak
+üretilir; önceki bir çıktıdaki başarılı kimlikler atlanarak yarıda kalan işler sürdürülebilir.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Set
+
+from ..agents.prp_generator_agent import PRPGeneratorAgent
+from ..api.llm_factory import LLMClient
+from ..utils.logger import get_logger
+
+STATUS_OK = 'ok'
+STATUS_ERROR = 'error'
+
+
+def record_id(record: Dict[str, Any]) -> str:
+    """Kaydın kimliğini döndür; yoksa içerikten kararlı bir kimlik türet"""
+    if record.get('id') not in (None, ''):
+        return str(record['id'])
+    canonical = json.dumps(
+        {'project_data': record.get('project_data'), 'requirements': record.get('requirements')},
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+def parse_records(lines: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    JSONL satırlarını batch kayıtlarına çevir
+
+    Raises:
+        ValueError: Geçersiz JSON veya eksik `project_data` içeren satırda
+    """
+
+    records = []
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Satır {line_number}: geçersiz JSON ({e.msg})") from e
+        if not isinstance(record, dict) or not isinstance(record.get('project_data'), dict):
+            raise ValueError(f"Satır {line_number}: 'project_data' nesnesi gerekli")
+
+        record.setdefault('requirements', {})
+        record['id'] = record_id(record)
+        records.append(record)
+    return records
+
+
+def completed_ids(lines: Iterable[str]) -> Set[str]:
+    """Önceki bir çıktı JSONL'indeki başarılı kayıt kimliklerini döndür"""
+
+    done = set()
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            result = json.loads(line)
+        except json.JSONDecodeError:
+            # Yarıda kesilmiş son satır olabilir
+            continue
+        if isinstance(result, dict) and result.get('status') == STATUS_OK and result.get('id'):
+            done.add(str(result['id']))
+    return done
+
+
+async def run_batch(records: List[Dict[str, Any]],
+                    client_factory: Callable[[str], LLMClient],
+                    providers: List[str],
+                    concurrency: int = 4,
+                    skip_ids: Optional[Set[str]] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Kayıtlar için PRP üret ve sonuçları tamamlanma sırasıyla üret
+
+    Args:
+        records: `parse_records` çıktısı
+        client_factory: Provider adından LLM client üreten fonksiyon
+        providers: Kayıtların sırayla dağıtılacağı provider'lar
+        concurrency: Aynı anda çalışan üretim sayısı
+        skip_ids: Atlanacak (daha önce tamamlanmış) kayıt kimlikleri
+
+    Yields:
+        Her kayıt için `id`, `status`, `provider`, `content`/`error` ve süre bilgisi
+    """
+
+    if not providers:
+        raise ValueError("En az bir provider gerekli")
+
+    logger = get_logger(__name__)
+    skip_ids = skip_ids or set()
+    pending = [record for record in records if record['id'] not in skip_ids]
+    if len(pending) < len(records):
+        logger.info(f"Batch sürdürülüyor: {len(records) - len(pending)} kayıt zaten tamamlanmış")
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    clients: Dict[str, LLMClient] = {}
+
+    async def _generate(index: int, record: Dict[str, Any]) -> Dict[str, Any]:
+        provider = record.get('provider') or providers[index % len(providers)]
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                if provider not in clients:
+                    clients[provider] = client_factory(provider)
+                # Provider hatası veya fallback PRP'ye düşen çıktı `error` olarak raporlanır
+                agent = PRPGeneratorAgent(clients[provider], logger, strict=True)
+                content = await agent.generate_comprehensive_prp(record['project_data'], record['requirements'])
+            except Exception as e:
+                logger.error(f"Batch kaydı başarısız: {record['id']} ({provider}): {str(e)}")
+                return {
+                    'id': record['id'],
+                    'status': STATUS_ERROR,
+                    'provider': provider,
+                    'error': str(e),
+                    'duration_seconds': round(time.perf_counter() - started, 3)
+                }
+
+            return {
+                'id': record['id'],
+                'status': STATUS_OK,
+                'provider': provider,
+                'content': content,
+                'duration_seconds': round(time.perf_counter() - started, 3)
+            }
+
+    tasks = [asyncio.ensure_future(_generate(index, record)) for index, record in enumerate(pending)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Tüketici erken çıkarsa kalan üretimleri iptal et
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def to_jsonl(result: Dict[str, Any]) -> str:
+    """Sonucu tek satırlık JSONL olarak serileştir"""
+    return json.dumps(result, ensure_ascii=False) + '\n'
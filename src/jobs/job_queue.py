@@ -0,0 +1,283 @@
+"""
+Arka Plan İş Kuyruğu
+====================
+
+Bu modül, uzun süren üretimleri (PRP, ekip workflow'u) HTTP isteğinden ayırır.
+İşler `data/jobs.db` SQLite veritabanında saklanır; böylece process yeniden başlasa da
+kuyruktaki ve yarıda kalan işler kaybolmaz. İşler kalıcı event loop üzerinde, en fazla
+`max_workers` tanesi aynı anda olacak şekilde çalıştırılır.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..utils.async_runner import get_runner
+from ..utils.db import DATA_DIR
+from ..utils.logger import LoggerMixin
+
+JOBS_DB_PATH = DATA_DIR / 'jobs.db'
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_COMPLETED = 'completed'
+JOB_FAILED = 'failed'
+
+FINISHED_STATES = (JOB_COMPLETED, JOB_FAILED)
+
+
+class JobContext:
+    """Çalışan işin ilerleme bildirdiği nesne"""
+
+    def __init__(self, store: 'JobStore', job_id: str, payload: Dict[str, Any]):
+        self.store = store
+        self.job_id = job_id
+        self.payload = payload
+
+    def report(self, progress: float, message: Optional[str] = None) -> None:
+        """İlerlemeyi (0-1 arası) ve isteğe bağlı durum mesajını kaydet"""
+        self.store.update_progress(self.job_id, max(0.0, min(progress, 1.0)), message)
+
+
+JobHandler = Callable[[JobContext], Awaitable[Any]]
+
+
+class JobStore:
+    """İşlerin SQLite kalıcı deposu"""
+
+    def __init__(self, db_path: Path = JOBS_DB_PATH):
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                owner TEXT,
+                status TEXT NOT NULL,
+                progress REAL NOT NULL DEFAULT 0,
+                message TEXT,
+                payload TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                worker_pid INTEGER,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, created_at)")
+
+    def create(self, kind: str, payload: Dict[str, Any], owner: Optional[str] = None) -> str:
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs(id, kind, owner, status, payload, created_at) VALUES(?, ?, ?, ?, ?, ?)",
+                (job_id, kind, owner, JOB_QUEUED, json.dumps(payload, ensure_ascii=False), time.time())
+            )
+        return job_id
+
+    def claim_next(self) -> Optional[sqlite3.Row]:
+        """En eski kuyruktaki işi atomik olarak 'running' durumuna al"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT * FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1", (JOB_QUEUED,)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = ?, worker_pid = ?, started_at = ? WHERE id = ?",
+                        (JOB_RUNNING, os.getpid(), time.time(), row['id'])
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return row
+
+    def update_progress(self, job_id: str, progress: float, message: Optional[str] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET progress = ?, message = COALESCE(?, message) WHERE id = ?",
+                (progress, message, job_id)
+            )
+
+    def complete(self, job_id: str, result: Any) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, progress = 1, result = ?, finished_at = ? WHERE id = ?",
+                (JOB_COMPLETED, json.dumps(result, ensure_ascii=False, default=str), time.time(), job_id)
+            )
+
+    def fail(self, job_id: str, error: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (JOB_FAILED, error, time.time(), job_id)
+            )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job['payload'] = json.loads(job['payload'])
+        job['result'] = json.loads(job['result']) if job['result'] is not None else None
+        return job
+
+    def requeue_orphaned(self) -> int:
+        """Çalıştığı process artık yaşamayan 'running' işleri yeniden kuyruğa al"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, worker_pid FROM jobs WHERE status = ?", (JOB_RUNNING,)
+            ).fetchall()
+            orphaned = [row['id'] for row in rows if not _pid_alive(row['worker_pid'])]
+            for job_id in orphaned:
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, worker_pid = NULL, started_at = NULL, "
+                    "progress = 0, message = ? WHERE id = ? AND status = ?",
+                    (JOB_QUEUED, 'Yeniden başlatma sonrası kuyruğa alındı', job_id, JOB_RUNNING)
+                )
+        return len(orphaned)
+
+    def purge_finished(self, older_than_seconds: float) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (*FINISHED_STATES, time.time() - older_than_seconds)
+            )
+        return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobQueue(LoggerMixin):
+    """SQLite destekli, sınırlı eşzamanlılıklı arka plan iş kuyruğu"""
+
+    def __init__(self, store: Optional[JobStore] = None, max_workers: int = 4, retention_seconds: float = 7 * 86400):
+        super().__init__()
+        self.store = store or JobStore()
+        self.max_workers = max(1, max_workers)
+        self.retention_seconds = retention_seconds
+        self._handlers: Dict[str, JobHandler] = {}
+        self._running = 0
+        self._started = False
+        self._lock = threading.Lock()
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """Bir iş türü için async handler kaydet"""
+        self._handlers[kind] = handler
+
+    def start(self) -> None:
+        """Yarıda kalan işleri kurtar ve kuyruğu işlemeye başla"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+
+        recovered = self.store.requeue_orphaned()
+        purged = self.store.purge_finished(self.retention_seconds)
+        if recovered or purged:
+            self.log_info("İş kuyruğu kurtarıldı", requeued=recovered, purged=purged)
+        self._pump()
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], owner: Optional[str] = None) -> str:
+        """Yeni iş ekle ve kimliğini döndür"""
+        if kind not in self._handlers:
+            raise ValueError(f"Bilinmeyen iş türü: {kind}")
+
+        job_id = self.store.create(kind, payload, owner)
+        self.log_info(f"İş kuyruğa alındı: {job_id}", kind=kind)
+        self.start()
+        self._pump()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self.store.get(job_id)
+
+    def _pump(self) -> None:
+        """Boş worker slotu kaldıkça kuyruktaki işleri başlat"""
+        while True:
+            with self._lock:
+                if self._running >= self.max_workers:
+                    return
+                row = self.store.claim_next()
+                if row is None:
+                    return
+                self._running += 1
+
+            future = get_runner().submit(self._execute(row['id'], row['kind'], json.loads(row['payload'])))
+            future.add_done_callback(self._on_done)
+
+    def _on_done(self, _future) -> None:
+        with self._lock:
+            self._running -= 1
+        self._pump()
+
+    async def _execute(self, job_id: str, kind: str, payload: Dict[str, Any]) -> None:
+        handler = self._handlers.get(kind)
+        if handler is None:
+            self.store.fail(job_id, f"Bilinmeyen iş türü: {kind}")
+            return
+
+        started = time.perf_counter()
+        try:
+            result = await handler(JobContext(self.store, job_id, payload))
+        except Exception as e:
+            self.log_error(f"İş başarısız: {job_id}", kind=kind, error=str(e))
+            self.store.fail(job_id, str(e))
+            return
+
+        self.store.complete(job_id, result)
+        self.log_info(f"İş tamamlandı: {job_id}", kind=kind, duration_seconds=round(time.perf_counter() - started, 2))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            running_here = self._running
+        return {'max_workers': self.max_workers, 'running_in_process': running_here, 'jobs': self.store.counts()}
+
+
+_job_queue: Optional[JobQueue] = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue(max_workers: int = 4) -> JobQueue:
+    """Process genelindeki iş kuyruğunu döndür"""
+
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            _job_queue = JobQueue(max_workers=max_workers)
+        return _job_queue
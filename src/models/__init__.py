@@ -2,10 +2,10 @@
 
 from .project_data import (
     ProjectData, ProjectRequirements, AnalysisResult,
-    ArchitectureResult, TestStrategy, PRPContent
+    ArchitectureResult, TestStrategy, PRPContent, FormFillResult
 )
 
 __all__ = [
     'ProjectData', 'ProjectRequirements', 'AnalysisResult',
-    'ArchitectureResult', 'TestStrategy', 'PRPContent'
+    'ArchitectureResult', 'TestStrategy', 'PRPContent', 'FormFillResult'
 ] 
\ No newline at end of file
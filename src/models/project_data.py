@@ -397,4 +397,39 @@ class PRPContent(BaseModel):
 Generated at: {self.generated_at.strftime('%Y-%m-%d %H:%M:%S')}
 """
         
-        return md_content 
\ No newline at end of file
+        return md_content 
+
+class FormFillResult(BaseModel):
+    """Form doldurma uzmanının proje açıklamasından çıkardığı alanlar"""
+    
+    project_name: Optional[str] = Field(None, description="Proje adı")
+    project_type: Optional[str] = Field(None, description="Proje türü (verilen seçeneklerden biri)")
+    description: Optional[str] = Field(None, description="İyileştirilmiş proje açıklaması")
+    target_audience: Optional[str] = Field(None, description="Hedef kitle")
+    timeline: Optional[str] = Field(None, description="Zaman çizelgesi")
+    deployment_target: Optional[str] = Field(None, description="Deployment hedefi")
+    budget_range: Optional[str] = Field(None, description="Bütçe aralığı")
+    main_goals: List[str] = Field(default_factory=list, description="Ana hedefler")
+    tech_stack: List[str] = Field(default_factory=list, description="Teknoloji stack'i")
+    additional_requirements: List[str] = Field(default_factory=list, description="Ek gereksinimler")
+    functional_requirements: List[str] = Field(default_factory=list, description="Fonksiyonel gereksinimler")
+    non_functional_requirements: List[str] = Field(default_factory=list, description="Fonksiyonel olmayan gereksinimler")
+    technical_requirements: List[str] = Field(default_factory=list, description="Teknik gereksinimler")
+    constraints: List[str] = Field(default_factory=list, description="Kısıtlamalar")
+    acceptance_criteria: List[str] = Field(default_factory=list, description="Kabul kriterleri")
+    user_stories: List[str] = Field(default_factory=list, description="Kullanıcı hikayeleri")
+    risks: List[str] = Field(default_factory=list, description="Riskler")
+    
+    @validator(
+        'main_goals', 'tech_stack', 'additional_requirements', 'functional_requirements',
+        'non_functional_requirements', 'technical_requirements', 'constraints',
+        'acceptance_criteria', 'user_stories', 'risks',
+        pre=True
+    )
+    def coerce_list(cls, v):
+        """Tek metin olarak dönen liste alanlarını satırlara böl"""
+        if v is None:
+            return []
+        if isinstance(v, str):
+            return [line.strip(' -*•\t') for line in v.splitlines() if line.strip(' -*•\t')]
+        return [str(item) for item in v]
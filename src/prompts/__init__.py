@@ -0,0 +1,5 @@
+"""Prompts package - Derlenmiş agent prompt şablonları"""
+
+from .registry import PromptRegistry, get_prompt_registry
+
+__all__ = ['PromptRegistry', 'get_prompt_registry']
@@ -0,0 +1,182 @@
+"""
+Prompt Şablon Kayıt Defteri
+===========================
+
+Bu modül, agent prompt'larını `templates/<agent>/<ad>.j2` dosyalarından yükler ve hepsini
+başlangıçta bir kez derler. Böylece her çağrıda büyük f-string'lerin yeniden kurulması yerine
+derlenmiş şablon yalnızca dinamik alanlarla doldurulur:
+
+- Değişken içermeyen (statik) şablonlar yükleme sırasında bir kez render edilip saklanır.
+- Yalnızca küçük, sonlu parametrelere bağlı şablonlar (ör. detay seviyesine göre sistem
+  prompt'u) `render_cached` ile parametre başına bir kez render edilir.
+- Kullanıcı verisi içeren şablonlar her çağrıda render edilir; statik metin parçaları
+  derlenmiş kodda sabit olarak durur.
+
+Render süreleri şablon bazında toplanır (`stats()`), `benchmarks/prompt_render.py` ile ölçülebilir.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, meta
+
+from ..utils.logger import LoggerMixin
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+TEMPLATE_EXTENSION = ".j2"
+
+
+def format_value(value: Any) -> str:
+    """`{{ }}` çıktısını f-string ile aynı şekilde metne çevir"""
+    return value if type(value) is str else format(value)
+
+
+def join_values(values: Any, separator: str = '') -> str:
+    """`str.join` ile aynı davranan `join` filtresi (`str, Enum` öğelerinde değeri yazar)"""
+    return separator.join(value if isinstance(value, str) else str(value) for value in values)
+
+
+def pretty_json(value: Any) -> str:
+    """Girdiyi prompt'lar için okunabilir JSON'a çevir"""
+    return json.dumps(value, indent=2, ensure_ascii=False)
+
+
+def format_items(mapping: Mapping[str, Any], pattern: str = "{}: {}") -> str:
+    """Sözlük öğelerini `pattern` ile biçimlendirip virgülle birleştir"""
+    return ', '.join(pattern.format(key, value) for key, value in mapping.items())
+
+
+def create_environment(template_dir: Path = TEMPLATE_DIR) -> Environment:
+    """Prompt şablonları için Jinja2 ortamını oluştur"""
+
+    env = Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        undefined=StrictUndefined,
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        auto_reload=False,
+        cache_size=-1,
+        finalize=format_value
+    )
+    env.filters['join'] = join_values
+    env.filters['pretty_json'] = pretty_json
+    env.filters['format_items'] = format_items
+    return env
+
+
+class PromptRegistry(LoggerMixin):
+    """Derlenmiş agent prompt şablonlarının kayıt defteri"""
+
+    def __init__(self, template_dir: Path = TEMPLATE_DIR):
+        super().__init__()
+        self.env = create_environment(template_dir)
+        self._templates = {}
+        self._variables: Dict[str, frozenset] = {}
+        self._static: Dict[str, str] = {}
+        self._cached: Dict[Tuple, str] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+        started = time.perf_counter()
+        for name in self.env.list_templates(extensions=[TEMPLATE_EXTENSION.lstrip('.')]):
+            key = name[:-len(TEMPLATE_EXTENSION)]
+            source = self.env.loader.get_source(self.env, name)[0]
+            self._variables[key] = frozenset(meta.find_undeclared_variables(self.env.parse(source)))
+            self._templates[key] = self.env.get_template(name)
+            if not self._variables[key]:
+                self._static[key] = self._templates[key].render()
+        self.compile_seconds = time.perf_counter() - started
+
+    def names(self) -> List[str]:
+        return sorted(self._templates)
+
+    def variables(self, name: str) -> frozenset:
+        """Şablonun beklediği dinamik değişkenler (statik şablonlarda boş)"""
+        return self._variables[name]
+
+    def is_static(self, name: str) -> bool:
+        return name in self._static
+
+    def render(self, name: str, **context: Any) -> str:
+        """Şablonu verilen bağlamla render et"""
+
+        static = self._static.get(name)
+        if static is not None:
+            self._record(name, 0.0, cached=True)
+            return static
+
+        template = self._templates.get(name)
+        if template is None:
+            raise KeyError(f"Bilinmeyen prompt şablonu: {name}")
+
+        started = time.perf_counter()
+        text = template.render(**context)
+        self._record(name, time.perf_counter() - started)
+        return text
+
+    def render_cached(self, name: str, **params: Any) -> str:
+        """
+        Yalnızca hashable, sonlu parametrelere bağlı şablonu parametre başına bir kez render et
+
+        Sistem prompt'ları gibi parametre kombinasyonu az olan şablonlar için kullanılır;
+        kullanıcı verisi içeren şablonlarda `render` kullanılmalıdır.
+        """
+
+        key = (name, tuple(sorted(params.items())))
+        text = self._cached.get(key)
+        if text is not None:
+            self._record(name, 0.0, cached=True)
+            return text
+
+        text = self.render(name, **params)
+        with self._lock:
+            self._cached.setdefault(key, text)
+        return text
+
+    def _record(self, name: str, seconds: float, cached: bool = False) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(name, {"renders": 0, "cached": 0, "seconds": 0.0})
+            stats["renders"] += 1
+            stats["cached"] += int(cached)
+            stats["seconds"] += seconds
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            templates = {
+                name: {
+                    "renders": int(stats["renders"]),
+                    "cached": int(stats["cached"]),
+                    "avg_us": round(stats["seconds"] / stats["renders"] * 1e6, 2) if stats["renders"] else 0.0
+                }
+                for name, stats in self._stats.items()
+            }
+        return {
+            "templates": len(self._templates),
+            "static": len(self._static),
+            "compile_ms": round(self.compile_seconds * 1000, 2),
+            "renders": templates
+        }
+
+
+_registry: Optional[PromptRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_prompt_registry() -> PromptRegistry:
+    """Process genelindeki prompt şablon kayıt defterini döndür"""
+
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = PromptRegistry()
+            _registry.log_info(
+                "Prompt şablonları derlendi",
+                templates=len(_registry.names()),
+                compile_ms=round(_registry.compile_seconds * 1000, 2)
+            )
+        return _registry
@@ -0,0 +1,9 @@
+"""Retrieval package - Prompt'lara eklenecek ilgili örnek PRP bölümlerinin seçimi"""
+
+from .bm25 import BM25Index, Chunk, chunk_markdown, estimate_tokens, tokenize
+from .context import ContextRetriever, get_context_retriever
+
+__all__ = [
+    'BM25Index', 'Chunk', 'chunk_markdown', 'estimate_tokens', 'tokenize',
+    'ContextRetriever', 'get_context_retriever'
+]
@@ -0,0 +1,179 @@
+"""
+BM25 Ters İndeksi
+=================
+
+Bu modül, markdown dokümanları başlıklara göre parçalara ayırıp parçalar üzerinde NumPy
+destekli bir BM25 ters indeksi kurar. Posting listeleri terim sırasına göre tek bir dizide
+(CSR düzeni) tutulur ve her posting'in BM25 ağırlığı indeks kurulurken hesaplanır; sorgu
+skoru yalnızca sorgu terimlerinin posting dilimlerinin toplanmasıdır.
+
+Tokenizer aksan ve büyük/küçük harf duyarsızdır (`ödeme` ile `odeme` aynı terimdir).
+"""
+
+import math
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+K1 = 1.5
+B = 0.75
+
+# Token sayısı tahmini için ortalama karakter/token oranı
+CHARS_PER_TOKEN = 4
+CHUNK_TOKENS = 300
+MIN_CHUNK_TOKENS = 20
+
+STOPWORDS = frozenset("""
+    a an and are as at be by for from has have in is it its of on or that the this to was were will with
+    ve veya ile bir bu şu da de için gibi olan olarak daha en çok her ise ki mi ne sonra kadar
+""".split())
+
+_WORD = re.compile(r'\w+')
+_HEADING = re.compile(r'^#{1,3}\s+(.+?)\s*#*$')
+
+
+def fold(text: str) -> str:
+    """Aksanları kaldır ve büyük/küçük harf farkını yok et"""
+    return ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    return [
+        token for token in _WORD.findall(fold(text))
+        if len(token) > 1 and not token.isdigit() and token not in STOPWORDS
+    ]
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+class Chunk:
+    """İndekslenen doküman parçası"""
+
+    __slots__ = ('source', 'title', 'text', 'tokens')
+
+    def __init__(self, source: str, title: str, text: str):
+        self.source = source
+        self.title = title
+        self.text = text
+        self.tokens = estimate_tokens(text)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {'source': self.source, 'title': self.title, 'text': self.text, 'tokens': self.tokens}
+
+
+def chunk_markdown(source: str, text: str, max_tokens: int = CHUNK_TOKENS) -> List[Chunk]:
+    """
+    Markdown metnini başlıklara (`#`-`###`) göre parçala
+
+    Kod blokları içindeki `#` satırları başlık sayılmaz. `max_tokens` sınırını aşan bölümler
+    kod bloğu dışındaki boş satırlardan bölünür; çok kısa parçalar atlanır.
+    """
+
+    chunks: List[Chunk] = []
+    title, lines, in_fence = source, [], False
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    size = 0
+
+    def flush() -> None:
+        nonlocal size
+        body = '\n'.join(lines).strip()
+        if body and estimate_tokens(body) >= MIN_CHUNK_TOKENS:
+            chunks.append(Chunk(source, title, body))
+        lines.clear()
+        size = 0
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith('```'):
+            in_fence = not in_fence
+        heading = None if in_fence else _HEADING.match(stripped)
+        if heading:
+            flush()
+            title = heading.group(1)
+        elif not stripped and not in_fence and size >= max_chars:
+            flush()
+            continue
+        elif size >= 2 * max_chars:
+            # Boş satırla bölünemeyen uzun kod bloğu
+            flush()
+        lines.append(line)
+        size += len(line) + 1
+    flush()
+    return chunks
+
+
+class BM25Index:
+    """Sabit doküman kümesi üzerinde BM25 skorlama"""
+
+    def __init__(self, documents: Sequence[str], k1: float = K1, b: float = B):
+        tokenized = [tokenize(document) for document in documents]
+        self.size = len(tokenized)
+        self.vocabulary: Dict[str, int] = {}
+
+        term_ids, doc_ids, frequencies = [], [], []
+        for doc_id, tokens in enumerate(tokenized):
+            for term, frequency in Counter(tokens).items():
+                term_ids.append(self.vocabulary.setdefault(term, len(self.vocabulary)))
+                doc_ids.append(doc_id)
+                frequencies.append(frequency)
+
+        terms = np.asarray(term_ids, dtype=np.int64)
+        order = np.argsort(terms, kind='stable')
+        terms = terms[order]
+        self.doc_ids = np.asarray(doc_ids, dtype=np.int64)[order]
+        tf = np.asarray(frequencies, dtype=np.float32)[order]
+
+        document_frequency = np.bincount(terms, minlength=len(self.vocabulary))
+        self.indptr = np.concatenate(([0], np.cumsum(document_frequency)))
+        idf = np.log1p((self.size - document_frequency + 0.5) / (document_frequency + 0.5)).astype(np.float32)
+
+        lengths = np.asarray([len(tokens) for tokens in tokenized], dtype=np.float32)
+        average_length = float(lengths.mean()) if self.size and lengths.sum() else 1.0
+        norm = k1 * (1 - b + b * lengths[self.doc_ids] / average_length)
+        self.weights = idf[terms] * tf * (k1 + 1) / (tf + norm)
+
+    def scores(self, query: str) -> np.ndarray:
+        """Tüm dokümanların sorgu skoru (eşleşmeyenler 0)"""
+
+        scores = np.zeros(self.size, dtype=np.float32)
+        for term in set(tokenize(query)):
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                continue
+            start, end = self.indptr[term_id], self.indptr[term_id + 1]
+            # Bir terimin posting listesinde her doküman bir kez geçer
+            scores[self.doc_ids[start:end]] += self.weights[start:end]
+        return scores
+
+    def top(self, query: str, k: int) -> List[Tuple[int, float]]:
+        """En yüksek skorlu `k` doküman: (doküman sırası, skor)"""
+
+        scores = self.scores(query)
+        matched = np.flatnonzero(scores)
+        if not len(matched) or k <= 0:
+            return []
+        if len(matched) > k:
+            matched = matched[np.argpartition(-scores[matched], k - 1)[:k]]
+        ranked = matched[np.argsort(-scores[matched], kind='stable')]
+        return [(int(doc_id), float(scores[doc_id])) for doc_id in ranked]
+
+    def stats(self) -> Dict[str, int]:
+        return {'documents': self.size, 'terms': len(self.vocabulary), 'postings': int(len(self.doc_ids))}
+
+
+def flatten_text(value: object, skip: Optional[Iterable[str]] = None) -> str:
+    """Sözlük/liste/pydantic modelindeki metin değerlerini tek metinde birleştir"""
+
+    skip = frozenset(skip or ())
+    if hasattr(value, 'model_dump'):
+        value = value.model_dump(mode='json')
+    if isinstance(value, dict):
+        return '\n'.join(flatten_text(item, skip) for key, item in value.items() if key not in skip)
+    if isinstance(value, (list, tuple, set)):
+        return '\n'.join(flatten_text(item, skip) for item in value)
+    return value if isinstance(value, str) else ''
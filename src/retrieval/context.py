@@ -0,0 +1,309 @@
+"""
+Prompt Bağlamı Seçimi
+=====================
+
+Bu modül, `examples/*.md` örneklerini ve geçmişte saklanan PRP'leri (her projenin son sürümü)
+parçalara ayırıp BM25 ile indeksler. Üretim sırasında proje verisi ve gereksinimlerden bir
+sorgu oluşturulur; en ilgili parçalar token bütçesini aşmayacak şekilde seçilip agent
+prompt'larına referans olarak eklenir.
+
+İndeks kurulumu (geçmiş PRP'lerin çözülüp parçalanması) event loop'u bloklamaması için
+arka plandaki tek bir thread'de yapılır. Geçmiş değiştiğinde (en fazla `refresh_interval`
+saniyede bir kontrol edilir) yeni indeks kurulurken eski indeks sunulmaya devam eder ve
+kurulum bitince atomik olarak değiştirilir. İlk kullanımda henüz indeks yoksa yalnızca
+örnek dokümanlardan (ucuz) bir indeks hemen kurulur; geçmiş arka planda eklenir.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..storage.history_store import HistoryStore
+from ..utils.logger import LoggerMixin
+from .bm25 import BM25Index, Chunk, chunk_markdown, flatten_text
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent.parent / 'examples'
+
+DEFAULT_TOKEN_BUDGET = 1500
+DEFAULT_TOP_K = 6
+REFRESH_INTERVAL_SECONDS = 30.0
+# İndekslenen en fazla proje (son sürümleri)
+HISTORY_DOCUMENTS = 200
+# Aynı kaynaktan (örnek dosya veya PRP) seçilecek en fazla parça
+MAX_CHUNKS_PER_SOURCE = 2
+
+# Sorguya katılmayan üretim ayarları
+QUERY_SKIP_KEYS = ('detail_level', 'include_examples', 'generated_at', 'simplified', 'ai_tools')
+
+
+def _format_chunk(chunk: Chunk) -> str:
+    # Başlığın ortasından bölünen parçalarda bölüm başlığı tekrar yazılır
+    text = chunk.text if chunk.text.startswith('#') else f"### {chunk.title}\n{chunk.text}"
+    return f"Kaynak: {chunk.source}\n{text}"
+
+
+class ContextRetriever(LoggerMixin):
+    """Örnek ve geçmiş PRP parçalarından projeye en uygun olanları seçer"""
+
+    def __init__(self,
+                 examples_dir: Path = EXAMPLES_DIR,
+                 history: Optional[HistoryStore] = None,
+                 token_budget: int = DEFAULT_TOKEN_BUDGET,
+                 top_k: int = DEFAULT_TOP_K,
+                 refresh_interval: float = REFRESH_INTERVAL_SECONDS,
+                 history_documents: int = HISTORY_DOCUMENTS):
+        super().__init__()
+        self.examples_dir = Path(examples_dir)
+        self.history = history
+        self.token_budget = token_budget
+        self.top_k = top_k
+        self.refresh_interval = refresh_interval
+        self.history_documents = history_documents
+
+        self._index: Optional[BM25Index] = None
+        self._chunks: List[Chunk] = []
+        self._revision: Optional[Tuple[int, int]] = None
+        # Mevcut indeks geçmiş PRP'leri içeriyor mu (ilk indeks yalnızca örneklerden kurulur)
+        self._history_indexed = False
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[Future] = None
+        self._stats = {'builds': 0, 'build_ms': 0.0, 'queries': 0, 'chunks_injected': 0, 'tokens_injected': 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.token_budget > 0 and self.top_k > 0
+
+    def _history_revision(self) -> Optional[Tuple[int, int]]:
+        if self.history is None:
+            return None
+        try:
+            return self.history.revision()
+        except Exception as e:
+            self.log_warning(f"PRP geçmişi okunamadı: {str(e)}")
+            return self._revision
+
+    def _example_documents(self) -> List[Tuple[str, str]]:
+        return [(path.name, path.read_text(encoding='utf-8')) for path in sorted(self.examples_dir.glob('*.md'))]
+
+    def _history_documents(self) -> List[Tuple[str, str]]:
+        try:
+            return [
+                (f"{row['project_name']} v{row['version']}", row['content'])
+                for row in self.history.latest_contents(self.history_documents)
+            ]
+        except Exception as e:
+            self.log_warning(f"PRP geçmişi indekslenemedi: {str(e)}")
+            return []
+
+    def _build(self, documents: List[Tuple[str, str]], revision: Optional[Tuple[int, int]], with_history: bool) -> None:
+        """İndeksi kilit dışında kur, sonra mevcut indeksle değiştir"""
+
+        started = time.perf_counter()
+        chunks = [chunk for source, text in documents for chunk in chunk_markdown(source, text)]
+        index = BM25Index([f"{chunk.title}\n{chunk.text}" for chunk in chunks])
+        build_ms = round((time.perf_counter() - started) * 1000, 2)
+        with self._lock:
+            self._index, self._chunks = index, chunks
+            self._revision = revision
+            self._history_indexed = with_history
+            self._stats['builds'] += 1
+            self._stats['build_ms'] = build_ms
+        self.log_info("Prompt bağlam indeksi kuruldu", chunks=len(chunks), build_ms=build_ms)
+
+    def refresh(self) -> bool:
+        """
+        Geçmiş değiştiyse indeksi çağıran thread'de yeniden kur
+
+        Returns:
+            İndeks yeniden kurulduysa True
+        """
+
+        revision = self._history_revision()
+        with self._lock:
+            current = self._index is not None and self._history_indexed and revision == self._revision
+        if current:
+            return False
+        documents = self._example_documents()
+        if self.history is not None:
+            documents += self._history_documents()
+        self._build(documents, revision, with_history=True)
+        return True
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            self.log_error(f"Prompt bağlam indeksi kurulamadı: {str(e)}")
+
+    def schedule_refresh(self) -> Future:
+        """Yeniden kurulumu arka plan thread'inde başlat (zaten sürüyorsa onu döndür)"""
+
+        with self._lock:
+            if self._pending is None or self._pending.done():
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='context-index')
+                self._pending = self._executor.submit(self._refresh_in_background)
+            return self._pending
+
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> None:
+        """Sürmekte olan arka plan kurulumunun bitmesini bekle"""
+        with self._lock:
+            pending = self._pending
+        if pending is not None:
+            pending.result(timeout)
+
+    def _ensure_index(self) -> Tuple[BM25Index, List[Chunk]]:
+        """
+        Sorgu için indeksi döndür; çağıran thread'i (event loop) yalnızca ilk kullanımda
+        ve yalnızca örnek dokümanların indekslenmesi kadar bekletir
+        """
+
+        with self._lock:
+            index, chunks = self._index, self._chunks
+            now = time.monotonic()
+            due = now - self._checked_at >= self.refresh_interval
+            if due:
+                self._checked_at = now
+
+        if index is None:
+            if self.history is None:
+                self.refresh()
+            else:
+                self._build(self._example_documents(), None, with_history=False)
+                due = True
+            with self._lock:
+                index, chunks = self._index, self._chunks
+        if due and self.history is not None:
+            # Geçmiş revizyonu da arka planda okunur; yeni indeks hazır olana dek bu indeks sunulur
+            self.schedule_refresh()
+        return index, chunks
+
+    def retrieve(self,
+                 project_data: Any,
+                 requirements: Any = None,
+                 top_k: Optional[int] = None,
+                 token_budget: Optional[int] = None) -> List[Chunk]:
+        """
+        Proje verisi ve gereksinimlere en ilgili parçaları seç
+
+        Parçalar skor sırasıyla, bütçeyi aşmayan ve aynı kaynaktan en fazla
+        `MAX_CHUNKS_PER_SOURCE` tane olacak şekilde alınır; aynı metin iki kez eklenmez.
+        """
+
+        top_k = self.top_k if top_k is None else top_k
+        token_budget = self.token_budget if token_budget is None else token_budget
+        if top_k <= 0 or token_budget <= 0:
+            return []
+
+        query = '\n'.join(flatten_text(value, QUERY_SKIP_KEYS) for value in (project_data, requirements))
+        index, chunks = self._ensure_index()
+
+        selected: List[Chunk] = []
+        per_source: Dict[str, int] = {}
+        seen = set()
+        used = 0
+        for position, _ in index.top(query, top_k * 4):
+            chunk = chunks[position]
+            if chunk.text in seen or per_source.get(chunk.source, 0) >= MAX_CHUNKS_PER_SOURCE:
+                continue
+            if used + chunk.tokens > token_budget:
+                continue
+            selected.append(chunk)
+            seen.add(chunk.text)
+            per_source[chunk.source] = per_source.get(chunk.source, 0) + 1
+            used += chunk.tokens
+            if len(selected) >= top_k:
+                break
+
+        with self._lock:
+            self._stats['queries'] += 1
+            self._stats['chunks_injected'] += len(selected)
+            self._stats['tokens_injected'] += used
+        return selected
+
+    def context_for(self, project_data: Any, requirements: Any = None) -> str:
+        """Seçilen parçaları prompt'a eklenecek markdown metni olarak döndür (boş olabilir)"""
+
+        if not self.enabled:
+            return ''
+        try:
+            chunks = self.retrieve(project_data, requirements)
+        except Exception as e:
+            # Referanslar isteğe bağlı; üretim bunlarsız devam eder
+            self.log_error(f"Prompt bağlamı seçilemedi: {str(e)}")
+            return ''
+        return '\n\n'.join(_format_chunk(chunk) for chunk in chunks)
+
+    def configure(self,
+                  history: Optional[HistoryStore] = None,
+                  token_budget: Optional[int] = None,
+                  top_k: Optional[int] = None) -> None:
+        """Verilen ayarları uygula; geçmiş değişirse indeks yeniden kurulur"""
+
+        with self._lock:
+            if token_budget is not None:
+                self.token_budget = token_budget
+            if top_k is not None:
+                self.top_k = top_k
+            if history is not None and history is not self.history:
+                self.history = history
+                self._index, self._chunks = None, []
+                self._history_indexed = False
+                self._checked_at = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            index = self._index
+        queries = stats['queries']
+        stats['avg_tokens_injected'] = round(stats['tokens_injected'] / queries, 1) if queries else 0.0
+        stats['index'] = index.stats() if index is not None else None
+        stats['token_budget'] = self.token_budget
+        return stats
+
+
+_context_retriever: Optional[ContextRetriever] = None
+_context_retriever_configured = False
+_context_retriever_lock = threading.Lock()
+
+
+def get_context_retriever(history: Optional[HistoryStore] = None,
+                          token_budget: Optional[int] = None,
+                          top_k: Optional[int] = None) -> ContextRetriever:
+    """
+    Process genelindeki bağlam seçiciyi döndür
+
+    Argümansız çağrılar (agent'lar) mevcut seçiciyi kullanır. Argümanlı ilk çağrı (web
+    uygulamasının başlangıç yapılandırması) seçiciyi yapılandırır; seçici daha önce
+    argümansız oluşturulmuşsa yapılandırma ona uygulanır.
+
+    Raises:
+        ValueError: Seçici başka değerlerle yapılandırılmışsa
+    """
+
+    global _context_retriever, _context_retriever_configured
+    settings = {
+        key: value for key, value in
+        (('history', history), ('token_budget', token_budget), ('top_k', top_k))
+        if value is not None
+    }
+    with _context_retriever_lock:
+        if _context_retriever is None:
+            _context_retriever = ContextRetriever(
+                history=history,
+                token_budget=DEFAULT_TOKEN_BUDGET if token_budget is None else token_budget,
+                top_k=DEFAULT_TOP_K if top_k is None else top_k
+            )
+            _context_retriever_configured = bool(settings)
+        elif settings and not _context_retriever_configured:
+            _context_retriever.configure(**settings)
+            _context_retriever_configured = True
+        elif settings:
+            conflicts = [key for key, value in settings.items() if getattr(_context_retriever, key) != value]
+            if conflicts:
+                raise ValueError(f"Bağlam seçici farklı ayarlarla yapılandırılmış: {', '.join(conflicts)}")
+        return _context_retriever
@@ -0,0 +1,9 @@
+"""Storage package - Üretilen içerikler için kalıcı depolar"""
+
+from .artifact_store import Artifact, ArtifactStore, content_hash, get_artifact_store
+from .history_store import HistoryStore, get_history_store
+
+__all__ = [
+    'Artifact', 'ArtifactStore', 'content_hash', 'get_artifact_store',
+    'HistoryStore', 'get_history_store'
+]
@@ -0,0 +1,381 @@
+"""
+PRP Artifact Deposu
+===================
+
+Bu modül, üretilen PRP'leri içerik hash'i ile adreslenen bir depoda saklar. İçerik
+(`artifact_blobs`) SHA-256 hash'i ile bir kez yazılır; aynı çıktıyı üreten session'lar
+aynı blob'u paylaşır. Her üretim için session, proje ve ayar bilgisini tutan bir metadata
+kaydı (`artifacts`) oluşturulur. İçeriğin türetilmiş gösterimleri (ör. render edilmiş HTML)
+aynı hash ile `artifact_renditions` tablosunda tutulur. Süre sonu `expires_at` indeksi
+üzerinden temizlenir ve hiçbir kayıt tarafından kullanılmayan blob'lar silinir.
+
+`zstandard` paketi kuruluysa içerik zstd ile sıkıştırılır; değilse sıkıştırılmadan saklanır.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..utils.db import DATA_DIR
+from ..utils.logger import LoggerMixin
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - opsiyonel bağımlılık
+    zstandard = None
+
+ARTIFACTS_DB_PATH = DATA_DIR / 'artifacts.db'
+
+ENCODING_IDENTITY = 'identity'
+ENCODING_ZSTD = 'zstd'
+
+
+def content_hash(content: str) -> str:
+    """İçeriğin SHA-256 hex özetini döndür"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class Artifact:
+    """Depodan okunan tek bir PRP artifact'ı"""
+
+    def __init__(self,
+                 artifact_id: str,
+                 content_hash: str,
+                 content: str,
+                 session_id: Optional[str] = None,
+                 project_name: Optional[str] = None,
+                 settings: Optional[Dict[str, Any]] = None,
+                 created_at: float = 0.0,
+                 size: int = 0):
+        self.id = artifact_id
+        self.hash = content_hash
+        self.content = content
+        self.session_id = session_id
+        self.project_name = project_name
+        self.settings = settings or {}
+        self.created_at = created_at
+        self.size = size
+
+    def __repr__(self) -> str:
+        return f"Artifact({self.id!r}, hash={self.hash[:12]!r}, size={self.size})"
+
+
+class ArtifactStore(LoggerMixin):
+    """SQLite metadata + içerik adresli blob deposu"""
+
+    def __init__(self,
+                 db_path: Path = ARTIFACTS_DB_PATH,
+                 ttl_seconds: float = 24 * 3600,
+                 compression: str = ENCODING_ZSTD,
+                 cache_size: int = 64,
+                 purge_interval_seconds: float = 300.0):
+        super().__init__()
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.cache_size = cache_size
+        self.purge_interval_seconds = purge_interval_seconds
+        self._last_purge = 0.0
+
+        self.encoding = ENCODING_ZSTD if compression == ENCODING_ZSTD and zstandard is not None else ENCODING_IDENTITY
+        if compression == ENCODING_ZSTD and zstandard is None:
+            self.log_info("zstandard kurulu değil, artifact'lar sıkıştırılmadan saklanacak")
+
+        # İçerik değişmez olduğundan hash (ve hash:gösterim) -> metin önbelleği her zaman geçerlidir
+        self._content_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS artifact_blobs (
+                hash TEXT PRIMARY KEY,
+                encoding TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_size INTEGER NOT NULL,
+                data BLOB NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS artifact_renditions (
+                hash TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                encoding TEXT NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (hash, kind)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS artifacts (
+                id TEXT PRIMARY KEY,
+                hash TEXT,
+                session_id TEXT,
+                project_name TEXT,
+                settings TEXT,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_artifacts_expires ON artifacts(expires_at);
+            CREATE INDEX IF NOT EXISTS idx_artifacts_hash ON artifacts(hash);
+            CREATE INDEX IF NOT EXISTS idx_artifacts_session ON artifacts(session_id);
+            """
+        )
+
+    def _encode(self, content: str) -> bytes:
+        raw = content.encode('utf-8')
+        if self.encoding == ENCODING_ZSTD:
+            return zstandard.ZstdCompressor(level=9).compress(raw)
+        return raw
+
+    @staticmethod
+    def _decode(encoding: str, data: bytes) -> str:
+        if encoding == ENCODING_ZSTD:
+            if zstandard is None:
+                raise RuntimeError("zstd ile sıkıştırılmış artifact için zstandard paketi gerekli")
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return bytes(data).decode('utf-8')
+
+    def _remember(self, digest: str, content: str) -> None:
+        self._content_cache[digest] = content
+        self._content_cache.move_to_end(digest)
+        while len(self._content_cache) > self.cache_size:
+            self._content_cache.popitem(last=False)
+
+    def reserve(self,
+                session_id: Optional[str] = None,
+                project_name: Optional[str] = None,
+                settings: Optional[Dict[str, Any]] = None) -> str:
+        """İçeriği daha sonra yazılacak bir artifact kaydı ayır ve kimliğini döndür"""
+
+        artifact_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO artifacts(id, hash, session_id, project_name, settings, created_at, expires_at)
+                VALUES(?, NULL, ?, ?, ?, ?, ?)
+                """,
+                (artifact_id, session_id, project_name,
+                 json.dumps(settings or {}, ensure_ascii=False), now, now + self.ttl_seconds)
+            )
+        self._maybe_purge(now)
+        return artifact_id
+
+    def put(self,
+            content: str,
+            session_id: Optional[str] = None,
+            project_name: Optional[str] = None,
+            settings: Optional[Dict[str, Any]] = None,
+            artifact_id: Optional[str] = None) -> str:
+        """
+        İçeriği sakla ve artifact kimliğini döndür
+
+        Args:
+            content: PRP metni
+            artifact_id: `reserve()` ile ayrılmış kimlik (verilmezse yeni kayıt oluşturulur)
+        """
+
+        digest = content_hash(content)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                exists = self._conn.execute(
+                    "SELECT 1 FROM artifact_blobs WHERE hash = ?", (digest,)
+                ).fetchone()
+                if exists is None:
+                    data = self._encode(content)
+                    self._conn.execute(
+                        "INSERT INTO artifact_blobs(hash, encoding, size, stored_size, data) VALUES(?, ?, ?, ?, ?)",
+                        (digest, self.encoding, len(content.encode('utf-8')), len(data), data)
+                    )
+
+                if artifact_id is None:
+                    artifact_id = uuid.uuid4().hex
+                    self._conn.execute(
+                        """
+                        INSERT INTO artifacts(id, hash, session_id, project_name, settings, created_at, expires_at)
+                        VALUES(?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (artifact_id, digest, session_id, project_name,
+                         json.dumps(settings or {}, ensure_ascii=False), now, now + self.ttl_seconds)
+                    )
+                else:
+                    self._conn.execute(
+                        "UPDATE artifacts SET hash = ?, expires_at = ? WHERE id = ?",
+                        (digest, now + self.ttl_seconds, artifact_id)
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            self._remember(digest, content)
+
+        self._maybe_purge(now)
+        return artifact_id
+
+    def get(self, artifact_id: str) -> Optional[Artifact]:
+        """Artifact'ı içeriğiyle birlikte döndür (yoksa, içerik henüz yazılmadıysa veya süresi dolduysa None)"""
+
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT a.id, a.hash, a.session_id, a.project_name, a.settings, a.created_at, b.size
+                FROM artifacts a JOIN artifact_blobs b ON b.hash = a.hash
+                WHERE a.id = ? AND a.expires_at > ?
+                """,
+                (artifact_id, time.time())
+            ).fetchone()
+            if row is None:
+                return None
+
+            content = self._content_cache.get(row['hash'])
+            if content is None:
+                blob = self._conn.execute(
+                    "SELECT encoding, data FROM artifact_blobs WHERE hash = ?", (row['hash'],)
+                ).fetchone()
+                content = self._decode(blob['encoding'], blob['data'])
+                self._remember(row['hash'], content)
+            else:
+                self._content_cache.move_to_end(row['hash'])
+
+        return Artifact(
+            row['id'], row['hash'], content,
+            session_id=row['session_id'],
+            project_name=row['project_name'],
+            settings=json.loads(row['settings'] or '{}'),
+            created_at=row['created_at'],
+            size=row['size']
+        )
+
+    def get_content(self, artifact_id: str) -> Optional[str]:
+        artifact = self.get(artifact_id)
+        return artifact.content if artifact else None
+
+    def get_hash(self, artifact_id: str) -> Optional[str]:
+        """İçeriği okumadan artifact'ın hash'ini döndür (koşullu istekler için)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT hash FROM artifacts WHERE id = ? AND expires_at > ? AND hash IS NOT NULL",
+                (artifact_id, time.time())
+            ).fetchone()
+        return row['hash'] if row else None
+
+    def get_created_at(self, artifact_id: str) -> Optional[float]:
+        """İçeriği okumadan artifact'ın oluşturulma zamanını döndür (koşullu istekler için)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_at FROM artifacts WHERE id = ? AND expires_at > ?",
+                (artifact_id, time.time())
+            ).fetchone()
+        return row['created_at'] if row else None
+
+    def get_rendition(self, digest: str, kind: str) -> Optional[str]:
+        """İçeriğin türetilmiş bir gösterimini döndür (yoksa None)"""
+        cache_key = f"{digest}:{kind}"
+        with self._lock:
+            cached = self._content_cache.get(cache_key)
+            if cached is not None:
+                self._content_cache.move_to_end(cache_key)
+                return cached
+            row = self._conn.execute(
+                "SELECT encoding, data FROM artifact_renditions WHERE hash = ? AND kind = ?", (digest, kind)
+            ).fetchone()
+            if row is None:
+                return None
+            text = self._decode(row['encoding'], row['data'])
+            self._remember(cache_key, text)
+            return text
+
+    def put_rendition(self, digest: str, kind: str, text: str) -> None:
+        """İçeriğin türetilmiş bir gösterimini hash'in yanına kaydet"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO artifact_renditions(hash, kind, encoding, data) VALUES(?, ?, ?, ?)",
+                (digest, kind, self.encoding, self._encode(text))
+            )
+            self._remember(f"{digest}:{kind}", text)
+
+    def delete(self, artifact_id: str) -> None:
+        """Artifact kaydını sil; blob başka kayıt kullanmıyorsa o da silinir"""
+        with self._lock:
+            row = self._conn.execute("SELECT hash FROM artifacts WHERE id = ?", (artifact_id,)).fetchone()
+            self._conn.execute("DELETE FROM artifacts WHERE id = ?", (artifact_id,))
+            if row is not None and row['hash']:
+                self._delete_orphan_blobs([row['hash']])
+
+    def _delete_orphan_blobs(self, hashes) -> int:
+        removed = 0
+        for digest in hashes:
+            in_use = self._conn.execute("SELECT 1 FROM artifacts WHERE hash = ? LIMIT 1", (digest,)).fetchone()
+            if in_use is None:
+                removed += self._conn.execute("DELETE FROM artifact_blobs WHERE hash = ?", (digest,)).rowcount
+                self._conn.execute("DELETE FROM artifact_renditions WHERE hash = ?", (digest,))
+                for cache_key in [key for key in self._content_cache if key.startswith(digest)]:
+                    del self._content_cache[cache_key]
+        return removed
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        """Süresi dolan kayıtları (indeks üzerinden) ve sahipsiz blob'ları sil"""
+
+        now = now or time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                hashes = [
+                    row['hash'] for row in self._conn.execute(
+                        "SELECT DISTINCT hash FROM artifacts WHERE expires_at <= ? AND hash IS NOT NULL", (now,)
+                    )
+                ]
+                purged = self._conn.execute("DELETE FROM artifacts WHERE expires_at <= ?", (now,)).rowcount
+                blobs = self._delete_orphan_blobs(hashes)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        if purged:
+            self.log_info("Süresi dolan artifact'lar temizlendi", artifacts=purged, blobs=blobs)
+        return purged
+
+    def _maybe_purge(self, now: float) -> None:
+        if now - self._last_purge >= self.purge_interval_seconds:
+            self._last_purge = now
+            self.purge_expired(now)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            artifacts = self._conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+            blobs, size, stored = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM artifact_blobs"
+            ).fetchone()
+        return {
+            'artifacts': artifacts,
+            'blobs': blobs,
+            'content_bytes': size,
+            'stored_bytes': stored,
+            'encoding': self.encoding,
+            'cached_contents': len(self._content_cache)
+        }
+
+
+_artifact_store: Optional[ArtifactStore] = None
+_artifact_store_lock = threading.Lock()
+
+
+def get_artifact_store(ttl_seconds: float = 24 * 3600, compression: str = ENCODING_ZSTD) -> ArtifactStore:
+    """Process genelindeki artifact deposunu döndür"""
+
+    global _artifact_store
+    with _artifact_store_lock:
+        if _artifact_store is None:
+            _artifact_store = ArtifactStore(ttl_seconds=ttl_seconds, compression=compression)
+        return _artifact_store
@@ -0,0 +1,549 @@
+"""
+Proje ve PRP Geçmişi
+====================
+
+Bu modül, üretilen PRP'leri kalıcı olarak `data/app.db` içinde saklar; artifact deposundan
+farklı olarak kayıtların süresi dolmaz. Şema (`src/utils/db.py` migration'ları):
+
+- `projects`: ad, tür ve sahipten türetilen anahtarla tekilleştirilmiş projeler
+- `requirement_snapshots`: üretimde kullanılan proje verisi ve gereksinimlerin anlık görüntüsü
+  (aynı girdiler tekrar saklanmaz)
+- `prp_versions`: proje başına artan sürüm numaralı PRP metinleri; aynı içerik aynı projeye
+  ikinci kez eklenmez
+- `compression_dicts`: PRP korpusundan eğitilmiş sıkıştırma sözlükleri
+- `prp_fts`: PRP metinleri ve proje adları üzerinde içeriksiz FTS5 tam metin indeksi
+
+PRP metinleri `prp_codec` ile sıkıştırılır: her `KEYFRAME_INTERVAL` sürümde bir eğitilmiş
+sözlükle (anahtar kare), aradaki sürümler ise daha küçükse önceki sürüme göre delta olarak.
+İlk sözlük `examples/*.md` iskeletinden oluşturulur; `retrain()` saklanan PRP'lerle yeni
+sözlük eğitip tüm sürümleri yeniden kodlar.
+
+Geçmişten açılan bir PRP yeniden üretilmeden session'a bağlanır.
+
+Her proje kaydeden sahibiyle (web uygulamasında çalışma alanı anahtarının hash'i) saklanır.
+Okuma ve silme metotları `owner` verildiğinde yalnızca o sahibin projelerini görür;
+`owner=None` tüm geçmişi kapsar ve yalnızca process içi kullanım (bağlam indeksi, yönetim
+işleri) içindir. Son kaydı `retention_seconds`'tan eski olan sahiplerin (ve sahipsiz eski
+kayıtların) projeleri kayıt sırasında periyodik olarak silinir.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.dal import Database
+from ..utils.db import get_database
+from ..utils.logger import LoggerMixin
+from . import prp_codec
+from .artifact_store import content_hash
+
+SNIPPET_TOKENS = 24
+# Delta zincirleri en fazla KEYFRAME_INTERVAL - 1 sürüm uzunluğunda olur
+KEYFRAME_INTERVAL = 8
+TEXT_CACHE_SIZE = 64
+RETRAIN_SAMPLES = 500
+RETENTION_SECONDS = 365 * 24 * 3600
+PURGE_INTERVAL_SECONDS = 3600.0
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value or {}, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def _project_key(name: str, project_type: Optional[str], owner: Optional[str] = None) -> str:
+    normalized = f"{' '.join(name.lower().split())}|{(project_type or '').strip().lower()}"
+    if owner:
+        # Farklı sahiplerin aynı adlı projeleri ayrı tutulur; sahipsiz eski anahtarlar değişmez
+        normalized += f"|{owner}"
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def fts_query(text: str) -> Optional[str]:
+    """
+    Kullanıcı sorgusunu güvenli bir FTS5 ifadesine çevir
+
+    Her kelime tırnaklanır (FTS5 operatörleri yorumlanmaz); son kelime önek olarak aranır.
+    """
+
+    terms = [f'"{term}"' for term in re.findall(r'\w+', text or '')]
+    if not terms:
+        return None
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def _fold(word: str) -> str:
+    # FTS5 unicode61 remove_diacritics ile aynı eşleşme: aksansız, büyük/küçük harf duyarsız
+    return ''.join(c for c in unicodedata.normalize('NFKD', word) if not unicodedata.combining(c)).casefold()
+
+
+def snippet(text: str, query: str, tokens: int = SNIPPET_TOKENS) -> str:
+    """Metinde sorgu terimlerinin ilk geçtiği yerin çevresi; eşleşmeler `[` `]` ile işaretlenir"""
+
+    terms = [_fold(term) for term in re.findall(r'\w+', query or '')]
+    words = list(re.finditer(r'\w+', text))
+    if not words:
+        return ''
+
+    def matches(word) -> bool:
+        folded = _fold(word.group())
+        return folded in terms[:-1] or (bool(terms) and folded.startswith(terms[-1]))
+
+    first = next((i for i, word in enumerate(words) if matches(word)), 0)
+    start = max(0, min(first - tokens // 4, len(words) - tokens))
+    end = min(len(words), start + tokens)
+
+    parts, position = [], words[start].start()
+    for word in words[start:end]:
+        if matches(word):
+            parts.append(f"{text[position:word.start()]}[{word.group()}]")
+            position = word.end()
+    parts.append(text[position:words[end - 1].end()])
+    return ('…' if start else '') + ''.join(parts) + ('…' if end < len(words) else '')
+
+
+# `owner` parametresi None ise filtre uygulanmaz
+_OWNED = "(? IS NULL OR p.owner = ?)"
+
+
+def _as_dicts(cursor) -> List[Dict[str, Any]]:
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+class HistoryStore(LoggerMixin):
+    """Proje, gereksinim anlık görüntüsü ve PRP sürümleri deposu"""
+
+    def __init__(self,
+                 db: Optional[Database] = None,
+                 codec: Optional[str] = None,
+                 seed_dir: Path = prp_codec.SEED_CORPUS_DIR,
+                 retention_seconds: float = RETENTION_SECONDS,
+                 purge_interval_seconds: float = PURGE_INTERVAL_SECONDS):
+        """
+        Args:
+            retention_seconds: Sahibin son kaydından sonra projelerinin tutulma süresi (0 sınırsız)
+            purge_interval_seconds: Kayıt sırasında yapılan temizlikler arasındaki en kısa süre
+        """
+        super().__init__()
+        self.db = db or get_database()
+        self.codec = codec or prp_codec.available_codec()
+        self.seed_dir = seed_dir
+        self.retention_seconds = retention_seconds
+        self.purge_interval_seconds = purge_interval_seconds
+        self._last_purge = 0.0
+        self._dictionaries: Dict[int, bytes] = {}
+        self._texts: "OrderedDict[int, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.db.migrate()
+        self.dict_id = self._current_dictionary() or self.retrain(recompress=False)['dict_id']
+
+    def _current_dictionary(self) -> Optional[int]:
+        row = self.db.fetchone(
+            "SELECT MAX(id) FROM compression_dicts WHERE codec = ?", (self.codec,)
+        )
+        return row[0] if row else None
+
+    def _dictionary(self, dict_id: int) -> bytes:
+        data = self._dictionaries.get(dict_id)
+        if data is None:
+            row = self.db.fetchone("SELECT data FROM compression_dicts WHERE id = ?", (dict_id,))
+            if row is None:
+                raise LookupError(f"Sıkıştırma sözlüğü bulunamadı: {dict_id}")
+            data = self._dictionaries[dict_id] = bytes(row[0])
+        return data
+
+    def _remember(self, version_id: int, text: str) -> None:
+        with self._lock:
+            self._texts[version_id] = text
+            self._texts.move_to_end(version_id)
+            while len(self._texts) > TEXT_CACHE_SIZE:
+                self._texts.popitem(last=False)
+
+    def _text(self, version_id: int) -> Optional[str]:
+        """Sürüm metnini çöz (delta zincirindeki önceki sürümler önbellekten okunur)"""
+
+        with self._lock:
+            text = self._texts.get(version_id)
+            if text is not None:
+                self._texts.move_to_end(version_id)
+                return text
+
+        row = self.db.fetchone(
+            "SELECT encoding, dict_id, base_id, body FROM prp_versions WHERE id = ?", (version_id,)
+        )
+        if row is None:
+            return None
+        encoding, dict_id, base_id, body = row
+        _, mode = prp_codec.parse_encoding(encoding)
+        if mode == prp_codec.MODE_DELTA:
+            dictionary = self._text(base_id).encode('utf-8')
+        elif mode == prp_codec.MODE_DICT:
+            dictionary = self._dictionary(dict_id)
+        else:
+            dictionary = None
+        text = prp_codec.decompress(encoding, body, dictionary)
+        self._remember(version_id, text)
+        return text
+
+    def _encode(self, text: str, version: int, base_id: Optional[int]) -> Tuple[str, Optional[int], Optional[int], bytes]:
+        """
+        Sürümü kodla: (encoding, dict_id, base_id, body)
+
+        Anahtar kare sürümleri sözlükle, diğerleri daha küçükse önceki sürüme göre delta
+        olarak kodlanır.
+        """
+
+        body = prp_codec.compress(text, self.codec, prp_codec.MODE_DICT, self._dictionary(self.dict_id))
+        encoded = (prp_codec.encoding_name(self.codec, prp_codec.MODE_DICT), self.dict_id, None, body)
+        if base_id is not None and (version - 1) % KEYFRAME_INTERVAL:
+            base = self._text(base_id)
+            delta = prp_codec.compress(text, self.codec, prp_codec.MODE_DELTA, base.encode('utf-8'))
+            if len(delta) < len(body):
+                encoded = (prp_codec.encoding_name(self.codec, prp_codec.MODE_DELTA), None, base_id, delta)
+        return encoded
+
+    def record(self,
+               project_data: Dict[str, Any],
+               requirements: Dict[str, Any],
+               content: str,
+               settings: Optional[Dict[str, Any]] = None,
+               provider: Optional[str] = None,
+               owner: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Üretilen PRP'yi geçmişe ekle
+
+        Returns:
+            `project_id`, `version_id`, `version` ve içerik zaten kayıtlıysa `created=False`
+        """
+
+        name = (project_data.get('project_name') or project_data.get('name') or 'Proje').strip()
+        project_type = project_data.get('project_type') or project_data.get('type')
+        digest = content_hash(content)
+        input_hash = hashlib.sha256(
+            (_canonical_json(project_data) + _canonical_json(requirements)).encode('utf-8')
+        ).hexdigest()
+        project_key = _project_key(name, project_type, owner)
+        now = time.time()
+
+        with self.db.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO projects(project_key, name, project_type, description, owner, created_at, updated_at)
+                VALUES(?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(project_key) DO UPDATE SET
+                    name = excluded.name, description = excluded.description, updated_at = excluded.updated_at
+                """,
+                (project_key, name, project_type, project_data.get('description'), owner, now, now)
+            )
+            project_id = conn.execute(
+                "SELECT id FROM projects WHERE project_key = ?", (project_key,)
+            ).fetchone()[0]
+
+            existing = conn.execute(
+                "SELECT id, version FROM prp_versions WHERE project_id = ? AND content_hash = ?",
+                (project_id, digest)
+            ).fetchone()
+            if existing:
+                return {'project_id': project_id, 'version_id': existing[0], 'version': existing[1], 'created': False}
+
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO requirement_snapshots(project_id, input_hash, project_data, requirements, created_at)
+                VALUES(?, ?, ?, ?, ?)
+                """,
+                (project_id, input_hash, _canonical_json(project_data), _canonical_json(requirements), now)
+            )
+            snapshot_id = conn.execute(
+                "SELECT id FROM requirement_snapshots WHERE project_id = ? AND input_hash = ?",
+                (project_id, input_hash)
+            ).fetchone()[0]
+
+            latest = conn.execute(
+                "SELECT id, version FROM prp_versions WHERE project_id = ? ORDER BY version DESC LIMIT 1",
+                (project_id,)
+            ).fetchone()
+            base_id, version = (latest[0], latest[1] + 1) if latest else (None, 1)
+            # Başka bir process yeniden eğitmiş olabilir; yazma kilidi altında güncel sözlüğü kullan
+            self.dict_id = conn.execute(
+                "SELECT MAX(id) FROM compression_dicts WHERE codec = ?", (self.codec,)
+            ).fetchone()[0] or self.dict_id
+            encoding, dict_id, base_id, body = self._encode(content, version, base_id)
+            cursor = conn.execute(
+                """
+                INSERT INTO prp_versions(project_id, snapshot_id, version, project_name, content_hash,
+                                         encoding, dict_id, base_id, body, raw_size,
+                                         provider, settings, created_at)
+                VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (project_id, snapshot_id, version, name, digest, encoding, dict_id, base_id, body,
+                 len(content.encode('utf-8')), provider, _canonical_json(settings), now)
+            )
+            conn.execute(
+                "INSERT INTO prp_fts(rowid, project_name, content) VALUES(?, ?, ?)",
+                (cursor.lastrowid, name, content)
+            )
+        self._remember(cursor.lastrowid, content)
+        self._maybe_purge(now)
+
+        self.log_info("PRP geçmişe kaydedildi", project=name, version=version)
+        return {'project_id': project_id, 'version_id': cursor.lastrowid, 'version': version, 'created': True}
+
+    def list_projects(self, limit: int = 50, offset: int = 0, owner: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Projeleri son güncellemeye göre, son sürüm bilgisiyle listele"""
+
+        return _as_dicts(self.db.execute(
+            f"""
+            SELECT p.id AS project_id, p.name, p.project_type, p.updated_at,
+                   COUNT(v.id) AS version_count, MAX(v.version) AS latest_version,
+                   (SELECT id FROM prp_versions WHERE project_id = p.id ORDER BY version DESC LIMIT 1) AS latest_version_id
+            FROM projects p LEFT JOIN prp_versions v ON v.project_id = p.id
+            WHERE {_OWNED}
+            GROUP BY p.id
+            ORDER BY p.updated_at DESC
+            LIMIT ? OFFSET ?
+            """,
+            (owner, owner, limit, offset)
+        ))
+
+    def versions(self, project_id: int, owner: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Projenin PRP sürümleri (içeriksiz), yeniden eskiye"""
+
+        rows = _as_dicts(self.db.execute(
+            f"""
+            SELECT v.id AS version_id, v.version, v.project_name, v.content_hash, v.provider, v.settings,
+                   v.raw_size AS length, LENGTH(v.body) AS stored_size, v.encoding, v.created_at
+            FROM prp_versions v JOIN projects p ON p.id = v.project_id
+            WHERE v.project_id = ? AND {_OWNED} ORDER BY v.version DESC
+            """,
+            (project_id, owner, owner)
+        ))
+        for row in rows:
+            row['settings'] = json.loads(row['settings']) if row['settings'] else {}
+        return rows
+
+    def get_version(self, version_id: int, owner: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """PRP sürümünü içeriği ve üretim girdileriyle döndür"""
+
+        rows = _as_dicts(self.db.execute(
+            f"""
+            SELECT v.id AS version_id, v.project_id, v.version, v.project_name, v.content_hash,
+                   v.provider, v.settings, v.created_at, s.project_data, s.requirements
+            FROM prp_versions v JOIN projects p ON p.id = v.project_id
+            LEFT JOIN requirement_snapshots s ON s.id = v.snapshot_id
+            WHERE v.id = ? AND {_OWNED}
+            """,
+            (version_id, owner, owner)
+        ))
+        if not rows:
+            return None
+        row = rows[0]
+        row['content'] = self._text(version_id)
+        for field in ('settings', 'project_data', 'requirements'):
+            row[field] = json.loads(row[field]) if row[field] else {}
+        return row
+
+    def latest_contents(self, limit: int = 200) -> List[Dict[str, Any]]:
+        """Her projenin son PRP sürümü içeriğiyle, yeniden eskiye"""
+
+        rows = _as_dicts(self.db.execute(
+            """
+            SELECT v.id AS version_id, v.project_name, v.version
+            FROM prp_versions v
+            JOIN (SELECT project_id, MAX(version) AS version FROM prp_versions GROUP BY project_id) latest
+                ON latest.project_id = v.project_id AND latest.version = v.version
+            ORDER BY v.created_at DESC
+            LIMIT ?
+            """,
+            (limit,)
+        ))
+        for row in rows:
+            row['content'] = self._text(row['version_id'])
+        return rows
+
+    def revision(self) -> Tuple[int, int]:
+        """Sürüm sayısı ve son sürüm kimliği; geçmişten türetilen indekslerin güncelliği için"""
+        count, last_id = self.db.fetchone("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM prp_versions")
+        return count, last_id
+
+    def search(self, query: str, limit: int = 20, owner: Optional[str] = None) -> List[Dict[str, Any]]:
+        """PRP metinlerinde ve proje adlarında tam metin arama (BM25 sıralı)"""
+
+        match = fts_query(query)
+        if match is None:
+            return []
+        results = _as_dicts(self.db.execute(
+            f"""
+            SELECT v.id AS version_id, v.project_id, v.version, v.project_name, v.created_at,
+                   bm25(prp_fts) AS rank
+            FROM prp_fts JOIN prp_versions v ON v.id = prp_fts.rowid
+            JOIN projects p ON p.id = v.project_id
+            WHERE prp_fts MATCH ? AND {_OWNED}
+            ORDER BY rank
+            LIMIT ?
+            """,
+            (match, owner, owner, limit)
+        ))
+        # İndeks metni saklamaz; önizleme yalnızca dönen sonuçlar için çözülür
+        for result in results:
+            result['snippet'] = snippet(self._text(result['version_id']), query)
+        return results
+
+    def delete_project(self, project_id: int, owner: Optional[str] = None) -> bool:
+        """Projeyi tüm sürümleriyle sil; `owner` verilmişse yalnızca o sahibin projesini"""
+
+        with self.db.transaction() as conn:
+            if not conn.execute(
+                f"SELECT 1 FROM projects p WHERE p.id = ? AND {_OWNED}", (project_id, owner, owner)
+            ).fetchone():
+                return False
+            return self._delete_projects(conn, [project_id]) > 0
+
+    def _delete_projects(self, conn, project_ids: List[int]) -> int:
+        """Projeleri sürümleri ve FTS5 girdileriyle sil (açık bir transaction içinde)"""
+
+        deleted = 0
+        for project_id in project_ids:
+            # İçeriksiz FTS5 indeksinden silmek için indekslenen değerler verilmelidir
+            versions = conn.execute(
+                "SELECT id, project_name FROM prp_versions WHERE project_id = ?", (project_id,)
+            ).fetchall()
+            for version_id, name in versions:
+                conn.execute(
+                    "INSERT INTO prp_fts(prp_fts, rowid, project_name, content) VALUES('delete', ?, ?, ?)",
+                    (version_id, name, self._text(version_id))
+                )
+            deleted += conn.execute("DELETE FROM projects WHERE id = ?", (project_id,)).rowcount
+            with self._lock:
+                for version_id, _ in versions:
+                    self._texts.pop(version_id, None)
+        return deleted
+
+    def purge_inactive(self, now: Optional[float] = None) -> int:
+        """
+        Son kaydı saklama süresinden eski olan sahiplerin projelerini sil
+
+        Sahibin çalışma alanı anahtarı (çerez) saklama süresiyle aynı anda sona erdiğinden bu
+        projelere artık hiçbir istek ulaşamaz. Sahipsiz eski kayıtlar tek bir sahip sayılır.
+
+        Returns:
+            Silinen proje sayısı
+        """
+
+        if not self.retention_seconds:
+            return 0
+        cutoff = (now or time.time()) - self.retention_seconds
+        with self.db.transaction() as conn:
+            project_ids = [row[0] for row in conn.execute(
+                """
+                SELECT id FROM projects WHERE COALESCE(owner, '') IN (
+                    SELECT COALESCE(owner, '') FROM projects GROUP BY owner HAVING MAX(updated_at) < ?
+                )
+                """,
+                (cutoff,)
+            ).fetchall()]
+            purged = self._delete_projects(conn, project_ids)
+        if purged:
+            self.log_info("Süresi dolan PRP geçmişi temizlendi", projects=purged)
+        return purged
+
+    def _maybe_purge(self, now: float) -> None:
+        if now - self._last_purge >= self.purge_interval_seconds:
+            self._last_purge = now
+            try:
+                self.purge_inactive(now)
+            except Exception as e:
+                self.log_error(f"PRP geçmişi temizlenemedi: {str(e)}")
+
+    def retrain(self, samples: int = RETRAIN_SAMPLES, recompress: bool = True) -> Dict[str, Any]:
+        """
+        Örnek PRP'ler ve son `samples` sürümle yeni sözlük eğit, gerekirse tüm sürümleri yeniden kodla
+
+        Returns:
+            Yeni sözlüğün kimliği, boyutu, örnek sayısı ve yeniden kodlanan sürüm sayısı
+        """
+
+        version_ids = [row[0] for row in self.db.fetchall(
+            "SELECT id FROM prp_versions ORDER BY created_at DESC LIMIT ?", (samples,)
+        )]
+        corpus = prp_codec.seed_corpus(self.seed_dir) + [self._text(version_id) for version_id in version_ids]
+        data = prp_codec.train_dictionary(corpus, self.codec)
+
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO compression_dicts(codec, data, sample_count, created_at) VALUES(?, ?, ?, ?)",
+                (self.codec, data, len(corpus), time.time())
+            )
+        self.dict_id = cursor.lastrowid
+        self._dictionaries[self.dict_id] = data
+        self.log_info("PRP sıkıştırma sözlüğü eğitildi", codec=self.codec, size=len(data), samples=len(corpus))
+
+        result = {'dict_id': self.dict_id, 'dict_size': len(data), 'samples': len(corpus), 'recompressed': 0}
+        if recompress:
+            result['recompressed'] = self.recompress()
+        return result
+
+    def recompress(self) -> int:
+        """Tüm sürümleri güncel sözlük ve delta kuralıyla yeniden kodla; kullanılmayan sözlükleri sil"""
+
+        rows = self.db.fetchall("SELECT id, project_id, version FROM prp_versions ORDER BY project_id, version")
+        # Yeniden kodlama sırasında tabanlar değişeceğinden önce tüm metinler çözülür
+        texts = {version_id: self._text(version_id) for version_id, _, _ in rows}
+
+        with self.db.transaction() as conn:
+            previous: Dict[int, int] = {}
+            for version_id, project_id, version in rows:
+                encoding, dict_id, base_id, body = self._encode(texts[version_id], version, previous.get(project_id))
+                conn.execute(
+                    "UPDATE prp_versions SET encoding = ?, dict_id = ?, base_id = ?, body = ? WHERE id = ?",
+                    (encoding, dict_id, base_id, body, version_id)
+                )
+                previous[project_id] = version_id
+            conn.execute(
+                """
+                DELETE FROM compression_dicts WHERE id != ?
+                AND id NOT IN (SELECT dict_id FROM prp_versions WHERE dict_id IS NOT NULL)
+                """,
+                (self.dict_id,)
+            )
+        return len(rows)
+
+    def compression_stats(self) -> Dict[str, Any]:
+        """Kodlama başına sürüm sayısı, ham ve saklanan boyut"""
+
+        encodings = {
+            encoding: {'versions': count, 'raw_bytes': raw or 0, 'stored_bytes': stored or 0}
+            for encoding, count, raw, stored in self.db.fetchall(
+                "SELECT encoding, COUNT(*), SUM(raw_size), SUM(LENGTH(body)) FROM prp_versions GROUP BY encoding"
+            )
+        }
+        raw = sum(item['raw_bytes'] for item in encodings.values())
+        stored = sum(item['stored_bytes'] for item in encodings.values())
+        return {
+            'codec': self.codec,
+            'dict_id': self.dict_id,
+            'encodings': encodings,
+            'raw_bytes': raw,
+            'stored_bytes': stored,
+            'ratio': round(raw / stored, 2) if stored else None
+        }
+
+
+_history_store: Optional[HistoryStore] = None
+_history_store_lock = threading.Lock()
+
+
+def get_history_store(retention_seconds: float = RETENTION_SECONDS) -> HistoryStore:
+    """Process genelindeki geçmiş deposunu döndür"""
+
+    global _history_store
+    with _history_store_lock:
+        if _history_store is None:
+            _history_store = HistoryStore(retention_seconds=retention_seconds)
+        return _history_store
@@ -0,0 +1,172 @@
+"""
+PRP Sıkıştırma Codec'i
+======================
+
+Üretilen PRP'ler aynı iskeleti (`examples/sample_prp.md`: Purpose, Core Principles, Goal,
+All Needed Context, Implementation Blueprint, Validation Loop) izlediğinden projeler ve
+sürümler arasında büyük ölçüde tekrar eder. Bu modül geçmiş deposu için iki kodlama sağlar:
+
+- `dict`: PRP korpusundan eğitilmiş sözlükle sıkıştırma (anahtar kare)
+- `delta`: aynı projenin önceki sürümü ham içerik sözlüğü olarak kullanılarak sıkıştırma
+
+`zstandard` paketi kuruluysa zstd çerçeveleri ve `zstandard.train_dictionary` kullanılır;
+değilse standart kütüphanedeki zlib'in önceden ayarlı sözlük (`zdict`) desteğine düşülür.
+Kodlama adı (`zstd-dict`, `zlib-delta`, ...) her kayıtla saklandığından farklı codec'lerle
+yazılmış sürümler birlikte okunabilir.
+"""
+
+import functools
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - opsiyonel bağımlılık
+    zstandard = None
+
+ENCODING_IDENTITY = 'identity'
+
+CODEC_ZSTD = 'zstd'
+CODEC_ZLIB = 'zlib'
+
+MODE_DICT = 'dict'
+MODE_DELTA = 'delta'
+
+# zlib yalnızca sözlüğün son 32 KB'ını kullanır; zstd için de PRP korpusuna yeterli
+DICT_SIZE = 32 * 1024
+ZSTD_LEVEL = 19
+ZLIB_LEVEL = 9
+
+SEED_CORPUS_DIR = Path(__file__).resolve().parent.parent.parent / 'examples'
+
+
+def available_codec() -> str:
+    """Kurulu paketlere göre kullanılacak codec"""
+    return CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+
+
+def encoding_name(codec: str, mode: str) -> str:
+    return f"{codec}-{mode}"
+
+
+def parse_encoding(encoding: str) -> Sequence[Optional[str]]:
+    """`zstd-delta` -> (`zstd`, `delta`); `identity` -> (None, None)"""
+    if encoding == ENCODING_IDENTITY:
+        return None, None
+    codec, _, mode = encoding.partition('-')
+    if codec not in (CODEC_ZSTD, CODEC_ZLIB) or mode not in (MODE_DICT, MODE_DELTA):
+        raise ValueError(f"Bilinmeyen PRP kodlaması: {encoding}")
+    return codec, mode
+
+
+def seed_corpus(directory: Path = SEED_CORPUS_DIR) -> List[str]:
+    """Sözlük eğitimi için örnek PRP'ler (`examples/*.md`)"""
+    return [path.read_text(encoding='utf-8') for path in sorted(Path(directory).glob('*.md'))]
+
+
+def raw_content_dictionary(samples: Iterable[str], size: int = DICT_SIZE) -> bytes:
+    """
+    Örneklerde tekrar eden satırlardan ham içerik sözlüğü oluştur
+
+    Satırlar geçtikleri örnek sayısına göre seçilir; boyut sınırı dolunca daha seyrek
+    satırlar atlanır. En sık satırlar sözlüğün sonuna yazılır (sıkıştırıcıya en yakın,
+    en ucuz referanslar).
+    """
+
+    counts = Counter()
+    for sample in samples:
+        counts.update({line for line in sample.splitlines() if line.strip()})
+
+    lines, total = [], 0
+    for line, _ in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+        data = (line + '\n').encode('utf-8')
+        if total + len(data) > size:
+            continue
+        lines.append(data)
+        total += len(data)
+    return b''.join(reversed(lines))
+
+
+def train_dictionary(samples: Sequence[str], codec: Optional[str] = None, size: int = DICT_SIZE) -> bytes:
+    """
+    PRP örneklerinden sıkıştırma sözlüğü eğit
+
+    zstd eğitimi yeterli örnek yoksa başarısız olur; bu durumda (ve zlib için) ham içerik
+    sözlüğü döndürülür. Her iki codec de ham içerik sözlüklerini kabul eder.
+    """
+
+    codec = codec or available_codec()
+    if codec == CODEC_ZSTD:
+        _require_zstandard()
+        try:
+            return zstandard.train_dictionary(size, [sample.encode('utf-8') for sample in samples]).as_bytes()
+        except zstandard.ZstdError:
+            pass
+    return raw_content_dictionary(samples, size)
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise RuntimeError("zstd ile sıkıştırılmış PRP için zstandard paketi gerekli")
+
+
+@functools.lru_cache(maxsize=8)
+def _zstd_dictionary(data: bytes) -> "zstandard.ZstdCompressionDict":
+    # Eğitilmiş sözlükler sürümler arasında paylaşılır; hazırlık maliyeti bir kez ödenir
+    dictionary = zstandard.ZstdCompressionDict(data)
+    dictionary.precompute_compress(level=ZSTD_LEVEL)
+    return dictionary
+
+
+def compress(text: str, codec: str, mode: str, dictionary: bytes) -> bytes:
+    """
+    Metni sözlükle sıkıştır
+
+    Args:
+        dictionary: `dict` modunda eğitilmiş sözlük, `delta` modunda önceki sürümün metni
+    """
+
+    raw = text.encode('utf-8')
+    if codec == CODEC_ZSTD:
+        _require_zstandard()
+        if mode == MODE_DICT:
+            zdict = _zstd_dictionary(dictionary)
+        else:
+            zdict = zstandard.ZstdCompressionDict(dictionary, dict_type=zstandard.DICT_TYPE_RAWCONTENT)
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=zdict).compress(raw)
+
+    compressor = zlib.compressobj(ZLIB_LEVEL, zdict=dictionary) if dictionary else zlib.compressobj(ZLIB_LEVEL)
+    return compressor.compress(raw) + compressor.flush()
+
+
+def decompress(encoding: str, body: bytes, dictionary: Optional[bytes] = None) -> str:
+    """`compress` çıktısını çöz; `identity` kayıtları olduğu gibi döner"""
+
+    codec, mode = parse_encoding(encoding)
+    body = bytes(body)
+    if codec is None:
+        return body.decode('utf-8')
+
+    if codec == CODEC_ZSTD:
+        _require_zstandard()
+        if mode == MODE_DICT:
+            zdict = _zstd_dictionary(dictionary)
+        else:
+            zdict = zstandard.ZstdCompressionDict(dictionary, dict_type=zstandard.DICT_TYPE_RAWCONTENT)
+        return zstandard.ZstdDecompressor(dict_data=zdict).decompress(body).decode('utf-8')
+
+    decompressor = zlib.decompressobj(zdict=dictionary) if dictionary else zlib.decompressobj()
+    return (decompressor.decompress(body) + decompressor.flush()).decode('utf-8')
+
+
+def plain_size(text: str, codec: Optional[str] = None) -> int:
+    """Sözlüksüz sıkıştırılmış boyut (karşılaştırma için)"""
+
+    raw = text.encode('utf-8')
+    if (codec or available_codec()) == CODEC_ZSTD:
+        _require_zstandard()
+        return len(zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw))
+    return len(zlib.compress(raw, ZLIB_LEVEL))
+
@@ -2,5 +2,6 @@
 
 from .config import load_config, ApplicationConfig
 from .logger import setup_logger, get_logger
+from .async_runner import run_coro
 
-__all__ = ['load_config', 'ApplicationConfig', 'setup_logger', 'get_logger'] 
\ No newline at end of file
+__all__ = ['load_config', 'ApplicationConfig', 'setup_logger', 'get_logger', 'run_coro']
@@ -0,0 +1,240 @@
+"""
+Kalıcı Event Loop Çalıştırıcısı
+===============================
+
+Bu modül, senkron Flask handler'larından coroutine çalıştırmak için arka planda
+yaşayan tek bir event loop sağlar. `asyncio.run()` her çağrıda yeni bir loop açıp
+kapattığından async HTTP bağlantı havuzları istekler arasında korunamaz; burada loop
+process boyunca açık kalır ve `run_coro()` ile çağıran thread'e köprülenir.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import os
+import queue
+import threading
+from typing import Any, AsyncIterator, Awaitable, Iterator, Optional, TypeVar
+
+from .logger import get_logger
+
+T = TypeVar("T")
+
+
+class BackgroundLoopRunner:
+    """Ayrı bir daemon thread'de çalışan kalıcı asyncio event loop"""
+
+    def __init__(self, name: str = "async-runner"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._owned = True
+        self._lock = threading.Lock()
+        self.logger = get_logger(self.__class__.__name__)
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Çalışan loop'u döndür, gerekirse başlat"""
+        return self._ensure_started()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        # Fork sonrası (ör. gunicorn --preload) loop thread'i child'a taşınmaz;
+        # her worker process kendi loop'unu başlatır
+        if self._loop is not None and self._pid == os.getpid() and self._loop.is_running():
+            return self._loop
+
+        with self._lock:
+            if self._loop is not None and self._pid == os.getpid() and self._loop.is_running():
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def _run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=_run, name=self.name, daemon=True)
+            thread.start()
+            started.wait()
+
+            self._loop = loop
+            self._thread = thread
+            self._pid = os.getpid()
+            self._owned = True
+            self.logger.debug(f"Arka plan event loop'u başlatıldı: {self.name}")
+            return loop
+
+    def attach_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Dışarıda çalışan bir loop'u (ör. ASGI sunucusunun loop'u) process loop'u olarak benimse
+
+        Bu thread'in loop'un kendi thread'i olması gerekir. Böylece senkron koddan yapılan
+        `run_coro()` çağrıları ve native async view'lar aynı loop'u ve bağlantı havuzlarını paylaşır.
+        """
+
+        with self._lock:
+            if self._loop is loop:
+                return
+            if self._loop is not None and self._owned and self._pid == os.getpid():
+                self.logger.warning("Arka plan loop'u zaten çalışıyor; harici loop benimsenmedi")
+                return
+
+            self._loop = loop
+            self._thread = threading.current_thread()
+            self._pid = os.getpid()
+            self._owned = False
+            self.logger.debug("Harici event loop benimsendi")
+
+    def submit(self, coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """
+        Coroutine'i arka plan loop'unda başlat ve concurrent Future döndür
+
+        Çağıran thread'in contextvars bağlamı task'a kopyalanır; böylece
+        Flask request/session proxy'leri coroutine içinde de erişilebilir kalır.
+        """
+
+        loop = self._ensure_started()
+        ctx = contextvars.copy_context()
+        future: "concurrent.futures.Future[T]" = concurrent.futures.Future()
+
+        def _start():
+            if not future.set_running_or_notify_cancel():
+                coro.close()
+                return
+
+            task = asyncio.ensure_future(coro)
+
+            def _done(t: asyncio.Task):
+                if t.cancelled():
+                    future.cancel()
+                elif t.exception() is not None:
+                    future.set_exception(t.exception())
+                else:
+                    future.set_result(t.result())
+
+            task.add_done_callback(_done)
+            future._task = task  # timeout durumunda iptal için
+
+        loop.call_soon_threadsafe(_start, context=ctx)
+        return future
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Coroutine'i çalıştır ve sonucunu bekle (senkron köprü)"""
+
+        if self._loop is not None and threading.current_thread() is self._thread:
+            raise RuntimeError("run_coro() arka plan loop'unun kendi thread'inden çağrılamaz")
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            task = getattr(future, "_task", None)
+            if task is not None:
+                self._loop.call_soon_threadsafe(task.cancel)
+            raise TimeoutError(f"Coroutine {timeout} saniye içinde tamamlanmadı")
+
+    def iterate(self, agen: AsyncIterator[T], timeout: Optional[float] = None) -> Iterator[T]:
+        """
+        Async generator'ı arka plan loop'unda tüket ve öğeleri senkron olarak üret
+
+        Öğeler thread-safe bir kuyruk üzerinden aktarılır; tüketici erken çıkarsa
+        (ör. istemci SSE bağlantısını kapatırsa) loop tarafındaki task iptal edilir.
+        """
+
+        items: "queue.Queue[Any]" = queue.Queue()
+        done = object()
+
+        async def _pump():
+            try:
+                async for item in agen:
+                    items.put((item, None))
+            except BaseException as e:
+                items.put((done, e))
+                raise
+            else:
+                items.put((done, None))
+
+        future = self.submit(_pump())
+        try:
+            while True:
+                try:
+                    item, error = items.get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError(f"Stream {timeout} saniye boyunca öğe üretmedi")
+                if item is done:
+                    if error is not None and not isinstance(error, asyncio.CancelledError):
+                        raise error
+                    return
+                yield item
+        finally:
+            task = getattr(future, "_task", None)
+            if not future.done() and task is not None:
+                self._loop.call_soon_threadsafe(task.cancel)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Loop'u durdur ve thread'in bitmesini bekle"""
+
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+
+        if loop is None or self._pid != os.getpid() or not self._owned:
+            return
+
+        async def _cancel_pending():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_cancel_pending(), loop).result(timeout=timeout)
+        except Exception:
+            pass
+
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=timeout)
+        loop.close()
+
+
+_runner = BackgroundLoopRunner()
+atexit.register(_runner.shutdown)
+
+
+def get_runner() -> BackgroundLoopRunner:
+    """Process genelindeki arka plan loop çalıştırıcısını döndür"""
+    return _runner
+
+
+def run_coro(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Coroutine'i kalıcı arka plan loop'unda çalıştır ve sonucunu döndür
+
+    Args:
+        coro: Çalıştırılacak coroutine
+        timeout: Saniye cinsinden bekleme süresi (None ise sınırsız)
+
+    Returns:
+        Coroutine'in sonucu
+    """
+    return _runner.run(coro, timeout=timeout)
+
+
+def iterate_async(agen: AsyncIterator[T], timeout: Optional[float] = None) -> Iterator[T]:
+    """
+    Async generator'ı kalıcı arka plan loop'unda çalıştırıp senkron iterator olarak sun
+
+    Args:
+        agen: Tüketilecek async generator
+        timeout: İki öğe arasında beklenecek en uzun süre (None ise sınırsız)
+
+    Returns:
+        Senkron iterator
+    """
+    return _runner.iterate(agen, timeout=timeout)
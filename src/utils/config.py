@@ -54,6 +54,14 @@ class ApplicationConfig(BaseSettings):
     # Application Settings
     max_tokens_per_request: int = Field(default=8192)
     max_context_tokens: int = Field(default=32768)
+    request_timeout_seconds: int = Field(default=300, description="AI endpoint'leri için coroutine zaman aşımı")
+    form_fill_memo_seconds: int = Field(default=900, description="Form doldurma analizinin session başına saklanma süresi")
+    
+    # Background Job Configuration
+    job_workers: int = Field(default=4, description="Aynı anda çalışan arka plan işi sayısı")
+    job_timeout_seconds: int = Field(default=1800, description="Tek bir arka plan işi için zaman aşımı")
+    job_retention_hours: int = Field(default=168, description="Biten işlerin data/jobs.db'de tutulma süresi")
+    batch_max_concurrency: int = Field(default=16, description="/api/batch-generate için eşzamanlılık üst sınırı")
     
 
     
@@ -64,9 +72,40 @@ class ApplicationConfig(BaseSettings):
     log_level: str = Field(default="INFO")
     log_file: str = Field(default="logs/app.log")
     
+    # Session Store Configuration
+    session_store: str = Field(default="sqlite", description="sqlite, memory veya filesystem (Flask-Session)")
+    session_cache_size: int = Field(default=1024, description="SQLite session deposunun LRU sınırı")
+    
+    # Artifact Store Configuration
+    artifact_ttl_hours: int = Field(default=24, description="Üretilen PRP'lerin data/artifacts.db'de tutulma süresi")
+    artifact_compression: str = Field(default="zstd", description="zstd (zstandard kuruluysa) veya identity")
+    
+    # History Configuration
+    history_enabled: bool = Field(default=True, description="Üretilen PRP'leri data/app.db geçmişine kalıcı kaydet")
+    history_retention_days: int = Field(default=365, description="Çalışma alanı anahtarının ve son kaydından sonra geçmişinin tutulma süresi (0 sınırsız)")
+    
+    # Retrieval Configuration
+    retrieval_token_budget: int = Field(default=1500, description="Prompt'lara eklenen örnek PRP bölümleri için token bütçesi (0 kapatır)")
+    retrieval_top_k: int = Field(default=6, description="Prompt'a eklenecek en fazla örnek bölüm sayısı")
+    
+    # Rate Limiting Configuration
+    enable_rate_limiting: bool = Field(default=True, description="Provider rpm_limit değerlerini uygula")
+    rate_limit_per_api_key: bool = Field(default=False, description="Her API anahtarı için ayrı bucket")
+    
+    # Retry / Failover Configuration
+    enable_failover: bool = Field(default=True, description="Hata durumunda diğer provider'lara geç")
+    llm_max_retries: int = Field(default=2, description="Geçici hatalarda provider başına yeniden deneme sayısı")
+    llm_retry_base_delay: float = Field(default=0.5, description="Üstel geri çekilme taban süresi (saniye)")
+    llm_retry_max_delay: float = Field(default=8.0, description="Tek bir bekleme için üst sınır (saniye)")
+    circuit_breaker_threshold: int = Field(default=5, description="Devreyi açan ardışık hata sayısı")
+    circuit_breaker_reset_seconds: int = Field(default=60, description="Açık devrenin yeniden denenme süresi")
+    
     # Cache Configuration
     enable_caching: bool = Field(default=True)
     cache_ttl_seconds: int = Field(default=3600)
+    cache_max_entries: int = Field(default=512, description="Bellek içi yanıt önbelleği LRU sınırı")
+    cache_disk_enabled: bool = Field(default=True, description="data/llm_cache.db disk katmanı")
+    enable_single_flight: bool = Field(default=True, description="Özdeş eşzamanlı LLM isteklerini tek çağrıda birleştir")
     
     # Development Settings
     debug_mode: bool = Field(default=False)
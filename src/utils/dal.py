@@ -0,0 +1,216 @@
+"""
+SQLite Veri Erişim Katmanı
+==========================
+
+Bu modül, uygulama veritabanı için küçük bir veri erişim katmanı sağlar:
+
+- Thread başına havuzlanmış bağlantılar (istek yolunda connect/close yok; fork sonrası
+  her process kendi bağlantısını açar)
+- WAL journal modu: okuyucular yazanı beklemez, yazımlar `BEGIN IMMEDIATE` ile sıralanır
+- Bağlantı başına hazırlanmış ifade önbelleği (`cached_statements`); sorgular sabit SQL
+  metni ve parametrelerle çalıştırıldığında yeniden derlenmez
+- `PRAGMA user_version` üzerinde sürümlü migration çalıştırıcısı
+- Coroutine'ler için event loop'u bloklamayan async erişim (ayrı thread havuzu)
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import os
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from .logger import LoggerMixin
+
+T = TypeVar("T")
+
+STATEMENT_CACHE_SIZE = 128
+BUSY_TIMEOUT_MS = 5000
+ASYNC_WORKERS = 4
+
+# (sürüm, ad, SQL betiği veya bağlantı alan fonksiyon)
+Migration = Tuple[int, str, Union[str, Callable[[sqlite3.Connection], None]]]
+
+
+def split_script(script: str) -> List[str]:
+    """SQL betiğini ifadelere böl (trigger gövdelerindeki `;` ifadeyi bitirmez)"""
+
+    statements, buffer = [], ""
+    for part in script.split(";"):
+        buffer += part + ";"
+        if sqlite3.complete_statement(buffer):
+            if buffer.strip(" \t\r\n;"):
+                statements.append(buffer.strip())
+            buffer = ""
+    return statements
+
+
+class _PooledConnection:
+    """Thread'e ait bağlantı; thread sonlanıp yerel veri silindiğinde bağlantı kapanır"""
+
+    __slots__ = ("conn", "pid", "generation", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection, generation: int):
+        self.conn = conn
+        self.pid = os.getpid()
+        self.generation = generation
+
+    def close(self) -> None:
+        try:
+            self.conn.close()
+        except sqlite3.Error:
+            pass
+
+    def __del__(self):
+        # Fork ile devralınan bağlantı child process'te kapatılmaz
+        if self.pid == os.getpid():
+            self.close()
+
+
+class Database(LoggerMixin):
+    """Thread başına bağlantı havuzlu, WAL modunda SQLite veritabanı"""
+
+    def __init__(self, path: Path, migrations: Sequence[Migration] = (), async_workers: int = ASYNC_WORKERS):
+        super().__init__()
+        self.path = Path(path)
+        self.migrations = sorted(migrations, key=lambda migration: migration[0])
+        self.async_workers = async_workers
+
+        self._local = threading.local()
+        self._connections: "weakref.WeakSet[_PooledConnection]" = weakref.WeakSet()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._executor_pid: Optional[int] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._stats = {"connections_opened": 0, "migrations_applied": 0}
+
+    def _open(self) -> _PooledConnection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA foreign_keys=ON")
+        pooled = _PooledConnection(conn, self._generation)
+        with self._lock:
+            self._connections.add(pooled)
+            self._stats["connections_opened"] += 1
+        return pooled
+
+    def connection(self) -> sqlite3.Connection:
+        """Çağıran thread'in havuzdaki bağlantısını döndür, gerekirse aç"""
+
+        pooled = getattr(self._local, "pooled", None)
+        if pooled is None or pooled.pid != os.getpid() or pooled.generation != self._generation:
+            pooled = self._open()
+            self._local.pooled = pooled
+        return pooled.conn
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        return self.connection().execute(sql, params)
+
+    def executemany(self, sql: str, rows: Sequence[Sequence[Any]]) -> sqlite3.Cursor:
+        return self.connection().executemany(sql, rows)
+
+    def fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[Tuple]:
+        return self.connection().execute(sql, params).fetchone()
+
+    def fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple]:
+        return self.connection().execute(sql, params).fetchall()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Yazma işlemi (`BEGIN IMMEDIATE`); hata olursa geri alınır
+
+        İç içe çağrılar dıştaki işleme katılır.
+        """
+
+        conn = self.connection()
+        if conn.in_transaction:
+            yield conn
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def migrate(self) -> int:
+        """
+        Bekleyen migration'ları sırayla uygula ve şema sürümünü döndür
+
+        Sürüm `PRAGMA user_version` içinde tutulur; eşzamanlı process'ler yazma kilidi
+        altında sürümü yeniden okuduğundan her migration bir kez uygulanır.
+        """
+
+        with self.transaction() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for target, name, step in self.migrations:
+                if target <= version:
+                    continue
+                if callable(step):
+                    step(conn)
+                else:
+                    # executescript bekleyen işlemi commit ettiğinden ifadeler tek tek çalıştırılır
+                    for statement in split_script(step):
+                        conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {int(target)}")
+                version = target
+                self._stats["migrations_applied"] += 1
+                self.log_info(f"Veritabanı migration'ı uygulandı: {name}", version=target, path=str(self.path))
+        return version
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.async_workers, thread_name_prefix="sqlite-dal"
+                )
+                self._executor_pid = os.getpid()
+            return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Senkron veritabanı işini DAL thread havuzunda çalıştır"""
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(fn, *args, **kwargs))
+
+    async def afetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[Tuple]:
+        return await self.run(self.fetchone, sql, params)
+
+    async def afetchall(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple]:
+        return await self.run(self.fetchall, sql, params)
+
+    async def aexecute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Yazma ifadesini çalıştır ve etkilenen satır sayısını döndür"""
+        return await self.run(lambda: self.execute(sql, params).rowcount)
+
+    def close(self) -> None:
+        """Tüm havuzlanmış bağlantıları ve async thread havuzunu kapat"""
+
+        with self._lock:
+            connections, self._connections = list(self._connections), weakref.WeakSet()
+            executor, self._executor = self._executor, None
+            # Diğer thread'ler bir sonraki kullanımda yeni bağlantı açar
+            self._generation += 1
+        for pooled in connections:
+            pooled.close()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "open_connections": len(self._connections)}
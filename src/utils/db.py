@@ -1,93 +1,359 @@
 import os
 import sqlite3
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 from cryptography.fernet import Fernet
 
+from .dal import Database
 
-DATA_DIR = Path(__file__).resolve().parent.parent.parent / 'data'
+
+# every database and the key file live here; APP_DATA_DIR relocates them (tests use a temp dir)
+DATA_DIR = Path(os.getenv('APP_DATA_DIR') or Path(__file__).resolve().parent.parent.parent / 'data')
 DB_PATH = DATA_DIR / 'app.db'
 KEY_PATH = DATA_DIR / 'fernet.key'
 
 
 def _ensure_dirs():
-    DATA_DIR.mkdir(exist_ok=True)
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _get_fernet():
+def _get_fernet(key_path: Path = None):
     _ensure_dirs()
-    if not KEY_PATH.exists():
-        KEY_PATH.write_bytes(Fernet.generate_key())
-    key = KEY_PATH.read_bytes()
+    key_path = key_path or KEY_PATH
+    if not key_path.exists():
+        key_path.write_bytes(Fernet.generate_key())
+    key = key_path.read_bytes()
     return Fernet(key)
 
 
-def init_db():
-    _ensure_dirs()
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute(
-        """
+def _add_api_keys_model_column(conn: sqlite3.Connection):
+    # databases created before the model column existed
+    cols = [row[1] for row in conn.execute("PRAGMA table_info(api_keys)")]
+    if 'model' not in cols:
+        conn.execute("ALTER TABLE api_keys ADD COLUMN model TEXT")
+
+
+# Applied in order by Database.migrate(); append new versions, never edit applied ones
+MIGRATIONS = [
+    (1, 'create api_keys', """
         CREATE TABLE IF NOT EXISTS api_keys (
             provider TEXT PRIMARY KEY,
             secret TEXT NOT NULL,
             model TEXT,
             updated_at TEXT NOT NULL
         )
-        """
-    )
-    conn.commit()
+    """),
+    (2, 'api_keys.model column', _add_api_keys_model_column),
+    # change counters shared by all worker processes
+    (3, 'create table_versions', """
+        CREATE TABLE IF NOT EXISTS table_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO table_versions(name, version) VALUES('api_keys', 0);
+    """),
+    # project / PRP history (src/storage/history_store.py)
+    (4, 'create history tables', """
+        CREATE TABLE IF NOT EXISTS projects (
+            id INTEGER PRIMARY KEY,
+            project_key TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            project_type TEXT,
+            description TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS requirement_snapshots (
+            id INTEGER PRIMARY KEY,
+            project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+            input_hash TEXT NOT NULL,
+            project_data TEXT NOT NULL,
+            requirements TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            UNIQUE(project_id, input_hash)
+        );
+        CREATE TABLE IF NOT EXISTS prp_versions (
+            id INTEGER PRIMARY KEY,
+            project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+            snapshot_id INTEGER REFERENCES requirement_snapshots(id),
+            version INTEGER NOT NULL,
+            project_name TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            content TEXT NOT NULL,
+            provider TEXT,
+            settings TEXT,
+            created_at REAL NOT NULL,
+            UNIQUE(project_id, version)
+        );
+        CREATE INDEX IF NOT EXISTS idx_prp_versions_hash ON prp_versions(project_id, content_hash);
+        CREATE INDEX IF NOT EXISTS idx_prp_versions_created ON prp_versions(created_at);
+    """),
+    (5, 'create prp full-text index', """
+        CREATE VIRTUAL TABLE IF NOT EXISTS prp_fts USING fts5(
+            project_name, content,
+            content='prp_versions', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        );
+        CREATE TRIGGER IF NOT EXISTS prp_versions_ai AFTER INSERT ON prp_versions BEGIN
+            INSERT INTO prp_fts(rowid, project_name, content) VALUES (new.id, new.project_name, new.content);
+        END;
+        CREATE TRIGGER IF NOT EXISTS prp_versions_ad AFTER DELETE ON prp_versions BEGIN
+            INSERT INTO prp_fts(prp_fts, rowid, project_name, content) VALUES ('delete', old.id, old.project_name, old.content);
+        END;
+        CREATE TRIGGER IF NOT EXISTS prp_versions_au AFTER UPDATE ON prp_versions BEGIN
+            INSERT INTO prp_fts(prp_fts, rowid, project_name, content) VALUES ('delete', old.id, old.project_name, old.content);
+            INSERT INTO prp_fts(rowid, project_name, content) VALUES (new.id, new.project_name, new.content);
+        END;
+    """),
+    # PRP bodies become compressed frames (src/storage/prp_codec.py); the full-text index keeps
+    # only tokens and is maintained by HistoryStore, existing rows stay readable as 'identity'
+    (6, 'compress prp versions', """
+        CREATE TABLE IF NOT EXISTS compression_dicts (
+            id INTEGER PRIMARY KEY,
+            codec TEXT NOT NULL,
+            data BLOB NOT NULL,
+            sample_count INTEGER NOT NULL,
+            created_at REAL NOT NULL
+        );
+        DROP TRIGGER IF EXISTS prp_versions_ai;
+        DROP TRIGGER IF EXISTS prp_versions_ad;
+        DROP TRIGGER IF EXISTS prp_versions_au;
+        DROP TABLE IF EXISTS prp_fts;
+        CREATE VIRTUAL TABLE prp_fts USING fts5(
+            project_name, content,
+            content='',
+            tokenize='unicode61 remove_diacritics 2'
+        );
+        INSERT INTO prp_fts(rowid, project_name, content) SELECT id, project_name, content FROM prp_versions;
+        CREATE TABLE prp_versions_encoded (
+            id INTEGER PRIMARY KEY,
+            project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+            snapshot_id INTEGER REFERENCES requirement_snapshots(id),
+            version INTEGER NOT NULL,
+            project_name TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            encoding TEXT NOT NULL,
+            dict_id INTEGER REFERENCES compression_dicts(id),
+            base_id INTEGER,
+            body BLOB NOT NULL,
+            raw_size INTEGER NOT NULL,
+            provider TEXT,
+            settings TEXT,
+            created_at REAL NOT NULL,
+            UNIQUE(project_id, version)
+        );
+        INSERT INTO prp_versions_encoded
+            SELECT id, project_id, snapshot_id, version, project_name, content_hash, 'identity', NULL, NULL,
+                   CAST(content AS BLOB), LENGTH(CAST(content AS BLOB)), provider, settings, created_at
+            FROM prp_versions;
+        DROP TABLE prp_versions;
+        ALTER TABLE prp_versions_encoded RENAME TO prp_versions;
+        CREATE INDEX idx_prp_versions_hash ON prp_versions(project_id, content_hash);
+        CREATE INDEX idx_prp_versions_created ON prp_versions(created_at);
+    """),
+    # history is scoped to the session that recorded it; older rows keep a NULL owner
+    (7, 'projects.owner column', """
+        ALTER TABLE projects ADD COLUMN owner TEXT;
+        CREATE INDEX IF NOT EXISTS idx_projects_owner ON projects(owner, updated_at);
+    """),
+]
+
+SELECT_KEY = "SELECT secret, model FROM api_keys WHERE provider = ?"
+SELECT_ALL_KEYS = "SELECT provider, secret, model FROM api_keys"
+SELECT_KEYS_VERSION = "SELECT version FROM table_versions WHERE name = 'api_keys'"
+UPSERT_KEY = """
+    INSERT INTO api_keys(provider, secret, model, updated_at)
+    VALUES(?, ?, ?, ?)
+    ON CONFLICT(provider) DO UPDATE SET secret=excluded.secret, model=excluded.model, updated_at=excluded.updated_at
+"""
+BUMP_KEYS_VERSION = """
+    INSERT INTO table_versions(name, version) VALUES('api_keys', 1)
+    ON CONFLICT(name) DO UPDATE SET version = version + 1
+"""
+
+_databases: Dict[Path, Database] = {}
+_databases_lock = threading.Lock()
+
+
+def get_database(db_path: Path = None) -> Database:
+    """Return the process-wide pooled database for db_path (default: data/app.db)"""
+    path = Path(db_path or DB_PATH).resolve()
+    with _databases_lock:
+        if path not in _databases:
+            _databases[path] = Database(path, MIGRATIONS)
+        return _databases[path]
+
+
+def init_db(db_path: Path = None):
+    _ensure_dirs()
+    get_database(db_path).migrate()
+
+
+class KeyVault:
+    """
+    In-memory cache of decrypted API keys over the api_keys table.
+
+    Keys are fetched and decrypted per provider on first use and then served from memory.
+    Writes through `save` bump the `api_keys` version in `table_versions`; other processes
+    notice the new version (checked at most every `check_interval` seconds) and drop their cache.
+    """
+
+    def __init__(self, db_path: Path = None, key_path: Path = None, check_interval: float = 2.0):
+        self.db = get_database(db_path)
+        self.key_path = key_path or KEY_PATH
+        self.check_interval = check_interval
+        self._fernet = None
+        self._keys: Dict[str, Optional[Dict[str, str]]] = {}
+        self._complete = False
+        self._version = None
+        self._checked_at = 0.0
+        self._lock = threading.RLock()
+        self._stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+    def _get_fernet(self) -> Fernet:
+        # the key file is read once per process
+        if self._fernet is None:
+            self._fernet = _get_fernet(self.key_path)
+        return self._fernet
+
+    def _decrypt(self, secret: str) -> str:
+        try:
+            return self._get_fernet().decrypt(secret.encode()).decode()
+        except Exception:
+            return ''
+
+    def encrypt(self, secret: str) -> str:
+        """Encrypt a secret with the vault key (for keys persisted outside api_keys)"""
+        return self._get_fernet().encrypt(secret.encode()).decode()
+
+    def decrypt(self, token: str) -> str:
+        """Inverse of `encrypt`; returns '' for tokens from another key"""
+        return self._decrypt(token)
+
+    def _read_version(self) -> int:
+        row = self.db.fetchone(SELECT_KEYS_VERSION)
+        return row[0] if row else 0
 
-    # ensure model column exists
-    try:
-        cur.execute("PRAGMA table_info(api_keys)")
-        cols = [row[1] for row in cur.fetchall()]
-        if 'model' not in cols:
-            cur.execute("ALTER TABLE api_keys ADD COLUMN model TEXT")
-            conn.commit()
-    except Exception:
-        pass
+    def _invalidate(self) -> None:
+        self._keys.clear()
+        self._complete = False
+        self._stats['invalidations'] += 1
 
-    conn.close()
+    def _check_version(self) -> None:
+        """Drop the cache when another process saved keys since the last check"""
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < self.check_interval:
+            return
+        version = self._read_version()
+        if version != self._version:
+            if self._version is not None:
+                self._invalidate()
+            self._version = version
+        self._checked_at = now
+
+    def get(self, provider: str) -> Optional[Dict[str, str]]:
+        """Return {'api_key': secret, 'model': model} for one provider, or None"""
+        with self._lock:
+            self._check_version()
+            if provider in self._keys:
+                self._stats['hits'] += 1
+                setting = self._keys[provider]
+                return dict(setting) if setting else None
+
+            self._stats['misses'] += 1
+            row = self.db.fetchone(SELECT_KEY, (provider,))
+            setting = {'api_key': self._decrypt(row[0]), 'model': row[1]} if row else None
+            self._keys[provider] = setting
+            return dict(setting) if setting else None
+
+    async def aget(self, provider: str) -> Optional[Dict[str, str]]:
+        """`get` for coroutine callers; database reads run off the event loop"""
+        with self._lock:
+            cached = provider in self._keys and time.monotonic() - self._checked_at < self.check_interval
+        if cached:
+            return self.get(provider)
+        return await self.db.run(self.get, provider)
+
+    def load_all(self) -> Dict[str, Dict[str, str]]:
+        """Return every stored provider (same shape as `load_api_keys`)"""
+        with self._lock:
+            self._check_version()
+            if not self._complete:
+                self._stats['misses'] += 1
+                self._keys = {
+                    provider: {'api_key': self._decrypt(secret), 'model': model}
+                    for provider, secret, model in self.db.fetchall(SELECT_ALL_KEYS)
+                }
+                self._complete = True
+            else:
+                self._stats['hits'] += 1
+            return {provider: dict(setting) for provider, setting in self._keys.items() if setting}
+
+    def save(self, settings: Dict[str, Dict[str, str]]) -> None:
+        """Insert or update provided keys (encrypted) and notify other processes"""
+        if not settings:
+            return
+        f = self._get_fernet()
+        now = datetime.utcnow().isoformat()
+        rows = [
+            (provider, f.encrypt(info['api_key'].encode()).decode() if info.get('api_key') else '', info.get('model'), now)
+            for provider, info in settings.items()
+        ]
+        with self._lock:
+            with self.db.transaction() as conn:
+                conn.executemany(UPSERT_KEY, rows)
+                conn.execute(BUMP_KEYS_VERSION)
+                version = self._read_version()
+            self._invalidate()
+            self._version = version
+            self._checked_at = time.monotonic()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, 'cached': sum(1 for s in self._keys.values() if s), 'version': self._version or 0}
+
+
+_vault: Optional[KeyVault] = None
+_vault_lock = threading.Lock()
+
+
+def get_key_vault() -> KeyVault:
+    """Return the process-wide key vault"""
+    global _vault
+    with _vault_lock:
+        if _vault is None:
+            _vault = KeyVault()
+        return _vault
 
 
 def save_api_keys(settings: Dict[str, Dict[str, str]]):
     """Insert or update provided keys dict into DB (encrypted)."""
-    if not settings:
-        return
-    f = _get_fernet()
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    for provider, info in settings.items():
-        secret = info.get('api_key', '')
-        model = info.get('model')
-        encrypted = f.encrypt(secret.encode()).decode() if secret else ''
-        cur.execute(
-            """
-            INSERT INTO api_keys(provider, secret, model, updated_at)
-            VALUES(?, ?, ?, ?)
-            ON CONFLICT(provider) DO UPDATE SET secret=excluded.secret, model=excluded.model, updated_at=excluded.updated_at
-            """,
-            (provider, encrypted, model, datetime.utcnow().isoformat())
-        )
-    conn.commit()
-    conn.close()
+    get_key_vault().save(settings)
 
 
 def load_api_keys() -> Dict[str, Dict[str, str]]:
     """Return dict {provider: {'api_key': secret, 'model': model}}"""
-    f = _get_fernet()
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute("SELECT provider, secret, model FROM api_keys")
-    rows = cur.fetchall()
-    conn.close()
-    result = {}
-    for provider, secret, model in rows:
-        try:
-            decrypted = f.decrypt(secret.encode()).decode()
-        except Exception:
-            decrypted = ''
-        result[provider] = {'api_key': decrypted, 'model': model}
-    return result 
\ No newline at end of file
+    return get_key_vault().load_all()
+
+
+def get_api_key(provider: str) -> Optional[Dict[str, str]]:
+    """Return {'api_key': secret, 'model': model} for one provider, or None"""
+    return get_key_vault().get(provider)
+
+
+def encrypt_secret(secret: str) -> str:
+    """Encrypt a secret with the application key"""
+    return get_key_vault().encrypt(secret)
+
+
+def decrypt_secret(token: str) -> str:
+    """Decrypt an `encrypt_secret` token ('' if it cannot be decrypted)"""
+    return get_key_vault().decrypt(token)
+
+
+async def aget_api_key(provider: str) -> Optional[Dict[str, str]]:
+    """Async variant of `get_api_key`"""
+    return await get_key_vault().aget(provider)
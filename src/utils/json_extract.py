@@ -0,0 +1,155 @@
+"""
+Toleranslı JSON Ayıklayıcı
+==========================
+
+Bu modül, LLM'in serbest metin yanıtlarından JSON nesnesini ayıklar. Tool calling
+desteklemeyen provider'lar JSON'u çoğu zaman markdown bloğu, açıklama cümleleri veya
+yarıda kesilmiş halde döndürür; ayıklayıcı bunları düzeltmeye çalışır:
+
+- Nesneden önceki/sonraki metin ve ``` blokları yok sayılır
+- Metin parça parça beslenebilir (`feed`); ilk üst düzey nesne tamamlandığında `complete` olur
+- Yanıt token sınırında kesildiyse açık string ve parantezler kapatılır, yarım kalan son
+  alan atılır
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+_CLOSERS = {'{': '}', '[': ']'}
+
+# Ayrıştırılamayan aday nesnelerden sonra denenecek en fazla başlangıç noktası
+MAX_ATTEMPTS = 4
+
+
+class JSONObjectExtractor:
+    """Metin akışından ilk JSON nesnesini tek geçişte ayıklayan tarayıcı"""
+
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._length = 0
+        self._start: Optional[int] = None
+        self._end: Optional[int] = None
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        # Yarım nesneyi kurtarmak için: (virgülün konumu, o andaki parantez yığını)
+        self._cut_points: List[Tuple[int, List[str]]] = []
+
+    @property
+    def start(self) -> Optional[int]:
+        """Aday nesnenin metindeki başlangıç konumu"""
+        return self._start
+
+    @property
+    def complete(self) -> bool:
+        """İlk üst düzey nesne kapandı mı"""
+        return self._end is not None
+
+    def feed(self, chunk: str) -> bool:
+        """Yeni metin parçasını işle; nesne tamamlandıysa True döndür"""
+
+        if self.complete or not chunk:
+            return self.complete
+
+        offset = self._length
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+
+        for index, char in enumerate(chunk):
+            position = offset + index
+            if self._start is None:
+                if char == '{':
+                    self._start = position
+                    self._stack.append('{')
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in _CLOSERS:
+                self._stack.append(char)
+            elif char in '}]':
+                if self._stack:
+                    self._stack.pop()
+                if not self._stack:
+                    self._end = position + 1
+                    return True
+            elif char == ',':
+                self._cut_points.append((position, list(self._stack)))
+
+        return False
+
+    def _text(self) -> str:
+        if len(self._chunks) > 1:
+            self._chunks = [''.join(self._chunks)]
+        return self._chunks[0] if self._chunks else ''
+
+    def result(self) -> Optional[Dict[str, Any]]:
+        """Ayıklanan nesneyi döndür; bulunamaz veya onarılamazsa None"""
+
+        if self._start is None:
+            return None
+
+        text = self._text()
+        if self.complete:
+            return _loads_object(text[self._start:self._end])
+
+        # Kesilmiş yanıt: önce olduğu gibi kapatmayı, sonra son virgüllerden kesmeyi dene
+        body = text[self._start:]
+        candidate = body + ('"' if self._in_string else '') + _closing(self._stack)
+        parsed = _loads_object(candidate)
+        if parsed is not None:
+            return parsed
+
+        for position, stack in reversed(self._cut_points[-8:]):
+            parsed = _loads_object(text[self._start:position] + _closing(stack))
+            if parsed is not None:
+                return parsed
+        return None
+
+
+def _closing(stack: List[str]) -> str:
+    return ''.join(_CLOSERS[opener] for opener in reversed(stack))
+
+
+def _loads_object(text: str) -> Optional[Dict[str, Any]]:
+    try:
+        value = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Serbest metinden ilk JSON nesnesini ayıkla
+
+    Args:
+        text: LLM yanıtı
+
+    Returns:
+        Ayıklanan sözlük; metinde kurtarılabilir bir nesne yoksa None
+    """
+
+    direct = _loads_object(text.strip())
+    if direct is not None:
+        return direct
+
+    # İlk '{' düz metnin parçası olabilir; ayrıştırılamazsa sonraki adaylara geç
+    remaining = text
+    for _ in range(MAX_ATTEMPTS):
+        extractor = JSONObjectExtractor()
+        extractor.feed(remaining)
+        parsed = extractor.result()
+        if parsed is not None or extractor.start is None:
+            return parsed
+        remaining = remaining[extractor.start + 1:]
+    return None
@@ -0,0 +1,5 @@
+"""Web package - Flask/ASGI sunum katmanı yardımcıları"""
+
+from .asgi import AsyncFlask, FlaskASGIApp
+
+__all__ = ['AsyncFlask', 'FlaskASGIApp']
@@ -0,0 +1,244 @@
+"""
+ASGI Köprüsü
+============
+
+Bu modül, Flask uygulamasını bir ASGI sunucusu (ör. uvicorn) altında çalıştırır.
+`async def` olarak tanımlanmış view'lar sunucunun event loop'unda doğrudan await edilir;
+böylece tek bir process, provider yanıtlarını beklerken yüzlerce eşzamanlı üretimi
+taşıyabilir. Senkron view'lar ise bir thread havuzunda standart WSGI yoluyla çalışır.
+"""
+
+import asyncio
+import inspect
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from flask import Flask
+from werkzeug.exceptions import HTTPException
+
+from ..utils.async_runner import get_runner, run_coro
+from ..utils.logger import LoggerMixin
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class AsyncFlask(Flask):
+    """
+    Async view'ları kalıcı process loop'unda çalıştıran Flask sınıfı
+
+    WSGI modunda Flask, async view'ları varsayılan olarak her istek için yeni bir
+    loop açan asgiref köprüsüyle çalıştırır. Burada bunun yerine `run_coro()` kullanılır;
+    ASGI modunda ise view'lar `FlaskASGIApp` tarafından doğrudan await edilir.
+    """
+
+    def async_to_sync(self, func: Callable[..., Awaitable[Any]]) -> Callable[..., Any]:
+        def wrapper(*args, **kwargs):
+            return run_coro(func(*args, **kwargs))
+
+        return wrapper
+
+
+def _build_environ(scope: Scope, body: bytes) -> Dict[str, Any]:
+    """ASGI scope'undan WSGI environ sözlüğü oluştur"""
+
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    path = scope.get("path", "/")
+
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": path.encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": str(server[0]),
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "REMOTE_PORT": str(client[1]),
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+        "asgi.scope": scope,
+    }
+
+    for raw_name, raw_value in scope.get("headers", []):
+        name = raw_name.decode("latin-1").upper().replace("-", "_")
+        value = raw_value.decode("latin-1")
+
+        if name == "CONTENT_TYPE":
+            environ["CONTENT_TYPE"] = value
+            continue
+        if name == "CONTENT_LENGTH":
+            continue
+
+        key = f"HTTP_{name}"
+        if key in environ:
+            separator = "; " if name == "COOKIE" else ","
+            environ[key] = f"{environ[key]}{separator}{value}"
+        else:
+            environ[key] = value
+
+    return environ
+
+
+def _encode_headers(headers: List[Tuple[str, str]]) -> List[Tuple[bytes, bytes]]:
+    return [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers]
+
+
+class FlaskASGIApp(LoggerMixin):
+    """Flask uygulamasını saran ASGI uygulaması"""
+
+    def __init__(self,
+                 app: Flask,
+                 max_sync_workers: int = 64,
+                 on_startup: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            app: Sarılan Flask uygulaması
+            max_sync_workers: Senkron view'ları çalıştıran thread sayısı
+            on_startup: Sunucunun loop'u benimsendikten sonra bir kez çağrılır (iş kuyruğu vb.)
+        """
+        super().__init__()
+        self.app = app
+        self.on_startup = on_startup
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_sync_workers,
+            thread_name_prefix="wsgi-sync"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+
+        if scope["type"] != "http":
+            raise RuntimeError(f"Desteklenmeyen ASGI scope tipi: {scope['type']}")
+
+        # Senkron koddan yapılan run_coro() çağrıları da sunucunun loop'unu kullansın
+        get_runner().attach_loop(asyncio.get_running_loop())
+
+        body = await self._read_body(receive)
+        environ = _build_environ(scope, body)
+
+        view_func = self._match_async_view(environ)
+        if view_func is not None:
+            await self._handle_async(environ, view_func, send)
+        else:
+            await self._handle_sync(environ, send)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                get_runner().attach_loop(asyncio.get_running_loop())
+                if self.on_startup is not None:
+                    self.on_startup()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self._executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    def _match_async_view(self, environ: Dict[str, Any]) -> Optional[Callable[..., Awaitable[Any]]]:
+        """İstek bir async view'a gidiyorsa view fonksiyonunu döndür"""
+
+        try:
+            endpoint, _ = self.app.url_map.bind_to_environ(environ).match()
+        except HTTPException:
+            return None
+
+        view_func = self.app.view_functions.get(endpoint)
+        if view_func is not None and inspect.iscoroutinefunction(view_func):
+            return view_func
+        return None
+
+    async def _handle_async(self,
+                            environ: Dict[str, Any],
+                            view_func: Callable[..., Awaitable[Any]],
+                            send: Send) -> None:
+        """Async view'ı sunucunun loop'unda doğrudan await et"""
+
+        ctx = self.app.request_context(environ)
+        ctx.push()
+        try:
+            try:
+                rv = self.app.preprocess_request()
+                if rv is None:
+                    rv = await view_func(**(ctx.request.view_args or {}))
+            except Exception as e:
+                rv = self.app.handle_user_exception(e)
+            response = self.app.finalize_request(rv)
+        except Exception as e:
+            response = self.app.handle_exception(e)
+        finally:
+            ctx.pop()
+
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": _encode_headers(list(response.headers.items())),
+        })
+        for chunk in response.iter_encoded():
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+        response.close()
+
+    async def _handle_sync(self, environ: Dict[str, Any], send: Send) -> None:
+        """Senkron view'ı thread havuzunda WSGI yoluyla çalıştır (streaming destekli)"""
+
+        loop = asyncio.get_running_loop()
+
+        def _send_threadsafe(message: Dict[str, Any]) -> None:
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        def _run_wsgi() -> None:
+            state: Dict[str, Any] = {"started": False}
+
+            def start_response(status, headers, exc_info=None):
+                state["status"] = int(status.split(" ", 1)[0])
+                state["headers"] = headers
+                return lambda data: None
+
+            def _start():
+                if not state["started"]:
+                    state["started"] = True
+                    _send_threadsafe({
+                        "type": "http.response.start",
+                        "status": state["status"],
+                        "headers": _encode_headers(state["headers"]),
+                    })
+
+            iterable = self.app.wsgi_app(environ, start_response)
+            try:
+                for chunk in iterable:
+                    _start()
+                    if chunk:
+                        _send_threadsafe({"type": "http.response.body", "body": chunk, "more_body": True})
+                _start()
+                _send_threadsafe({"type": "http.response.body", "body": b"", "more_body": False})
+            finally:
+                if hasattr(iterable, "close"):
+                    iterable.close()
+
+        await loop.run_in_executor(self._executor, _run_wsgi)
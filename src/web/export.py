@@ -0,0 +1,240 @@
+"""
+PRP Export Motoru
+=================
+
+Bu modül, üretilen PRP'yi farklı dosya formatlarına dönüştüren yazıcıları (writer) içerir.
+Her yazıcı içeriği parça parça üreten bir generator döndürür; yanıt bu parçalar doğrudan
+istemciye aktarılarak oluşturulur. Böylece ne diske geçici dosya yazılır ne de çıktının
+tam bir kopyası bellekte tutulur.
+
+Yeni bir format eklemek için `ExportWriter` alt sınıfı yazıp `register_writer` ile
+kaydetmek yeterlidir.
+"""
+
+import json
+import re
+import time
+import zipfile
+from abc import ABC, abstractmethod
+from datetime import datetime
+from html import escape
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..storage.artifact_store import Artifact, ArtifactStore
+from .rendering import get_html
+
+# Yanıta yazılan parçaların hedef boyutu
+CHUNK_SIZE = 64 * 1024
+
+# Ekip workflow'unun ara çıktılarının artifact deposundaki gösterim adı
+AGENT_OUTPUTS_RENDITION = "agent_outputs"
+
+_MARKDOWN_MARKS = re.compile(r'[#*`]')
+
+
+class ExportContext:
+    """Bir export işleminin girdileri"""
+
+    def __init__(self,
+                 artifact: Artifact,
+                 store: Optional[ArtifactStore] = None,
+                 project_data: Optional[Dict[str, Any]] = None,
+                 requirements: Optional[Dict[str, Any]] = None,
+                 agent_outputs: Optional[Dict[str, Any]] = None,
+                 created_at: Optional[float] = None):
+        self.artifact = artifact
+        self.store = store
+        self.project_data = project_data or {}
+        self.requirements = requirements or {}
+        self.agent_outputs = agent_outputs or {}
+        self.created_at = created_at or artifact.created_at or time.time()
+
+    @property
+    def generated_at(self) -> datetime:
+        """
+        Artifact'ın oluşturulma zamanı
+
+        Aynı içerik farklı zamanlarda kaydedilmiş olabilir; bu zamanı kullanan yazıcıların
+        (`uses_created_at`) ETag'ine `created_at` eklenmelidir.
+        """
+        return datetime.fromtimestamp(self.created_at)
+
+
+def _chunked(text: str) -> Iterator[bytes]:
+    for start in range(0, len(text), CHUNK_SIZE):
+        yield text[start:start + CHUNK_SIZE].encode('utf-8')
+
+
+def _buffered(parts: Iterator[str]) -> Iterator[bytes]:
+    """Küçük metin parçalarını CHUNK_SIZE civarı bloklar halinde birleştir"""
+    buffer: List[str] = []
+    size = 0
+    for part in parts:
+        buffer.append(part)
+        size += len(part)
+        if size >= CHUNK_SIZE:
+            yield ''.join(buffer).encode('utf-8')
+            buffer, size = [], 0
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
+
+class ExportWriter(ABC):
+    """Export formatı temel sınıfı"""
+
+    name = ""
+    extension = ""
+    mimetype = "application/octet-stream"
+    # Çıktı PRP içeriği dışında session verisini de içeriyorsa True (ETag'e eklenir)
+    uses_session_data = False
+    # Çıktı artifact'ın oluşturulma zamanını içeriyorsa True (ETag'e eklenir)
+    uses_created_at = False
+    # Zaten sıkıştırılmış formatlar için False
+    compressible = True
+
+    @abstractmethod
+    def write(self, ctx: ExportContext) -> Iterator[bytes]:
+        """Çıktıyı parça parça üret"""
+        pass
+
+
+class MarkdownWriter(ExportWriter):
+    name = "markdown"
+    extension = "md"
+    mimetype = "text/markdown"
+
+    def write(self, ctx: ExportContext) -> Iterator[bytes]:
+        return _chunked(ctx.artifact.content)
+
+
+class TextWriter(ExportWriter):
+    """Markdown işaretleri ayıklanmış düz metin"""
+
+    name = "txt"
+    extension = "txt"
+    mimetype = "text/plain"
+
+    def write(self, ctx: ExportContext) -> Iterator[bytes]:
+        lines = ctx.artifact.content.splitlines(keepends=True)
+        return _buffered(_MARKDOWN_MARKS.sub('', line) for line in lines)
+
+
+class JSONWriter(ExportWriter):
+    """Proje verisi, gereksinimler ve PRP içeriği tek JSON belgesinde"""
+
+    name = "json"
+    extension = "json"
+    mimetype = "application/json"
+    uses_session_data = True
+    uses_created_at = True
+
+    def write(self, ctx: ExportContext) -> Iterator[bytes]:
+        document = {
+            'project_data': ctx.project_data,
+            'requirements': ctx.requirements,
+            'generated_content': ctx.artifact.content,
+            'generated_at': ctx.generated_at.isoformat()
+        }
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False, default=str)
+        return _buffered(encoder.iterencode(document))
+
+
+class HTMLWriter(ExportWriter):
+    """Tek başına açılabilen HTML belgesi (render sonucu depodan okunur)"""
+
+    name = "html"
+    extension = "html"
+    mimetype = "text/html"
+
+    def write(self, ctx: ExportContext) -> Iterator[bytes]:
+        title = ctx.artifact.project_name or "PRP"
+        yield (
+            '<!DOCTYPE html>\n<html lang="tr">\n<head>\n<meta charset="utf-8">\n'
+            f'<title>{escape(title)}</title>\n</head>\n<body>\n'
+        ).encode('utf-8')
+        yield from _chunked(get_html(ctx.store, ctx.artifact))
+        yield b'\n</body>\n</html>\n'
+
+
+class _ZipStream:
+    """zipfile'ın yazdığı baytları toplayan, seek desteklemeyen hedef"""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self._parts)
+        self._parts = []
+        return data
+
+
+class ZipBundleWriter(ExportWriter):
+    """PRP, HTML görünümü, proje verisi ve tüm ajan çıktılarını içeren ZIP arşivi"""
+
+    name = "zip"
+    extension = "zip"
+    mimetype = "application/zip"
+    uses_session_data = True
+    uses_created_at = True
+    compressible = False
+
+    def _members(self, ctx: ExportContext) -> Iterator[tuple]:
+        yield 'PRP.md', MarkdownWriter().write(ctx)
+        yield 'PRP.html', HTMLWriter().write(ctx)
+        yield 'project.json', JSONWriter().write(ctx)
+        for name, output in ctx.agent_outputs.items():
+            encoder = json.JSONEncoder(indent=2, ensure_ascii=False, default=str)
+            yield f'agents/{name}.json', _buffered(encoder.iterencode(output))
+
+    def write(self, ctx: ExportContext) -> Iterator[bytes]:
+        stream = _ZipStream()
+        # Sabit zaman damgası: aynı içerik her seferinde aynı arşivi üretsin (ETag)
+        date_time = ctx.generated_at.timetuple()[:6]
+        with zipfile.ZipFile(stream, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for member_name, chunks in self._members(ctx):
+                info = zipfile.ZipInfo(member_name, date_time=date_time)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                with archive.open(info, 'w') as member:
+                    for chunk in chunks:
+                        member.write(chunk)
+                        data = stream.drain()
+                        if data:
+                            yield data
+                data = stream.drain()
+                if data:
+                    yield data
+        yield stream.drain()
+
+
+_writers: Dict[str, ExportWriter] = {}
+
+
+def register_writer(writer: ExportWriter) -> None:
+    """Export formatını kaydet (aynı isimdeki kaydın üzerine yazar)"""
+    _writers[writer.name] = writer
+
+
+def get_writer(name: str) -> Optional[ExportWriter]:
+    """İsme göre kayıtlı yazıcıyı döndür"""
+    return _writers.get(name)
+
+
+def available_formats() -> List[str]:
+    """Kayıtlı export formatlarının isimleri"""
+    return list(_writers)
+
+
+for _writer in (MarkdownWriter(), TextWriter(), JSONWriter(), HTMLWriter(), ZipBundleWriter()):
+    register_writer(_writer)
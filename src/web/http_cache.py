@@ -0,0 +1,226 @@
+"""
+HTTP Önbellek Yardımcıları
+==========================
+
+Bu modül, içerik hash'inden türetilen güçlü ETag'lerle koşullu yanıtlar üretir.
+İstemcinin `If-None-Match` başlığı ETag ile eşleşirse gövde hiç hazırlanmadan 304 döner;
+eşleşmezse gövde bir kez oluşturulur, istemcinin desteğine göre brotli veya gzip ile
+sıkıştırılır ve ETag başına process içi bir LRU'da tutulur. Böylece sonuç sayfasının
+tekrarlanan istekleri neredeyse hiç iş yapmaz.
+
+Güçlü ETag bayt bayt aynı gövdeyi temsil etmelidir; bu yüzden sıkıştırılmış gösterimlerin
+ETag'ine kodlama soneki eklenir (`"<hash>-gz"`, `"<hash>-br"`).
+
+`brotli` paketi requirements.txt'te bulunur; kurulu olmayan ortamlarda yalnızca gzip sunulur.
+"""
+
+import gzip
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from flask import Response, request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - opsiyonel bağımlılık
+    brotli = None
+
+# Bundan küçük gövdeler sıkıştırılmaz (başlık yükü kazancı aşar)
+MIN_COMPRESS_SIZE = 1024
+
+# Koşullu isteklerin 304 ile yanıtlanabileceği metotlar
+CONDITIONAL_METHODS = ("GET", "HEAD")
+
+
+def _gzip(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def _brotli(body: bytes) -> bytes:
+    return brotli.compress(body, quality=5)
+
+
+# Tercih sırasına göre kullanılabilir kodlayıcılar (eşit kalitede ilki seçilir)
+ENCODERS: Dict[str, Callable[[bytes], bytes]] = {}
+if brotli is not None:
+    ENCODERS["br"] = _brotli
+ENCODERS["gzip"] = _gzip
+
+
+def _gzip_stream(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip başlığı
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _brotli_stream(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = brotli.Compressor(quality=5)
+    for chunk in chunks:
+        data = compressor.process(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+# Parça parça üretilen gövdeler için akış kodlayıcıları
+STREAM_ENCODERS: Dict[str, Callable[[Iterator[bytes]], Iterator[bytes]]] = {}
+if brotli is not None:
+    STREAM_ENCODERS["br"] = _brotli_stream
+STREAM_ENCODERS["gzip"] = _gzip_stream
+
+# Sıkıştırılmış gösterimlerin ETag sonekleri
+ETAG_SUFFIXES: Dict[str, str] = {"br": "br", "gzip": "gz"}
+
+
+class EncodedBodyCache:
+    """(ETag, içerik kodlaması) -> gövde baytları LRU önbelleği"""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, etag: str, encoding: str) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get((etag, encoding))
+            if body is not None:
+                self._entries.move_to_end((etag, encoding))
+            return body
+
+    def set(self, etag: str, encoding: str, body: bytes) -> None:
+        with self._lock:
+            self._entries[(etag, encoding)] = body
+            self._entries.move_to_end((etag, encoding))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_body_cache = EncodedBodyCache()
+
+
+def make_etag(*parts: object) -> str:
+    """Hash ve gösterim bilgisinden güçlü ETag değeri üret (tırnaksız)"""
+    return "-".join(str(part) for part in parts if part not in (None, ""))
+
+
+def _cache_headers(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    extra_headers = dict(headers or {})
+    extra_headers["Vary"] = "Accept-Encoding"
+    # Tarayıcı her seferinde doğrulasın; ETag eşleşirse 304 ile gövdesiz döneriz
+    extra_headers.setdefault("Cache-Control", "private, no-cache")
+    return extra_headers
+
+
+def _encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """Kodlanmış gösterimin ETag'i; identity gövde temel ETag'i kullanır"""
+    if not encoding or encoding == "identity":
+        return etag
+    return make_etag(etag, ETAG_SUFFIXES[encoding])
+
+
+def _matching_etag(etag: str, encoding: Optional[str]) -> Optional[str]:
+    """
+    If-None-Match ile eşleşen gösterim ETag'ini döndür
+
+    İstemcinin elindeki gösterim, şu an sunulacak kodlamanın ya da (her zaman kabul
+    edilebilir olan) identity gövdenin ETag'ini taşıyorsa geçerlidir.
+    """
+    if request.method not in CONDITIONAL_METHODS:
+        return None
+    for candidate in (_encoded_etag(etag, encoding), etag):
+        if request.if_none_match.contains(candidate):
+            return candidate
+    return None
+
+
+def _not_modified(etag: str, headers: Dict[str, str]) -> Response:
+    response = Response(status=304, headers=headers)
+    response.set_etag(etag)
+    return response
+
+
+def _negotiate_encoding(body_size: int) -> str:
+    if body_size < MIN_COMPRESS_SIZE:
+        return "identity"
+    return request.accept_encodings.best_match(list(ENCODERS)) or "identity"
+
+
+def conditional_response(etag: str,
+                         build_body: Callable[[], bytes],
+                         mimetype: str,
+                         headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    ETag'e göre koşullu, sıkıştırılmış ve önbelleklenmiş yanıt üret
+
+    Args:
+        etag: Güçlü temel ETag (tırnaksız); aynı ETag her zaman aynı gövdeyi temsil etmeli,
+            sıkıştırılmış yanıtlarda kodlama soneki eklenir
+        build_body: Önbellekte yoksa gövdeyi üreten fonksiyon
+        mimetype: Yanıtın MIME tipi
+        headers: Ek yanıt başlıkları (ör. Content-Disposition)
+    """
+
+    extra_headers = _cache_headers(headers)
+    # Gövde boyutu bilinmeden istemcinin tercih ettiği kodlama ile eşleştirilir
+    matched = _matching_etag(etag, request.accept_encodings.best_match(list(ENCODERS)))
+    if matched:
+        return _not_modified(matched, extra_headers)
+
+    body = _body_cache.get(etag, "identity")
+    if body is None:
+        body = build_body()
+        _body_cache.set(etag, "identity", body)
+
+    encoding = _negotiate_encoding(len(body))
+    if encoding != "identity":
+        encoded = _body_cache.get(etag, encoding)
+        if encoded is None:
+            encoded = ENCODERS[encoding](body)
+            _body_cache.set(etag, encoding, encoded)
+        body = encoded
+        extra_headers["Content-Encoding"] = encoding
+
+    response = Response(body, mimetype=mimetype, headers=extra_headers)
+    response.set_etag(_encoded_etag(etag, encoding))
+    response.content_length = len(body)
+    return response
+
+
+def conditional_stream(etag: str,
+                       generate: Callable[[], Iterator[bytes]],
+                       mimetype: str,
+                       headers: Optional[Dict[str, str]] = None,
+                       compressible: bool = True) -> Response:
+    """
+    ETag'e göre koşullu, parça parça aktarılan yanıt üret
+
+    Gövde önbelleğe alınmaz ve boyutu önceden bilinmediği için Content-Length yerine
+    chunked aktarım kullanılır; sıkıştırma da akış üzerinde yapılır.
+
+    Args:
+        etag: Güçlü temel ETag (tırnaksız); sıkıştırılmış yanıtlarda kodlama soneki eklenir
+        generate: Gövde parçalarını üreten generator fonksiyonu (yalnızca 304 değilse çağrılır)
+        mimetype: Yanıtın MIME tipi
+        headers: Ek yanıt başlıkları (ör. Content-Disposition)
+        compressible: Zaten sıkıştırılmış içerik (ör. ZIP) için False
+    """
+
+    extra_headers = _cache_headers(headers)
+    encoding = request.accept_encodings.best_match(list(STREAM_ENCODERS)) if compressible else None
+    matched = _matching_etag(etag, encoding)
+    if matched:
+        return _not_modified(matched, extra_headers)
+
+    body = generate()
+    if encoding:
+        body = STREAM_ENCODERS[encoding](body)
+        extra_headers["Content-Encoding"] = encoding
+
+    response = Response(body, mimetype=mimetype, headers=extra_headers)
+    response.set_etag(_encoded_etag(etag, encoding))
+    return response
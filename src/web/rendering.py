@@ -0,0 +1,119 @@
+"""
+PRP Render Pipeline
+===================
+
+Bu modül, üretilen PRP markdown'ını HTML'e çevirir. Her içerik (hash'i) için render
+bir kez yapılır; sonuç artifact deposunda PRP'nin yanında saklanır ve sonraki
+isteklerde doğrudan okunur. LLM çıktısındaki ham HTML kaçışlanır; bağlantı ve görsel
+adreslerinde yalnızca izin verilen şemalar (http, https, mailto) ile göreli adresler kalır.
+"""
+
+import html
+import re
+import threading
+from typing import Any, Dict, Optional
+
+import markdown
+from markdown.treeprocessors import Treeprocessor
+
+from ..storage.artifact_store import Artifact, ArtifactStore
+
+# Render çıktısını etkileyen her değişiklikte artırılmalı (önbellekteki HTML geçersiz olur)
+RENDERER_VERSION = 2
+HTML_RENDITION = f"html:v{RENDERER_VERSION}"
+
+MARKDOWN_EXTENSIONS = ['fenced_code', 'tables', 'sane_lists', 'toc']
+
+SAFE_URL_SCHEMES = frozenset({'http', 'https', 'mailto'})
+
+_URL_SCHEME = re.compile(r'^([a-z][a-z0-9+.\-]*):', re.IGNORECASE)
+# Tarayıcıların URL'lerden sildiği boşluk ve kontrol karakterleri
+_URL_IGNORED = re.compile(r'[\x00-\x20\x7f-\x9f]+')
+_SECTION_HEADING = re.compile(r'^#+\s', re.MULTILINE)
+
+
+def is_safe_url(url: str) -> bool:
+    """
+    URL'nin izin verilen bir şema kullanıp kullanmadığını kontrol et
+
+    Tarayıcının yorumladığı biçim denetlenir: HTML varlıkları (`&#115;`, `&colon;`) çözülür
+    ve boşluk/kontrol karakterleri silinir. Şemasız (göreli, `#...`) adresler güvenlidir.
+    """
+
+    normalized = _URL_IGNORED.sub('', html.unescape(url))
+    scheme = _URL_SCHEME.match(normalized)
+    return scheme is None or scheme.group(1).lower() in SAFE_URL_SCHEMES
+
+
+class _SafeLinksTreeprocessor(Treeprocessor):
+    """İzin verilmeyen URL şemalarını bağlantı ve görsellerden kaldır"""
+
+    def run(self, root):
+        for element in root.iter():
+            for attribute in ('href', 'src'):
+                value = element.get(attribute)
+                if value is not None and not is_safe_url(value):
+                    element.set(attribute, '#')
+
+
+_local = threading.local()
+
+
+def _markdown() -> markdown.Markdown:
+    """Thread başına tek (yeniden kullanılan) Markdown örneği"""
+    md = getattr(_local, 'md', None)
+    if md is None:
+        md = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS, output_format='html')
+        # Ham HTML blokları ve satır içi etiketler metin olarak kaçışlansın
+        md.preprocessors.deregister('html_block')
+        md.inlinePatterns.deregister('html')
+        md.treeprocessors.register(_SafeLinksTreeprocessor(md), 'safe_links', 0)
+        _local.md = md
+    return md
+
+
+def render_markdown(content: str) -> str:
+    """Markdown metnini güvenli HTML'e çevir"""
+    md = _markdown()
+    try:
+        return md.convert(content)
+    finally:
+        md.reset()
+
+
+def content_stats(content: str) -> Dict[str, int]:
+    """Sonuç sayfasında gösterilen içerik istatistikleri"""
+    return {
+        'lines': content.count('\n') + 1,
+        'words': len(content.split()),
+        'chars': len(content),
+        'sections': len(_SECTION_HEADING.findall(content)),
+        'bytes': len(content.encode('utf-8'))
+    }
+
+
+def get_html(store: Optional[ArtifactStore], artifact: Artifact) -> str:
+    """Artifact'ın HTML'ini döndür; yoksa bir kez render edip depoya yaz (depo verilmişse)"""
+
+    html = store.get_rendition(artifact.hash, HTML_RENDITION) if store is not None else None
+    if html is None:
+        html = render_markdown(artifact.content)
+        if store is not None:
+            store.put_rendition(artifact.hash, HTML_RENDITION, html)
+    return html
+
+
+def representation(store: Optional[ArtifactStore], artifact: Artifact, fmt: str) -> Dict[str, Any]:
+    """İstenen gösterimi (markdown, html veya both) JSON'a uygun sözlük olarak hazırla"""
+
+    payload: Dict[str, Any] = {
+        'success': True,
+        'format': fmt,
+        'hash': artifact.hash,
+        'stats': content_stats(artifact.content)
+    }
+    if fmt in ('markdown', 'both'):
+        payload['content'] = artifact.content
+    if fmt in ('html', 'both'):
+        payload['html'] = get_html(store, artifact)
+    return payload
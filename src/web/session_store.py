@@ -0,0 +1,374 @@
+"""
+Sunucu Tarafı Session Deposu
+============================
+
+Bu modül, Flask-Session'ın dosya sistemi backend'i yerine geçen, anahtar bazında kalıcı
+bir session arayüzü sağlar. Her session anahtarı ayrı bir satırda saklanır ve istek
+sonunda yalnızca değeri gerçekten değişen anahtarlar yazılır; `session['current_step']`
+gibi aynı değerin yeniden atanması disk yazımına yol açmaz. Süre sonu, dizin taraması
+yerine `expires_at` indeksi üzerinden temizlenir.
+
+Varsayılan depo SQLite (WAL) üzerindedir ve önünde process içi bir LRU katmanı bulunur.
+Birden fazla worker process'i aynı veritabanını paylaşabilir: LRU kaydı her istekte
+tek satırlık bir sürüm kontrolüyle doğrulanır.
+"""
+
+import pickle
+import secrets
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+from flask.sessions import SessionInterface, SessionMixin
+from itsdangerous import BadSignature, Signer
+from werkzeug.datastructures import CallbackDict
+
+from ..utils.db import DATA_DIR
+from ..utils.logger import LoggerMixin
+
+SESSIONS_DB_PATH = DATA_DIR / 'sessions.db'
+
+# Anahtar -> pickle edilmiş değer
+SessionRecord = Dict[str, bytes]
+
+
+def _dumps(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class SessionStore(ABC):
+    """Session depoları için ortak arayüz"""
+
+    @abstractmethod
+    def load(self, sid: str, now: float) -> Optional[Tuple[SessionRecord, float]]:
+        """Session'ın (anahtar kayıtları, expires_at) ikilisini döndür; yoksa/süresi dolduysa None"""
+
+    @abstractmethod
+    def write(self, sid: str, upserts: SessionRecord, deletes: Set[str], expires_at: float) -> None:
+        """Yalnızca değişen anahtarları yaz ve süre sonunu güncelle"""
+
+    @abstractmethod
+    def touch(self, sid: str, expires_at: float) -> None:
+        """Veriye dokunmadan süre sonunu uzat"""
+
+    @abstractmethod
+    def delete(self, sid: str) -> None:
+        """Session'ı tamamen sil"""
+
+    @abstractmethod
+    def purge_expired(self, now: float) -> int:
+        """Süresi dolmuş session'ları sil ve sayısını döndür"""
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class MemorySessionStore(SessionStore):
+    """Process içi depo (testler ve tek process geliştirme ortamı için)"""
+
+    def __init__(self):
+        self._sessions: Dict[str, Tuple[SessionRecord, float]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, sid, now):
+        with self._lock:
+            entry = self._sessions.get(sid)
+            if entry is None or entry[1] <= now:
+                return None
+            return dict(entry[0]), entry[1]
+
+    def write(self, sid, upserts, deletes, expires_at):
+        with self._lock:
+            record = dict(self._sessions.get(sid, ({}, 0))[0])
+            record.update(upserts)
+            for key in deletes:
+                record.pop(key, None)
+            self._sessions[sid] = (record, expires_at)
+
+    def touch(self, sid, expires_at):
+        with self._lock:
+            if sid in self._sessions:
+                self._sessions[sid] = (self._sessions[sid][0], expires_at)
+
+    def delete(self, sid):
+        with self._lock:
+            self._sessions.pop(sid, None)
+
+    def purge_expired(self, now):
+        with self._lock:
+            expired = [sid for sid, (_, expires_at) in self._sessions.items() if expires_at <= now]
+            for sid in expired:
+                del self._sessions[sid]
+        return len(expired)
+
+
+class SQLiteSessionStore(SessionStore, LoggerMixin):
+    """SQLite (WAL) session deposu + process içi LRU önbelleği"""
+
+    def __init__(self, db_path: Path = SESSIONS_DB_PATH, cache_size: int = 1024):
+        super().__init__()
+        self.db_path = db_path
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Tuple[int, float, SessionRecord]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = {"cache_hits": 0, "db_reads": 0, "db_writes": 0, "keys_written": 0, "keys_deleted": 0}
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                sid TEXT PRIMARY KEY,
+                version INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_sessions_expires ON sessions(expires_at);
+            CREATE TABLE IF NOT EXISTS session_values (
+                sid TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                PRIMARY KEY (sid, key)
+            ) WITHOUT ROWID;
+            """
+        )
+
+    def _remember(self, sid: str, version: int, expires_at: float, record: SessionRecord) -> None:
+        self._cache[sid] = (version, expires_at, record)
+        self._cache.move_to_end(sid)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def load(self, sid, now):
+        with self._lock:
+            head = self._conn.execute(
+                "SELECT version, expires_at FROM sessions WHERE sid = ?", (sid,)
+            ).fetchone()
+            if head is None or head[1] <= now:
+                self._cache.pop(sid, None)
+                return None
+
+            version, expires_at = head
+            cached = self._cache.get(sid)
+            if cached is not None and cached[0] == version:
+                # Başka bir process yazmamış; önbellekteki kayıt güncel
+                self._stats["cache_hits"] += 1
+                self._cache.move_to_end(sid)
+                return dict(cached[2]), expires_at
+
+            rows = self._conn.execute(
+                "SELECT key, value FROM session_values WHERE sid = ?", (sid,)
+            ).fetchall()
+            self._stats["db_reads"] += 1
+            record = {key: bytes(value) for key, value in rows}
+            self._remember(sid, version, expires_at, record)
+            return dict(record), expires_at
+
+    def write(self, sid, upserts, deletes, expires_at):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    """
+                    INSERT INTO sessions(sid, version, expires_at) VALUES(?, 1, ?)
+                    ON CONFLICT(sid) DO UPDATE SET version = version + 1, expires_at = excluded.expires_at
+                    """,
+                    (sid, expires_at)
+                )
+                if upserts:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO session_values(sid, key, value) VALUES(?, ?, ?)",
+                        [(sid, key, value) for key, value in upserts.items()]
+                    )
+                if deletes:
+                    self._conn.executemany(
+                        "DELETE FROM session_values WHERE sid = ? AND key = ?",
+                        [(sid, key) for key in deletes]
+                    )
+                version = self._conn.execute(
+                    "SELECT version FROM sessions WHERE sid = ?", (sid,)
+                ).fetchone()[0]
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                self._cache.pop(sid, None)
+                raise
+
+            self._stats["db_writes"] += 1
+            self._stats["keys_written"] += len(upserts)
+            self._stats["keys_deleted"] += len(deletes)
+
+            cached = self._cache.get(sid)
+            if cached is not None and cached[0] == version - 1:
+                record = dict(cached[2])
+                record.update(upserts)
+                for key in deletes:
+                    record.pop(key, None)
+                self._remember(sid, version, expires_at, record)
+            elif version == 1:
+                self._remember(sid, version, expires_at, dict(upserts))
+            else:
+                # Araya başka bir process'in yazımı girdi; bir sonraki okumada yenilensin
+                self._cache.pop(sid, None)
+
+    def touch(self, sid, expires_at):
+        with self._lock:
+            # Sürüm değişmez: yalnızca süre uzatılır, önbellekteki veri geçerli kalır
+            self._conn.execute("UPDATE sessions SET expires_at = ? WHERE sid = ?", (expires_at, sid))
+            self._stats["db_writes"] += 1
+            cached = self._cache.get(sid)
+            if cached is not None:
+                self._cache[sid] = (cached[0], expires_at, cached[2])
+
+    def delete(self, sid):
+        with self._lock:
+            self._conn.execute("DELETE FROM session_values WHERE sid = ?", (sid,))
+            self._conn.execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+            self._stats["db_writes"] += 1
+            self._cache.pop(sid, None)
+
+    def purge_expired(self, now):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    """
+                    DELETE FROM session_values WHERE sid IN (
+                        SELECT sid FROM sessions WHERE expires_at <= ?
+                    )
+                    """,
+                    (now,)
+                )
+                purged = self._conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,)).rowcount
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            for sid in [sid for sid, entry in self._cache.items() if entry[1] <= now]:
+                del self._cache[sid]
+        if purged:
+            self.log_info("Süresi dolan session'lar temizlendi", purged=purged)
+        return purged
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "cached_sessions": len(self._cache)}
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    """Yüklenen anahtar kayıtlarını hatırlayan sunucu tarafı session"""
+
+    def __init__(self, initial: Optional[Dict[str, Any]] = None, sid: Optional[str] = None,
+                 new: bool = False, snapshot: Optional[SessionRecord] = None, expires_at: float = 0.0):
+        def on_update(self):
+            self.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+        self.snapshot = snapshot or {}
+        self.expires_at = expires_at
+
+
+class IndexedSessionInterface(SessionInterface):
+    """`SessionStore` üzerinde çalışan, yalnızca değişen anahtarları yazan Flask session arayüzü"""
+
+    def __init__(self,
+                 store: SessionStore,
+                 lifetime_seconds: float,
+                 use_signer: bool = True,
+                 purge_interval_seconds: float = 300.0):
+        self.store = store
+        self.lifetime_seconds = lifetime_seconds
+        self.use_signer = use_signer
+        self.purge_interval_seconds = purge_interval_seconds
+        # Süre sonu her istekte değil, ömrün onda biri geçtikçe uzatılır
+        self.touch_after_seconds = lifetime_seconds / 10
+        self._last_purge = time.time()
+        self._purge_lock = threading.Lock()
+
+    def _signer(self, app) -> Signer:
+        return Signer(app.secret_key, salt="flask-session", key_derivation="hmac")
+
+    def _sid_from_cookie(self, app, cookie: Optional[str]) -> Optional[str]:
+        if not cookie:
+            return None
+        if not self.use_signer:
+            return cookie
+        try:
+            return self._signer(app).unsign(cookie).decode("utf-8")
+        except BadSignature:
+            return None
+
+    def open_session(self, app, request) -> ServerSideSession:
+        now = time.time()
+        self._maybe_purge(now)
+
+        sid = self._sid_from_cookie(app, request.cookies.get(self.get_cookie_name(app)))
+        if sid:
+            loaded = self.store.load(sid, now)
+            if loaded is not None:
+                snapshot, expires_at = loaded
+                data = {key: pickle.loads(value) for key, value in snapshot.items()}
+                return ServerSideSession(data, sid=sid, snapshot=snapshot, expires_at=expires_at)
+
+        return ServerSideSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app, session: ServerSideSession, response) -> None:
+        now = time.time()
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        cookie_name = self.get_cookie_name(app)
+
+        if not session:
+            if not session.new:
+                self.store.delete(session.sid)
+                response.delete_cookie(cookie_name, domain=domain, path=path)
+            return
+
+        # Yalnızca serileştirilmiş hali değişen anahtarları yaz
+        upserts = {}
+        for key, value in session.items():
+            payload = _dumps(value)
+            if session.snapshot.get(key) != payload:
+                upserts[key] = payload
+        deletes = set(session.snapshot) - set(session)
+
+        expires_at = now + self.lifetime_seconds
+        if upserts or deletes:
+            self.store.write(session.sid, upserts, deletes, expires_at)
+        elif session.expires_at - now < self.lifetime_seconds - self.touch_after_seconds:
+            self.store.touch(session.sid, expires_at)
+
+        if session.new or (session.permanent and app.config.get("SESSION_REFRESH_EACH_REQUEST", True)):
+            cookie_value = session.sid
+            if self.use_signer:
+                cookie_value = self._signer(app).sign(session.sid).decode("utf-8")
+            response.set_cookie(
+                cookie_name,
+                cookie_value,
+                expires=self.get_expiration_time(app, session),
+                httponly=self.get_cookie_httponly(app),
+                domain=domain,
+                path=path,
+                secure=self.get_cookie_secure(app),
+                samesite=self.get_cookie_samesite(app)
+            )
+
+    def _maybe_purge(self, now: float) -> None:
+        if now - self._last_purge < self.purge_interval_seconds:
+            return
+        if not self._purge_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_purge = now
+            self.store.purge_expired(now)
+        finally:
+            self._purge_lock.release()
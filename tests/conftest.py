@@ -0,0 +1,19 @@
+"""
+Test Ortamı
+===========
+
+Test modülleri `flask_app`'i import ettiğinde veritabanları (app.db, jobs.db, artifacts.db,
+sessions.db, ...) ve şifreleme anahtarı depodaki `data/` yerine geçici bir dizinde oluşur.
+Bu dosya test modüllerinden önce yüklendiği için ortam değişkeni import'lardan önce ayarlanır.
+"""
+
+import os
+import shutil
+import tempfile
+
+os.environ['TEST_MODE'] = 'true'
+os.environ['APP_DATA_DIR'] = tempfile.mkdtemp(prefix='prp-test-data-')
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(os.environ['APP_DATA_DIR'], ignore_errors=True)
@@ -0,0 +1,80 @@
+"""
+Artifact Deposu Testleri
+========================
+
+PRP artifact'larının içerik hash'i ile tekilleştirilmesini, ayrılmış kayıtları ve
+süre sonu temizliğini test eder.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.storage import ArtifactStore, content_hash
+
+@pytest.mark.parametrize('compression', ['zstd', 'identity'])
+def test_content_round_trips_with_each_compression(tmp_path, compression):
+    """Her sıkıştırma ile yazılan içerik aynen okunmalı; başka ayarla açılan depo da okuyabilmeli"""
+
+    if compression == 'zstd':
+        pytest.importorskip('zstandard')
+
+    store = ArtifactStore(db_path=tmp_path / 'artifacts.db', compression=compression)
+    assert store.encoding == compression
+
+    content = '# PRP\n\n' + 'Tekrarlanan satır içeriği.\n' * 500
+    artifact_id = store.put(content)
+    stats = store.stats()
+    if compression == 'zstd':
+        assert stats['stored_bytes'] < stats['content_bytes'] / 10
+    else:
+        assert stats['stored_bytes'] == stats['content_bytes']
+
+    other = ArtifactStore(db_path=tmp_path / 'artifacts.db', compression='identity')
+    assert other.get_content(artifact_id) == content
+
+def test_identical_outputs_share_one_blob(tmp_path):
+    """Aynı içerik iki session için tek blob olarak saklanmalı"""
+
+    store = ArtifactStore(db_path=tmp_path / 'artifacts.db')
+    first = store.put('# PRP\n\nİçerik', session_id='s1', project_name='Demo', settings={'detail_level': 'basic'})
+    second = store.put('# PRP\n\nİçerik', session_id='s2')
+
+    assert first != second
+    assert store.stats()['blobs'] == 1
+
+    artifact = store.get(first)
+    assert artifact.hash == content_hash('# PRP\n\nİçerik')
+    assert artifact.settings == {'detail_level': 'basic'}
+
+    store.delete(first)
+    assert store.get_content(second) == '# PRP\n\nİçerik'
+    store.delete(second)
+    assert store.stats()['blobs'] == 0
+
+def test_reserved_artifact_is_empty_until_filled(tmp_path):
+    """Ayrılmış kayıt içerik yazılana kadar okunamamalı"""
+
+    store = ArtifactStore(db_path=tmp_path / 'artifacts.db')
+    artifact_id = store.reserve(session_id='s1')
+    assert store.get(artifact_id) is None
+
+    store.put('hazır', artifact_id=artifact_id)
+    assert store.get_content(artifact_id) == 'hazır'
+
+def test_expired_artifacts_and_orphan_blobs_are_purged(tmp_path):
+    """Süresi dolan kayıtlar ve yalnızca onların kullandığı blob'lar silinmeli"""
+
+    store = ArtifactStore(db_path=tmp_path / 'artifacts.db', ttl_seconds=60)
+    old = store.put('eski')
+    store.put('yeni')
+
+    assert store.purge_expired(now=time.time() + 120) == 2
+    assert store.get(old) is None
+    assert store.stats()['blobs'] == 0
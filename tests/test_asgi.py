@@ -0,0 +1,123 @@
+"""
+ASGI Modu Testleri
+==================
+
+Async view'ların hem WSGI hem ASGI modunda çalıştığını test eder.
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ['TEST_MODE'] = 'true'
+
+import flask_app
+from src.web.asgi import FlaskASGIApp
+
+def _call_asgi(application, method, path, body=b""):
+    """ASGI uygulamasını tek bir istekle çağır ve (status, body) döndür"""
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 1234),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(application(scope, receive, send))
+
+    status = sent[0]["status"]
+    payload = b"".join(m.get("body", b"") for m in sent[1:])
+    return status, payload
+
+def test_async_view_under_wsgi(monkeypatch):
+    """Async view Flask test client (WSGI) üzerinden çalışmalı"""
+
+    monkeypatch.setattr(flask_app.config, "default_provider", "mock")
+    client = flask_app.app.test_client()
+
+    response = client.post('/api/expand-description', json={'description': 'todo app'})
+
+    assert response.status_code == 200
+    assert response.get_json()['expanded_description'].startswith("Mock response")
+
+def test_async_and_sync_views_under_asgi(monkeypatch):
+    """ASGI modunda async view doğrudan, senkron view thread havuzunda çalışmalı"""
+
+    monkeypatch.setattr(flask_app.config, "default_provider", "mock")
+    application = FlaskASGIApp(flask_app.app)
+
+    status, payload = _call_asgi(
+        application, "POST", "/api/expand-description",
+        json.dumps({'description': 'todo app'}).encode()
+    )
+    assert status == 200
+    assert json.loads(payload)['success'] is True
+
+    status, _ = _call_asgi(application, "POST", "/api/clear-template")
+    assert status == 200
+
+LIFESPAN_SCRIPT = """
+import asyncio
+from src.jobs.job_queue import JobStore
+
+# Yarıda kalmış bir iş: import sırasında kuyruk başlasaydı ayrı bir loop açılırdı
+JobStore().create('probe', {})
+
+import flask_app
+from asgi import application
+
+loops = []
+
+async def probe(ctx):
+    loops.append(asyncio.get_running_loop())
+    return {}
+
+flask_app.job_queue.register('probe', probe)
+
+async def main():
+    messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        pass
+
+    await application({'type': 'lifespan'}, receive, send)
+    for _ in range(200):
+        if loops:
+            break
+        await asyncio.sleep(0.01)
+    assert loops == [asyncio.get_running_loop()], loops
+
+asyncio.run(main())
+"""
+
+def test_jobs_run_on_the_adopted_server_loop(tmp_path):
+    """İş kuyruğu import'ta değil lifespan'de başlamalı ve işler sunucunun loop'unda çalışmalı"""
+
+    env = {**os.environ, 'APP_DATA_DIR': str(tmp_path), 'TEST_MODE': 'true'}
+    result = subprocess.run(
+        [sys.executable, '-c', LIFESPAN_SCRIPT],
+        cwd=project_root, env=env, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
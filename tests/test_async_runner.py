@@ -0,0 +1,45 @@
+"""
+Async Runner Testleri
+=====================
+
+Kalıcı arka plan event loop köprüsünü test eder.
+"""
+
+import asyncio
+import contextvars
+import sys
+from pathlib import Path
+
+import pytest
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.utils.async_runner import run_coro, get_runner
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+def test_loop_survives_across_calls():
+    """Ardışık çağrılar aynı event loop'u kullanmalı"""
+
+    first = run_coro(_current_loop())
+    second = run_coro(_current_loop())
+
+    assert first is second
+    assert first is get_runner().loop
+
+def test_context_and_timeout():
+    """Çağıranın contextvars bağlamı taşınmalı, zaman aşımı TimeoutError vermeli"""
+
+    async def _read_context():
+        return request_id.get()
+
+    request_id.set("abc")
+    assert run_coro(_read_context()) == "abc"
+
+    with pytest.raises(TimeoutError):
+        run_coro(asyncio.sleep(5), timeout=0.05)
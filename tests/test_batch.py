@@ -0,0 +1,102 @@
+"""
+Toplu Üretim Testleri
+=====================
+
+JSONL kayıtlarının ayrıştırılmasını, sınırlı eşzamanlılıkla üretimi ve
+önceki çıktıdan sürdürmeyi test eder.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ['TEST_MODE'] = 'true'
+
+from src.api.llm_factory import MockClient, LLMProviderFactory
+from src.jobs import completed_ids, parse_records, run_batch
+from src.utils.config import LLMProviderConfig
+from src.utils.logger import get_logger
+
+RECORDS = [
+    {'id': 'a', 'project_data': {'project_name': 'Alfa', 'project_type': 'Web', 'description': 'Alfa app'},
+     'requirements': {'functional_requirements': 'Login'}},
+    {'project_data': {'project_name': 'Beta', 'project_type': 'CLI', 'description': 'Beta tool'},
+     'requirements': {'functional_requirements': 'Export'}},
+]
+
+def _lines(records):
+    return [json.dumps(record) for record in records]
+
+def test_parse_records_assigns_stable_ids_and_rejects_bad_lines():
+    """Kimliksiz kayıtlara içerikten kararlı kimlik verilmeli, bozuk satır reddedilmeli"""
+
+    first = parse_records(_lines(RECORDS))
+    second = parse_records(_lines(RECORDS))
+    assert first[0]['id'] == 'a'
+    assert first[1]['id'] == second[1]['id']
+
+    try:
+        parse_records(['{"requirements": {}}'])
+        assert False, "ValueError bekleniyordu"
+    except ValueError as e:
+        assert 'Satır 1' in str(e)
+
+def test_run_batch_skips_completed_records():
+    """Önceki çıktıda başarılı olan kayıtlar yeniden üretilmemeli"""
+
+    records = parse_records(_lines(RECORDS))
+    client = MockClient(LLMProviderConfig(name='Mock', api_key='k', default_model='m'), get_logger())
+
+    async def collect(skip_ids):
+        return [r async for r in run_batch(records, lambda name: client, ['mock'], 2, skip_ids)]
+
+    results = asyncio.run(collect(set()))
+    assert {r['id'] for r in results} == {'a', records[1]['id']}
+    assert all(r['status'] == 'ok' and r['content'] for r in results)
+
+    previous = [json.dumps(results[0]), '{"id": "x", "status": "error"}', '{"id": "tru']
+    skip = completed_ids(previous)
+    assert skip == {results[0]['id']}
+    resumed = asyncio.run(collect(skip))
+    assert [r['id'] for r in resumed] == [results[1]['id']]
+
+def test_provider_failures_are_reported_as_errors():
+    """Provider hatası fallback PRP ile 'ok' sayılmamalı; kayıt sürdürmede yeniden denenmeli"""
+
+    class FailingClient(MockClient):
+        async def generate_response(self, prompt, system_prompt=None, **kwargs):
+            raise RuntimeError("429 rate limited")
+
+    records = parse_records(_lines(RECORDS[:1]))
+    client = FailingClient(LLMProviderConfig(name='Mock', api_key='k', default_model='m'), get_logger())
+
+    async def collect():
+        return [r async for r in run_batch(records, lambda name: client, ['mock'])]
+
+    results = asyncio.run(collect())
+    assert results[0]['status'] == 'error'
+    assert '429' in results[0]['error']
+    assert 'content' not in results[0]
+    assert completed_ids([json.dumps(results[0])]) == set()
+
+def test_batch_generate_endpoint_streams_jsonl():
+    """/api/batch-generate sonuçları JSONL olarak stream etmeli"""
+
+    import flask_app
+
+    client = flask_app.app.test_client()
+    response = client.post(
+        '/api/batch-generate?providers=mock&concurrency=2',
+        data='\n'.join(_lines(RECORDS)),
+        content_type='application/x-ndjson'
+    )
+    assert response.mimetype == 'application/x-ndjson'
+    results = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert len(results) == 2
+    assert all(r['status'] == 'ok' for r in results)
@@ -0,0 +1,63 @@
+"""
+Client Havuzu Testleri
+======================
+
+Paylaşılan LLM client havuzunun yeniden kullanım ve eviction davranışını test eder.
+"""
+
+import sys
+import os
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ['TEST_MODE'] = 'true'
+
+from src.utils.config import load_config, LLMProviderConfig
+from src.api.llm_factory import LLMProviderFactory, MockClient
+from src.api.client_pool import LLMClientPool
+
+def test_client_reused_across_factories():
+    """Farklı factory instance'ları aynı client'ı paylaşmalı"""
+
+    config = load_config()
+    pool = LLMClientPool()
+
+    first = LLMProviderFactory(config, pool).create_client("mock")
+    second = LLMProviderFactory(config, pool).create_client("mock")
+
+    assert first is second
+    assert pool.stats()["hits"] == 1
+
+def test_rotated_key_evicts_stale_client():
+    """Anahtar değiştiğinde eski client havuzdan çıkarılmalı"""
+
+    pool = LLMClientPool()
+    provider_config = LLMProviderConfig(name="Mock", api_key="key-1", default_model="mock-model")
+
+    old_client = pool.get_or_create("mock", provider_config, MockClient)
+    provider_config.api_key = "key-2"
+    new_client = pool.get_or_create("mock", provider_config, MockClient)
+
+    assert old_client is not new_client
+    assert old_client.config.api_key == "key-1"
+    assert pool.evict_stale({"mock": provider_config}) == 1
+    assert pool.stats()["size"] == 1
+
+def test_pooled_clients_are_not_reconfigured_per_call():
+    """Farklı katman ayarlı factory'ler paylaşılan client'ı değiştirmemeli, ayrı client almalı"""
+
+    config = load_config()
+    pool = LLMClientPool()
+
+    cached = LLMProviderFactory(config, pool).create_client("mock")
+    uncached_config = config.model_copy(update={'enable_caching': False, 'enable_single_flight': False})
+    uncached = LLMProviderFactory(uncached_config, pool).create_client("mock")
+
+    assert cached is not uncached
+    assert cached.response_cache is not None and cached.single_flight is not None
+    assert uncached.response_cache is None and uncached.single_flight is None
+    assert LLMProviderFactory(config, pool).create_client("mock") is cached
+    assert pool.stats()["size"] == 2
@@ -0,0 +1,65 @@
+"""
+Veri Erişim Katmanı Testleri
+============================
+
+Havuzlanmış WAL bağlantılarını, sürümlü migration'ları ve async erişimi test eder.
+"""
+
+import asyncio
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.utils.dal import Database
+from src.utils.db import MIGRATIONS
+
+def test_connections_are_pooled_per_thread_in_wal_mode(tmp_path):
+    """Aynı thread aynı bağlantıyı kullanmalı; farklı thread kendi bağlantısını açmalı"""
+
+    db = Database(tmp_path / 'app.db')
+    conn = db.connection()
+    assert db.connection() is conn
+    assert db.fetchone("PRAGMA journal_mode")[0] == 'wal'
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(db.connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+
+    db.execute("CREATE TABLE t (v INTEGER)")
+    with pytest.raises(ValueError):
+        with db.transaction() as tx:
+            tx.execute("INSERT INTO t VALUES (1)")
+            raise ValueError("geri al")
+    with db.transaction() as tx:
+        tx.execute("INSERT INTO t VALUES (2)")
+
+    assert asyncio.run(db.afetchall("SELECT v FROM t")) == [(2,)]
+    db.close()
+    assert db.fetchone("SELECT COUNT(*) FROM t") == (1,)
+
+def test_migrations_upgrade_legacy_database_once(tmp_path):
+    """Eski şemadaki veritabanına eksik kolon eklenmeli, migration'lar bir kez çalışmalı"""
+
+    path = tmp_path / 'app.db'
+    legacy = sqlite3.connect(path)
+    legacy.execute("CREATE TABLE api_keys (provider TEXT PRIMARY KEY, secret TEXT NOT NULL, updated_at TEXT NOT NULL)")
+    legacy.execute("INSERT INTO api_keys VALUES ('openai', 'x', 'dün')")
+    legacy.commit()
+    legacy.close()
+
+    db = Database(path, MIGRATIONS)
+    assert db.migrate() == len(MIGRATIONS)
+    assert db.migrate() == len(MIGRATIONS)
+    assert db.stats()['migrations_applied'] == len(MIGRATIONS)
+
+    assert db.fetchone("SELECT provider, model FROM api_keys") == ('openai', None)
+    assert db.fetchone("SELECT version FROM table_versions WHERE name = 'api_keys'") == (0,)
@@ -0,0 +1,95 @@
+"""
+Export Motoru Testleri
+======================
+
+Export yazıcılarının parça parça çıktı üretmesini ve indirme endpoint'inin ZIP paketini
+test eder.
+"""
+
+import io
+import json
+import os
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ['TEST_MODE'] = 'true'
+
+import flask_app
+from src.storage import ArtifactStore
+from src.web.export import CHUNK_SIZE, ExportContext, available_formats, get_writer
+
+def test_writers_stream_in_chunks(tmp_path):
+    """Büyük içerik tek parça yerine CHUNK_SIZE bloklar halinde üretilmeli"""
+
+    store = ArtifactStore(db_path=tmp_path / 'artifacts.db')
+    content = '# **PRP**\n\n' + 'Satır `kod` içeriği\n' * 10000
+    ctx = ExportContext(store.get(store.put(content)), store=store, project_data={'project_name': 'Demo'})
+
+    assert {'markdown', 'txt', 'json', 'html', 'zip'} <= set(available_formats())
+
+    chunks = list(get_writer('markdown').write(ctx))
+    assert len(chunks) > 1
+    assert max(len(chunk) for chunk in chunks) <= CHUNK_SIZE * 4
+    assert b''.join(chunks).decode('utf-8') == content
+
+    text = b''.join(get_writer('txt').write(ctx)).decode('utf-8')
+    assert '#' not in text and '*' not in text and '`' not in text
+
+    document = json.loads(b''.join(get_writer('json').write(ctx)))
+    assert document['generated_content'] == content
+    assert document['project_data'] == {'project_name': 'Demo'}
+
+def test_zip_bundle_contains_agent_outputs():
+    """ZIP paketi PRP'yi ve kaydedilmiş ajan çıktılarını içermeli"""
+
+    client = flask_app.app.test_client()
+    artifact_id = flask_app.artifact_store.put('# PRP\n\nİçerik')
+    with client.session_transaction() as sess:
+        sess['generated_prp_artifact'] = artifact_id
+        sess['project_data'] = {'project_name': 'Demo'}
+
+    with flask_app.app.test_request_context():
+        flask_app.session['generated_prp_artifact'] = artifact_id
+        flask_app.store_agent_outputs({'analysis': {'summary': 'Analiz'}})
+
+    response = client.get('/api/download-file?format=zip', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert 'Content-Encoding' not in response.headers
+
+    archive = zipfile.ZipFile(io.BytesIO(response.data))
+    assert set(archive.namelist()) == {'PRP.md', 'PRP.html', 'project.json', 'agents/analysis.json'}
+    assert archive.read('PRP.md').decode('utf-8') == '# PRP\n\nİçerik'
+    assert json.loads(archive.read('agents/analysis.json')) == {'summary': 'Analiz'}
+
+    cached = client.get('/api/download-file?format=zip', headers={'If-None-Match': response.headers['ETag']})
+    assert cached.status_code == 304
+    assert client.get('/api/download-file?format=pdf').status_code == 400
+
+    flask_app.artifact_store.delete(artifact_id)
+
+def test_etag_changes_with_artifact_creation_time():
+    """Aynı içerikli farklı zamanlı artifact'lar aynı JSON ETag'ini paylaşmamalı"""
+
+    client = flask_app.app.test_client()
+    etags, bodies = [], []
+    for _ in range(2):
+        # Kayıt reserve() anında zaman damgası alır; içerik sonradan aynı şekilde yazılır
+        artifact_id = flask_app.artifact_store.reserve(project_name='Demo')
+        time.sleep(0.01)
+        flask_app.artifact_store.put('# PRP\n\nAynı içerik', artifact_id=artifact_id)
+        with client.session_transaction() as sess:
+            sess['generated_prp_artifact'] = artifact_id
+        first = client.get('/api/download-file?format=json')
+        again = client.get('/api/download-file?format=json')
+        assert (first.headers['ETag'], first.data) == (again.headers['ETag'], again.data)
+        etags.append(first.headers['ETag'])
+        bodies.append(json.loads(first.data)['generated_at'])
+        flask_app.artifact_store.delete(artifact_id)
+
+    assert etags[0] != etags[1] and bodies[0] != bodies[1]
@@ -0,0 +1,103 @@
+"""
+Form Doldurma Testleri
+======================
+
+Form doldurma uzmanının typed output'u kullanmasını, tool calling olmayan
+provider'larda serbest metinden JSON ayıklamasını ve sonuç paylaşımını test eder.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.agents.form_filler_agent import FormFillMemo, FormFillerAgent
+from src.models import FormFillResult
+from src.utils.json_extract import extract_json_object
+from src.utils.logger import get_logger
+
+class _Result:
+    def __init__(self, output):
+        self.output = output
+
+class _FakeClient:
+    """Agent çıktısı veya hatası ile metin yanıtı ayarlanabilen sahte client"""
+
+    def __init__(self, agent_output=None, agent_error=None, text=''):
+        self.agent_output = agent_output
+        self.agent_error = agent_error
+        self.text = text
+        self.text_calls = 0
+
+    def create_agent(self, system_prompt, output_type=str, tools=None):
+        client = self
+
+        class _Agent:
+            async def run(self, prompt):
+                if client.agent_error:
+                    raise client.agent_error
+                return _Result(client.agent_output)
+
+        return _Agent()
+
+    async def generate_response(self, prompt, **kwargs):
+        self.text_calls += 1
+        return self.text
+
+def test_structured_output_is_used_directly():
+    """Typed output geldiğinde metin yanıtı istenmemeli"""
+
+    client = _FakeClient(agent_output=FormFillResult(project_name='Demo', tech_stack=['Flask']))
+    data = asyncio.run(FormFillerAgent(client, get_logger()).analyze_and_fill_form('Bir web uygulaması'))
+
+    assert data['project_name'] == 'Demo'
+    assert data['tech_stack'] == ['Flask']
+    assert client.text_calls == 0
+
+def test_text_mode_recovers_fenced_and_truncated_json():
+    """Tool calling hatasında metin moduna geçilmeli; markdown bloğu ve kesik JSON onarılmalı"""
+
+    text = 'İşte sonuç:\n```json\n{"project_name": "Demo", "tech_stack": "- React\\n- Node", "risks": ["Süre", "Bütç'
+    client = _FakeClient(agent_error=ValueError('tools not supported'), text=text)
+    data = asyncio.run(FormFillerAgent(client, get_logger()).analyze_and_fill_form('Bir web uygulaması'))
+
+    assert data['project_name'] == 'Demo'
+    assert data['tech_stack'] == ['React', 'Node']
+    assert data['risks'] == ['Süre', 'Bütç']
+    assert client.text_calls == 1
+
+    assert extract_json_object('Açıklama {yok} ve {"a": {"b": [1, 2]}} son') == {'a': {'b': [1, 2]}}
+    assert extract_json_object('JSON yok') is None
+
+def test_memo_shares_in_flight_and_completed_results():
+    """Aynı kapsam ve açıklama için analiz bir kez yapılmalı; başarısız sonuç saklanmamalı"""
+
+    memo = FormFillMemo(ttl_seconds=60)
+    calls = []
+
+    async def fill(result):
+        calls.append(result)
+        await asyncio.sleep(0.01)
+        return result
+
+    async def scenario():
+        first, second = await asyncio.gather(
+            memo.get_or_fill(('s1', 'openai'), 'Açıklama', lambda: fill({'project_name': 'A'})),
+            memo.get_or_fill(('s1', 'openai'), 'Açıklama', lambda: fill({'project_name': 'B'}))
+        )
+        later = await memo.get_or_fill(('s1', 'openai'), 'Açıklama', lambda: fill({'project_name': 'C'}))
+        other = await memo.get_or_fill(('s2', 'openai'), 'Açıklama', lambda: fill({'project_name': 'D'}))
+        failed = await memo.get_or_fill(('s3', 'openai'), 'Açıklama', lambda: fill(None))
+        retried = await memo.get_or_fill(('s3', 'openai'), 'Açıklama', lambda: fill({'project_name': 'E'}))
+        return first, second, later, other, failed, retried
+
+    first, second, later, other, failed, retried = asyncio.run(scenario())
+
+    assert first == second == later == {'project_name': 'A'}
+    assert other == {'project_name': 'D'}
+    assert failed is None and retried == {'project_name': 'E'}
+    assert len(calls) == 4
+    assert memo.stats()['hits'] == 2
@@ -0,0 +1,95 @@
+"""
+PRP Geçmişi Testleri
+====================
+
+Proje/PRP sürümlerinin kalıcı kaydını, tekilleştirmeyi ve FTS5 tam metin aramasını test eder.
+"""
+
+import sys
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.storage.history_store import HistoryStore, fts_query
+from src.utils.dal import Database
+from src.utils.db import MIGRATIONS
+
+PROJECT = {'project_name': 'Mağaza', 'project_type': 'web_app', 'description': 'E-ticaret sitesi'}
+REQUIREMENTS = {'functional_requirements': 'Sepet ve ödeme adımları'}
+
+def _store(tmp_path):
+    return HistoryStore(Database(tmp_path / 'app.db', MIGRATIONS))
+
+def test_versions_are_numbered_and_duplicates_skipped(tmp_path):
+    """Aynı içerik ikinci kez eklenmemeli; yeni içerik sonraki sürüm olmalı"""
+
+    store = _store(tmp_path)
+    first = store.record(PROJECT, REQUIREMENTS, '# PRP v1', settings={'detail_level': 'basic'}, provider='openai')
+    again = store.record(PROJECT, REQUIREMENTS, '# PRP v1')
+    second = store.record(PROJECT, REQUIREMENTS, '# PRP v2')
+
+    assert first['created'] and not again['created']
+    assert again['version_id'] == first['version_id']
+    assert (first['version'], second['version']) == (1, 2)
+
+    [project] = store.list_projects()
+    assert (project['version_count'], project['latest_version_id']) == (2, second['version_id'])
+    assert [v['version'] for v in store.versions(project['project_id'])] == [2, 1]
+
+    version = store.get_version(first['version_id'])
+    assert version['content'] == '# PRP v1'
+    assert version['settings'] == {'detail_level': 'basic'}
+    assert version['project_data'] == PROJECT and version['requirements'] == REQUIREMENTS
+
+def test_search_ignores_diacritics_and_tracks_deletes(tmp_path):
+    """Arama aksan duyarsız ve önekli olmalı; silinen proje indeksten düşmeli"""
+
+    store = _store(tmp_path)
+    recorded = store.record(PROJECT, REQUIREMENTS, '## Ödeme Akışı\nKredi kartı ile ödeme alınır.')
+    store.record({'project_name': 'Blog'}, {}, '## Yorumlar\nZiyaretçi yorumları.')
+
+    results = store.search('odeme kre')
+    assert [r['version_id'] for r in results] == [recorded['version_id']]
+    assert '[Kredi]' in results[0]['snippet']
+    assert store.search('magaza')[0]['project_name'] == 'Mağaza'
+    assert fts_query('NOT "OR') == '"NOT" "OR"*' and store.search('***') == []
+
+    assert store.delete_project(recorded['project_id'])
+    assert store.search('odeme') == []
+    assert store.get_version(recorded['version_id']) is None
+
+def test_history_is_scoped_to_the_workspace_token(tmp_path, monkeypatch):
+    """Geçmiş session'dan bağımsız olarak çalışma alanı anahtarına ait olmalı; anahtarsız istek reddedilmeli"""
+
+    import flask_app
+
+    store = _store(tmp_path)
+    monkeypatch.setattr(flask_app, 'history_store', store)
+
+    browser = flask_app.app.test_client()
+    assert browser.get('/api/history').status_code == 403
+    token = browser.get_cookie(flask_app.WORKSPACE_COOKIE).value
+    with flask_app.app.test_request_context('/', headers={'Cookie': f'{flask_app.WORKSPACE_COOKIE}={token}'}):
+        recorded = flask_app.record_history('## Ödeme\nKredi kartı')
+    project_url = f"/api/history/projects/{recorded['project_id']}"
+
+    # Yeni bir session (ör. süresi dolmuş oturum) aynı anahtarla geçmişe erişir; başka anahtar erişemez
+    owner = {flask_app.WORKSPACE_HEADER: token}
+    other = {flask_app.WORKSPACE_HEADER: 'x' * 43}
+    client = flask_app.app.test_client()
+    assert [p['project_id'] for p in client.get('/api/history', headers=owner).get_json()['projects']] == [recorded['project_id']]
+    assert client.get('/api/history', headers=other).get_json()['projects'] == []
+    assert client.get('/api/history/search?q=odeme', headers=other).get_json()['results'] == []
+    assert client.post(f"/api/history/versions/{recorded['version_id']}/open", headers=other).status_code == 404
+    assert client.delete(project_url, headers=other).status_code == 404
+    assert client.delete(project_url, headers=owner).status_code == 200
+
+    # Son kaydı saklama süresinden eski çalışma alanlarının geçmişi silinir
+    kept = store.record(PROJECT, REQUIREMENTS, '# Yeni', owner='aktif')
+    stale = store.record({'project_name': 'Eski'}, {}, '# Eski', owner='terk')
+    store.db.execute("UPDATE projects SET updated_at = 0 WHERE id = ?", (stale['project_id'],))
+    assert store.purge_inactive() == 1
+    assert store.get_version(stale['version_id']) is None and store.get_version(kept['version_id'])
+    assert store.search('eski') == []
@@ -0,0 +1,99 @@
+"""
+HTTP Önbellek Testleri
+======================
+
+İndirme endpoint'lerinin ETag, 304 ve sıkıştırma davranışını test eder.
+"""
+
+import gzip
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ['TEST_MODE'] = 'true'
+
+import flask_app
+
+CONTENT = '# Demo PRP\n\n' + '- Gereksinim maddesi\n' * 300
+
+def _client_with_prp():
+    client = flask_app.app.test_client()
+    artifact_id = flask_app.artifact_store.put(CONTENT, project_name='Demo')
+    with client.session_transaction() as sess:
+        sess['generated_prp_artifact'] = artifact_id
+        sess['project_data'] = {'project_name': 'Demo Proje'}
+    return client, artifact_id
+
+def test_download_prp_is_conditional_and_compressed():
+    """PRP indirmesi ETag ile 304 dönmeli ve gzip ile sıkıştırılmalı"""
+
+    client, artifact_id = _client_with_prp()
+
+    response = client.get('/api/download-prp', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert 'Demo_Proje_PRP.md' in response.headers['Content-Disposition']
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert int(response.headers['Content-Length']) == len(response.data)
+    assert gzip.decompress(response.data).decode('utf-8') == CONTENT
+
+    # Sıkıştırılmış gösterim kendi ETag'ini taşır; yalnızca aynı kodlamayla eşleşir
+    etag = response.headers['ETag']
+    identity = client.get('/api/download-prp')
+    assert etag == identity.headers['ETag'][:-1] + '-gz"'
+    assert identity.data.decode('utf-8') == CONTENT
+
+    cached = client.get('/api/download-prp', headers={'If-None-Match': etag, 'Accept-Encoding': 'gzip'})
+    assert cached.status_code == 304
+    assert cached.headers['ETag'] == etag
+    assert client.get('/api/download-prp', headers={'If-None-Match': etag}).status_code == 200
+    assert client.get(
+        '/api/download-prp', headers={'If-None-Match': identity.headers['ETag'], 'Accept-Encoding': 'gzip'}
+    ).status_code == 304
+
+    flask_app.artifact_store.delete(artifact_id)
+
+def test_download_file_etag_depends_on_format():
+    """Farklı formatlar farklı ETag almalı; POST istekleri 304 ile yanıtlanmamalı"""
+
+    client, artifact_id = _client_with_prp()
+
+    markdown = client.get('/api/download-file?format=markdown')
+    text = client.get('/api/download-file?format=txt')
+    assert markdown.headers['ETag'] != text.headers['ETag']
+    assert b'#' not in text.data
+
+    etag = markdown.headers['ETag']
+    assert client.get('/api/download-file?format=markdown', headers={'If-None-Match': etag}).status_code == 304
+    posted = client.post('/api/download-file', json={'format': 'markdown'}, headers={'If-None-Match': etag})
+    assert posted.status_code == 200
+    assert posted.data == markdown.data
+
+    flask_app.artifact_store.delete(artifact_id)
+
+@pytest.mark.parametrize('encoding', ['br', 'gzip'])
+def test_responses_are_encoded_with_negotiated_codec(encoding):
+    """Tam ve akışla üretilen gövdeler istemcinin seçtiği kodlamayla sıkıştırılmalı"""
+
+    decompress = pytest.importorskip('brotli').decompress if encoding == 'br' else gzip.decompress
+    client, artifact_id = _client_with_prp()
+    headers = {'Accept-Encoding': f'{encoding}, identity;q=0.5'}
+
+    response = client.get('/api/download-prp', headers=headers)
+    assert response.headers['Content-Encoding'] == encoding
+    assert decompress(response.data).decode('utf-8') == CONTENT
+
+    streamed = client.get('/api/download-file?format=markdown', headers=headers)
+    assert streamed.headers['Content-Encoding'] == encoding
+    assert decompress(streamed.data).decode('utf-8') == CONTENT
+    suffix = {'br': 'br', 'gzip': 'gz'}[encoding]
+    assert response.headers['ETag'].endswith(f'-{suffix}"') and streamed.headers['ETag'].endswith(f'-{suffix}"')
+    conditional = dict(headers, **{'If-None-Match': streamed.headers['ETag']})
+    assert client.get('/api/download-file?format=markdown', headers=conditional).status_code == 304
+
+    flask_app.artifact_store.delete(artifact_id)
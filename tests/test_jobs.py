@@ -0,0 +1,137 @@
+"""
+Arka Plan İş Kuyruğu Testleri
+=============================
+
+İşlerin SQLite'a kaydedilmesini, yeniden başlatma sonrası kurtarılmasını ve
+PRP üretim işinin uçtan uca çalışmasını test eder.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ['TEST_MODE'] = 'true'
+
+from src.jobs import JobQueue, JobStore
+
+def _wait_for(queue, job_id, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = queue.get(job_id)
+        if job['status'] in ('completed', 'failed'):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"İş zamanında bitmedi: {job_id}")
+
+def test_job_runs_and_result_is_persisted(tmp_path):
+    """Kuyruğa alınan iş çalışmalı, ilerleme ve sonuç veritabanından okunabilmeli"""
+
+    async def handler(ctx):
+        ctx.report(0.5, 'yarısı')
+        return {'content': ctx.payload['text'].upper()}
+
+    queue = JobQueue(JobStore(tmp_path / 'jobs.db'), max_workers=2)
+    queue.register('echo', handler)
+    job_id = queue.enqueue('echo', {'text': 'merhaba'}, owner='sid-1')
+
+    job = _wait_for(queue, job_id)
+    assert job['status'] == 'completed'
+    assert job['result'] == {'content': 'MERHABA'}
+    assert job['progress'] == 1
+
+    # Yeni bir store aynı dosyadan aynı sonucu okumalı
+    assert JobStore(tmp_path / 'jobs.db').get(job_id)['owner'] == 'sid-1'
+
+def test_orphaned_running_job_is_requeued(tmp_path):
+    """Çalışırken process'i ölen iş yeniden başlatmada kuyruğa dönmeli ve tamamlanmalı"""
+
+    store = JobStore(tmp_path / 'jobs.db')
+    job_id = store.create('echo', {'text': 'x'})
+    store.claim_next()
+    # Artık yaşamayan bir worker process'i taklit et
+    store._conn.execute("UPDATE jobs SET worker_pid = ? WHERE id = ?", (2 ** 22 + 12345, job_id))
+
+    async def handler(ctx):
+        return {'content': 'ok'}
+
+    queue = JobQueue(store)
+    queue.register('echo', handler)
+    queue.start()
+
+    assert _wait_for(queue, job_id)['status'] == 'completed'
+
+def test_generation_job_endpoints(monkeypatch):
+    """POST /api/jobs iş kimliği döndürmeli; durum ve sonuç uçları PRP'yi sunmalı"""
+
+    import flask_app
+
+    monkeypatch.setattr(flask_app.config, "default_provider", "mock")
+    client = flask_app.app.test_client()
+    with client.session_transaction() as sess:
+        sess['project_data'] = {'project_name': 'Demo', 'project_type': 'Web Application', 'description': 'Demo app'}
+        sess['project_requirements'] = {'functional_requirements': 'Login'}
+
+    response = client.post('/api/jobs', json={'kind': 'prp', 'detail_level': 'basic'})
+    assert response.status_code == 202
+    job_id = response.get_json()['job_id']
+
+    _wait_for(flask_app.job_queue, job_id)
+    status = client.get(f'/api/jobs/{job_id}').get_json()
+    assert status['status'] == 'completed'
+
+    result = client.get(f'/api/jobs/{job_id}/result').get_json()
+    assert result['success'] and result['content']
+    with client.session_transaction() as sess:
+        assert flask_app.artifact_store.get_content(sess['generated_prp_artifact'])
+
+    # Başka bir session işi göremez
+    assert flask_app.app.test_client().get(f'/api/jobs/{job_id}').status_code == 404
+
+def test_generation_job_uses_keys_resolved_at_enqueue(monkeypatch):
+    """İş, global config'teki değil kuyruğa alındığı session'ın anahtarıyla çalışmalı"""
+
+    import flask_app
+
+    with flask_app.app.test_request_context():
+        flask_app.session['api_keys'] = {'openai': 'sk-oturum'}
+        payload = {'credentials': flask_app._job_credentials()}
+    assert 'sk-oturum' not in json.dumps(payload)
+
+    # Başka bir session'ın anahtarı config'e uygulanmış olsa bile
+    monkeypatch.setattr(flask_app.config.providers['openai'], 'api_key', 'sk-baska')
+    assert flask_app._job_provider_configs(payload)['openai'].api_key == 'sk-oturum'
+    assert flask_app._job_provider_configs({})['openai'].api_key is None
+
+def test_generation_job_fails_on_provider_error(monkeypatch):
+    """Provider hatası fallback PRP ile 'completed' değil 'failed' olmalı"""
+
+    import flask_app
+    from src.api.llm_factory import MockClient
+    from src.utils.config import LLMProviderConfig
+
+    class FailingClient(MockClient):
+        async def generate_response(self, prompt, system_prompt=None, **kwargs):
+            raise RuntimeError("429 rate limited")
+
+        async def stream_response(self, prompt, system_prompt=None, **kwargs):
+            raise RuntimeError("429 rate limited")
+            yield
+
+    failing = FailingClient(LLMProviderConfig(name='Mock', api_key='k', default_model='m'))
+    monkeypatch.setattr(flask_app, "_create_llm_client", lambda *args, **kwargs: failing)
+    client = flask_app.app.test_client()
+    with client.session_transaction() as sess:
+        sess['project_data'] = {'project_name': 'Demo', 'project_type': 'Web Application', 'description': 'Demo app'}
+        sess['project_requirements'] = {'functional_requirements': 'Login'}
+
+    job_id = client.post('/api/jobs', json={'kind': 'prp', 'detail_level': 'basic'}).get_json()['job_id']
+    job = _wait_for(flask_app.job_queue, job_id)
+    assert job['status'] == 'failed'
+    assert '429' in job['error']
+    assert client.get(f'/api/jobs/{job_id}/result').status_code == 409
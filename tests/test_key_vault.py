@@ -0,0 +1,53 @@
+"""
+API Anahtar Önbelleği Testleri
+==============================
+
+Çözülmüş API anahtarlarının bellekte tutulmasını ve kayıt sonrası (diğer process'ler
+dahil) önbelleğin geçersiz kılınmasını test eder.
+"""
+
+import sys
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.utils.db import KeyVault, init_db
+
+def _vault(tmp_path, **kwargs):
+    return KeyVault(db_path=tmp_path / 'app.db', key_path=tmp_path / 'fernet.key', **kwargs)
+
+def test_single_provider_is_decrypted_once(tmp_path):
+    """Provider anahtarı ilk kullanımda okunmalı, sonrasında bellekten dönmeli"""
+
+    init_db(tmp_path / 'app.db')
+    vault = _vault(tmp_path, check_interval=60)
+    vault.save({'openai': {'api_key': 'sk-test', 'model': 'gpt-4o'}, 'gemini': {'api_key': 'g-test'}})
+
+    assert vault.get('openai') == {'api_key': 'sk-test', 'model': 'gpt-4o'}
+    assert vault.get('openai') == {'api_key': 'sk-test', 'model': 'gpt-4o'}
+    assert vault.get('anthropic') is None and vault.get('anthropic') is None
+
+    # Dönen kopya üzerinde değişiklik önbelleği bozmamalı
+    vault.get('openai')['api_key'] = 'değişti'
+    assert vault.load_all()['openai']['api_key'] == 'sk-test'
+
+    stats = vault.stats()
+    assert (stats['misses'], stats['hits']) == (3, 3)
+
+def test_save_in_other_process_invalidates_cache(tmp_path):
+    """Başka bir process'in kaydı sürüm sayacı ile fark edilmeli"""
+
+    init_db(tmp_path / 'app.db')
+    worker_a = _vault(tmp_path, check_interval=0)
+    worker_b = _vault(tmp_path, check_interval=0)
+    worker_a.save({'openai': {'api_key': 'eski'}})
+
+    assert worker_b.get('openai')['api_key'] == 'eski'
+
+    worker_a.save({'openai': {'api_key': 'yeni', 'model': 'gpt-4o-mini'}})
+
+    assert worker_b.get('openai') == {'api_key': 'yeni', 'model': 'gpt-4o-mini'}
+    assert worker_b.stats()['invalidations'] == 1
+    assert worker_a.stats()['version'] == worker_b.stats()['version'] == 2
@@ -0,0 +1,68 @@
+"""
+Prompt Önbelleği Testleri
+=========================
+
+Sistem prompt'larının önbellek işaretleriyle gönderilmesini ve önbellekten okunan token
+sayılarının raporlanmasını test eder.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from pydantic_ai.messages import ModelRequest, SystemPromptPart, UserPromptPart
+from pydantic_ai.providers.anthropic import AnthropicProvider
+from pydantic_ai.usage import RunUsage
+
+from src.api.prompt_cache import (
+    MIN_CACHEABLE_SYSTEM_CHARS, PromptCachingAnthropicModel, TokenUsageRegistry,
+    UsageTrackingAgent, openai_prompt_cache_settings
+)
+
+def test_long_system_prompt_is_marked_for_caching():
+    """Uzun sistem prompt'u cache_control bloğu olmalı; kısa olan düz metin kalmalı"""
+
+    model = PromptCachingAnthropicModel('claude-3-5-sonnet-latest', provider=AnthropicProvider(api_key='test'))
+    long_prompt = 'Sen bir PRP uzmanısın. ' * (MIN_CACHEABLE_SYSTEM_CHARS // 10)
+
+    async def mapped(system_prompt):
+        messages = [ModelRequest(parts=[SystemPromptPart(system_prompt), UserPromptPart('Proje')])]
+        return await model._map_message(messages)
+
+    system, messages = asyncio.run(mapped(long_prompt))
+    assert system == [{'type': 'text', 'text': long_prompt, 'cache_control': {'type': 'ephemeral'}}]
+    assert messages[0]['role'] == 'user'
+
+    short_system, _ = asyncio.run(mapped('Kısa'))
+    assert short_system == 'Kısa'
+
+    settings = openai_prompt_cache_settings(long_prompt)
+    assert settings == openai_prompt_cache_settings(long_prompt)
+    assert openai_prompt_cache_settings('Kısa') is None
+
+def test_usage_tracking_reports_cache_reads():
+    """Provider'a giden çağrıların cache_read token'ları toplanmalı"""
+
+    class _Result:
+        output = 'yanıt'
+
+        def usage(self):
+            return RunUsage(requests=1, input_tokens=2000, output_tokens=100, cache_read_tokens=1500)
+
+    class _Agent:
+        async def run(self, prompt):
+            return _Result()
+
+    registry = TokenUsageRegistry()
+    agent = UsageTrackingAgent(_Agent(), registry, 'Anthropic')
+    asyncio.run(agent.run('a'))
+    asyncio.run(agent.run('b'))
+
+    stats = registry.stats()['Anthropic']
+    assert stats['requests'] == 2
+    assert stats['cache_read_tokens'] == 3000
+    assert stats['cache_hit_ratio'] == 0.75
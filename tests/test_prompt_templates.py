@@ -0,0 +1,67 @@
+"""
+Prompt Şablon Testleri
+======================
+
+Agent prompt şablonlarının başlangıçta derlenmesini, statik şablonların önbelleklenmesini
+ve render çıktısının f-string davranışıyla uyumunu test eder.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from jinja2 import UndefinedError
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+os.environ['TEST_MODE'] = 'true'
+
+from src.models.project_data import AnalysisResult, ProjectData, ProjectRequirements
+from src.prompts.registry import PromptRegistry
+
+def test_all_templates_compile_and_static_ones_are_prerendered():
+    """Tüm agent şablonları yüklenmeli; değişkensiz sistem prompt'ları hazır tutulmalı"""
+
+    registry = PromptRegistry()
+
+    for agent in ('system_analyst', 'software_architect', 'test_specialist', 'documentation_specialist'):
+        assert registry.is_static(f'{agent}/system')
+    assert registry.is_static('form_filler/system')
+    assert registry.variables('prp_generator/system') == {'detail_level', 'include_examples'}
+
+    first = registry.render_cached('prp_generator/system', detail_level='basic', include_examples=False)
+    second = registry.render_cached('prp_generator/system', detail_level='basic', include_examples=False)
+    assert first is second
+    assert 'DETAY SEVİYESİ: TEMEL' in first and 'NOT: Kod örneklerini' in first
+
+    stats = registry.stats()['renders']['prp_generator/system']
+    assert (stats['renders'], stats['cached']) == (2, 1)
+
+def test_dynamic_prompt_matches_fstring_formatting():
+    """Enum alanları ve `join` çıktısı eski f-string prompt'larıyla aynı olmalı"""
+
+    registry = PromptRegistry()
+    project = ProjectData(
+        name='Demo', type='Web Uygulaması', language='Python', description='Demo proje açıklaması',
+        platform=['iOS', 'Android'], requirements=ProjectRequirements(functional_requirements='Kullanıcı girişi ve kayıt')
+    )
+    analysis = AnalysisResult(
+        complexity_score=6, risk_factors=['r'], recommended_approach='Agile',
+        key_challenges=['a', 'b'], success_criteria=['s'], estimated_effort='orta'
+    )
+
+    prompt = registry.render('software_architect/architecture', project=project, analysis=analysis, req=project.requirements)
+
+    assert f"- **Proje Türü**: {project.type}\n" in prompt
+    assert "- **Hedef Platformlar**: iOS, Android\n" in prompt
+    assert "- **Karmaşıklık Skoru**: 6/10\n" in prompt
+    assert "- **Veritabanı**: Belirtilmemiş\n" in prompt
+    assert prompt.endswith("Cevabını JSON formatında ver ve Türkçe açıkla.\n")
+
+    without_requirements = registry.render('software_architect/architecture', project=project, analysis=analysis, req=None)
+    assert '## Teknik Gereksinimler' not in without_requirements
+
+    with pytest.raises(UndefinedError):
+        registry.render('software_architect/architecture', project=project, req=None)
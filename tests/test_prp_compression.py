@@ -0,0 +1,70 @@
+"""
+PRP Sıkıştırma Testleri
+=======================
+
+Sözlük/delta codec'ini, geçmiş deposunda anahtar kare ve delta sürümlerini ve sözlüğün
+yeniden eğitilmesini test eder.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.storage import prp_codec
+from src.storage.history_store import KEYFRAME_INTERVAL, HistoryStore
+from src.utils.dal import Database
+from src.utils.db import MIGRATIONS
+
+SAMPLE = prp_codec.seed_corpus()[0]
+
+@pytest.fixture(params=[prp_codec.CODEC_ZSTD, prp_codec.CODEC_ZLIB])
+def codec(request):
+    """Her iki codec; zstd yalnızca `zstandard` kuruluysa"""
+    if request.param == prp_codec.CODEC_ZSTD:
+        pytest.importorskip('zstandard')
+    return request.param
+
+def test_dictionary_and_delta_round_trip(codec):
+    """Sözlük ve delta kodlaması metni aynen geri vermeli ve sözlüksüzden küçük olmalı"""
+
+    dictionary = prp_codec.train_dictionary([SAMPLE], codec)
+    text = SAMPLE.replace('Research Agent', 'Fatura Ajanı') + '\n- ödeme adımı'
+
+    body = prp_codec.compress(text, codec, prp_codec.MODE_DICT, dictionary)
+    assert prp_codec.decompress(prp_codec.encoding_name(codec, 'dict'), body, dictionary) == text
+    assert len(body) < prp_codec.plain_size(text, codec)
+
+    delta = prp_codec.compress(text, codec, prp_codec.MODE_DELTA, SAMPLE.encode('utf-8'))
+    assert prp_codec.decompress(prp_codec.encoding_name(codec, 'delta'), delta, SAMPLE.encode('utf-8')) == text
+    assert len(delta) < len(body)
+
+    assert prp_codec.decompress('identity', text.encode('utf-8')) == text
+
+def test_history_versions_use_keyframes_deltas_and_retrain(tmp_path, codec):
+    """Ara sürümler delta, her KEYFRAME_INTERVAL sürüm sözlüklü olmalı; yeniden eğitim içeriği korumalı"""
+
+    db = Database(tmp_path / 'app.db', MIGRATIONS)
+    store = HistoryStore(db, codec=codec)
+    texts = [SAMPLE + f'\n- revizyon {i}' for i in range(KEYFRAME_INTERVAL + 1)]
+    ids = [store.record({'project_name': 'Demo'}, {}, text)['version_id'] for text in texts]
+
+    encodings = [row[0] for row in db.fetchall("SELECT encoding FROM prp_versions ORDER BY version")]
+    assert all(encoding.startswith(f'{codec}-') for encoding in encodings)
+    assert encodings[0].endswith('-dict') and encodings[KEYFRAME_INTERVAL].endswith('-dict')
+    assert all(encoding.endswith('-delta') for encoding in encodings[1:KEYFRAME_INTERVAL])
+
+    old_dict = store.dict_id
+    result = store.retrain()
+    assert result['recompressed'] == len(texts) and result['dict_id'] != old_dict
+    assert db.fetchone("SELECT COUNT(*) FROM compression_dicts") == (1,)
+
+    fresh = HistoryStore(db, codec=codec)
+    assert fresh.dict_id == result['dict_id']
+    assert [fresh.get_version(version_id)['content'] for version_id in ids] == texts
+    assert fresh.search('revizyon 3')[0]['version_id'] == ids[3]
+    assert fresh.compression_stats()['ratio'] > 10
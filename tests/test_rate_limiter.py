@@ -0,0 +1,75 @@
+"""
+Rate Limiter Testleri
+=====================
+
+Token bucket'ın hız sınırını ve session'lar arası adil sıralamasını test eder.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.api.rate_limiter import AsyncTokenBucket
+
+def test_bucket_enforces_rate_and_records_wait():
+    """Kapasite bittiğinde çağrılar beklemeli ve bekleme metriklere yansımalı"""
+
+    async def scenario():
+        bucket = AsyncTokenBucket("test", rate_per_minute=600, capacity=1)  # 10/sn
+        waits = [await bucket.acquire() for _ in range(3)]
+        return waits, bucket.stats()
+
+    waits, stats = asyncio.run(scenario())
+
+    assert waits[0] == 0.0
+    assert sum(waits) >= 0.15
+    assert stats["acquired"] == 3
+    assert stats["max_wait_seconds"] > 0
+
+def test_round_robin_across_sessions():
+    """Bir session'ın birikmiş istekleri diğer session'ı aç bırakmamalı"""
+
+    async def scenario():
+        bucket = AsyncTokenBucket("test", rate_per_minute=1200, capacity=1)
+        await bucket.acquire("warmup")
+        order = []
+
+        async def call(key):
+            await bucket.acquire(key)
+            order.append(key)
+
+        await asyncio.gather(*(call("a") for _ in range(3)), call("b"))
+        return order
+
+    order = asyncio.run(scenario())
+
+    assert order.index("b") <= 1
+
+def test_queued_waiters_share_one_timer():
+    """Kuyruktaki çok sayıda bekleyen tek bir dağıtım zamanlayıcısı kullanmalı"""
+
+    async def scenario():
+        bucket = AsyncTokenBucket("test", rate_per_minute=60, capacity=1)
+        await bucket.acquire()
+        tasks = [asyncio.ensure_future(bucket.acquire(f"s{i}")) for i in range(50)]
+        await asyncio.sleep(0)
+
+        loop = asyncio.get_running_loop()
+        timers = [
+            handle for handle in loop._scheduled
+            if not handle.cancelled() and getattr(handle._callback, '__self__', None) is bucket
+        ]
+        queued = bucket.stats()["queued"]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return len(timers), queued
+
+    timers, queued = asyncio.run(scenario())
+
+    assert queued == 50
+    assert timers == 1
@@ -0,0 +1,85 @@
+"""
+Render Pipeline Testleri
+========================
+
+Markdown'ın güvenli HTML'e çevrilmesini, render sonucunun bir kez saklanmasını ve
+içerik endpoint'inin ETag/gzip davranışını test eder.
+"""
+
+import gzip
+import json
+import os
+import sys
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ['TEST_MODE'] = 'true'
+
+import flask_app
+from src.storage import ArtifactStore
+from src.web.rendering import HTML_RENDITION, get_html, render_markdown
+
+def test_raw_html_and_unsafe_links_are_neutralized():
+    """LLM çıktısındaki HTML etiketleri ve javascript: bağlantıları çalıştırılmamalı"""
+
+    html = render_markdown("# Başlık\n\n<script>alert(1)</script>\n\n[tıkla](javascript:alert(1))")
+
+    assert '>Başlık</h1>' in html
+    assert '<script>' not in html
+    assert 'javascript:' not in html
+
+def test_encoded_and_obfuscated_schemes_are_blocked():
+    """HTML varlıkları veya boşlukla gizlenmiş şemalar da engellenmeli; güvenli adresler kalmalı"""
+
+    html = render_markdown(
+        "[a](java&#115;cript:alert(1)) [b](jav\tascript:alert(1)) [c](JaVa&#x53;cript&colon;x) "
+        "[d](https://ornek.com) [e](/yerel?a=1) [f](#bolum) [g](mailto:a@b.com)"
+    )
+
+    assert 'cript' not in html
+    assert html.count('href="#"') == 3
+    for url in ('https://ornek.com', '/yerel?a=1', '#bolum', 'mailto:a@b.com'):
+        assert f'href="{url}"' in html
+
+def test_html_is_rendered_once_per_content(tmp_path):
+    """Aynı içerik için HTML depodan okunmalı"""
+
+    store = ArtifactStore(db_path=tmp_path / 'artifacts.db')
+    artifact = store.get(store.put('# PRP\n\n- madde'))
+
+    html = get_html(store, artifact)
+    assert '<li>madde</li>' in html
+    assert store.get_rendition(artifact.hash, HTML_RENDITION) == html
+
+    store.put_rendition(artifact.hash, HTML_RENDITION, '<p>önbellek</p>')
+    assert get_html(store, artifact) == '<p>önbellek</p>'
+
+def test_generated_content_supports_etag_and_gzip():
+    """Endpoint ETag döndürmeli, eşleşen istekte 304 vermeli ve gzip desteklemeli"""
+
+    client = flask_app.app.test_client()
+    content = '# PRP\n\n' + 'Uzun bir satır içeriği. ' * 200
+    artifact_id = flask_app.artifact_store.put(content)
+    with client.session_transaction() as sess:
+        sess['generated_prp_artifact'] = artifact_id
+
+    response = client.get('/api/get-generated-content?format=html')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    data = response.get_json()
+    assert 'content' not in data
+    assert data['stats']['sections'] == 1
+
+    cached = client.get('/api/get-generated-content?format=html', headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.data == b''
+
+    compressed = client.get('/api/get-generated-content?format=markdown', headers={'Accept-Encoding': 'gzip'})
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(compressed.data))['content'] == content
+
+    assert client.get('/api/get-generated-content?format=pdf').status_code == 400
+    flask_app.artifact_store.delete(artifact_id)
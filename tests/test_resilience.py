@@ -0,0 +1,130 @@
+"""
+Dayanıklılık Testleri
+=====================
+
+Geçici hatalarda yeniden denemeyi, provider failover'ını ve circuit breaker'ı test eder.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.api.resilience import (
+    CircuitBreaker, CircuitBreakerRegistry, LLMUnavailableError, ResilientAgent, RetryPolicy
+)
+
+
+class FakeHTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FakeResult:
+    def __init__(self, output):
+        self.output = output
+
+
+class FakeClient:
+    """Sırayla verilen hataları fırlatan, sonra yanıt dönen client"""
+
+    def __init__(self, name, errors=()):
+        self.name = name
+        self.errors = list(errors)
+        self.calls = 0
+
+    def create_agent(self, system_prompt, output_type=str, tools=None):
+        client = self
+
+        class FakeAgent:
+            async def run(self, prompt):
+                client.calls += 1
+                if client.errors:
+                    raise client.errors.pop(0)
+                return FakeResult(f"{client.name}: {prompt}")
+
+        return FakeAgent()
+
+
+def _agent(candidates, **policy):
+    policy = RetryPolicy(base_delay=0, max_delay=0, **policy)
+    kwargs = {"system_prompt": "sys", "output_type": str, "tools": None}
+    return ResilientAgent(candidates, kwargs, policy, CircuitBreakerRegistry())
+
+
+def test_transient_error_is_retried_on_same_provider():
+    """429 gibi geçici hatalar aynı provider'da yeniden denenmeli"""
+
+    primary = FakeClient("openai", [FakeHTTPError(429), FakeHTTPError(503)])
+    backup = FakeClient("anthropic")
+    agent = _agent([("openai", primary), ("anthropic", backup)], max_retries=2)
+
+    result = asyncio.run(agent.run("merhaba"))
+
+    assert result.output == "openai: merhaba"
+    assert primary.calls == 3
+    assert backup.calls == 0
+
+
+def test_fails_over_and_raises_when_all_providers_fail():
+    """Kalıcı hata anında bir sonraki provider'a geçilmeli; hepsi düşerse hata fırlatılmalı"""
+
+    primary = FakeClient("openai", [FakeHTTPError(401)])
+    backup = FakeClient("anthropic")
+    agent = _agent([("openai", primary), ("anthropic", backup)], max_retries=2)
+
+    assert asyncio.run(agent.run("x")).output == "anthropic: x"
+    assert primary.calls == 1
+
+    broken = _agent([("openai", FakeClient("openai", [ValueError("bad")]))])
+    try:
+        asyncio.run(broken.run("x"))
+        assert False, "LLMUnavailableError bekleniyordu"
+    except LLMUnavailableError as e:
+        assert "openai" in e.errors
+
+
+def test_circuit_breaker_opens_and_half_opens():
+    """Eşik aşılınca devre açılmalı, süre dolunca tek deneme isteğine izin vermeli"""
+
+    breaker = CircuitBreaker("openai", failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_non_transient_errors_do_not_open_the_circuit():
+    """400/401 gibi kalıcı hatalar devre eşiğine sayılmamalı; geçici hatalar sayılmalı"""
+
+    breakers = CircuitBreakerRegistry()
+    policy = RetryPolicy(max_retries=0, base_delay=0, max_delay=0, failure_threshold=2)
+    kwargs = {"system_prompt": "sys", "output_type": str, "tools": None}
+
+    for error in (FakeHTTPError(401), FakeHTTPError(400), ValueError("bad")):
+        agent = ResilientAgent([("openai", FakeClient("openai", [error]))], kwargs, policy, breakers)
+        try:
+            asyncio.run(agent.run("x"))
+        except LLMUnavailableError:
+            pass
+    assert breakers.stats()["openai"] == {"state": "closed", "consecutive_failures": 0}
+
+    for _ in range(2):
+        agent = ResilientAgent([("openai", FakeClient("openai", [FakeHTTPError(503)]))], kwargs, policy, breakers)
+        try:
+            asyncio.run(agent.run("x"))
+        except LLMUnavailableError:
+            pass
+    assert breakers.stats()["openai"]["state"] == "open"
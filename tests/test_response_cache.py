@@ -0,0 +1,62 @@
+"""
+Yanıt Önbelleği Testleri
+========================
+
+LLM yanıt önbelleğinin bellek/disk katmanlarını ve agent entegrasyonunu test eder.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.api.response_cache import ResponseCache, CachedAgent, make_cache_key
+from src.models.project_data import AnalysisResult
+
+def test_disk_tier_roundtrip_and_ttl(tmp_path):
+    """Yapılandırılmış çıktı diskten geri yüklenmeli ve TTL sonunda düşmeli"""
+
+    db_path = tmp_path / "cache.db"
+    key = make_cache_key("OpenAI", "gpt-4o", "system", "user", AnalysisResult)
+    value = AnalysisResult(
+        complexity_score=5,
+        estimated_effort="2 hafta",
+        risk_factors=["risk"],
+        recommended_approach="iteratif",
+        key_challenges=["zorluk"],
+        success_criteria=["kriter"]
+    )
+
+    ResponseCache(ttl_seconds=60, db_path=db_path).set(key, value, AnalysisResult)
+
+    fresh = ResponseCache(ttl_seconds=60, db_path=db_path)
+    found, cached = fresh.get(key, AnalysisResult)
+    assert found and cached == value
+    assert fresh.stats()["disk_hits"] == 1
+
+    expired = ResponseCache(ttl_seconds=-1, db_path=None)
+    expired.set(key, value, AnalysisResult)
+    assert expired.get(key, AnalysisResult) == (False, None)
+
+def test_cached_agent_calls_provider_once():
+    """Aynı prompt ikinci kez provider'a gönderilmemeli"""
+
+    class FakeAgent:
+        calls = 0
+
+        async def run(self, prompt):
+            FakeAgent.calls += 1
+            return type("Result", (), {"output": f"yanıt: {prompt}"})()
+
+    cache = ResponseCache(db_path=None)
+    key_parts = {"provider": "Fake", "model": "m", "system_prompt": "s", "output_type": str}
+    agent = CachedAgent(FakeAgent(), cache, key_parts)
+
+    first = asyncio.run(agent.run("merhaba"))
+    second = asyncio.run(agent.run("merhaba"))
+
+    assert first.output == second.output == "yanıt: merhaba"
+    assert FakeAgent.calls == 1
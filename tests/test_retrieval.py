@@ -0,0 +1,91 @@
+"""
+Prompt Bağlamı Seçimi Testleri
+==============================
+
+Markdown parçalamayı, BM25 sıralamasını ve örnek/geçmiş PRP bölümlerinin token bütçesi
+içinde seçilmesini test eder.
+"""
+
+import sys
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.retrieval import BM25Index, ContextRetriever, chunk_markdown
+from src.storage.history_store import HistoryStore
+from src.utils.dal import Database
+from src.utils.db import MIGRATIONS
+
+def _section(title, words):
+    return f"## {title}\n" + ' '.join(words) + "\n"
+
+def test_chunks_follow_headings_and_bm25_ranks_matching_chunk_first():
+    """Kod bloğundaki `#` satırı başlık sayılmamalı; aksansız sorgu doğru parçayı bulmalı"""
+
+    text = (
+        _section('Ödeme', ['Kredi kartı ile ödeme alınır ve fatura kesilir.'] * 5)
+        + "```yaml\n# MUST READ\n- url: https://stripe.com/docs\n```\n"
+        + _section('Bildirimler', ['Kullanıcıya e-posta ve push bildirimi gönderilir.'] * 5)
+    )
+    chunks = chunk_markdown('ornek.md', text)
+    assert [chunk.title for chunk in chunks] == ['Ödeme', 'Bildirimler']
+    assert '# MUST READ' in chunks[0].text
+
+    index = BM25Index([chunk.text for chunk in chunks])
+    assert [position for position, _ in index.top('odeme FATURA', 5)] == [0]
+    assert index.top('push bildirimi ödeme', 1)[0][0] == 1
+    assert index.top('bilinmeyen', 5) == []
+
+def test_retriever_respects_budget_and_indexes_new_history(tmp_path):
+    """Seçim bütçeyi aşmamalı; geçmişe eklenen PRP yeniden kurulan indekste bulunmalı"""
+
+    examples = tmp_path / 'examples'
+    examples.mkdir()
+    (examples / 'web.md').write_text(
+        _section('Kimlik Doğrulama', ['JWT token ile oturum açma ve yenileme akışı.'] * 8)
+        + _section('Veritabanı', ['PostgreSQL şeması ve migration adımları.'] * 8)
+        + _section('Önbellek', ['Redis ile oturum önbelleği ve JWT kara listesi.'] * 8),
+        encoding='utf-8'
+    )
+    history = HistoryStore(Database(tmp_path / 'app.db', MIGRATIONS), seed_dir=examples)
+    retriever = ContextRetriever(examples_dir=examples, history=history, token_budget=200, top_k=3, refresh_interval=0)
+
+    project = {'project_name': 'Panel', 'description': 'JWT oturum açma ve Redis önbellek', 'detail_level': 'basic'}
+    chunks = retriever.retrieve(project, {'database': 'PostgreSQL'})
+    assert sum(chunk.tokens for chunk in chunks) <= 200
+    assert len(chunks) == 2 and chunks[0].title in ('Kimlik Doğrulama', 'Önbellek')
+    assert retriever.context_for(project, {}).startswith('Kaynak: web.md\n## ')
+
+    retriever.wait_for_refresh()
+    history.record({'project_name': 'Kargo'}, {}, _section('Kargo Takibi', ['Gönderi barkodu ile kargo takibi yapılır.'] * 8))
+    # Yeni indeks arka planda kurulurken eski indeks sunulur
+    assert retriever.retrieve({'description': 'kargo takibi barkodu'}) == []
+    retriever.wait_for_refresh()
+    [chunk] = retriever.retrieve({'description': 'kargo takibi barkodu'})
+    assert (chunk.source, chunk.title) == ('Kargo v1', 'Kargo Takibi')
+    # Yalnızca örneklerle ilk indeks, geçmişle tam indeks, yeni PRP sonrası indeks
+    assert retriever.stats()['builds'] == 3
+
+    assert ContextRetriever(examples_dir=examples, token_budget=0).context_for(project) == ''
+
+def test_get_context_retriever_rejects_conflicting_settings(monkeypatch, tmp_path):
+    """Argümansız oluşturulan seçici yapılandırılmalı; farklı ayarla ikinci yapılandırma reddedilmeli"""
+
+    from src.retrieval import context
+
+    monkeypatch.setattr(context, '_context_retriever', None)
+    monkeypatch.setattr(context, '_context_retriever_configured', False)
+    history = HistoryStore(Database(tmp_path / 'app.db', MIGRATIONS))
+
+    retriever = context.get_context_retriever()
+    assert context.get_context_retriever(history=history, token_budget=300) is retriever
+    assert (retriever.history, retriever.token_budget) == (history, 300)
+    assert context.get_context_retriever(token_budget=300) is retriever
+
+    try:
+        context.get_context_retriever(token_budget=500)
+        assert False, "ValueError bekleniyordu"
+    except ValueError as e:
+        assert 'token_budget' in str(e)
@@ -0,0 +1,86 @@
+"""
+Session Deposu Testleri
+=======================
+
+SQLite session deposunun yalnızca değişen anahtarları yazmasını, süre sonu
+temizliğini ve process'ler arası tutarlılığı test eder.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from flask import Flask, session
+
+from src.web.session_store import IndexedSessionInterface, SQLiteSessionStore
+
+def _app(store):
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    app.session_interface = IndexedSessionInterface(store, lifetime_seconds=3600)
+
+    @app.route('/set/<key>/<value>')
+    def set_value(key, value):
+        session[key] = value
+        return 'ok'
+
+    @app.route('/get/<key>')
+    def get_value(key):
+        return session.get(key, '-')
+
+    @app.route('/drop/<key>')
+    def drop_value(key):
+        session.pop(key, None)
+        return 'ok'
+
+    return app
+
+def test_only_changed_keys_are_written(tmp_path):
+    """Aynı değerin yeniden atanması yazım yapmamalı; değişen anahtar tek başına yazılmalı"""
+
+    store = SQLiteSessionStore(db_path=tmp_path / 'sessions.db')
+    client = _app(store).test_client()
+
+    client.get('/set/current_step/results')
+    client.get('/set/project/demo')
+    writes = store.stats()['db_writes']
+    keys_written = store.stats()['keys_written']
+
+    client.get('/set/current_step/results')
+    assert store.stats()['db_writes'] == writes
+
+    client.get('/set/current_step/generation')
+    assert store.stats()['keys_written'] == keys_written + 1
+
+    client.get('/drop/project')
+    assert client.get('/get/project').get_data(as_text=True) == '-'
+    assert client.get('/get/current_step').get_data(as_text=True) == 'generation'
+
+def test_expired_sessions_are_purged_by_index(tmp_path):
+    """Süresi dolan session'lar okunmamalı ve purge ile silinmeli"""
+
+    store = SQLiteSessionStore(db_path=tmp_path / 'sessions.db')
+    store.write('old', {'a': b'1'}, set(), time.time() - 1)
+    store.write('live', {'a': b'1'}, set(), time.time() + 60)
+
+    assert store.load('old', time.time()) is None
+    assert store.purge_expired(time.time()) == 1
+    assert store.load('live', time.time()) is not None
+
+def test_cache_is_refreshed_after_write_from_another_process(tmp_path):
+    """Başka bir depo örneğinin (worker) yazımı LRU önbelleğini geçersiz kılmalı"""
+
+    db_path = tmp_path / 'sessions.db'
+    first = SQLiteSessionStore(db_path=db_path)
+    second = SQLiteSessionStore(db_path=db_path)
+    expires_at = time.time() + 60
+
+    first.write('sid', {'step': b'a'}, set(), expires_at)
+    assert first.load('sid', time.time())[0] == {'step': b'a'}
+
+    second.write('sid', {'step': b'b'}, set(), expires_at)
+    assert first.load('sid', time.time())[0] == {'step': b'b'}
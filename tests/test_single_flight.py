@@ -0,0 +1,110 @@
+"""
+Single-Flight Testleri
+======================
+
+Özdeş eşzamanlı LLM isteklerinin tek provider çağrısında birleştirilmesini test eder.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.api.llm_factory import LLMClient
+from src.api.single_flight import SingleFlight, SingleFlightAgent
+from src.utils.config import LLMProviderConfig
+
+KEY_PARTS = {'provider': 'OpenAI', 'model': 'gpt-4o', 'system_prompt': 'system', 'output_type': str}
+
+class _Result:
+    def __init__(self, output):
+        self.output = output
+
+class _SlowAgent:
+    """Çağrı sayısını tutan ve kısa süre bekleyen sahte agent"""
+
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+
+    async def run(self, prompt):
+        self.calls.append(prompt)
+        await asyncio.sleep(0.02)
+        if self.error:
+            raise self.error
+        return _Result(f"yanıt: {prompt}")
+
+def test_identical_concurrent_prompts_share_one_call():
+    """Aynı prompt tek çağrı yapmalı; farklı prompt ayrı çağrılmalı"""
+
+    group = SingleFlight()
+    inner = _SlowAgent()
+    agent = SingleFlightAgent(inner, group, KEY_PARTS)
+
+    async def scenario():
+        return await asyncio.gather(agent.run("a"), agent.run("a"), agent.run("a"), agent.run("b"))
+
+    results = asyncio.run(scenario())
+
+    assert [result.output for result in results] == ["yanıt: a", "yanıt: a", "yanıt: a", "yanıt: b"]
+    assert sorted(inner.calls) == ["a", "b"]
+    assert sum(getattr(result, 'coalesced', False) for result in results) == 2
+    assert group.stats() == {'calls': 4, 'leaders': 2, 'coalesced': 2, 'inflight': 0}
+
+    # Tamamlanan istek saklanmaz; sonraki çağrı yeniden gönderilir
+    asyncio.run(agent.run("a"))
+    assert inner.calls.count("a") == 2
+
+def test_leader_error_is_shared_and_key_released():
+    """Liderin hatası bekleyenlere iletilmeli ve anahtar serbest kalmalı"""
+
+    group = SingleFlight()
+    agent = SingleFlightAgent(_SlowAgent(error=TimeoutError("zaman aşımı")), group, KEY_PARTS)
+
+    async def scenario():
+        return await asyncio.gather(agent.run("a"), agent.run("a"), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+
+    assert all(isinstance(result, TimeoutError) for result in results)
+    assert group.stats()['inflight'] == 0
+    with pytest.raises(TimeoutError):
+        asyncio.run(agent.run("a"))
+
+class _WrappingClient(LLMClient):
+    """Sahte agent'ı gerçek _wrap_agent katmanlarıyla saran client"""
+
+    def __init__(self, config, inner, group):
+        super().__init__(config)
+        self.inner = inner
+        self.single_flight = group
+
+    def create_agent(self, system_prompt, output_type=str, tools=None):
+        return self._wrap_agent(self.inner, system_prompt, output_type, tools)
+
+    async def generate_response(self, prompt, system_prompt=None, **kwargs):
+        result = await self.create_agent(system_prompt or "system").run(prompt)
+        return result.output
+
+def test_different_api_keys_are_not_coalesced():
+    """Farklı API anahtarlı özdeş istekler ayrı ayrı provider'a gitmeli"""
+
+    group = SingleFlight()
+    inner = _SlowAgent()
+    clients = [
+        _WrappingClient(LLMProviderConfig(name="OpenAI", api_key=key, default_model="gpt-4o"), inner, group)
+        for key in ("key-1", "key-2", "key-1")
+    ]
+
+    async def scenario():
+        return await asyncio.gather(*(client.create_agent("system").run("a") for client in clients))
+
+    results = asyncio.run(scenario())
+
+    assert inner.calls == ["a", "a"]
+    assert [getattr(result, 'coalesced', False) for result in results].count(True) == 1
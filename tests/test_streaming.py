@@ -0,0 +1,37 @@
+"""
+Streaming Testleri
+==================
+
+PRP üretiminin Server-Sent Events ile stream edilmesini test eder.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ['TEST_MODE'] = 'true'
+
+import flask_app
+
+def test_generate_prp_stream_sse(monkeypatch):
+    """Streaming endpoint token olaylarını ve tamamlanma olayını SSE olarak göndermeli"""
+
+    monkeypatch.setattr(flask_app.config, "default_provider", "mock")
+    client = flask_app.app.test_client()
+    with client.session_transaction() as sess:
+        sess['project_data'] = {'project_name': 'Demo', 'project_type': 'Web Application', 'description': 'Demo app'}
+        sess['project_requirements'] = {'functional_requirements': 'Login'}
+
+    response = client.post('/api/generate-prp/stream', json={'detail_level': 'basic'})
+    body = response.get_data(as_text=True)
+
+    assert response.mimetype == 'text/event-stream'
+    assert 'event: token' in body
+    assert 'event: complete' in body
+
+    with client.session_transaction() as sess:
+        assert flask_app.artifact_store.get_content(sess['generated_prp_artifact'])
@@ -0,0 +1,106 @@
+"""
+İş Akışı Testleri
+=================
+
+Bağımlılık grafiği zamanlayıcısını ve ekip workflow'unu test eder.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+os.environ['TEST_MODE'] = 'true'
+
+from src.agents.workflow import WorkflowStage, run_stage_graph
+from src.agents.team_manager import SoftwareEngineeringTeam
+from src.api.llm_factory import LLMProviderFactory
+from src.models.project_data import ProjectData
+from src.utils.config import load_config
+from src.utils.logger import get_logger
+
+def test_independent_stages_run_concurrently():
+    """Bağımsız aşamalar paralel, bağımlı aşama sonra çalışmalı"""
+
+    async def slow(value):
+        async def _run(results):
+            await asyncio.sleep(0.1)
+            return value
+        return _run
+
+    async def scenario():
+        stages = [
+            WorkflowStage('a', await slow(1)),
+            WorkflowStage('b', await slow(2)),
+            WorkflowStage('sum', lambda results: asyncio.sleep(0, results['a'] + results['b']), depends_on=['a', 'b']),
+        ]
+        timings = {}
+        started = time.perf_counter()
+        results = await run_stage_graph(stages, timings)
+        return results, timings, time.perf_counter() - started
+
+    results, timings, elapsed = asyncio.run(scenario())
+
+    assert results['sum'] == 3
+    assert elapsed < 0.18
+    assert set(timings) == {'a', 'b', 'sum'}
+
+def test_cycle_rejected():
+    """Döngüsel bağımlılık reddedilmeli"""
+
+    async def noop(results):
+        return None
+
+    stages = [WorkflowStage('a', noop, ['b']), WorkflowStage('b', noop, ['a'])]
+    with pytest.raises(ValueError):
+        asyncio.run(run_stage_graph(stages))
+
+def test_full_workflow_records_stage_timings():
+    """Workflow metadata'sı aşama sürelerini içermeli; spekülasyon yalnızca istenince çalışmalı"""
+
+    client = LLMProviderFactory(load_config()).create_client("mock")
+    team = SoftwareEngineeringTeam(client, get_logger())
+    project = ProjectData(name="Demo", type="Web Uygulaması", description="Demo proje", language="Python")
+
+    results = asyncio.run(team.full_analysis_workflow(project))
+    metadata = results['metadata']
+
+    assert set(metadata['stage_timings']) == {'analysis', 'architecture', 'test_strategy', 'prp'}
+    assert metadata['speculation'] == {'enabled': False, 'architecture': None}
+    assert results['prp_content']
+
+    speculative = asyncio.run(team.full_analysis_workflow(project, speculative=True))['metadata']
+    assert 'architecture_draft' in speculative['stage_timings']
+    assert speculative['speculation']['architecture'] in ('accepted', 'rejected')
+
+def test_default_workflow_overlaps_analysis_and_test_strategy():
+    """Varsayılan çağrıda test stratejisi sistem analiziyle aynı anda çalışmalı"""
+
+    client = LLMProviderFactory(load_config()).create_client("mock")
+    team = SoftwareEngineeringTeam(client, get_logger())
+    project = ProjectData(name="Demo", type="Web Uygulaması", description="Demo proje", language="Python")
+    windows = {}
+
+    def slowed(name, method):
+        async def _run(*args, **kwargs):
+            started = time.perf_counter()
+            await asyncio.sleep(0.1)
+            result = await method(*args, **kwargs)
+            windows[name] = (started, time.perf_counter())
+            return result
+        return _run
+
+    team.system_analyst.analyze_project = slowed('analysis', team.system_analyst.analyze_project)
+    team.test_specialist.create_test_strategy = slowed('test_strategy', team.test_specialist.create_test_strategy)
+
+    asyncio.run(team.full_analysis_workflow(project))
+
+    (analysis_start, analysis_end), (test_start, test_end) = windows['analysis'], windows['test_strategy']
+    assert test_start < analysis_end and analysis_start < test_end